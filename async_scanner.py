@@ -0,0 +1,217 @@
+"""
+Moteur de scan asynchrone (ccxt.async_support)
+Toutes les requêtes OHLCV sont lancées sur un seul thread, sous un sémaphore
+global de concurrence ; l'analyse réutilise les étapes de scanner.build_pipeline.
+"""
+
+import asyncio
+import queue
+import threading
+from logger import get_logger
+from exchange import init_async_exchange
+from data import PairFrames, fetch_ohlcv_async
+from scanner import build_pipeline, new_analysis, run_stage, finish_analysis
+
+logger = get_logger()
+
+
+async def _fetch(frames, timeframe, limit, semaphore):
+    """
+    Récupère un timeframe d'une paire sous le sémaphore global de concurrence
+
+    Returns:
+        tuple: (timeframe, OHLCV ou None)
+    """
+    async with semaphore:
+        df = await fetch_ohlcv_async(
+            frames.exchange, frames.symbol, timeframe=timeframe, limit=limit, settings=frames.settings
+        )
+    return timeframe, df
+
+
+async def analyze_pair_async(
+    exchange, symbol, idx, total, plan, semaphore, kept=None, pipeline=None
+):
+    """
+    Analyse une paire : étapes du pipeline, récupérations concurrentes entre deux étapes
+
+    Avant chaque étape (scanner.build_pipeline), les timeframes qu'elle lit
+    et qui manquent encore sont récupérés en parallèle ; une paire rejetée
+    ne télécharge donc pas les timeframes des étapes suivantes, comme avec
+    le moteur à threads.
+
+    Args:
+        exchange: Instance ccxt.async_support de l'exchange
+        symbol (str): Symbole à analyser
+        idx (int): Index de la paire (pour logs)
+        total (int): Nombre total de paires
+        plan (dict): Plan de récupération {timeframe: limit}
+        semaphore (asyncio.Semaphore): Limite globale de requêtes simultanées
+        kept (dict): Complété avec les bougies des paires candidates
+                     {symbol: PairFrames} (optionnel)
+        pipeline (Pipeline): Étapes ordonnées et configuration du scan
+                             (optionnel, build_pipeline)
+
+    Returns:
+        tuple: (symbol, status, result) - mêmes status/result que analyze_single_pair
+    """
+    try:
+        logger.debug(f"[{idx}/{total}] Traitement de {symbol}...")
+
+        if pipeline is None:
+            pipeline = build_pipeline(plan)
+        frames = PairFrames(exchange, symbol, plan, settings=pipeline.settings)
+        state = new_analysis(exchange, symbol, frames)
+
+        for stage in pipeline:
+            missing = [tf for tf in stage.timeframes if not frames.has(tf)]
+            if missing:
+                fetched = await asyncio.gather(
+                    *(_fetch(frames, tf, plan.get(tf, 1), semaphore) for tf in missing)
+                )
+                frames.update(dict(fetched))
+
+            # Timeframes reconstruits sur un historique trop court : téléchargés
+            short = frames.direct_fetches(stage.reads)
+            if short:
+                fetched = await asyncio.gather(
+                    *(_fetch(frames, tf, stage.reads[tf], semaphore) for tf in short)
+                )
+                frames.update(dict(fetched))
+
+            status = run_stage(stage, state, pipeline)
+            if status is not None:
+                return symbol, status, None
+
+        status, result = finish_analysis(state, kept)
+        return symbol, status, result
+
+    except Exception as e:
+        logger.error(f"  ✗ Erreur inattendue pour {symbol}: {str(e)}")
+        return symbol, "error", None
+
+
+async def _scan(markets_exchange, symbols, plan, kept=None, pipeline=None, emit=None, stop=None):
+    """
+    Lance l'analyse de toutes les paires sur une instance asynchrone
+
+    Args:
+        emit (callable): Coroutine appelée avec chaque résultat dès qu'il est
+                         connu (optionnel, sinon résultats retournés en liste)
+        stop (threading.Event): Arrêt demandé : les paires restantes sont annulées
+
+    Returns:
+        list: [(symbol, status, result), ...] dans l'ordre de complétion
+              (vide si emit est fourni)
+    """
+    if pipeline is None:
+        pipeline = build_pipeline(plan)
+    exchange = init_async_exchange(markets_from=markets_exchange, settings=pipeline.settings)
+    semaphore = asyncio.Semaphore(pipeline.settings.ASYNC_MAX_CONCURRENCY)
+    tasks = []
+
+    try:
+        tasks = [
+            asyncio.ensure_future(
+                analyze_pair_async(
+                    exchange, symbol, idx, len(symbols), plan, semaphore, kept, pipeline
+                )
+            )
+            for idx, symbol in enumerate(symbols, 1)
+        ]
+
+        outcomes = []
+        for task in asyncio.as_completed(tasks):
+            outcome = await task
+            if emit is None:
+                outcomes.append(outcome)
+                continue
+            await emit(outcome)
+            if stop is not None and stop.is_set():
+                break
+        return outcomes
+
+    finally:
+        unfinished = [task for task in tasks if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+        await exchange.close()
+
+
+def run_async_scan(exchange, symbols, plan, kept=None, pipeline=None):
+    """
+    Scanne les paires avec le moteur asyncio (point d'entrée synchrone)
+
+    Args:
+        exchange: Instance ccxt synchrone dont les marchés sont déjà chargés
+        symbols (list): Symboles à analyser
+        plan (dict): Plan de récupération {timeframe: limit}
+        kept (dict): Complété avec les bougies des paires candidates
+                     {symbol: PairFrames} (optionnel)
+        pipeline (Pipeline): Étapes ordonnées et configuration du scan
+                             (optionnel, build_pipeline)
+
+    Returns:
+        list: [(symbol, status, result), ...] - mêmes résultats que analyze_single_pair
+    """
+    return asyncio.run(_scan(exchange, symbols, plan, kept, pipeline))
+
+
+def iter_async_scan(exchange, symbols, plan, kept=None, pipeline=None):
+    """
+    Scanne les paires avec le moteur asyncio, résultats au fil de l'eau
+
+    La boucle asyncio tourne dans un thread dédié et transmet chaque résultat
+    par une file bornée (ASYNC_MAX_CONCURRENCY éléments) : si le consommateur
+    ne suit pas, la boucle attend (contre-pression). Fermer le générateur
+    annule les paires restantes.
+
+    Args:
+        exchange: Instance ccxt synchrone dont les marchés sont déjà chargés
+        symbols (list): Symboles à analyser
+        plan (dict): Plan de récupération {timeframe: limit}
+        kept (dict): Complété avec les bougies des paires candidates
+                     {symbol: PairFrames} (optionnel)
+        pipeline (Pipeline): Étapes ordonnées et configuration du scan
+                             (optionnel, build_pipeline)
+
+    Yields:
+        tuple: (symbol, status, result) dans l'ordre de complétion
+    """
+    if pipeline is None:
+        pipeline = build_pipeline(plan)
+    outcomes = queue.Queue(maxsize=pipeline.settings.ASYNC_MAX_CONCURRENCY)
+    stop = threading.Event()
+    finished = object()
+
+    async def emit(outcome):
+        await asyncio.to_thread(outcomes.put, outcome)
+
+    def run():
+        try:
+            asyncio.run(_scan(exchange, symbols, plan, kept, pipeline, emit, stop))
+            outcomes.put(finished)
+        except Exception as e:
+            outcomes.put(e)
+
+    thread = threading.Thread(target=run, name="async-scan", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = outcomes.get()
+            if item is finished:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    finally:
+        # Débloquer la boucle (file pleine) le temps qu'elle s'arrête
+        stop.set()
+        while thread.is_alive():
+            try:
+                outcomes.get(timeout=0.05)
+            except queue.Empty:
+                pass
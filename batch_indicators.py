@@ -0,0 +1,250 @@
+"""
+Indicateurs techniques vectorisés sur une matrice symboles × temps
+Chaque fonction traite toutes les paires en une passe NumPy : entrée (N, T)
+float64 (une ligne par paire, bougies alignées sur la plus récente), sortie
+(N,) pour la dernière bougie. Mêmes formules que indicators.py.
+"""
+
+import numpy as np
+from kernels import jit_backend, rolling_max, rolling_min
+
+
+def stack_columns(series, column):
+    """
+    Empile une colonne de plusieurs séries OHLCV de même longueur
+
+    Args:
+        series (list): Conteneurs data.OHLCV de même longueur T
+        column (str): 'open', 'high', 'low', 'close' ou 'volume'
+
+    Returns:
+        np.ndarray: Matrice (N, T) float64
+    """
+    return np.stack([s.column(column) for s in series])
+
+
+def rsi_last(close, period=14):
+    """
+    Dernier RSI de Wilder de chaque ligne
+
+    Amorçage par moyenne simple puis récurrence de Wilder, avec les opérations
+    dans le même ordre que kernels.rsi_kernel (résultats identiques).
+
+    Args:
+        close (np.ndarray): Clôtures (N, T), T > period, sans NaN
+        period (int): Période du RSI
+
+    Returns:
+        np.ndarray: RSI (N,) (0-100)
+    """
+    delta = np.diff(close, axis=1)
+    gains = np.where(delta < 0, 0.0, delta)
+    losses = np.abs(np.where(delta > 0, 0.0, delta))
+
+    avg_gain = gains[:, :period].sum(axis=1) / period
+    avg_loss = losses[:, :period].sum(axis=1) / period
+
+    jit = jit_backend()
+    if jit is not None:
+        avg_gain = jit.wilder_rows(np.ascontiguousarray(gains[:, period - 1:]), avg_gain, period)[:, -1]
+        avg_loss = jit.wilder_rows(np.ascontiguousarray(losses[:, period - 1:]), avg_loss, period)[:, -1]
+    else:
+        p1 = period - 1
+        for t in range(period, delta.shape[1]):
+            avg_gain = (avg_gain * p1 + gains[:, t]) / period
+            avg_loss = (avg_loss * p1 + losses[:, t]) / period
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    return np.where(avg_loss == 0, 100.0, np.where(avg_gain == 0, 0.0, rsi))
+
+
+def sma_last(close, period):
+    """
+    Dernière moyenne mobile simple de chaque ligne
+
+    Args:
+        close (np.ndarray): Clôtures (N, T), T >= period
+        period (int): Période de la SMA
+
+    Returns:
+        np.ndarray: SMA (N,)
+    """
+    return close[:, -period:].mean(axis=1)
+
+
+def ema_series(values, period):
+    """
+    Moyenne mobile exponentielle complète de chaque ligne
+
+    Même récurrence que pandas `ewm(span=period, adjust=False).mean()`
+    (amorçage sur la première valeur, mêmes opérations flottantes).
+
+    Args:
+        values (np.ndarray): Valeurs (N, T) sans NaN
+        period (int): Période (span) de l'EMA
+
+    Returns:
+        np.ndarray: EMA (N, T)
+    """
+    alpha = 2.0 / (period + 1.0)
+    jit = jit_backend()
+    if jit is not None:
+        return jit.ema_rows(np.ascontiguousarray(values, dtype=np.float64), alpha)
+
+    old_weight = 1.0 - alpha
+    norm = old_weight + alpha
+
+    out = np.empty_like(values)
+    weighted = values[:, 0].copy()
+    out[:, 0] = weighted
+    for t in range(1, values.shape[1]):
+        current = values[:, t]
+        weighted = np.where(
+            weighted != current,
+            (old_weight * weighted + alpha * current) / norm,
+            weighted,
+        )
+        out[:, t] = weighted
+    return out
+
+
+def ema_last(values, period):
+    """Dernière EMA de chaque ligne (voir ema_series)"""
+    return ema_series(values, period)[:, -1]
+
+
+def macd_last(close, fast_period=12, slow_period=26, signal_period=9):
+    """
+    Dernières valeurs du MACD de chaque ligne
+
+    Args:
+        close (np.ndarray): Clôtures (N, T)
+        fast_period (int): Période de l'EMA rapide
+        slow_period (int): Période de l'EMA lente
+        signal_period (int): Période de la ligne de signal
+
+    Returns:
+        dict: {'macd', 'signal', 'histogram'} - tableaux (N,)
+    """
+    macd_line = ema_series(close, fast_period) - ema_series(close, slow_period)
+    signal_line = ema_series(macd_line, signal_period)[:, -1]
+    macd_value = macd_line[:, -1]
+    return {
+        "macd": macd_value,
+        "signal": signal_line,
+        "histogram": macd_value - signal_line,
+    }
+
+
+def bollinger_last(close, period=20, std_dev=2):
+    """
+    Dernières Bandes de Bollinger de chaque ligne (écart-type échantillon, ddof=1)
+
+    Args:
+        close (np.ndarray): Clôtures (N, T), T >= period
+        period (int): Période de la bande moyenne
+        std_dev (float): Nombre d'écarts-types
+
+    Returns:
+        dict: {'upper', 'middle', 'lower'} - tableaux (N,)
+    """
+    window = close[:, -period:]
+    middle = window.mean(axis=1)
+    std = window.std(axis=1, ddof=1)
+    return {
+        "upper": middle + std * std_dev,
+        "middle": middle,
+        "lower": middle - std * std_dev,
+    }
+
+
+def stochastic_last(high, low, close, k_period=14, d_period=3):
+    """
+    Deux dernières valeurs de %K et %D de chaque ligne
+
+    Args:
+        high (np.ndarray): Plus hauts (N, T)
+        low (np.ndarray): Plus bas (N, T)
+        close (np.ndarray): Clôtures (N, T), T >= k_period + d_period
+        k_period (int): Période de %K
+        d_period (int): Période de %D (moyenne de %K)
+
+    Returns:
+        dict: {'k', 'd', 'k_previous', 'd_previous'} - tableaux (N,)
+    """
+    count = d_period + 1  # %K nécessaires pour les deux derniers %D
+    span = k_period + count - 1
+    highest_high = rolling_max(high[:, -span:], k_period)[:, k_period - 1:]
+    lowest_low = rolling_min(low[:, -span:], k_period)[:, k_period - 1:]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stoch_k = ((close[:, -count:] - lowest_low) / (highest_high - lowest_low)) * 100
+
+    return {
+        "k": stoch_k[:, -1],
+        "d": stoch_k[:, 1:].mean(axis=1),
+        "k_previous": stoch_k[:, -2],
+        "d_previous": stoch_k[:, :-1].mean(axis=1),
+    }
+
+
+def macd_signal(histogram):
+    """
+    Signal MACD de chaque ligne (voir indicators.detect_macd_signal)
+
+    Returns:
+        np.ndarray: 'bullish', 'bearish' ou 'neutral' (N,)
+    """
+    return np.select([histogram > 0, histogram < 0], ["bullish", "bearish"], "neutral")
+
+
+def bollinger_position(price, bands):
+    """
+    Position du prix dans les Bandes de Bollinger (voir indicators.detect_bollinger_signal)
+
+    Args:
+        price (np.ndarray): Dernières clôtures (N,)
+        bands (dict): Résultat de bollinger_last
+
+    Returns:
+        np.ndarray: 'oversold', 'overbought', 'near_oversold', 'near_overbought' ou 'neutral' (N,)
+    """
+    upper, middle, lower = bands["upper"], bands["middle"], bands["lower"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        near_lower = (price < middle) & ((price - lower) / (middle - lower) < 0.3)
+        near_upper = (price > middle) & ((upper - price) / (upper - middle) < 0.3)
+
+    return np.select(
+        [price <= lower, price >= upper, near_lower, near_upper],
+        ["oversold", "overbought", "near_oversold", "near_overbought"],
+        "neutral",
+    )
+
+
+def stochastic_signal(stoch, oversold_level=20, overbought_level=80):
+    """
+    Signal Stochastic de chaque ligne (voir indicators.detect_stochastic_signal)
+
+    Args:
+        stoch (dict): Résultat de stochastic_last
+        oversold_level (float): Seuil de survente
+        overbought_level (float): Seuil de surachat
+
+    Returns:
+        np.ndarray: 'bullish_cross', 'bearish_cross', 'oversold', 'overbought' ou 'neutral' (N,)
+    """
+    k, d = stoch["k"], stoch["d"]
+    k_previous, d_previous = stoch["k_previous"], stoch["d_previous"]
+
+    return np.select(
+        [
+            (k_previous < d_previous) & (k > d) & (k < oversold_level + 10),
+            (k_previous > d_previous) & (k < d) & (k > overbought_level - 10),
+            k < oversold_level,
+            k > overbought_level,
+        ],
+        ["bullish_cross", "bearish_cross", "oversold", "overbought"],
+        "neutral",
+    )
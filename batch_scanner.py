@@ -0,0 +1,455 @@
+"""
+Moteur de scan vectorisé (matrice symboles × temps)
+Les bougies de toutes les paires sont récupérées en parallèle puis empilées
+en matrices (N, T) : chaque indicateur est calculé en une seule passe NumPy
+pour toutes les paires (batch_indicators). Le RSI puis les multi-indicateurs
+(mêmes bougies) filtrent d'abord l'univers ; les autres timeframes ne sont
+récupérés que pour les paires encore en course.
+
+Les paires dont l'historique est incomplet (listing récent, bougies
+manquantes) repassent par l'analyse paire par paire (analyze_single_pair).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from logger import get_logger
+from data import PairFrames, get_last_closed_candle
+from batch_indicators import (
+    stack_columns,
+    rsi_last,
+    sma_last,
+    ema_last,
+    macd_last,
+    bollinger_last,
+    stochastic_last,
+    macd_signal,
+    bollinger_position,
+    stochastic_signal,
+)
+from indicator_registry import required_bars
+from scanner import (
+    _ma_periods,
+    analyze_single_pair,
+    build_pipeline,
+    passes_trend_filter,
+    rejects_early,
+    finalize_pair,
+)
+
+logger = get_logger()
+
+
+def _fetch_all(frames, timeframes, settings):
+    """
+    Récupère des timeframes pour plusieurs paires (threads, une tâche par paire)
+
+    Args:
+        frames (list): PairFrames des paires
+        timeframes (list): Timeframes à récupérer
+        settings (ScanConfig): Configuration du scan (MAX_WORKERS)
+    """
+    workers = settings.MAX_WORKERS if settings.ENABLE_CONCURRENCY else 1
+
+    def fetch(pair_frames):
+        for tf in timeframes:
+            pair_frames.get(tf)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(fetch, frames))
+
+
+def _dense_series(pair_frames, timeframe, limit, columns=("close",)):
+    """
+    Retourne les `limit` dernières bougies si elles sont complètes
+
+    Args:
+        pair_frames (PairFrames): Bougies de la paire
+        timeframe (str): Timeframe voulu
+        limit (int): Nombre exact de bougies requis
+        columns (tuple): Colonnes qui ne doivent pas contenir de NaN
+
+    Returns:
+        OHLCV: Série de longueur `limit`
+        None: Historique trop court ou incomplet (analyse paire par paire)
+    """
+    series = pair_frames.get(timeframe, limit=limit)
+    if series is None or len(series) != limit:
+        return None
+    if not all(np.isfinite(series.column(column)).all() for column in columns):
+        return None
+    return series
+
+
+def rsi_columns(series, settings):
+    """
+    RSI de plusieurs paires
+
+    Args:
+        series (list): OHLCV de même longueur, une par paire
+        settings (ScanConfig): Configuration du scan
+
+    Returns:
+        dict: {'rsi': np.ndarray (N,)}
+    """
+    return {"rsi": rsi_last(stack_columns(series, "close"), settings.RSI_PERIOD)}
+
+
+def ma_columns(series_by_tf, count, settings):
+    """
+    Moyennes mobiles et tendance de plusieurs paires, par timeframe
+
+    Mêmes colonnes et même ordre que les clés de scanner.analyze_pair_ma.
+
+    Args:
+        series_by_tf (dict): {timeframe: [OHLCV, ...]} - même ordre de paires
+        count (int): Nombre de paires
+        settings (ScanConfig): Configuration du scan
+
+    Returns:
+        dict: {'sma20_1w': np.ndarray, ..., 'trend_1w': np.ndarray, ..., 'trend_score': np.ndarray}
+    """
+    columns = {}
+    trend_score = 0
+
+    for tf, series in series_by_tf.items():
+        close = stack_columns(series, "close")
+        sma = {p: sma_last(close, p) for p in settings.SMA_PERIODS} if settings.USE_SMA else {}
+        ema = {p: ema_last(close, p) for p in settings.EMA_PERIODS} if settings.USE_EMA else {}
+
+        for period, values in sma.items():
+            columns[f"sma{period}_{tf}"] = values
+        for period, values in ema.items():
+            columns[f"ema{period}_{tf}"] = values
+
+        # Même règle que indicators.detect_trend (MA 20 et 50)
+        has_sma_20_50 = 20 in sma and 50 in sma
+        has_ema_20_50 = 20 in ema and 50 in ema
+
+        if has_sma_20_50 or has_ema_20_50:
+            price = close[:, -1]
+            bullish = np.zeros(len(close), dtype=bool)
+            if has_sma_20_50:
+                bullish |= (price > sma[20]) & (price > sma[50])
+            if has_ema_20_50:
+                bullish |= ema[20] > ema[50]
+            columns[f"trend_{tf}"] = bullish
+            trend_score = trend_score + bullish
+        else:
+            columns[f"trend_{tf}"] = np.full(count, None, dtype=object)
+
+    columns["trend_score"] = np.broadcast_to(trend_score, (count,))
+    return columns
+
+
+def multi_columns(series, settings):
+    """
+    MACD, Bollinger et Stochastic de plusieurs paires
+
+    Mêmes colonnes et même ordre que les clés de
+    scanner.analyze_pair_multi_indicators.
+
+    Args:
+        series (list): OHLCV de même longueur, une par paire
+        settings (ScanConfig): Configuration du scan
+
+    Returns:
+        dict: {'macd': np.ndarray, ..., 'stoch_signal': np.ndarray}
+    """
+    close = stack_columns(series, "close")
+    columns = {}
+
+    if settings.USE_MACD:
+        macd = macd_last(
+            close,
+            fast_period=settings.MACD_FAST_PERIOD,
+            slow_period=settings.MACD_SLOW_PERIOD,
+            signal_period=settings.MACD_SIGNAL_PERIOD,
+        )
+        columns["macd"] = macd["macd"]
+        columns["macd_signal"] = macd["signal"]
+        columns["macd_histogram"] = macd["histogram"]
+        columns["macd_signal_type"] = macd_signal(macd["histogram"])
+
+    if settings.USE_BOLLINGER:
+        bands = bollinger_last(
+            close, period=settings.BOLLINGER_PERIOD, std_dev=settings.BOLLINGER_STD_DEV
+        )
+        columns["bb_upper"] = bands["upper"]
+        columns["bb_middle"] = bands["middle"]
+        columns["bb_lower"] = bands["lower"]
+        columns["bb_position"] = bollinger_position(close[:, -1], bands)
+
+    if settings.USE_STOCHASTIC:
+        stoch = stochastic_last(
+            stack_columns(series, "high"),
+            stack_columns(series, "low"),
+            close,
+            k_period=settings.STOCHASTIC_K_PERIOD,
+            d_period=settings.STOCHASTIC_D_PERIOD,
+        )
+        columns["stoch_k"] = stoch["k"]
+        columns["stoch_d"] = stoch["d"]
+        columns["stoch_signal"] = stochastic_signal(
+            stoch,
+            oversold_level=settings.STOCHASTIC_OVERSOLD,
+            overbought_level=settings.STOCHASTIC_OVERBOUGHT,
+        )
+
+    return columns
+
+
+def _row(columns, i, digits):
+    """
+    Extrait la paire `i` d'un jeu de colonnes en dict de scalaires Python
+
+    Args:
+        columns (dict): Colonnes {nom: np.ndarray}
+        i (int): Index de la paire
+        digits (dict): Arrondi par préfixe de colonne (comme le scan paire par paire)
+
+    Returns:
+        dict: {nom: valeur}
+    """
+    row = {}
+    for name, values in columns.items():
+        value = values[i]
+        if isinstance(value, np.floating):
+            value = round(float(value), digits.get(name.split("_")[0], 8))
+        elif isinstance(value, np.bool_):
+            value = bool(value)
+        elif isinstance(value, np.integer):
+            value = int(value)
+        elif isinstance(value, np.str_):
+            value = str(value)
+        row[name] = value
+    return row
+
+
+def screen_pairs(frames, symbols, pipeline):
+    """
+    RSI puis multi-indicateurs de plusieurs paires, en une passe chacun
+
+    Seul le timeframe principal est lu (déjà récupéré ou récupéré par
+    PairFrames). Étapes 1-2 de run_batch_scan.
+
+    Args:
+        frames (dict): {symbol: PairFrames}
+        symbols (list): Symboles à analyser
+        pipeline (Pipeline): Étapes, rejet anticipé et configuration (scanner.build_pipeline)
+
+    Returns:
+        tuple: (outcomes, survivors, fallback, screened)
+            - outcomes (list): [(symbol, 'filtered', None), ...]
+            - survivors (list): Paires en course pour les MA
+            - fallback (list): Paires à analyser individuellement
+            - screened (dict): {symbol: {'rsi': ..., 'multi': ...}} des survivantes
+              (état des prédicats de rejet, comme scanner.run_stage)
+    """
+    settings = pipeline.settings
+    outcomes = []
+    fallback = []
+
+    rsi = {}
+    rsi_bars = required_bars("rsi", settings.TIMEFRAME, settings)
+    if settings.USE_RSI:
+        dense = {}
+        for symbol in symbols:
+            series = _dense_series(frames[symbol], settings.TIMEFRAME, rsi_bars)
+            if series is not None and rsi_bars > settings.RSI_PERIOD:
+                dense[symbol] = series
+            else:
+                fallback.append(symbol)
+
+        if dense:
+            values = rsi_columns(list(dense.values()), settings)["rsi"]
+            for symbol, value in zip(dense, values):
+                value = float(value)
+                if value >= settings.RSI_THRESHOLD:
+                    outcomes.append((symbol, "filtered", None))
+                else:
+                    rsi[symbol] = value
+        survivors = list(rsi)
+    else:
+        survivors = list(symbols)
+
+    use_multi = settings.USE_MACD or settings.USE_BOLLINGER or settings.USE_STOCHASTIC
+    multi_fields = ("close", "high", "low") if settings.USE_STOCHASTIC else ("close",)
+
+    multi = {}
+    if survivors and use_multi:
+        dense = {}
+        for symbol in survivors:
+            series = _dense_series(
+                frames[symbol], settings.TIMEFRAME, required_bars("multi", settings.TIMEFRAME, settings), multi_fields
+            )
+            if series is None:
+                fallback.append(symbol)
+            else:
+                dense[symbol] = series
+
+        if dense:
+            columns = multi_columns(list(dense.values()), settings)
+            # %K indéfini (plus haut = plus bas sur la fenêtre) : analyse individuelle
+            valid = (
+                np.isfinite(columns["stoch_d"]) if settings.USE_STOCHASTIC else np.ones(len(dense), dtype=bool)
+            )
+            for i, symbol in enumerate(dense):
+                if valid[i]:
+                    multi[symbol] = _row(columns, i, {"stoch": 2})
+                else:
+                    fallback.append(symbol)
+        survivors = list(multi)
+
+    screened = {}
+    for symbol in survivors:
+        screened[symbol] = {"settings": settings, "rsi": rsi.get(symbol)}
+        if use_multi:
+            screened[symbol]["multi"] = multi.get(symbol)
+
+    if pipeline.early_rejection:
+        remaining = []
+        for symbol in survivors:
+            if rejects_early(screened[symbol]):
+                outcomes.append((symbol, "filtered", None))
+                del screened[symbol]
+            else:
+                remaining.append(symbol)
+        survivors = remaining
+
+    return outcomes, survivors, fallback, screened
+
+
+def finish_pairs(frames, symbols, screened, pipeline, kept=None):
+    """
+    MA de plusieurs paires en une passe, puis résultat candidat par paire
+
+    Les autres timeframes doivent être récupérés (sinon PairFrames les
+    récupère). Étapes 3-4 de run_batch_scan.
+
+    Args:
+        frames (dict): {symbol: PairFrames}
+        symbols (list): Paires en course (survivors de screen_pairs)
+        screened (dict): État des paires (screened de screen_pairs)
+        pipeline (Pipeline): Étapes, rejet anticipé et configuration
+        kept (dict): Complété avec les bougies des paires candidates (optionnel)
+
+    Returns:
+        tuple: (outcomes, fallback) - [(symbol, status, result), ...] et
+               paires à analyser individuellement
+    """
+    settings = pipeline.settings
+    use_ma = settings.USE_MA and bool(_ma_periods(settings))
+    rsi_bars = required_bars("rsi", settings.TIMEFRAME, settings)
+    outcomes = []
+    fallback = []
+
+    batch = []
+    ma_series = {tf: [] for tf in settings.MA_TIMEFRAMES} if use_ma else {}
+    for symbol in symbols:
+        pair_ma = {
+            tf: _dense_series(frames[symbol], tf, required_bars("ma", tf, settings)) for tf in ma_series
+        }
+        if any(s is None for s in pair_ma.values()):
+            fallback.append(symbol)
+            continue
+
+        batch.append(symbol)
+        for tf, series in pair_ma.items():
+            ma_series[tf].append(series)
+
+    ma = ma_columns(ma_series, len(batch), settings) if batch and use_ma else None
+
+    for i, symbol in enumerate(batch):
+        try:
+            pair_frames = frames[symbol]
+            state = screened[symbol]
+            last_candle = get_last_closed_candle(
+                pair_frames.get(settings.TIMEFRAME, limit=rsi_bars if settings.USE_RSI else 1)
+            )
+
+            ma_data = _row(ma, i, {}) if ma is not None else None
+            if use_ma and not passes_trend_filter(ma_data, settings):
+                outcomes.append((symbol, "filtered", None))
+                continue
+            if pipeline.early_rejection and use_ma and rejects_early({**state, "ma": ma_data}):
+                outcomes.append((symbol, "filtered", None))
+                continue
+
+            status, result = finalize_pair(
+                symbol, state["rsi"], last_candle, ma_data, state.get("multi"), settings
+            )
+            if kept is not None and status == "success":
+                kept[symbol] = pair_frames
+            outcomes.append((symbol, status, result))
+
+        except Exception as e:
+            logger.error(f"  ✗ Erreur inattendue pour {symbol}: {str(e)}")
+            outcomes.append((symbol, "error", None))
+
+    return outcomes, fallback
+
+
+def run_batch_scan(exchange, symbols, plan, kept=None, pipeline=None):
+    """
+    Scanne les paires avec le moteur vectorisé
+
+    Même ordre d'étapes que le scan paire par paire (scanner.build_pipeline) :
+    1. Timeframe principal de toutes les paires, RSI en une passe, filtre
+    2. Multi-indicateurs en une passe (mêmes bougies, sans requête), rejet
+       anticipé sur les filtres de signaux et le score atteignable
+    3. Autres timeframes des paires encore en course, MA en une passe
+    4. Filtre de tendance et résultat candidat par paire
+       (scanner.finalize_pair, identique au scan paire par paire)
+
+    Args:
+        exchange: Instance ccxt dont les marchés sont déjà chargés
+        symbols (list): Symboles à analyser
+        plan (dict): Plan de récupération {timeframe: limit}
+        kept (dict): Complété avec les bougies des paires candidates
+                     {symbol: PairFrames} (optionnel)
+        pipeline (Pipeline): Étapes de l'analyse individuelle, rejet anticipé
+                             et configuration du scan (optionnel, build_pipeline)
+
+    Returns:
+        list: [(symbol, status, result), ...] - mêmes résultats que analyze_single_pair
+    """
+    if pipeline is None:
+        pipeline = build_pipeline(plan)
+    settings = pipeline.settings
+    total = len(symbols)
+    index = {symbol: idx for idx, symbol in enumerate(symbols, 1)}
+    frames = {symbol: PairFrames(exchange, symbol, plan, settings=settings) for symbol in symbols}
+
+    # ===== 1-2. TIMEFRAME PRINCIPAL : RSI, MULTI-INDICATEURS, REJET ANTICIPÉ =====
+    _fetch_all(frames.values(), [settings.TIMEFRAME], settings)
+    outcomes, survivors, fallback, screened = screen_pairs(frames, symbols, pipeline)
+
+    logger.info(
+        f"  Batch RSI / multi-indicateurs: {len(survivors)}/{total} paire(s) en course pour les MA, "
+        f"{len(fallback)} en analyse individuelle"
+    )
+
+    # ===== 3-4. AUTRES TIMEFRAMES, MA, RÉSULTATS PAR PAIRE =====
+    others = [tf for tf in plan if tf != settings.TIMEFRAME]
+    if survivors and others:
+        _fetch_all([frames[symbol] for symbol in survivors], others, settings)
+
+    finished, missing = finish_pairs(frames, survivors, screened, pipeline, kept)
+    outcomes.extend(finished)
+    fallback.extend(missing)
+
+    # ===== 5. ANALYSE INDIVIDUELLE (HISTORIQUE INCOMPLET) =====
+    for symbol in fallback:
+        status, result = analyze_single_pair(
+            exchange,
+            symbol,
+            index[symbol],
+            total,
+            plan=plan,
+            frames=frames[symbol],
+            kept=kept,
+            pipeline=pipeline,
+        )
+        outcomes.append((symbol, status, result))
+
+    return outcomes
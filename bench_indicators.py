@@ -0,0 +1,353 @@
+"""
+Micro-benchmark des indicateurs techniques
+Compare les noyaux NumPy à l'implémentation pandas historique
+Usage: python bench_indicators.py
+"""
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+from indicators import (
+    calculate_rsi,
+    get_latest_rsi,
+    calculate_sma,
+    calculate_ema,
+    calculate_macd,
+    calculate_bollinger_bands,
+    calculate_stochastic,
+    latest_rsi,
+    latest_sma,
+    latest_ema,
+    latest_macd,
+    latest_bollinger_bands,
+    latest_stochastic,
+)
+from data import OHLCV
+from kernels import rolling_max, rolling_min, rolling_mean_std
+from sweeps import rsi_sweep, macd_sweep, bollinger_sweep
+
+
+def legacy_calculate_rsi(prices, period=14):
+    """
+    Implémentation historique du RSI (boucles iloc élément par élément)
+    Conservée comme référence pour la parité et le benchmark
+    """
+    prices = prices.reset_index(drop=True)
+    delta = prices.diff()
+
+    gains = delta.copy()
+    losses = delta.copy()
+    gains[gains < 0] = 0
+    losses[losses > 0] = 0
+    losses = abs(losses)
+
+    avg_gain = pd.Series(index=gains.index, dtype=float)
+    avg_loss = pd.Series(index=losses.index, dtype=float)
+    avg_gain.iloc[period] = gains.iloc[1:period + 1].mean()
+    avg_loss.iloc[period] = losses.iloc[1:period + 1].mean()
+
+    for i in range(period + 1, len(gains)):
+        avg_gain.iloc[i] = (avg_gain.iloc[i - 1] * (period - 1) + gains.iloc[i]) / period
+        avg_loss.iloc[i] = (avg_loss.iloc[i - 1] * (period - 1) + losses.iloc[i]) / period
+
+    rsi = pd.Series(index=prices.index, dtype=float)
+    for i in range(period, len(prices)):
+        if avg_loss.iloc[i] == 0:
+            rsi.iloc[i] = 100.0
+        elif avg_gain.iloc[i] == 0:
+            rsi.iloc[i] = 0.0
+        else:
+            rs = avg_gain.iloc[i] / avg_loss.iloc[i]
+            rsi.iloc[i] = 100 - (100 / (1 + rs))
+
+    return rsi
+
+
+def random_prices(n, seed=42):
+    """Génère une marche aléatoire géométrique de n prix"""
+    rng = np.random.default_rng(seed)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))))
+
+
+def best_time(func, repeat):
+    """Meilleur temps (secondes) sur `repeat` exécutions"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_rsi(sizes=(200, 1000, 10000), period=14):
+    """Benchmark RSI : boucles iloc vs noyau NumPy (avec contrôle de parité)"""
+    print("\n" + "=" * 60)
+    print(f"RSI (période {period}) : pandas iloc vs noyau NumPy")
+    print("=" * 60)
+    print(f"{'Bougies':>8} | {'Historique':>12} | {'NumPy':>10} | {'Gain':>8} | Parité")
+    print("-" * 60)
+
+    all_equal = True
+    for n in sizes:
+        prices = random_prices(n)
+        repeat = 3 if n >= 10000 else 10
+
+        legacy = legacy_calculate_rsi(prices, period)
+        current = calculate_rsi(prices, period)
+        equal = np.array_equal(legacy.to_numpy(), current.to_numpy(), equal_nan=True)
+        all_equal &= equal
+
+        t_legacy = best_time(lambda: legacy_calculate_rsi(prices, period), repeat)
+        t_current = best_time(lambda: calculate_rsi(prices, period), repeat)
+
+        print(
+            f"{n:>8} | {t_legacy * 1000:>9.2f} ms | {t_current * 1000:>7.3f} ms | "
+            f"{t_legacy / t_current:>7.0f}x | {'✓ identique' if equal else '✗ ÉCART'}"
+        )
+
+    return all_equal
+
+
+def legacy_to_dataframe(rows):
+    """
+    Conversion historique des bougies ccxt (DataFrame + to_datetime + to_numeric)
+    Conservée comme référence pour le benchmark d'ingestion
+    """
+    df = pd.DataFrame(rows, columns=['time', 'open', 'high', 'low', 'close', 'volume'])
+    df['time'] = pd.to_datetime(df['time'], unit='ms')
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def bench_ingestion(sizes=(200, 1000)):
+    """Benchmark ingestion OHLCV : DataFrame historique vs conteneur OHLCV"""
+    print("\n" + "=" * 60)
+    print("Ingestion OHLCV (liste ccxt -> colonne close)")
+    print("=" * 60)
+    print(f"{'Bougies':>8} | {'DataFrame':>12} | {'OHLCV':>10} | {'Gain':>8} | Parité")
+    print("-" * 60)
+
+    all_equal = True
+    for n in sizes:
+        prices = random_prices(n).to_numpy()
+        rows = [[1700000000000 + i * 14400000, p, p * 1.01, p * 0.99, p, 1000.0]
+                for i, p in enumerate(prices)]
+
+        legacy = legacy_to_dataframe(rows)
+        current = OHLCV.from_rows(rows)
+        equal = all(
+            np.array_equal(legacy[col].to_numpy(), current[col].to_numpy())
+            for col in current.columns
+        )
+        all_equal &= equal
+
+        t_legacy = best_time(lambda: legacy_to_dataframe(rows)['close'], 20)
+        t_current = best_time(lambda: OHLCV.from_rows(rows)['close'], 20)
+
+        print(
+            f"{n:>8} | {t_legacy * 1000:>9.3f} ms | {t_current * 1000:>7.3f} ms | "
+            f"{t_legacy / t_current:>7.1f}x | {'✓ identique' if equal else '✗ ÉCART'}"
+        )
+
+    return all_equal
+
+
+def bench_latest(sizes=(200, 1000)):
+    """Benchmark dernières valeurs : séries pandas complètes vs latest_* (une paire)"""
+    print("\n" + "=" * 60)
+    print("Dernières valeurs (RSI, SMA/EMA 20-50, MACD, Bollinger, Stochastic)")
+    print("=" * 60)
+    print(f"{'Bougies':>8} | {'Séries':>12} | {'latest_*':>10} | {'Gain':>8} | Parité")
+    print("-" * 60)
+
+    all_equal = True
+    for n in sizes:
+        close = random_prices(n)
+        high, low = close * 1.01, close * 0.99
+        arrays = close.to_numpy(), high.to_numpy(), low.to_numpy()
+
+        def full():
+            return [
+                get_latest_rsi(close),
+                *(calculate_sma(close, p).iloc[-1] for p in (20, 50)),
+                *(calculate_ema(close, p).iloc[-1] for p in (20, 50)),
+                calculate_macd(close)["histogram"].iloc[-1],
+                calculate_bollinger_bands(close)["upper"].iloc[-1],
+                calculate_stochastic(high, low, close)["d"].iloc[-1],
+            ]
+
+        def latest():
+            c, h, l = arrays
+            return [
+                latest_rsi(c),
+                *(latest_sma(c, p) for p in (20, 50)),
+                *(latest_ema(c, p) for p in (20, 50)),
+                latest_macd(c)["histogram"][-1],
+                latest_bollinger_bands(c)["upper"][-1],
+                latest_stochastic(h, l, c)["d"][-1],
+            ]
+
+        # Écart relatif : préchauffage borné (CONVERGENCE_TOLERANCE) et sommes glissantes
+        equal = np.allclose(full(), latest(), rtol=1e-9, atol=1e-9)
+        all_equal &= equal
+
+        t_full = best_time(full, 20)
+        t_latest = best_time(latest, 20)
+
+        print(
+            f"{n:>8} | {t_full * 1000:>9.3f} ms | {t_latest * 1000:>7.3f} ms | "
+            f"{t_full / t_latest:>7.1f}x | {'✓ < 1e-9' if equal else '✗ ÉCART'}"
+        )
+
+    return all_equal
+
+
+def bench_rolling(sizes=(1000, 10000), pairs=300, window=20):
+    """Benchmark fenêtres glissantes : pandas rolling vs noyaux O(n) (1-D et lot 2-D)"""
+    print("\n" + "=" * 60)
+    print(f"Fenêtres glissantes (min/max/moyenne/écart-type, fenêtre {window})")
+    print("=" * 60)
+    print(f"{'Série':>12} | {'pandas':>10} | {'Noyaux':>10} | {'Gain':>6} | Parité")
+    print("-" * 60)
+
+    def pandas_rolling(frame):
+        rolling = frame.rolling(window)
+        return [rolling.min(), rolling.max(), rolling.mean(), rolling.std()]
+
+    def kernel_rolling(values):
+        return [rolling_min(values, window), rolling_max(values, window), *rolling_mean_std(values, window)]
+
+    cases = [(f"{n}", random_prices(n)) for n in sizes]
+    batch = np.stack([random_prices(200, seed=i).to_numpy() for i in range(pairs)])
+    cases.append((f"{pairs}x200", pd.DataFrame(batch.T)))
+
+    all_equal = True
+    for label, frame in cases:
+        values = frame.to_numpy().T if isinstance(frame, pd.DataFrame) else frame.to_numpy()
+        expected = [result.to_numpy().T if isinstance(frame, pd.DataFrame) else result.to_numpy()
+                    for result in pandas_rolling(frame)]
+        equal = all(
+            np.allclose(k, p, rtol=1e-9, atol=0, equal_nan=True)
+            for k, p in zip(kernel_rolling(values), expected)
+        )
+        all_equal &= equal
+
+        t_pandas = best_time(lambda: pandas_rolling(frame), 10)
+        t_kernel = best_time(lambda: kernel_rolling(values), 10)
+
+        print(
+            f"{label:>12} | {t_pandas * 1000:>7.3f} ms | {t_kernel * 1000:>7.3f} ms | "
+            f"{t_pandas / t_kernel:>5.1f}x | {'✓ < 1e-9' if equal else '✗ ÉCART'}"
+        )
+
+    return all_equal
+
+
+def bench_sweeps(n=1000):
+    """Benchmark balayages de paramètres : un appel par variante vs sweeps.py"""
+    print("\n" + "=" * 60)
+    print(f"Balayages de paramètres ({n} bougies)")
+    print("=" * 60)
+    print(f"{'Balayage':>16} | {'Variantes':>10} | {'Sweep':>10} | {'Gain':>6} | Parité")
+    print("-" * 60)
+
+    close = random_prices(n)
+    values = close.to_numpy()
+    rsi_periods = range(7, 29)
+    macd_params = [(f, s, g) for f in (8, 10, 12) for s in (21, 26, 30) for g in (5, 9, 12)]
+    bb_params = [(p, d) for p in (10, 20, 30) for d in (1.5, 2, 2.5)]
+
+    cases = [
+        (
+            "RSI 7-28",
+            lambda: np.stack([calculate_rsi(pd.Series(values), p).to_numpy() for p in rsi_periods]),
+            lambda: rsi_sweep(values, rsi_periods),
+        ),
+        (
+            "MACD 3x3x3",
+            lambda: np.stack([calculate_macd(pd.Series(values), *p)["signal"].to_numpy() for p in macd_params]),
+            lambda: macd_sweep(values, (8, 10, 12), (21, 26, 30), (5, 9, 12))[1]["signal"],
+        ),
+        (
+            "Bollinger 3x3",
+            lambda: np.stack([calculate_bollinger_bands(pd.Series(values), *p)["upper"].to_numpy() for p in bb_params]),
+            lambda: bollinger_sweep(values, (10, 20, 30), (1.5, 2, 2.5))["upper"].reshape(len(bb_params), -1),
+        ),
+    ]
+
+    all_equal = True
+    for label, variants, sweep in cases:
+        equal = np.array_equal(variants(), sweep(), equal_nan=True)
+        all_equal &= equal
+
+        t_variants = best_time(variants, 10)
+        t_sweep = best_time(sweep, 10)
+
+        print(
+            f"{label:>16} | {t_variants * 1000:>7.3f} ms | {t_sweep * 1000:>7.3f} ms | "
+            f"{t_variants / t_sweep:>5.1f}x | {'✓ identique' if equal else '✗ ÉCART'}"
+        )
+
+    return all_equal
+
+
+def bench_backends(n=10000, pairs=300):
+    """Benchmark récurrences : backend NumPy vs Numba (si installé)"""
+    import config
+    import kernels_numba
+    from batch_indicators import rsi_last as batch_rsi_last
+
+    print("\n" + "=" * 60)
+    print("Récurrences : backend NumPy vs Numba (KERNEL_BACKEND)")
+    print("=" * 60)
+    if not kernels_numba.NUMBA_AVAILABLE:
+        print("Numba non installé : comparaison ignorée (pip install numba)")
+        return True
+    print(f"{'Calcul':>16} | {'NumPy':>10} | {'Numba':>10} | {'Gain':>6} | Parité")
+    print("-" * 60)
+
+    close = random_prices(n)
+    matrix = np.stack([random_prices(1000, seed=i).to_numpy() for i in range(pairs)])
+    cases = [
+        (f"RSI {n}", lambda: calculate_rsi(close).to_numpy()),
+        (f"RSI {pairs}x1000", lambda: batch_rsi_last(matrix, 14)),
+    ]
+
+    saved = config.KERNEL_BACKEND
+    all_equal = True
+    try:
+        for label, func in cases:
+            config.KERNEL_BACKEND = "numpy"
+            expected = func()
+            t_numpy = best_time(func, 5)
+            config.KERNEL_BACKEND = "numba"
+            equal = np.array_equal(expected, func(), equal_nan=True)  # 1er appel : compilation
+            all_equal &= equal
+            t_numba = best_time(func, 5)
+
+            print(
+                f"{label:>16} | {t_numpy * 1000:>7.3f} ms | {t_numba * 1000:>7.3f} ms | "
+                f"{t_numpy / t_numba:>5.1f}x | {'✓ identique' if equal else '✗ ÉCART'}"
+            )
+    finally:
+        config.KERNEL_BACKEND = saved
+
+    return all_equal
+
+
+def main():
+    """Lance tous les benchmarks"""
+    ok = bench_rsi()
+    ok &= bench_ingestion()
+    ok &= bench_latest()
+    ok &= bench_rolling()
+    ok &= bench_sweeps()
+    ok &= bench_backends()
+    print("=" * 60 + "\n")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
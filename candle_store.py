@@ -0,0 +1,163 @@
+"""
+Cache local des bougies OHLCV (stockage sur disque)
+Une série par (exchange, symbole, timeframe), au format NumPy .npy
+Seules les bougies clôturées sont conservées : elles ne changent plus.
+CANDLE_STORE_DIR / CANDLE_STORE_MAX_BARS sont des paramètres du processus,
+lus dans config.py et hors de la ScanConfig (scan_config.PROCESS_SETTINGS).
+"""
+
+import os
+import threading
+import numpy as np
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+
+def series_path(exchange_id, symbol, timeframe):
+    """
+    Chemin du fichier d'une série de bougies
+
+    Args:
+        exchange_id (str): Identifiant ccxt de l'exchange (ex: 'binance')
+        symbol (str): Symbole de la paire (ex: 'BTC/USDC')
+        timeframe (str): Timeframe des bougies (ex: '4h')
+
+    Returns:
+        str: Chemin du fichier .npy (ex: 'cache/candles/binance/BTC_USDC/4h.npy')
+    """
+    safe_symbol = symbol.replace("/", "_").replace(":", "_")
+    return os.path.join(config.CANDLE_STORE_DIR, exchange_id, safe_symbol, f"{timeframe}.npy")
+
+
+def capacity():
+    """Nombre maximal de bougies conservées par série (CANDLE_STORE_MAX_BARS)"""
+    return config.CANDLE_STORE_MAX_BARS
+
+
+def load_candles(exchange_id, symbol, timeframe):
+    """
+    Charge les bougies clôturées stockées pour une série
+
+    Args:
+        exchange_id (str): Identifiant ccxt de l'exchange
+        symbol (str): Symbole de la paire
+        timeframe (str): Timeframe des bougies
+
+    Returns:
+        np.ndarray: Tableau (n, 6) [time_ms, open, high, low, close, volume]
+        None: Si aucune donnée stockée ou fichier illisible
+    """
+    path = series_path(exchange_id, symbol, timeframe)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        rows = np.load(path)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Cache bougies illisible pour {symbol} ({timeframe}): {str(e)}")
+        return None
+
+    if rows.ndim != 2 or rows.shape[1] != 6 or len(rows) == 0:
+        return None
+
+    return rows
+
+
+def save_candles(exchange_id, symbol, timeframe, rows):
+    """
+    Enregistre une série de bougies clôturées (écriture atomique)
+
+    Seules les CANDLE_STORE_MAX_BARS dernières bougies sont conservées.
+    Une erreur d'écriture est journalisée mais n'interrompt jamais le scan.
+
+    Args:
+        exchange_id (str): Identifiant ccxt de l'exchange
+        symbol (str): Symbole de la paire
+        timeframe (str): Timeframe des bougies
+        rows (np.ndarray): Tableau (n, 6) de bougies clôturées, triées par date
+    """
+    if rows is None or len(rows) == 0:
+        return
+
+    path = series_path(exchange_id, symbol, timeframe)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(rows[-capacity():], dtype=np.float64))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Écriture du cache bougies impossible pour {symbol} ({timeframe}): {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def closed_candles(rows, timeframe_ms, now_ms):
+    """
+    Ne garde que les bougies clôturées (date d'ouverture + durée <= maintenant)
+
+    Args:
+        rows (np.ndarray): Tableau (n, 6) de bougies
+        timeframe_ms (int): Durée d'une bougie en millisecondes
+        now_ms (int): Horodatage courant en millisecondes
+
+    Returns:
+        np.ndarray: Bougies clôturées
+    """
+    return rows[rows[:, 0] + timeframe_ms <= now_ms]
+
+
+def merge_candles(stored, fresh):
+    """
+    Fusionne les bougies stockées et les bougies récentes
+
+    En cas de doublon sur la date d'ouverture, la bougie récente l'emporte.
+
+    Args:
+        stored (np.ndarray): Bougies stockées (n, 6)
+        fresh (np.ndarray): Bougies téléchargées (m, 6)
+
+    Returns:
+        np.ndarray: Bougies fusionnées, triées par date, sans doublon
+    """
+    if stored is None or len(stored) == 0:
+        return fresh
+    if fresh is None or len(fresh) == 0:
+        return stored
+
+    combined = np.concatenate([stored, fresh])
+    # np.unique garde la première occurrence : on parcourt à l'envers
+    # pour privilégier les bougies récentes
+    _, idx = np.unique(combined[::-1, 0], return_index=True)
+    return combined[::-1][idx]
+
+
+def incremental_since(stored, timeframe_ms, now_ms, limit):
+    """
+    Détermine si une récupération incrémentale ("since") suffit
+
+    Args:
+        stored (np.ndarray): Bougies stockées (ou None)
+        timeframe_ms (int): Durée d'une bougie en millisecondes
+        now_ms (int): Horodatage courant en millisecondes
+        limit (int): Nombre de bougies demandées par l'appelant
+
+    Returns:
+        tuple: (since, count) - date de la première bougie manquante et
+               nombre de bougies à télécharger (bougie en cours incluse)
+        None: Si un téléchargement complet est nécessaire
+    """
+    if stored is None or len(stored) == 0:
+        return None
+
+    since = int(stored[-1, 0]) + timeframe_ms
+    count = max(1, (now_ms - since) // timeframe_ms + 1)
+
+    # Trop de bougies manquantes, ou historique stocké trop court
+    if count >= limit or len(stored) + count < limit:
+        return None
+
+    return since, int(count)
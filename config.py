@@ -3,12 +3,31 @@ Configuration globale du scanner RSI
 Tous les paramètres sont centralisés ici.
 """
 
+import os
+
 # ============================
 # EXCHANGE
 # ============================
 EXCHANGE_ID = "binance"
 EXCHANGE_SANDBOX = False  # Mode sandbox/testnet (non utilisé en V1)
 
+# Cache des marchés (exchangeInfo) et des listes de paires filtrées
+USE_MARKETS_CACHE = True  # Cache disque JSON des marchés et des listes filtrées
+MARKETS_CACHE_DIR = "cache/markets"  # Dossier du cache JSON
+MARKETS_CACHE_TTL = 6 * 3600  # Durée de validité (secondes)
+
+# Source des données : "live" (Binance via ccxt), "synthetic" (générateur hors-ligne)
+# ou "archive" (rejeu d'une archive enregistrée, voir replay_exchange.py)
+# Surchargeable par la variable d'environnement SCANNER_EXCHANGE_MODE (CI sans réseau)
+EXCHANGE_MODE = os.environ.get("SCANNER_EXCHANGE_MODE", "live")
+REPLAY_ARCHIVE_DIR = "replay/archive"  # Archive lue en mode "archive"
+REPLAY_SYNTHETIC_PAIRS = 1000  # Nombre de paires générées en mode "synthetic"
+REPLAY_SYNTHETIC_BARS = 1000  # Profondeur d'historique de chaque série synthétique
+REPLAY_NOW_MS = 1760000000000  # Horloge simulée figée (None = heure réelle)
+REPLAY_SEED = 42  # Graine des données synthétiques et des erreurs injectées
+REPLAY_LATENCY_MS = 0  # Latence simulée par requête (millisecondes)
+REPLAY_RATE_LIMIT_ERROR_RATE = 0.0  # Probabilité d'une erreur 429 par requête de données
+
 # ============================
 # UNIVERS DE SCAN
 # ============================
@@ -16,6 +35,15 @@ QUOTE_FILTER = "USDC"  # Scanner uniquement les paires */USDC
 MARKET_TYPE = "spot"  # Type de marché (spot uniquement en V1)
 EXCLUDE_STABLE_PAIRS = True  # Exclure les paires stable/stable (ex: USDT/USDC)
 
+# Préfiltre tickers 24h : un seul appel fetch_tickers écarte les paires peu liquides
+# ou inactives avant toute récupération de bougies (None = critère désactivé)
+USE_TICKER_PREFILTER = False
+PREFILTER_MIN_QUOTE_VOLUME = 100_000  # Volume 24h minimum en devise de cotation (ex: 100k USDC)
+PREFILTER_MAX_SPREAD_PCT = 0.5  # Écart bid/ask maximum (% du prix moyen)
+PREFILTER_MIN_CHANGE_PCT = None  # Variation 24h minimum (%)
+PREFILTER_MAX_CHANGE_PCT = None  # Variation 24h maximum (%)
+PREFILTER_MAX_STALENESS_MINUTES = 60  # Ancienneté maximale du dernier ticker
+
 # Limite de paires à scanner (utile pour le dev/test)
 # None = scanner toutes les paires du scope
 MAX_PAIRS = None  # Mode production
@@ -24,7 +52,19 @@ MAX_PAIRS = None  # Mode production
 # DONNÉES OHLCV
 # ============================
 TIMEFRAME = "4h"  # Timeframe pour le calcul du RSI
-MIN_OHLCV_BARS = 200  # Nombre minimum de bougies à récupérer
+MIN_OHLCV_BARS = 200  # Bougies récupérées par défaut hors scan (graphiques, tests)
+
+# Bougies récupérées par le scan : déduites des indicateurs activés (indicator_registry)
+INDICATOR_PRECISION = 1e-6  # Poids maximal de l'historique non récupéré (EMA, RSI, MACD)
+# (1e-6 : RSI / MACD amorcés sur au moins autant de bougies qu'avant le registre ;
+#  1e-3 : ~2x moins de bougies, valeurs légèrement différentes)
+MAX_FETCH_BARS = 1000  # Plafond par timeframe (limite Binance par requête: 1000)
+
+# Cache local des bougies clôturées (rescan : seules les nouvelles bougies sont téléchargées)
+USE_CANDLE_STORE = False  # Activer le cache disque des bougies (écrit des .npy sous CANDLE_STORE_DIR)
+CANDLE_STORE_DIR = "cache/candles"  # Dossier du cache (un fichier .npy par série)
+CANDLE_STORE_MAX_BARS = 2500  # Nombre maximum de bougies conservées par série
+# (≥ 2088 : historique 4h du 1d reconstruit avec RESAMPLE_HIGHER_TIMEFRAMES, voir plus bas)
 
 # ============================
 # INDICATEURS À UTILISER
@@ -60,7 +100,18 @@ MA_TIMEFRAMES = [
 MIN_TREND_SCORE = (
     2  # Score minimum de tendance haussière (0-3) pour filtrer les opportunités
 )
-MIN_MA_BARS = 60  # Nombre de bougies pour calculer les MA (max(periods) + marge)
+
+# Reconstruction locale des timeframes supérieurs (1d, 1w) à partir de TIMEFRAME
+# (bornes de l'exchange : jours UTC, semaines commençant le lundi). Un timeframe est
+# reconstruit si l'historique TIMEFRAME nécessaire tient en une requête
+# (RESAMPLE_MAX_SOURCE_BARS) ou, avec USE_CANDLE_STORE, dans le cache des bougies
+# (CANDLE_STORE_MAX_BARS) ; il est téléchargé sinon.
+# Avec INDICATOR_PRECISION = 1e-6 (347 bougies par timeframe MA), le 1d demande 2088
+# bougies 4h : reconstruit seulement avec le cache (une requête `since` par rescan au
+# lieu de deux) ; le 1w (14616 bougies 4h) reste toujours téléchargé. Sans cache, la
+# reconstruction ne s'applique qu'aux précisions grossières (1e-2 : 1d sur 708 bougies 4h).
+RESAMPLE_HIGHER_TIMEFRAMES = False
+RESAMPLE_MAX_SOURCE_BARS = 1000  # Bougies TIMEFRAME max par requête (limite Binance: 1000)
 
 # ============================
 # OUTPUT
@@ -81,9 +132,17 @@ LOG_TO_FILE = True  # Écrire les logs dans un fichier
 # RATE LIMITING & RETRIES
 # ============================
 ENABLE_RATE_LIMIT = True  # Activer la gestion automatique du rate limit par ccxt
+# (ignoré si USE_WEIGHT_RATE_LIMITER : le limiteur de poids partagé le remplace)
 MAX_RETRIES = 3  # Nombre maximum de tentatives en cas d'erreur réseau
 RETRY_DELAY = 2  # Délai initial entre les tentatives (secondes) - doublé à chaque retry
 
+# Limiteur de poids partagé (token bucket) : tous les appels à l'exchange, tous threads
+# confondus, puisent dans le même budget de poids Binance (REQUEST_WEIGHT)
+USE_WEIGHT_RATE_LIMITER = True
+RATE_LIMIT_WEIGHT_PER_MINUTE = 6000  # Budget de poids de l'exchange par minute (Binance: 6000)
+RATE_LIMIT_SAFETY_RATIO = 0.9  # Fraction du budget utilisée (marge pour les autres clients de l'IP)
+RATE_LIMIT_BURST_WEIGHT = 200  # Poids consommable en rafale avant lissage
+
 # ============================
 # CONCURRENCY (V2)
 # ============================
@@ -92,6 +151,22 @@ MAX_WORKERS = (
     8  # Nombre de threads parallèles (5-10 recommandé pour respecter rate limits)
 )
 
+# Moteur de scan : "threads" (ThreadPoolExecutor ci-dessus), "asyncio" (ccxt.async_support),
+# "batch" (indicateurs vectorisés sur toutes les paires à la fois, voir batch_scanner.py)
+# ou "pipelined" (étages réseau et calcul séparés, voir pipelined_scanner.py)
+SCAN_ENGINE = "threads"
+ASYNC_MAX_CONCURRENCY = 64  # Requêtes OHLCV simultanées max (moteur asyncio)
+
+# Moteur "pipelined" : chaque étage se règle séparément
+PIPELINE_FETCH_WORKERS = 16  # Threads de téléchargement (réseau uniquement)
+PIPELINE_COMPUTE_WORKERS = 2  # Threads de calcul (lots vectorisés NumPy)
+PIPELINE_QUEUE_DEPTH = 256  # Paires téléchargées en attente de calcul (file bornée)
+PIPELINE_BATCH_SIZE = 64  # Paires max par lot de calcul
+
+# Récurrences des indicateurs (lissage de Wilder, EMA) : "numpy" (défaut) ou
+# "numba" (boucles compilées de kernels_numba.py, si Numba est installé)
+KERNEL_BACKEND = os.environ.get("SCANNER_KERNEL_BACKEND", "numpy")
+
 
 # ============================
 # MULTI-INDICATEURS (V2.5)
@@ -149,3 +224,23 @@ FILTER_BB_POSITION = None  # Ex: ['oversold', 'near_oversold'] pour survente uni
 # Options: 'oversold', 'overbought', 'bullish_cross', 'bearish_cross', 'neutral'
 FILTER_STOCH_SIGNAL = None  # Ex: ['oversold', 'bullish_cross'] pour signaux d'achat uniquement
 # FILTER_STOCH_SIGNAL = ['oversold', 'bullish_cross']  # Décommenter pour activer
+
+# === REJET ANTICIPÉ ===
+# Les étapes de l'analyse d'une paire s'exécutent de la moins coûteuse à la plus
+# coûteuse (RSI -> MACD/BB/Stoch -> MA multi-timeframe). Avec le rejet anticipé,
+# les filtres ci-dessus et le meilleur score de confluence encore atteignable
+# sont vérifiés après chaque étape : une paire perdue d'avance ne télécharge
+# pas ses timeframes supérieurs (mêmes résultats, moins de requêtes). Les paires
+# rejetées manquent aux candidats re-notés par la GUI : False pour les garder
+EARLY_REJECTION = True
+
+# ============================
+# MODE DAEMON (python main.py --daemon)
+# ============================
+# Scan relancé juste après chaque clôture de bougie TIMEFRAME (horloge de
+# l'exchange). Bougies et résultats restent en mémoire d'un cycle à l'autre :
+# seules les séries dont une bougie s'est clôturée sont mises à jour (une petite
+# requête par série) et seules les paires modifiées sont recalculées
+DAEMON_CLOSE_DELAY = 5  # Secondes après la clôture avant de scanner (bougie publiée par l'exchange)
+DAEMON_SYNC_CLOCK = True  # Mesurer le décalage horloge locale / exchange (fetch_time) à chaque cycle
+DAEMON_MAX_CYCLES = None  # Nombre de cycles avant arrêt (None = sans fin)
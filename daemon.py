@@ -0,0 +1,229 @@
+"""
+Scan continu aligné sur les clôtures de bougies (mode daemon)
+Usage: python main.py --daemon
+
+Un cycle est lancé au démarrage, puis DAEMON_CLOSE_DELAY secondes après
+chaque clôture d'une bougie TIMEFRAME, mesurée sur l'horloge de
+l'exchange (décalage de l'horloge locale compensé via fetch_time).
+
+Les bougies (PairFrames) et le dernier résultat de chaque paire restent en
+mémoire d'un cycle à l'autre. Une série n'est mise à jour que si une bougie
+s'est clôturée depuis sa récupération, par une petite requête `since`
+(PairFrames.refresh) ; une paire dont aucune série n'a changé garde son
+résultat sans recalcul. Un cycle 4h coûte ainsi une requête de 2 bougies par
+série 4h, les séries 1d et 1w n'étant mises à jour qu'à leur propre clôture.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import ccxt
+from scan_config import ScanConfig
+from logger import get_logger
+from exchange import get_filtered_pairs
+from data import PairFrames, WEEK_OFFSET_MS
+from scanner import analyze_single_pair, build_fetch_plan, build_pipeline, sort_results
+from scoring import score_results
+
+logger = get_logger()
+
+# Attente max (secondes) entre deux vérifications de l'horloge pendant la veille
+_WAKE_CHECK_INTERVAL = 60
+
+
+def next_close_ms(timeframe, now_ms):
+    """
+    Clôture de la bougie en cours (ouverture de la suivante)
+
+    Args:
+        timeframe (str): Timeframe des bougies (ex: '4h')
+        now_ms (int): Horodatage courant (millisecondes)
+
+    Returns:
+        int: Horodatage de la clôture (millisecondes, semaines alignées sur le lundi)
+    """
+    timeframe_ms = ccxt.Exchange.parse_timeframe(timeframe) * 1000
+    offset = WEEK_OFFSET_MS if timeframe == "1w" else 0
+    return ((now_ms - offset) // timeframe_ms + 1) * timeframe_ms + offset
+
+
+def _format_ms(timestamp_ms):
+    """Horodatage lisible (UTC)"""
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+class ScanDaemon:
+    """
+    Scanner permanent : état par paire conservé en mémoire entre les cycles
+    """
+
+    def __init__(self, exchange=None, settings=None):
+        """
+        Args:
+            exchange: Instance ccxt à réutiliser (optionnel, créée au premier cycle)
+            settings (ScanConfig): Configuration de tous les cycles (None =
+                config.py figé à la création du daemon)
+        """
+        self.exchange = exchange
+        self.settings = settings or ScanConfig.from_module()
+        self.frames = {}  # {symbol: PairFrames}
+        self.outcomes = {}  # {symbol: (status, result)} du dernier calcul
+        self.plan = None
+        self.clock_offset_ms = 0
+        self.cycles = 0
+        self.stop_event = threading.Event()
+
+    def sync_clock(self):
+        """
+        Mesure le décalage entre l'horloge de l'exchange et l'horloge locale
+
+        Le décalage est estimé au milieu de l'aller-retour de fetch_time. En
+        cas d'échec, le décalage précédent est conservé.
+
+        Returns:
+            float: Décalage en millisecondes (exchange - local)
+        """
+        if not self.settings.DAEMON_SYNC_CLOCK:
+            return self.clock_offset_ms
+
+        try:
+            before = time.time() * 1000
+            server_ms = self.exchange.fetch_time()
+            after = time.time() * 1000
+        except Exception as e:
+            logger.warning(f"Horloge de l'exchange indisponible, décalage précédent conservé: {str(e)}")
+            return self.clock_offset_ms
+
+        self.clock_offset_ms = server_ms - (before + after) / 2
+        logger.debug(f"Décalage horloge exchange: {self.clock_offset_ms:+.0f} ms")
+        return self.clock_offset_ms
+
+    def now_ms(self):
+        """Horodatage courant de l'exchange (horloge locale corrigée)"""
+        return int(time.time() * 1000 + self.clock_offset_ms)
+
+    def next_scan_ms(self):
+        """Heure (exchange) du prochain cycle : clôture TIMEFRAME + DAEMON_CLOSE_DELAY"""
+        settings = self.settings
+        return next_close_ms(settings.TIMEFRAME, self.now_ms()) + int(settings.DAEMON_CLOSE_DELAY * 1000)
+
+    def _update_pair(self, symbol, idx, total, now_ms, pipeline):
+        """
+        Met à jour les séries d'une paire et la recalcule si elles ont changé
+
+        Returns:
+            bool: True si la paire a été recalculée
+        """
+        pair_frames = self.frames.get(symbol)
+        previous = self.outcomes.get(symbol)
+
+        if pair_frames is None:
+            pair_frames = PairFrames(self.exchange, symbol, self.plan, settings=pipeline.settings)
+            self.frames[symbol] = pair_frames
+        elif not pair_frames.refresh(now_ms) and previous is not None and previous[0] != "error":
+            return False
+
+        self.outcomes[symbol] = analyze_single_pair(
+            self.exchange, symbol, idx, total, plan=self.plan, frames=pair_frames, pipeline=pipeline
+        )
+        return True
+
+    def run_cycle(self):
+        """
+        Exécute un cycle : univers, mise à jour incrémentale, paires modifiées
+
+        Returns:
+            list: Opportunités retenues, triées (mêmes règles que scan_market)
+            None: Si l'exchange ou l'univers est indisponible
+        """
+        settings = self.settings
+        start_time = time.time()
+
+        try:
+            self.exchange, symbols = get_filtered_pairs(self.exchange, settings)
+        except Exception as e:
+            logger.error(f"Erreur lors de l'initialisation de l'exchange: {str(e)}")
+            return None
+
+        if not symbols:
+            logger.warning("Aucune paire trouvée correspondant au scope")
+            return None
+
+        self.sync_clock()
+
+        plan = build_fetch_plan(settings)
+        if plan != self.plan:
+            # Indicateurs modifiés : bougies et résultats à reconstruire
+            self.frames.clear()
+            self.outcomes.clear()
+            self.plan = plan
+
+        # Paires sorties de l'univers
+        for symbol in set(self.frames) - set(symbols):
+            del self.frames[symbol]
+            self.outcomes.pop(symbol, None)
+
+        pipeline = build_pipeline(plan, settings=settings)
+        now_ms = self.now_ms()
+        fetches_before = sum(pair_frames.fetch_count for pair_frames in self.frames.values())
+        total = len(symbols)
+
+        workers = settings.MAX_WORKERS if settings.ENABLE_CONCURRENCY else 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            updated = list(executor.map(
+                lambda item: self._update_pair(item[1], item[0], total, now_ms, pipeline),
+                enumerate(symbols, 1),
+            ))
+
+        candidates = [
+            result for status, result in (self.outcomes[symbol] for symbol in symbols)
+            if status == "success"
+        ]
+        results = sort_results(score_results(candidates, settings=settings), settings)
+
+        self.cycles += 1
+        fetches = sum(pair_frames.fetch_count for pair_frames in self.frames.values()) - fetches_before
+        logger.info(
+            f"Cycle {self.cycles} ({_format_ms(now_ms)}): {sum(updated)}/{total} paire(s) recalculée(s), "
+            f"{fetches} requête(s) OHLCV, {len(results)} opportunité(s) en {time.time() - start_time:.1f}s"
+        )
+        return results
+
+    def run(self, on_cycle=None):
+        """
+        Boucle du daemon : un cycle immédiatement, puis après chaque clôture TIMEFRAME
+
+        Args:
+            on_cycle (callable): Appelé avec les opportunités de chaque cycle
+                (optionnel, ex: output.output_results)
+        """
+        settings = self.settings
+        logger.info("=" * 60)
+        logger.info(f"MODE DAEMON - scan après chaque clôture {settings.TIMEFRAME} (+{settings.DAEMON_CLOSE_DELAY}s)")
+        logger.info("=" * 60)
+
+        while not self.stop_event.is_set():
+            results = self.run_cycle()
+            if results is not None and on_cycle is not None:
+                on_cycle(results)
+
+            if settings.DAEMON_MAX_CYCLES and self.cycles >= settings.DAEMON_MAX_CYCLES:
+                break
+
+            wake_ms = self.next_scan_ms()
+            logger.info(f"Prochain scan: {_format_ms(wake_ms)}")
+
+            # Veille par tranches : l'échéance est recalculée sur l'horloge
+            # (mise en veille de la machine, décalage corrigé au cycle suivant)
+            while not self.stop_event.is_set():
+                remaining = (wake_ms - self.now_ms()) / 1000
+                if remaining <= 0:
+                    break
+                self.stop_event.wait(min(remaining, _WAKE_CHECK_INTERVAL))
+
+        logger.info(f"Daemon arrêté après {self.cycles} cycle(s)")
+
+    def stop(self):
+        """Arrête le daemon (après le cycle en cours)"""
+        self.stop_event.set()
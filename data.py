@@ -2,75 +2,301 @@
 Récupération et préparation des données OHLCV
 """
 
+import asyncio
+import numpy as np
 import pandas as pd
 import time
 import ccxt
-import config
+from scan_config import ScanConfig
+import candle_store
+import rate_limiter
 from logger import get_logger
 
 logger = get_logger()
 
 
-def fetch_ohlcv(exchange, symbol, timeframe=None, limit=None):
+def _prepare_download(exchange, symbol, timeframe, limit, settings):
+    """
+    Prépare la requête OHLCV, en consultant le cache local si activé
+
+    Avec USE_CANDLE_STORE, seules les bougies postérieures à la dernière bougie
+    clôturée stockée sont demandées à l'exchange (paramètre `since` de ccxt).
+
+    Args:
+        exchange: Instance ccxt de l'exchange (synchrone ou asynchrone)
+        symbol (str): Symbole de la paire
+        timeframe (str): Timeframe des bougies
+        limit (int): Nombre de bougies à retourner
+        settings (ScanConfig): Configuration du scan
+
+    Returns:
+        tuple: (request, store_state)
+            - request (dict): Arguments de exchange.fetch_ohlcv
+            - store_state (tuple): (stored, timeframe_ms, now_ms), None sans cache
+    """
+    if not settings.USE_CANDLE_STORE:
+        return {"symbol": symbol, "timeframe": timeframe, "limit": limit}, None
+
+    timeframe_ms = exchange.parse_timeframe(timeframe) * 1000
+    now_ms = exchange.milliseconds()
+    stored = candle_store.load_candles(exchange.id, symbol, timeframe)
+    incremental = candle_store.incremental_since(stored, timeframe_ms, now_ms, limit)
+
+    if incremental is None:
+        request = {"symbol": symbol, "timeframe": timeframe, "limit": limit}
+        stored = None
+    else:
+        since, count = incremental
+        logger.debug(f"Cache bougies {symbol} ({timeframe}): {count} bougie(s) manquante(s)")
+        request = {"symbol": symbol, "timeframe": timeframe, "since": since, "limit": count}
+
+    return request, (stored, timeframe_ms, now_ms)
+
+
+def _complete_download(exchange, symbol, timeframe, limit, fresh, store_state):
+    """
+    Fusionne les bougies reçues avec le cache et réenregistre les bougies clôturées
+
+    Args:
+        exchange: Instance ccxt de l'exchange
+        symbol (str): Symbole de la paire
+        timeframe (str): Timeframe des bougies
+        limit (int): Nombre de bougies à retourner
+        fresh (list): Bougies reçues de l'exchange
+        store_state (tuple): État retourné par _prepare_download
+
+    Returns:
+        list | np.ndarray: Bougies [time, open, high, low, close, volume]
+    """
+    if store_state is None:
+        return fresh
+
+    stored, timeframe_ms, now_ms = store_state
+    if len(fresh) == 0 and stored is None:
+        return fresh
+
+    fresh = np.asarray(fresh, dtype=np.float64).reshape(-1, 6)
+    rows = candle_store.merge_candles(stored, fresh)
+
+    candle_store.save_candles(
+        exchange.id, symbol, timeframe,
+        candle_store.closed_candles(rows, timeframe_ms, now_ms)
+    )
+
+    return rows[-limit:]
+
+
+def _request_pages(exchange, request, page):
+    """
+    Découpe une requête OHLCV plus longue que la limite de l'exchange
+
+    Les pages sont des requêtes `since` contiguës, de la plus ancienne à la
+    plus récente ; sans `since`, la dernière page se termine sur la bougie en cours.
+
+    Args:
+        exchange: Instance ccxt de l'exchange
+        request (dict): Arguments de exchange.fetch_ohlcv
+        page (int): Bougies max par requête (RESAMPLE_MAX_SOURCE_BARS)
+
+    Returns:
+        list: Requêtes successives (la requête elle-même si elle tient en une page)
+    """
+    limit = request["limit"]
+    if not limit or limit <= page:
+        return [request]
+
+    timeframe_ms = exchange.parse_timeframe(request["timeframe"]) * 1000
+    since = request.get("since")
+    if since is None:
+        offset = _bucket_offset(timeframe_ms)
+        current_open = (exchange.milliseconds() - offset) // timeframe_ms * timeframe_ms + offset
+        since = current_open - (limit - 1) * timeframe_ms
+
+    return [
+        {**request, "since": since + start * timeframe_ms, "limit": min(page, limit - start)}
+        for start in range(0, limit, page)
+    ]
+
+
+def _join_pages(pages):
+    """Bougies des pages d'une requête, triées et sans doublon (paire récente)"""
+    if len(pages) == 1:
+        return pages[0]
+    rows = None
+    for fresh in pages:
+        if len(fresh):
+            rows = candle_store.merge_candles(rows, np.asarray(fresh, dtype=np.float64).reshape(-1, 6))
+    return [] if rows is None else rows
+
+
+def _download_rows(exchange, symbol, timeframe, limit, settings, since=None):
+    """
+    Télécharge les bougies brutes, via le cache local si activé
+
+    Args:
+        exchange: Instance ccxt de l'exchange
+        symbol (str): Symbole de la paire
+        timeframe (str): Timeframe des bougies
+        limit (int): Nombre de bougies à retourner
+        settings (ScanConfig): Configuration du scan
+        since (int): Date d'ouverture de la première bougie voulue (ms) ;
+                     requête directe, sans le cache local (PairFrames.refresh)
+
+    Returns:
+        list | np.ndarray: Bougies [time, open, high, low, close, volume]
+    """
+    if since is not None:
+        request, store_state = {"symbol": symbol, "timeframe": timeframe, "since": since, "limit": limit}, None
+    else:
+        request, store_state = _prepare_download(exchange, symbol, timeframe, limit, settings)
+    pages = []
+    for page in _request_pages(exchange, request, settings.RESAMPLE_MAX_SOURCE_BARS):
+        rate_limiter.acquire(rate_limiter.ohlcv_weight(page["limit"]))
+        pages.append(exchange.fetch_ohlcv(**page))
+    return _complete_download(exchange, symbol, timeframe, limit, _join_pages(pages), store_state)
+
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+_COLUMN_INDEX = {name: i for i, name in enumerate(OHLCV_COLUMNS)}
+
+
+class OHLCV:
+    """
+    Bougies OHLCV stockées dans des tableaux NumPy
+
+    Horodatages en int64 (millisecondes) et valeurs dans un seul tableau float64
+    (5, n) dont chaque ligne est une colonne contiguë (open, high, low, close,
+    volume). `ohlcv['close']` retourne une pd.Series sans copie, utilisable
+    directement par les indicateurs ; le DataFrame complet n'est construit qu'à
+    la demande (to_dataframe).
+    """
+
+    columns = ['time'] + OHLCV_COLUMNS
+
+    def __init__(self, times, values):
+        """
+        Args:
+            times (np.ndarray): Horodatages d'ouverture int64 (n,), en millisecondes
+            values (np.ndarray): Valeurs float64 (5, n) [open, high, low, close, volume]
+        """
+        self.times = times
+        self.values = values
+        self._frame = None
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Construit le conteneur à partir des bougies brutes de ccxt (une seule conversion)
+
+        Args:
+            rows (list | np.ndarray): Bougies [time, open, high, low, close, volume]
+
+        Returns:
+            OHLCV: Conteneur (valeurs manquantes converties en NaN)
+        """
+        block = np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+        return cls(block[:, 0].astype(np.int64), np.ascontiguousarray(block[:, 1:].T))
+
+    def __len__(self):
+        return len(self.times)
+
+    def column(self, name):
+        """
+        Vue NumPy (sans copie) d'une colonne
+
+        Args:
+            name (str): 'time', 'open', 'high', 'low', 'close' ou 'volume'
+
+        Returns:
+            np.ndarray: Colonne (datetime64[ms] pour 'time', float64 sinon)
+        """
+        if name == 'time':
+            return self.times.view('datetime64[ms]')
+        return self.values[_COLUMN_INDEX[name]]
+
+    def __getitem__(self, name):
+        return pd.Series(self.column(name), name=name, copy=False)
+
+    def tail(self, n):
+        """Les `n` dernières bougies (vues, sans copie)"""
+        if n >= len(self):
+            return self
+        return OHLCV(self.times[-n:], self.values[:, -n:])
+
+    def last_candle(self):
+        """Dernière bougie sous forme de dictionnaire (voir get_last_closed_candle)"""
+        candle = {'time': pd.Timestamp(int(self.times[-1]), unit='ms')}
+        for name, i in _COLUMN_INDEX.items():
+            candle[name] = self.values[i, -1]
+        return candle
+
+    def to_dataframe(self):
+        """
+        DataFrame équivalent (construit une seule fois, à la demande)
+
+        Returns:
+            pd.DataFrame: Colonnes [time, open, high, low, close, volume]
+        """
+        if self._frame is None:
+            frame = {'time': self.column('time')}
+            frame.update({name: self.values[i] for name, i in _COLUMN_INDEX.items()})
+            self._frame = pd.DataFrame(frame)
+        return self._frame
+
+
+def fetch_ohlcv(exchange, symbol, timeframe=None, limit=None, since=None, settings=None):
     """
     Récupère les données OHLCV pour un symbole donné
 
     Args:
         exchange: Instance ccxt de l'exchange
         symbol (str): Symbole de la paire (ex: 'BTC/USDT')
-        timeframe (str): Timeframe des bougies (par défaut: config.TIMEFRAME)
-        limit (int): Nombre de bougies à récupérer (par défaut: config.MIN_OHLCV_BARS)
+        timeframe (str): Timeframe des bougies (par défaut: TIMEFRAME de settings)
+        limit (int): Nombre de bougies à récupérer (par défaut: MIN_OHLCV_BARS de settings)
+        since (int): Date d'ouverture de la première bougie (ms, optionnel) :
+                     les `limit` bougies à partir de cette date
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
 
     Returns:
-        pd.DataFrame: DataFrame avec colonnes [time, open, high, low, close, volume]
+        OHLCV: Bougies [time, open, high, low, close, volume] (to_dataframe() au besoin)
         None: En cas d'erreur
     """
+    if settings is None:
+        settings = ScanConfig.from_module()
     if timeframe is None:
-        timeframe = config.TIMEFRAME
+        timeframe = settings.TIMEFRAME
     if limit is None:
-        limit = config.MIN_OHLCV_BARS
+        limit = settings.MIN_OHLCV_BARS
 
     retry_count = 0
-    delay = config.RETRY_DELAY
+    delay = settings.RETRY_DELAY
 
-    while retry_count < config.MAX_RETRIES:
+    while retry_count < settings.MAX_RETRIES:
         try:
             logger.debug(f"Récupération OHLCV pour {symbol} ({timeframe}, limit={limit})")
 
-            ohlcv = exchange.fetch_ohlcv(
-                symbol=symbol,
-                timeframe=timeframe,
-                limit=limit
-            )
+            ohlcv = _download_rows(exchange, symbol, timeframe, limit, settings, since)
 
-            if not ohlcv or len(ohlcv) == 0:
+            if ohlcv is None or len(ohlcv) == 0:
                 logger.warning(f"Aucune donnée OHLCV pour {symbol}")
                 return None
 
-            # Conversion en DataFrame
-            df = pd.DataFrame(
-                ohlcv,
-                columns=['time', 'open', 'high', 'low', 'close', 'volume']
-            )
-
-            # Conversion du timestamp en datetime
-            df['time'] = pd.to_datetime(df['time'], unit='ms')
-
-            # S'assurer que les colonnes OHLC sont bien numériques
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+            candles = OHLCV.from_rows(ohlcv)
 
-            logger.debug(f"✓ {len(df)} bougies récupérées pour {symbol}")
-            return df
+            logger.debug(f"✓ {len(candles)} bougies récupérées pour {symbol}")
+            return candles
 
         except ccxt.RateLimitExceeded:
             logger.warning(f"Rate limit dépassé pour {symbol}, attente de {delay}s...")
+            # Pause partagée : les autres threads attendent aussi au lieu de
+            # déclencher à leur tour des erreurs 429
+            rate_limiter.penalize(delay)
             time.sleep(delay)
             delay *= 2  # Backoff exponentiel
             retry_count += 1
 
         except ccxt.NetworkError as e:
-            logger.warning(f"Erreur réseau pour {symbol} (tentative {retry_count + 1}/{config.MAX_RETRIES}): {str(e)}")
+            logger.warning(f"Erreur réseau pour {symbol} (tentative {retry_count + 1}/{settings.MAX_RETRIES}): {str(e)}")
             time.sleep(delay)
             delay *= 2
             retry_count += 1
@@ -83,24 +309,183 @@ def fetch_ohlcv(exchange, symbol, timeframe=None, limit=None):
             logger.error(f"Erreur inattendue pour {symbol}: {str(e)}")
             return None
 
-    logger.error(f"Échec après {config.MAX_RETRIES} tentatives pour {symbol}")
+    logger.error(f"Échec après {settings.MAX_RETRIES} tentatives pour {symbol}")
+    return None
+
+
+async def fetch_ohlcv_async(exchange, symbol, timeframe=None, limit=None, settings=None):
+    """
+    Version asynchrone de fetch_ohlcv (ccxt.async_support)
+
+    Même politique de retry, même cache local et même conteneur OHLCV en sortie ;
+    les attentes utilisent asyncio.sleep pour ne pas bloquer la boucle.
+
+    Args:
+        exchange: Instance ccxt.async_support de l'exchange
+        symbol (str): Symbole de la paire (ex: 'BTC/USDT')
+        timeframe (str): Timeframe des bougies (par défaut: TIMEFRAME de settings)
+        limit (int): Nombre de bougies à récupérer (par défaut: MIN_OHLCV_BARS de settings)
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        OHLCV: Bougies [time, open, high, low, close, volume] (to_dataframe() au besoin)
+        None: En cas d'erreur
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    if timeframe is None:
+        timeframe = settings.TIMEFRAME
+    if limit is None:
+        limit = settings.MIN_OHLCV_BARS
+
+    retry_count = 0
+    delay = settings.RETRY_DELAY
+
+    while retry_count < settings.MAX_RETRIES:
+        try:
+            logger.debug(f"Récupération OHLCV async pour {symbol} ({timeframe}, limit={limit})")
+
+            request, store_state = _prepare_download(exchange, symbol, timeframe, limit, settings)
+            pages = []
+            for page in _request_pages(exchange, request, settings.RESAMPLE_MAX_SOURCE_BARS):
+                await rate_limiter.acquire_async(rate_limiter.ohlcv_weight(page["limit"]))
+                pages.append(await exchange.fetch_ohlcv(**page))
+            ohlcv = _complete_download(exchange, symbol, timeframe, limit, _join_pages(pages), store_state)
+
+            if ohlcv is None or len(ohlcv) == 0:
+                logger.warning(f"Aucune donnée OHLCV pour {symbol}")
+                return None
+
+            candles = OHLCV.from_rows(ohlcv)
+
+            logger.debug(f"✓ {len(candles)} bougies récupérées pour {symbol}")
+            return candles
+
+        except ccxt.RateLimitExceeded:
+            logger.warning(f"Rate limit dépassé pour {symbol}, attente de {delay}s...")
+            # Pause partagée : les autres threads attendent aussi au lieu de
+            # déclencher à leur tour des erreurs 429
+            rate_limiter.penalize(delay)
+            await asyncio.sleep(delay)
+            delay *= 2  # Backoff exponentiel
+            retry_count += 1
+
+        except ccxt.NetworkError as e:
+            logger.warning(f"Erreur réseau pour {symbol} (tentative {retry_count + 1}/{settings.MAX_RETRIES}): {str(e)}")
+            await asyncio.sleep(delay)
+            delay *= 2
+            retry_count += 1
+
+        except ccxt.ExchangeError as e:
+            logger.error(f"Erreur exchange pour {symbol}: {str(e)}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Erreur inattendue pour {symbol}: {str(e)}")
+            return None
+
+    logger.error(f"Échec après {settings.MAX_RETRIES} tentatives pour {symbol}")
     return None
 
 
+# 1970-01-01 est un jeudi : les semaines de l'exchange commencent le lundi (J+4)
+WEEK_OFFSET_MS = 4 * 86400 * 1000
+
+
+def _bucket_offset(timeframe_ms):
+    """Décalage d'alignement des bougies d'un timeframe (lundi pour 1w, minuit UTC sinon)"""
+    return WEEK_OFFSET_MS if timeframe_ms == 7 * 86400 * 1000 else 0
+
+
+def timeframe_ratio(source_timeframe, target_timeframe):
+    """
+    Nombre de bougies source agrégées dans une bougie cible
+
+    Args:
+        source_timeframe (str): Timeframe de la série disponible (ex: '4h')
+        target_timeframe (str): Timeframe à reconstruire (ex: '1d')
+
+    Returns:
+        int: Nombre de bougies source par bougie cible
+        None: Si le timeframe cible ne peut pas être reconstruit (mois, années,
+              durée non multiple ou bornes non alignées)
+    """
+    if target_timeframe[-1] in ("M", "y"):
+        return None
+
+    source_ms = ccxt.Exchange.parse_timeframe(source_timeframe) * 1000
+    target_ms = ccxt.Exchange.parse_timeframe(target_timeframe) * 1000
+
+    if target_ms <= source_ms or target_ms % source_ms or _bucket_offset(target_ms) % source_ms:
+        return None
+
+    return target_ms // source_ms
+
+
+def resample_ohlcv(ohlcv, source_timeframe, target_timeframe):
+    """
+    Reconstruit des bougies d'un timeframe supérieur à partir d'une série locale
+
+    Les bornes suivent celles de l'exchange : jours UTC, semaines commençant le
+    lundi. La première bougie, incomplète (début de série en cours de période),
+    est écartée ; la dernière reste en cours, comme celle renvoyée par l'exchange.
+
+    Args:
+        ohlcv (OHLCV): Bougies du timeframe source
+        source_timeframe (str): Timeframe de `ohlcv` (ex: '4h')
+        target_timeframe (str): Timeframe à reconstruire (ex: '1d', '1w')
+
+    Returns:
+        OHLCV: Bougies reconstruites
+        None: Si la série source est vide ou le timeframe non reconstructible
+    """
+    if ohlcv is None or len(ohlcv) == 0 or timeframe_ratio(source_timeframe, target_timeframe) is None:
+        return None
+
+    target_ms = ccxt.Exchange.parse_timeframe(target_timeframe) * 1000
+    offset = _bucket_offset(target_ms)
+
+    times, values = ohlcv.times, ohlcv.values
+    buckets = (times - offset) // target_ms * target_ms + offset
+
+    # Première période incomplète : la série commence après son ouverture
+    if times[0] != buckets[0]:
+        keep = buckets != buckets[0]
+        times, values, buckets = times[keep], values[:, keep], buckets[keep]
+        if len(times) == 0:
+            return None
+
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+
+    resampled = np.stack([
+        values[0, starts],
+        np.maximum.reduceat(values[1], starts),
+        np.minimum.reduceat(values[2], starts),
+        values[3, ends],
+        np.add.reduceat(values[4], starts),
+    ])
+
+    return OHLCV(buckets[starts], resampled)
+
+
 def get_last_closed_candle(df):
     """
     Retourne les informations de la dernière bougie clôturée
 
     Args:
-        df (pd.DataFrame): DataFrame OHLCV
+        df (OHLCV | pd.DataFrame): Bougies OHLCV
 
     Returns:
         dict: Dictionnaire avec time, open, high, low, close, volume
-        None: Si le DataFrame est vide
+        None: Si aucune bougie
     """
     if df is None or len(df) == 0:
         return None
 
+    if isinstance(df, OHLCV):
+        return df.last_candle()
+
     # On prend la dernière ligne (dernière bougie clôturée)
     last = df.iloc[-1]
 
@@ -112,3 +497,214 @@ def get_last_closed_candle(df):
         'close': last['close'],
         'volume': last['volume']
     }
+
+
+class PairFrames:
+    """
+    Bougies OHLCV d'une paire, récupérées une seule fois par timeframe
+
+    Le plan de récupération ({timeframe: limit}) est construit en amont à partir
+    des besoins de chaque indicateur (voir scanner.build_fetch_plan). Chaque
+    timeframe est téléchargé au plus une fois, à la première demande, avec la
+    limite maximale du plan. Les indicateurs reçoivent ensuite la fin de cette
+    série sur la longueur qu'ils demandent.
+
+    Avec RESAMPLE_HIGHER_TIMEFRAMES, un timeframe absent du plan est reconstruit
+    localement à partir de la série TIMEFRAME (voir resample_ohlcv). Si
+    la série source de la paire est trop courte (paire récente), le timeframe
+    est téléchargé directement. Une série source plus longue qu'une requête
+    (historique du cache des bougies) est téléchargée par pages au premier scan.
+    """
+
+    def __init__(self, exchange, symbol, plan, frames=None, settings=None):
+        """
+        Args:
+            exchange: Instance ccxt de l'exchange
+            symbol (str): Symbole de la paire (ex: 'BTC/USDC')
+            plan (dict): Nombre de bougies à récupérer par timeframe
+            frames (dict): Séries déjà récupérées {timeframe: OHLCV} (optionnel)
+            settings (ScanConfig): Configuration du scan (None = config.py actuel)
+        """
+        self.exchange = exchange
+        self.symbol = symbol
+        self.plan = dict(plan)
+        self.settings = settings if settings is not None else ScanConfig.from_module()
+        self._frames = dict(frames) if frames else {}
+        self._direct = set()  # Timeframes reconstructibles, mais trop courts : téléchargés
+        self.fetch_count = 0
+
+    def get(self, timeframe, limit=None):
+        """
+        Retourne les dernières bougies d'un timeframe (téléchargées au besoin)
+
+        Args:
+            timeframe (str): Timeframe des bougies
+            limit (int): Nombre de bougies souhaitées (None = toute la série)
+
+        Returns:
+            OHLCV: Les `limit` dernières bougies
+            None: Si la récupération a échoué
+        """
+        if timeframe not in self._frames:
+            source = self._resample_source(timeframe)
+            if source:
+                self.get(source)
+                self._resample(timeframe, limit)
+            if timeframe not in self._frames:
+                fetch_limit = max(self.plan.get(timeframe, 0), limit or 0) or None
+                self._frames[timeframe] = fetch_ohlcv(
+                    self.exchange, self.symbol, timeframe=timeframe, limit=fetch_limit, settings=self.settings
+                )
+                self.fetch_count += 1
+
+        df = self._frames[timeframe]
+
+        if df is None or limit is None or len(df) <= limit:
+            return df
+
+        return df.tail(limit)
+
+    def _resample(self, timeframe, limit):
+        """
+        Reconstruit `timeframe` depuis sa série source (déjà en mémoire)
+
+        Returns:
+            bool: False si la série reconstruite a moins de `limit` bougies :
+                  le timeframe passe alors en téléchargement direct
+        """
+        source = self._resample_source(timeframe)
+        resampled = resample_ohlcv(self._frames.get(source), source, timeframe)
+        if limit and (resampled is None or len(resampled) < limit):
+            logger.debug(
+                f"    {self.symbol}: {timeframe} reconstruit trop court "
+                f"({0 if resampled is None else len(resampled)}/{limit}), téléchargement direct"
+            )
+            self._direct.add(timeframe)
+            return False
+        self._frames[timeframe] = resampled
+        return True
+
+    def direct_fetches(self, reads):
+        """
+        Timeframes reconstruits trop courts, à télécharger directement
+
+        Pour les moteurs qui téléchargent eux-mêmes (moteur asyncio) : les
+        timeframes reconstructibles sont reconstruits depuis leur source déjà
+        récupérée, ceux dont l'historique est insuffisant sont retournés.
+
+        Args:
+            reads (dict): Bougies lues par timeframe {timeframe: bars}
+
+        Returns:
+            list: Timeframes à télécharger (puis à fournir via update)
+        """
+        short = []
+        for timeframe, bars in reads.items():
+            source = self._resample_source(timeframe)
+            if source and timeframe not in self._frames and source in self._frames:
+                if not self._resample(timeframe, bars):
+                    short.append(timeframe)
+        return short
+
+    def has(self, timeframe):
+        """Indique si un timeframe est déjà en mémoire (récupéré ou fourni)"""
+        return timeframe in self._frames
+
+    def update(self, frames):
+        """
+        Ajoute des séries récupérées ailleurs (ex: moteur asyncio)
+
+        Args:
+            frames (dict): {timeframe: OHLCV ou None}
+        """
+        self._frames.update(frames)
+
+    def refresh(self, now_ms):
+        """
+        Met à jour les séries dont une bougie s'est clôturée depuis leur récupération
+
+        La dernière bougie d'une série est la bougie en cours au moment de la
+        récupération. Si elle s'est clôturée depuis, seules les bougies à
+        partir d'elle sont demandées (une petite requête `since` par série),
+        fusionnées et la série garde sa longueur. Les autres séries sont
+        conservées telles quelles, sans requête. Les timeframes reconstruits
+        le seront depuis la série source à jour ; une série en échec, ou trop
+        en retard, est retéléchargée entièrement à la prochaine demande.
+
+        Args:
+            now_ms (int): Horodatage courant de l'exchange (millisecondes)
+
+        Returns:
+            list: Timeframes modifiés (mis à jour ou à retélécharger)
+        """
+        changed = []
+
+        for timeframe in list(self._frames):
+            if self._resample_source(timeframe):
+                continue
+
+            df = self._frames[timeframe]
+            if df is None or len(df) == 0:
+                del self._frames[timeframe]
+                changed.append(timeframe)
+                continue
+
+            timeframe_ms = self.exchange.parse_timeframe(timeframe) * 1000
+            since = int(df.times[-1])
+            if since + timeframe_ms > now_ms:
+                continue  # Bougie en cours inchangée : série conservée
+
+            changed.append(timeframe)
+            keep = max(len(df), self.plan.get(timeframe, 0))
+            count = (now_ms - since) // timeframe_ms + 1
+            fresh = None
+            if count < keep:
+                fresh = fetch_ohlcv(
+                    self.exchange, self.symbol, timeframe=timeframe, limit=int(count), since=since,
+                    settings=self.settings,
+                )
+                self.fetch_count += 1
+
+            if fresh is None or len(fresh) == 0 or int(fresh.times[0]) != since:
+                del self._frames[timeframe]
+                continue
+
+            rows = candle_store.merge_candles(
+                np.column_stack([df.times, df.values.T]),
+                np.column_stack([fresh.times, fresh.values.T]),
+            )
+            self._frames[timeframe] = OHLCV.from_rows(rows[-keep:])
+
+        # Timeframes reconstruits : à reconstruire depuis leur source mise à jour
+        for timeframe in list(self._frames):
+            source = self._resample_source(timeframe)
+            if source and source in changed:
+                del self._frames[timeframe]
+                changed.append(timeframe)
+
+        return changed
+
+    def fetch_timeframe(self, timeframe):
+        """
+        Timeframe à télécharger pour obtenir `timeframe`
+
+        Returns:
+            str: TIMEFRAME si `timeframe` est reconstruit localement,
+                 `timeframe` sinon
+        """
+        return self._resample_source(timeframe) or timeframe
+
+    def _resample_source(self, timeframe):
+        """
+        Timeframe source à partir duquel reconstruire `timeframe`
+
+        Returns:
+            str: TIMEFRAME si le timeframe est absent du plan et reconstructible
+            None: Si le timeframe doit être téléchargé
+        """
+        settings = self.settings
+        if not settings.RESAMPLE_HIGHER_TIMEFRAMES or timeframe in self.plan or timeframe in self._direct:
+            return None
+        if settings.TIMEFRAME not in self.plan or timeframe_ratio(settings.TIMEFRAME, timeframe) is None:
+            return None
+        return settings.TIMEFRAME
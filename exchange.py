@@ -3,64 +3,224 @@ Gestion de l'exchange Binance via CCXT
 Initialisation, chargement des marchés et filtrage des paires
 """
 
+import json
+import os
+import time
+import weakref
 import ccxt
-import config
+from scan_config import ScanConfig
+import rate_limiter
 from logger import get_logger
 
 logger = get_logger()
 
 
-def init_exchange():
+def init_exchange(settings=None):
     """
     Initialise la connexion à l'exchange Binance
 
+    Args:
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
     Returns:
         ccxt.Exchange: Instance de l'exchange configurée
     """
-    logger.info(f"Initialisation de l'exchange {config.EXCHANGE_ID}...")
+    if settings is None:
+        settings = ScanConfig.from_module()
+
+    if settings.EXCHANGE_MODE != "live":
+        from replay_exchange import create_replay_exchange
+
+        exchange = create_replay_exchange(settings=settings)
+        logger.info(f"Exchange hors-ligne {exchange.id} initialisé (EXCHANGE_MODE={settings.EXCHANGE_MODE})")
+        return exchange
+
+    logger.info(f"Initialisation de l'exchange {settings.EXCHANGE_ID}...")
+
+    exchange_class = getattr(ccxt, settings.EXCHANGE_ID)
+
+    exchange = exchange_class(_exchange_options(settings))
+
+    logger.info(f"Exchange {settings.EXCHANGE_ID} initialisé avec succès")
+    return exchange
+
+
+def init_async_exchange(markets_from=None, settings=None):
+    """
+    Initialise une instance asynchrone de l'exchange (ccxt.async_support)
+
+    Args:
+        markets_from: Instance ccxt dont les marchés déjà chargés sont réutilisés
+                      (évite un second téléchargement de exchangeInfo)
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        ccxt.async_support.Exchange: Instance asynchrone (à fermer avec `await exchange.close()`)
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+
+    if settings.EXCHANGE_MODE != "live":
+        from replay_exchange import create_replay_exchange
+
+        exchange = create_replay_exchange(async_mode=True, shared_with=markets_from, settings=settings)
+    else:
+        import ccxt.async_support as ccxt_async
+
+        exchange_class = getattr(ccxt_async, settings.EXCHANGE_ID)
+        exchange = exchange_class(_exchange_options(settings))
+
+    if markets_from is not None and markets_from.markets:
+        exchange.set_markets(markets_from.markets, markets_from.currencies)
+
+    logger.debug(f"Exchange asynchrone {settings.EXCHANGE_ID} initialisé")
+    return exchange
+
+
+def _exchange_options(settings):
+    """
+    Options ccxt communes aux instances synchrone et asynchrone
 
-    exchange_class = getattr(ccxt, config.EXCHANGE_ID)
+    Args:
+        settings (ScanConfig): Configuration du scan
 
-    exchange = exchange_class({
-        'enableRateLimit': config.ENABLE_RATE_LIMIT,
+    Returns:
+        dict: Options de construction de l'exchange
+    """
+    # Le limiteur de poids partagé remplace le limiteur ccxt (propre à chaque instance)
+    enable_rate_limit = settings.ENABLE_RATE_LIMIT and not rate_limiter.enabled()
+
+    return {
+        'enableRateLimit': enable_rate_limit,
         'timeout': 30000,  # 30 secondes
         'options': {
-            'defaultType': config.MARKET_TYPE,
+            'defaultType': settings.MARKET_TYPE,
         }
-    })
+    }
 
-    logger.info(f"Exchange {config.EXCHANGE_ID} initialisé avec succès")
-    return exchange
+
+# Date de chargement des marchés de chaque instance (réutilisation dans la GUI)
+_markets_loaded_at = weakref.WeakKeyDictionary()
+
+
+def _markets_cache_path(exchange_id, settings):
+    """Chemin du cache JSON des marchés d'un exchange"""
+    return os.path.join(settings.MARKETS_CACHE_DIR, f"{exchange_id}_{settings.MARKET_TYPE}.json")
+
+
+def _filtered_cache_path(exchange_id, settings):
+    """Chemin du cache JSON des listes de paires filtrées d'un exchange"""
+    return os.path.join(settings.MARKETS_CACHE_DIR, f"{exchange_id}_{settings.MARKET_TYPE}_filtered.json")
+
+
+def _read_json(path):
+    """Lit un fichier JSON du cache (None si absent ou illisible)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Cache illisible ({path}): {str(e)}")
+        return None
+
+
+def _write_json(path, payload):
+    """Écrit un fichier JSON du cache (écriture atomique, erreurs journalisées)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Écriture du cache impossible ({path}): {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _is_fresh(saved_at, settings):
+    """Indique si un chargement datant de `saved_at` (epoch) est dans le TTL"""
+    return saved_at is not None and time.time() - saved_at < settings.MARKETS_CACHE_TTL
 
 
-def load_markets(exchange):
+def load_markets(exchange, settings=None):
     """
     Charge tous les marchés disponibles sur l'exchange
 
+    Par ordre de préférence : marchés déjà présents sur l'instance (réutilisée),
+    cache disque JSON (USE_MARKETS_CACHE), puis téléchargement de exchangeInfo.
+    Les deux caches expirent après MARKETS_CACHE_TTL secondes.
+
     Args:
         exchange: Instance ccxt de l'exchange
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
 
     Returns:
         dict: Dictionnaire des marchés
     """
+    if settings is None:
+        settings = ScanConfig.from_module()
+
+    if exchange.markets and _is_fresh(_markets_loaded_at.get(exchange), settings):
+        logger.info(f"{len(exchange.markets)} marchés déjà chargés (instance réutilisée)")
+        return exchange.markets
+
+    if settings.USE_MARKETS_CACHE:
+        cached = _read_json(_markets_cache_path(exchange.id, settings))
+        if cached is not None and _is_fresh(cached.get("saved_at"), settings):
+            exchange.set_markets(cached["markets"], cached.get("currencies"))
+            _markets_loaded_at[exchange] = cached["saved_at"]
+            age_min = (time.time() - cached["saved_at"]) / 60
+            logger.info(f"{len(exchange.markets)} marchés chargés depuis le cache ({age_min:.0f} min)")
+            return exchange.markets
+
     logger.info("Chargement des marchés...")
-    markets = exchange.load_markets()
+    rate_limiter.acquire(rate_limiter.ENDPOINT_WEIGHTS["load_markets"])
+    markets = exchange.load_markets(reload=True)
+    _markets_loaded_at[exchange] = time.time()
     logger.info(f"{len(markets)} marchés chargés")
+
+    if settings.USE_MARKETS_CACHE:
+        _write_json(_markets_cache_path(exchange.id, settings), {
+            "saved_at": _markets_loaded_at[exchange],
+            "markets": markets,
+            "currencies": exchange.currencies,
+        })
+
     return markets
 
 
-def filter_pairs(exchange):
+def filter_pairs(exchange, settings=None):
     """
     Filtre les paires selon le scope défini dans la config
 
     Args:
         exchange: Instance ccxt de l'exchange
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
 
     Returns:
         list: Liste des symboles filtrés (ex: ['BTC/USDT', 'ETH/USDT', ...])
     """
+    if settings is None:
+        settings = ScanConfig.from_module()
+
     logger.info("Filtrage des paires selon le scope...")
 
+    # Liste déjà calculée pour ces marchés et ce scope
+    markets_saved_at = _markets_loaded_at.get(exchange)
+    scope_key = f"{settings.QUOTE_FILTER}|{settings.EXCLUDE_STABLE_PAIRS}|{settings.MAX_PAIRS}"
+    cached = _read_json(_filtered_cache_path(exchange.id, settings)) if settings.USE_MARKETS_CACHE else None
+    if (
+        cached is not None
+        and markets_saved_at is not None
+        and cached.get("markets_saved_at") == markets_saved_at
+        and scope_key in cached.get("scopes", {})
+    ):
+        filtered_symbols = cached["scopes"][scope_key]
+        logger.info(f"{len(filtered_symbols)} paires correspondent au scope (cache)")
+        return filtered_symbols
+
     markets = exchange.markets
     filtered_symbols = []
 
@@ -73,15 +233,15 @@ def filter_pairs(exchange):
             continue
 
         # Vérifier le type de marché (spot uniquement)
-        if market.get('type') != config.MARKET_TYPE:
+        if market.get('type') != settings.MARKET_TYPE:
             continue
 
         # Vérifier la quote currency
-        if market.get('quote') != config.QUOTE_FILTER:
+        if market.get('quote') != settings.QUOTE_FILTER:
             continue
 
         # Exclure les paires stable/stable si activé
-        if config.EXCLUDE_STABLE_PAIRS:
+        if settings.EXCLUDE_STABLE_PAIRS:
             base = market.get('base', '')
             if base in stablecoins:
                 logger.debug(f"Exclusion paire stable/stable: {symbol}")
@@ -90,25 +250,138 @@ def filter_pairs(exchange):
         filtered_symbols.append(symbol)
 
     # Appliquer la limite MAX_PAIRS si définie
-    if config.MAX_PAIRS is not None and config.MAX_PAIRS > 0:
-        filtered_symbols = filtered_symbols[:config.MAX_PAIRS]
-        logger.warning(f"Limitation à {config.MAX_PAIRS} paires (config.MAX_PAIRS)")
+    if settings.MAX_PAIRS is not None and settings.MAX_PAIRS > 0:
+        filtered_symbols = filtered_symbols[:settings.MAX_PAIRS]
+        logger.warning(f"Limitation à {settings.MAX_PAIRS} paires (MAX_PAIRS)")
 
     logger.info(f"{len(filtered_symbols)} paires correspondent au scope")
     logger.debug(f"Premières paires: {filtered_symbols[:5]}")
 
+    if settings.USE_MARKETS_CACHE and markets_saved_at is not None:
+        scopes = {}
+        if cached is not None and cached.get("markets_saved_at") == markets_saved_at:
+            scopes = cached.get("scopes", {})
+        scopes[scope_key] = filtered_symbols
+        _write_json(_filtered_cache_path(exchange.id, settings), {
+            "markets_saved_at": markets_saved_at,
+            "scopes": scopes,
+        })
+
     return filtered_symbols
 
 
-def get_filtered_pairs():
+def _ticker_rejection(ticker, now_ms, settings):
+    """
+    Motif de rejet d'une paire d'après son ticker 24h
+
+    Args:
+        ticker (dict): Ticker ccxt de la paire (None si absent)
+        now_ms (int): Horodatage courant en millisecondes
+        settings (ScanConfig): Configuration du scan (seuils PREFILTER_*)
+
+    Returns:
+        str: Motif de rejet ('absent', 'volume', 'spread', 'variation', 'inactif')
+        None: Si la paire passe le préfiltre
+    """
+    if ticker is None:
+        return "absent"
+
+    quote_volume = ticker.get('quoteVolume')
+    if settings.PREFILTER_MIN_QUOTE_VOLUME is not None and (
+        quote_volume is None or quote_volume < settings.PREFILTER_MIN_QUOTE_VOLUME
+    ):
+        return "volume"
+
+    bid, ask = ticker.get('bid'), ticker.get('ask')
+    if settings.PREFILTER_MAX_SPREAD_PCT is not None and bid and ask:
+        spread_pct = (ask - bid) / ((ask + bid) / 2) * 100
+        if spread_pct > settings.PREFILTER_MAX_SPREAD_PCT:
+            return "spread"
+
+    change_pct = ticker.get('percentage')
+    if change_pct is not None:
+        if settings.PREFILTER_MIN_CHANGE_PCT is not None and change_pct < settings.PREFILTER_MIN_CHANGE_PCT:
+            return "variation"
+        if settings.PREFILTER_MAX_CHANGE_PCT is not None and change_pct > settings.PREFILTER_MAX_CHANGE_PCT:
+            return "variation"
+
+    timestamp = ticker.get('timestamp')
+    if settings.PREFILTER_MAX_STALENESS_MINUTES is not None and timestamp is not None:
+        if now_ms - timestamp > settings.PREFILTER_MAX_STALENESS_MINUTES * 60 * 1000:
+            return "inactif"
+
+    return None
+
+
+def prefilter_by_tickers(exchange, symbols, settings=None):
+    """
+    Préfiltre les paires avec un seul appel fetch_tickers (avant toute bougie)
+
+    Écarte les paires peu liquides ou inactives : volume 24h en devise de
+    cotation, écart bid/ask, variation 24h et ancienneté du dernier ticker
+    (seuils PREFILTER_* de la config). En cas d'échec de l'appel, les paires
+    sont retournées sans filtrage.
+
+    Args:
+        exchange: Instance ccxt de l'exchange
+        symbols (list): Symboles issus de filter_pairs
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        list: Symboles retenus (ordre conservé)
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+
+    logger.info("Préfiltre tickers 24h (un seul appel)...")
+
+    try:
+        rate_limiter.acquire(rate_limiter.ENDPOINT_WEIGHTS["fetch_tickers"])
+        tickers = exchange.fetch_tickers()
+    except Exception as e:
+        logger.warning(f"Préfiltre tickers ignoré (fetch_tickers en échec): {str(e)}")
+        return symbols
+
+    now_ms = exchange.milliseconds()
+    kept = []
+    rejected = {}
+
+    for symbol in symbols:
+        reason = _ticker_rejection(tickers.get(symbol), now_ms, settings)
+        if reason is None:
+            kept.append(symbol)
+        else:
+            rejected[reason] = rejected.get(reason, 0) + 1
+            logger.debug(f"Préfiltre: {symbol} écartée ({reason})")
+
+    details = ", ".join(f"{reason}: {count}" for reason, count in rejected.items())
+    logger.info(
+        f"{len(kept)}/{len(symbols)} paires retenues par le préfiltre"
+        + (f" (écartées - {details})" if details else "")
+    )
+
+    return kept
+
+
+def get_filtered_pairs(exchange=None, settings=None):
     """
     Fonction utilitaire qui initialise l'exchange et retourne les paires filtrées
 
+    Args:
+        exchange: Instance ccxt à réutiliser (optionnel, créée si None)
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
     Returns:
         tuple: (exchange, filtered_symbols)
     """
-    exchange = init_exchange()
-    load_markets(exchange)
-    filtered_symbols = filter_pairs(exchange)
+    if settings is None:
+        settings = ScanConfig.from_module()
+    if exchange is None:
+        exchange = init_exchange(settings)
+    load_markets(exchange, settings)
+    filtered_symbols = filter_pairs(exchange, settings)
+
+    if settings.USE_TICKER_PREFILTER:
+        filtered_symbols = prefilter_by_tickers(exchange, filtered_symbols, settings)
 
     return exchange, filtered_symbols
@@ -3,6 +3,7 @@ Onglet Configuration - Paramétrage du scanner
 Permet de configurer tous les paramètres du scan (RSI, MA, indicateurs, etc.)
 """
 
+import math
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -28,6 +29,15 @@ import config
 # ============================================================
 
 
+# Précisions proposées pour INDICATOR_PRECISION {libellé: valeur}
+PRECISION_CHOICES = {"1e-2": 1e-2, "1e-3": 1e-3, "1e-4": 1e-4, "1e-6": 1e-6}
+
+
+def _precision_label(value):
+    """Libellé de PRECISION_CHOICES le plus proche de `value`"""
+    return min(PRECISION_CHOICES, key=lambda label: abs(math.log10(PRECISION_CHOICES[label] / value)))
+
+
 def create_info_label(tooltip_text):
     """Crée un label d'information avec tooltip"""
     info_label = QLabel("ℹ️")
@@ -706,25 +716,46 @@ class ConfigTab(QWidget):
         self.quote_combo.setCurrentText(config.QUOTE_FILTER)
         layout.addWidget(self.quote_combo, 1, 1)
 
-        # Min bars
-        min_bars_layout = QHBoxLayout()
-        min_bars_layout.addWidget(QLabel("Minimum de bougies:"))
-        min_bars_layout.addWidget(
+        # Précision des indicateurs (nombre de bougies récupérées par le scan)
+        precision_layout = QHBoxLayout()
+        precision_layout.addWidget(QLabel("Précision indicateurs:"))
+        precision_layout.addWidget(
+            create_info_label(
+                "Le nombre de bougies récupérées est déduit des indicateurs\n"
+                "activés : assez d'historique pour que la part non récupérée\n"
+                "pèse moins que cette précision (EMA, RSI, MACD).\n\n"
+                "• 1e-6 (défaut) : ~202 bougies pour le RSI 14, valeurs\n"
+                "  identiques aux versions précédentes (historique complet)\n"
+                "• 1e-3 : ~109 bougies, RSI / MACD légèrement décalés\n"
+                "• 1e-2 : Scan plus rapide, valeurs moins exactes"
+            )
+        )
+        precision_layout.addStretch()
+        layout.addLayout(precision_layout, 2, 0)
+
+        self.precision_combo = QComboBox()
+        self.precision_combo.addItems(list(PRECISION_CHOICES))
+        self.precision_combo.setCurrentText(_precision_label(config.INDICATOR_PRECISION))
+        layout.addWidget(self.precision_combo, 2, 1)
+
+        # Plafond de bougies par timeframe
+        max_bars_layout = QHBoxLayout()
+        max_bars_layout.addWidget(QLabel("Plafond de bougies:"))
+        max_bars_layout.addWidget(
             create_info_label(
-                "Nombre minimum de bougies OHLCV à récupérer.\n\n"
-                "• 200 (défaut) : Suffisant pour la plupart des calculs\n"
-                "• 100 : Minimum acceptable\n"
-                "• 500+ : Analyse long terme avec grandes périodes MA\n\n"
-                "Plus de données = calculs plus précis mais scan plus lent."
+                "Nombre maximum de bougies récupérées par timeframe.\n\n"
+                "• 1000 (défaut) : Limite Binance pour une requête\n"
+                "• Plus bas : Scan plus rapide, grandes périodes MA\n"
+                "  calculées sur moins d'historique"
             )
         )
-        min_bars_layout.addStretch()
-        layout.addLayout(min_bars_layout, 2, 0)
+        max_bars_layout.addStretch()
+        layout.addLayout(max_bars_layout, 3, 0)
 
-        self.min_bars_spin = QSpinBox()
-        self.min_bars_spin.setRange(50, 1000)
-        self.min_bars_spin.setValue(config.MIN_OHLCV_BARS)
-        layout.addWidget(self.min_bars_spin, 2, 1)
+        self.max_bars_spin = QSpinBox()
+        self.max_bars_spin.setRange(50, 1000)
+        self.max_bars_spin.setValue(config.MAX_FETCH_BARS)
+        layout.addWidget(self.max_bars_spin, 3, 1)
 
         # Max pairs (limite dev)
         max_pairs_layout = QHBoxLayout()
@@ -739,12 +770,12 @@ class ConfigTab(QWidget):
             )
         )
         max_pairs_layout.addStretch()
-        layout.addLayout(max_pairs_layout, 3, 0)
+        layout.addLayout(max_pairs_layout, 4, 0)
 
         self.max_pairs_spin = QSpinBox()
         self.max_pairs_spin.setRange(0, 500)
         self.max_pairs_spin.setValue(config.MAX_PAIRS if config.MAX_PAIRS else 0)
-        layout.addWidget(self.max_pairs_spin, 3, 1)
+        layout.addWidget(self.max_pairs_spin, 4, 1)
 
         # Exclure stables
         exclude_layout = QHBoxLayout()
@@ -760,7 +791,7 @@ class ConfigTab(QWidget):
             )
         )
         exclude_layout.addStretch()
-        layout.addLayout(exclude_layout, 4, 0, 1, 2)
+        layout.addLayout(exclude_layout, 5, 0, 1, 2)
 
         group.setLayout(layout)
         return group
@@ -1054,7 +1085,8 @@ class ConfigTab(QWidget):
         # Mettre à jour l'UI
         self.timeframe_combo.setCurrentText(config.TIMEFRAME)
         self.quote_combo.setCurrentText(config.QUOTE_FILTER)
-        self.min_bars_spin.setValue(config.MIN_OHLCV_BARS)
+        self.precision_combo.setCurrentText(_precision_label(config.INDICATOR_PRECISION))
+        self.max_bars_spin.setValue(config.MAX_FETCH_BARS)
         self.max_pairs_spin.setValue(config.MAX_PAIRS if config.MAX_PAIRS else 0)
         self.exclude_stables_check.setChecked(config.EXCLUDE_STABLE_PAIRS)
 
@@ -1082,7 +1114,8 @@ class ConfigTab(QWidget):
 
         config.TIMEFRAME = self.timeframe_combo.currentText()
         config.QUOTE_FILTER = self.quote_combo.currentText()
-        config.MIN_OHLCV_BARS = self.min_bars_spin.value()
+        config.INDICATOR_PRECISION = PRECISION_CHOICES[self.precision_combo.currentText()]
+        config.MAX_FETCH_BARS = self.max_bars_spin.value()
         max_pairs_val = self.max_pairs_spin.value()
         config.MAX_PAIRS = max_pairs_val if max_pairs_val > 0 else None
         config.EXCLUDE_STABLE_PAIRS = self.exclude_stables_check.isChecked()
@@ -1,6 +1,8 @@
 """
 Onglet Détails - Visualisation graphique d'une paire
 Affiche les graphiques de prix + indicateurs pour une paire sélectionnée
+Les séries viennent du moteur du scanner (scanner.pair_series) : mêmes
+valeurs que le tableau de résultats, calculées à partir des bougies du scan.
 """
 
 from PyQt6.QtWidgets import (
@@ -18,9 +20,9 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
-from gui.data_fetcher import OHLCVFetcher
-from gui.chart_utils import ChartCalculator
-import config
+from data import PairFrames
+from scanner import build_fetch_plan, pair_series
+from scan_config import ScanConfig
 
 matplotlib.use("QtAgg")
 
@@ -36,8 +38,10 @@ class DetailsTab(QWidget):
         self.current_pair = None
         self.current_data = None
         self.ohlcv_data = None
-        self.fetcher = None
-        self.calculator = ChartCalculator()
+        self.series = None
+        self.scan_frames = {}  # Bougies du dernier scan {symbol: PairFrames}
+        self.fetched_frames = {}  # Bougies téléchargées hors scan {symbol: PairFrames}
+        self.series_cache = {}  # Séries déjà calculées {symbol: dict}
         self.exchange = None
         self.init_ui()
 
@@ -151,6 +155,53 @@ class DetailsTab(QWidget):
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
 
+    def set_scan_frames(self, frames):
+        """
+        Bougies du dernier scan, réutilisées par les graphiques
+
+        Args:
+            frames (dict): {symbol: PairFrames} (scanner.scan_market(frames=...))
+        """
+        self.scan_frames = frames or {}
+        self.clear_series()
+
+    def clear_series(self):
+        """
+        Oublie les séries calculées (nouveau scan ou configuration modifiée)
+
+        Les bougies téléchargées hors scan sont oubliées aussi (plan de l'ancienne
+        configuration) ; celles du scan gardent sa configuration, celle du tableau.
+        """
+        self.series_cache.clear()
+        self.fetched_frames.clear()
+
+    def _load_series(self, refresh=False):
+        """
+        Séries de la paire courante (calculées une fois par paire)
+
+        Args:
+            refresh (bool): Nouveau téléchargement des bougies
+
+        Returns:
+            bool: True si les bougies sont disponibles
+        """
+        symbol = self.current_pair
+        if refresh or symbol not in self.series_cache:
+            # Bougies du scan : configuration du scan (mêmes valeurs que le tableau) ;
+            # nouveau téléchargement : configuration courante (onglet Configuration)
+            frames = None if refresh else self.fetched_frames.get(symbol, self.scan_frames.get(symbol))
+            if frames is None:
+                if self.exchange is None:
+                    return False
+                settings = ScanConfig.from_module()
+                frames = PairFrames(self.exchange, symbol, build_fetch_plan(settings), settings=settings)
+                self.fetched_frames[symbol] = frames
+            self.series_cache[symbol] = pair_series(frames, frames.settings)
+
+        self.series = self.series_cache[symbol]
+        self.ohlcv_data = self.series["ohlcv"] if self.series else None
+        return self.ohlcv_data is not None and len(self.ohlcv_data) > 0
+
     def update_details(self, result_data, exchange):
         """Affiche détails + graphiques pour une paire sélectionnée"""
         if not result_data:
@@ -163,30 +214,18 @@ class DetailsTab(QWidget):
         self.pair_label.setText(f"📊 {self.current_pair}")
         self.refresh_button.setEnabled(True)
 
-        if self.fetcher is None and exchange is not None:
-            self.fetcher = OHLCVFetcher(exchange)
-
-        if self.fetcher:
-            timeframe = config.TIMEFRAME
-            self.ohlcv_data = self.fetcher.fetch_ohlcv(
-                self.current_pair, timeframe=timeframe, limit=200
-            )
-
-            if self.ohlcv_data is None or len(self.ohlcv_data) == 0:
-                self._show_error("Impossible de récupérer les données OHLCV")
-                return
+        if not self._load_series():
+            self._show_error("Impossible de récupérer les données OHLCV")
+            return
 
         self._update_key_info(result_data)
         self._display_confluence_details(result_data)
 
-        if self.ohlcv_data is not None:
-            self._plot_price_chart()
-            self._plot_rsi_chart()
-            self._plot_macd_chart()
-            self._plot_bollinger_chart()
-            self._plot_stochastic_chart()
-        else:
-            self._plot_placeholder()
+        self._plot_price_chart()
+        self._plot_rsi_chart()
+        self._plot_macd_chart()
+        self._plot_bollinger_chart()
+        self._plot_stochastic_chart()
 
     def _update_key_info(self, data):
         """Met à jour les informations clés"""
@@ -223,22 +262,17 @@ class DetailsTab(QWidget):
             color='white', linewidth=1.5, label='Prix'
         )
 
-        if hasattr(config, 'ENABLE_MA') and config.ENABLE_MA:
-            if hasattr(config, 'MA_PERIODS'):
-                for period in config.MA_PERIODS:
-                    sma = self.calculator.calculate_sma(self.ohlcv_data, period)
-                    if not sma.empty:
-                        ax_price.plot(
-                            sma.index, sma,
-                            linewidth=1, alpha=0.7, label=f'SMA{period}'
-                        )
-
-                    ema = self.calculator.calculate_ema(self.ohlcv_data, period)
-                    if not ema.empty:
-                        ax_price.plot(
-                            ema.index, ema,
-                            linewidth=1, alpha=0.7, linestyle='--', label=f'EMA{period}'
-                        )
+        for period, sma in self.series.get('sma', {}).items():
+            ax_price.plot(
+                sma.index, sma,
+                linewidth=1, alpha=0.7, label=f'SMA{period}'
+            )
+
+        for period, ema in self.series.get('ema', {}).items():
+            ax_price.plot(
+                ema.index, ema,
+                linewidth=1, alpha=0.7, linestyle='--', label=f'EMA{period}'
+            )
 
         ax_price.set_ylabel('Prix (USDC)', color='#cccccc')
         ax_price.tick_params(colors='#cccccc')
@@ -271,7 +305,7 @@ class DetailsTab(QWidget):
         ax = self.rsi_figure.add_subplot(111)
         ax.set_facecolor("#1e1e1e")
 
-        rsi = self.calculator.calculate_rsi(self.ohlcv_data, period=config.RSI_PERIOD)
+        rsi = self.series.get('rsi')
 
         if rsi is not None and not rsi.empty:
             ax.plot(rsi.index, rsi, color='#9370DB', linewidth=1.5, label='RSI')
@@ -299,7 +333,7 @@ class DetailsTab(QWidget):
         ax = self.macd_figure.add_subplot(111)
         ax.set_facecolor("#1e1e1e")
 
-        macd_data = self.calculator.calculate_macd(self.ohlcv_data)
+        macd_data = self.series.get('macd')
 
         if macd_data and not macd_data['macd'].empty:
             ax.plot(
@@ -337,7 +371,7 @@ class DetailsTab(QWidget):
         ax = self.bollinger_figure.add_subplot(111)
         ax.set_facecolor("#1e1e1e")
 
-        bb_data = self.calculator.calculate_bollinger_bands(self.ohlcv_data)
+        bb_data = self.series.get('bollinger')
 
         if bb_data and not bb_data['middle'].empty:
             ax.plot(
@@ -378,7 +412,7 @@ class DetailsTab(QWidget):
         ax = self.stochastic_figure.add_subplot(111)
         ax.set_facecolor("#1e1e1e")
 
-        stoch_data = self.calculator.calculate_stochastic(self.ohlcv_data)
+        stoch_data = self.series.get('stochastic')
 
         if stoch_data and not stoch_data['k'].empty:
             ax.plot(
@@ -453,12 +487,7 @@ class DetailsTab(QWidget):
         if self.current_pair and self.exchange:
             self.pair_label.setText(f"📊 {self.current_pair} (Actualisation...)")
 
-            if self.fetcher:
-                self.ohlcv_data = self.fetcher.fetch_ohlcv(
-                    self.current_pair, timeframe=config.TIMEFRAME, limit=200
-                )
-
-            if self.ohlcv_data is not None:
+            if self._load_series(refresh=True):
                 self._plot_price_chart()
                 self._plot_rsi_chart()
                 self._plot_macd_chart()
@@ -156,12 +156,13 @@ class MainWindow(QMainWindow):
         self.tabs.setCurrentIndex(1)  # Aller sur onglet Scanner
         self.scanner_tab.start_scan()
 
-    def on_scan_finished(self, results, exchange_instance):
+    def on_scan_finished(self, results, exchange_instance, candidates, frames, settings):
         """Callback quand un scan est terminé"""
         # Stocker l'exchange pour utilisation future
         self.exchange_instance = exchange_instance
         
-        self.results_tab.load_results(results)
+        self.results_tab.load_results(results, candidates, scan_settings=settings)
+        self.details_tab.set_scan_frames(frames)
 
         # Passer à l'onglet résultats
         self.tabs.setCurrentIndex(2)
@@ -184,7 +185,18 @@ class MainWindow(QMainWindow):
 
     def on_config_changed(self):
         """Callback quand la configuration change"""
-        self.status_bar.showMessage("⚙️ Configuration mise à jour")
+        # Paires téléchargées hors scan : séries recalculées avec la nouvelle configuration
+        self.details_tab.clear_series()
+
+        # Pondérations / score minimum : re-notation des paires du dernier scan
+        if self.results_tab.rescore():
+            message = f"⚙️ Configuration mise à jour - {len(self.results_tab.results)} opportunités re-notées"
+            if not self.results_tab.rescore_complete:
+                # Rejet anticipé : paires écartées pendant le scan absentes des candidats
+                message += " (critères plus permissifs que le scan : relancer le scan pour les appliquer à toutes les paires)"
+            self.status_bar.showMessage(message)
+        else:
+            self.status_bar.showMessage("⚙️ Configuration mise à jour")
 
     def show_about(self):
         """Affiche la boîte de dialogue À propos"""
@@ -21,6 +21,9 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor
 import pandas as pd
 from datetime import datetime
+from scoring import score_results
+from scanner import sort_results, rescore_is_complete
+from scan_config import ScanConfig
 
 
 class ResultsTab(QWidget):
@@ -36,6 +39,9 @@ class ResultsTab(QWidget):
         super().__init__()
         self.results = []
         self.filtered_results = []
+        self.candidates = []  # Résultats avant filtres de signaux / confluence
+        self.scan_settings = None  # Configuration figée du scan des candidats
+        self.rescore_complete = True  # Dernière re-notation sur tous les candidats utiles
         self.init_ui()
 
     def init_ui(self):
@@ -154,8 +160,18 @@ class ResultsTab(QWidget):
 
         self.setLayout(layout)
 
-    def load_results(self, results):
-        """Charge les résultats du scan dans le tableau"""
+    def load_results(self, results, candidates=None, scan_settings=None):
+        """
+        Charge les résultats du scan dans le tableau
+
+        Args:
+            results (list): Résultats retenus
+            candidates (list): Résultats candidats du scan (pour rescore)
+            scan_settings (ScanConfig): Configuration du scan (pour rescore)
+        """
+        if candidates is not None:
+            self.candidates = candidates
+            self.scan_settings = scan_settings
         self.results = results
         self.filtered_results = results.copy()
 
@@ -169,6 +185,25 @@ class ResultsTab(QWidget):
         # Remplir le tableau
         self.populate_table(results)
 
+    def rescore(self):
+        """
+        Re-note les paires du dernier scan avec la configuration courante
+        (pondérations, score minimum, filtres de signaux), sans nouveau scan
+
+        Returns:
+            bool: True si des candidats ont été re-notés
+        """
+        if not self.candidates:
+            return False
+
+        # Re-notation plus permissive qu'un scan avec rejet anticipé : partielle
+        settings = ScanConfig.from_module()
+        self.rescore_complete = self.scan_settings is None or rescore_is_complete(self.scan_settings, settings)
+        results = sort_results(score_results(self.candidates, settings=settings), settings)
+        self.load_results(results)
+        self.apply_filters()
+        return True
+
     def populate_table(self, results):
         """Remplit le tableau avec les résultats"""
         self.table.setRowCount(0)
@@ -5,30 +5,68 @@ Ajoute le support des callbacks de progression sans modifier scanner.py
 
 import exchange
 import scanner
+from scan_config import ScanConfig
 from logger import get_logger
 
 logger = get_logger()
 
+# Instance partagée entre les scans (marchés chargés une seule fois par TTL)
+_shared_exchange = None
+_shared_exchange_key = None
 
-def run_scan(exchange_instance=None, progress_callback=None, log_callback=None):
+
+def get_shared_exchange(settings=None):
+    """
+    Retourne l'instance d'exchange réutilisée d'un scan à l'autre
+
+    Une nouvelle instance n'est créée qu'au premier scan ou si
+    EXCHANGE_ID ou EXCHANGE_MODE a changé.
+
+    Args:
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        ccxt.Exchange: Instance partagée
+    """
+    global _shared_exchange, _shared_exchange_key
+    if settings is None:
+        settings = ScanConfig.from_module()
+    key = (settings.EXCHANGE_ID, settings.EXCHANGE_MODE)
+    if _shared_exchange is None or _shared_exchange_key != key:
+        _shared_exchange = exchange.init_exchange(settings)
+        _shared_exchange_key = key
+    return _shared_exchange
+
+
+def run_scan(exchange_instance=None, progress_callback=None, log_callback=None,
+             result_callback=None, stop=None, settings=None):
     """
     Wrapper pour scan_market() qui ajoute le support des callbacks
 
     Args:
-        exchange_instance: Instance exchange (optionnel, sera créée si None)
+        exchange_instance: Instance exchange (optionnel, instance partagée si None)
         progress_callback: Fonction callback(current, total) pour progression
         log_callback: Fonction callback(message) pour logs
+        result_callback: Fonction callback(result) appelée pour chaque
+            opportunité dès qu'elle est trouvée (scanner.iter_scan)
+        stop (threading.Event): Arrêt demandé (résultats partiels retournés)
+        settings (ScanConfig): Configuration figée du scan (None = config.py
+            au lancement du scan)
 
     Returns:
-        tuple: (results, exchange_instance)
+        tuple: (results, exchange_instance, candidates, frames)
             - results (list): Résultats du scan
             - exchange_instance: Instance exchange utilisée
+            - candidates (list): Résultats avant filtres de signaux et score
+              de confluence (re-notation sans nouveau scan)
+            - frames (dict): Bougies des paires candidates {symbol: PairFrames}
+              (graphiques de l'onglet Détails sans nouveau téléchargement)
     """
-    # Si pas d'exchange fourni, en créer un
+    # Si pas d'exchange fourni, réutiliser l'instance partagée
     if exchange_instance is None:
         if log_callback:
             log_callback("Initialisation de l'exchange...")
-        exchange_instance = exchange.init_exchange()
+        exchange_instance = get_shared_exchange(settings)
 
     # Monkey patch temporaire du logger pour capturer les logs
     original_info = logger.info
@@ -57,8 +95,21 @@ def run_scan(exchange_instance=None, progress_callback=None, log_callback=None):
 
     try:
         # Lancer le scan
-        results = scanner.scan_market()
-        return results, exchange_instance
+        candidates = []
+        frames = {}
+
+        def on_event(event):
+            if event.kind == "progress":
+                if progress_callback:
+                    progress_callback(event.done, event.total)
+            elif event.kind == "result" and result_callback:
+                result_callback(event.result)
+
+        results = scanner.scan_market(
+            exchange_instance, candidates=candidates, frames=frames,
+            on_event=on_event, stop=stop, settings=settings,
+        )
+        return results, exchange_instance, candidates, frames
 
     finally:
         # Restaurer le logger
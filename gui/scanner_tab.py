@@ -15,7 +15,9 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QThread
 from PyQt6.QtGui import QTextCursor
+import threading
 import time
+from scan_config import ScanConfig
 
 
 class ScanWorker(QThread):
@@ -26,12 +28,17 @@ class ScanWorker(QThread):
     # Signaux
     progress = pyqtSignal(int, int)  # current, total
     log_message = pyqtSignal(str)
-    scan_completed = pyqtSignal(list, object)  # results, exchange
+    opportunity_found = pyqtSignal(dict)  # résultat retenu, pendant le scan
+    scan_completed = pyqtSignal(list, object, list, dict, object)  # results, exchange, candidates, frames, settings
     scan_error = pyqtSignal(str)
 
     def __init__(self):
         super().__init__()
         self.should_stop = False
+        self.stop_event = threading.Event()
+        # Configuration figée au lancement : les modifications de l'onglet
+        # Configuration pendant le scan s'appliquent au scan suivant
+        self.settings = ScanConfig.from_module()
 
     def run(self):
         """Exécute le scan dans un thread séparé"""
@@ -47,10 +54,13 @@ class ScanWorker(QThread):
             self.log_message.emit("🔍 Début du scan...")
             start_time = time.time()
 
-            results, exchange_instance = run_scan(
-                exchange_instance=None,  # L'adaptateur créera l'instance
+            results, exchange_instance, candidates, frames = run_scan(
+                exchange_instance=None,  # L'adaptateur réutilise l'instance partagée
                 progress_callback=self._on_progress,
                 log_callback=self._on_log,
+                result_callback=self._on_result,
+                stop=self.stop_event,
+                settings=self.settings,
             )
 
             elapsed = time.time() - start_time
@@ -58,7 +68,7 @@ class ScanWorker(QThread):
             self.log_message.emit(f"\n✅ Scan terminé en {elapsed:.1f}s")
             self.log_message.emit(f"📊 {len(results)} opportunités trouvées")
 
-            self.scan_completed.emit(results, exchange_instance)
+            self.scan_completed.emit(results, exchange_instance, candidates, frames, self.settings)
 
         except Exception as e:
             self.log_message.emit(f"\n❌ Erreur: {str(e)}")
@@ -69,6 +79,11 @@ class ScanWorker(QThread):
         if not self.should_stop:
             self.progress.emit(current, total)
 
+    def _on_result(self, result):
+        """Callback opportunité trouvée"""
+        if not self.should_stop:
+            self.opportunity_found.emit(result)
+
     def _on_log(self, message):
         """Callback log"""
         if not self.should_stop:
@@ -77,6 +92,7 @@ class ScanWorker(QThread):
     def stop(self):
         """Arrête le scan proprement"""
         self.should_stop = True
+        self.stop_event.set()
 
 
 class ScannerTab(QWidget):
@@ -85,8 +101,8 @@ class ScannerTab(QWidget):
     Permet de lancer un scan et suivre sa progression
     """
 
-    # Signal émis quand scan terminé (results, exchange_instance)
-    scan_finished = pyqtSignal(list, object)
+    # Signal émis quand scan terminé (results, exchange_instance, candidates, frames, settings)
+    scan_finished = pyqtSignal(list, object, list, dict, object)
 
     def __init__(self):
         super().__init__()
@@ -183,6 +199,7 @@ class ScannerTab(QWidget):
         self.progress_label.setText("Démarrage...")
         self.pairs_scanned_label.setText("Paires scannées: 0")
         self.opportunities_label.setText("Opportunités: 0")
+        self.live_opportunities = 0
         self.speed_label.setText("Vitesse: -")
 
         # Activer/désactiver boutons
@@ -193,6 +210,7 @@ class ScannerTab(QWidget):
         self.worker = ScanWorker()
         self.worker.progress.connect(self.update_progress)
         self.worker.log_message.connect(self.add_log)
+        self.worker.opportunity_found.connect(self.on_opportunity_found)
         self.worker.scan_completed.connect(self.on_scan_completed)
         self.worker.scan_error.connect(self.on_scan_error)
         self.worker.start()
@@ -222,6 +240,16 @@ class ScannerTab(QWidget):
             )
             self.pairs_scanned_label.setText(f"Paires scannées: {current}")
 
+    def on_opportunity_found(self, result):
+        """Affiche une opportunité dès qu'elle est trouvée"""
+        self.live_opportunities += 1
+        self.opportunities_label.setText(f"Opportunités: {self.live_opportunities}")
+
+        details = f"RSI {result['rsi']:.2f}" if 'rsi' in result else ""
+        if 'confluence_score' in result:
+            details += f" | Score {result['confluence_score']:.1f} ({result['confluence_grade']})"
+        self.add_log(f"🎯 {result['symbol']} {details}")
+
     def add_log(self, message):
         """Ajoute un message aux logs"""
         self.logs_text.append(message)
@@ -234,7 +262,7 @@ class ScannerTab(QWidget):
         """Efface tous les logs"""
         self.logs_text.clear()
 
-    def on_scan_completed(self, results, exchange_instance):
+    def on_scan_completed(self, results, exchange_instance, candidates, frames, settings):
         """Callback quand le scan est terminé avec succès"""
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
@@ -243,7 +271,7 @@ class ScannerTab(QWidget):
         self.opportunities_label.setText(f"Opportunités: {len(results)}")
 
         # Émettre signal pour onglet résultats (avec exchange)
-        self.scan_finished.emit(results, exchange_instance)
+        self.scan_finished.emit(results, exchange_instance, candidates, frames, settings)
 
     def on_scan_error(self, error_msg):
         """Callback quand le scan échoue"""
@@ -0,0 +1,162 @@
+"""
+Contexte de calcul partagé par les indicateurs d'une même série
+Les primitives (diff, moyenne / écart-type / min / max glissants, ewm) sont
+mémorisées par paramètres : chaque primitive n'est calculée qu'une fois par
+série, quel que soit le nombre d'indicateurs qui la demandent (ex: SMA20 et
+bande médiane de Bollinger 20, EMA 12/26 du MACD et EMA des graphiques).
+"""
+
+import numpy as np
+import pandas as pd
+from kernels import rolling_max, rolling_min, rolling_mean_std
+
+
+class IndicatorContext:
+    """
+    Primitives mémorisées d'une série OHLCV
+
+    Les colonnes de base sont désignées par leur nom ('close', 'high'...).
+    Une série composée (ligne MACD, %K...) est enregistrée avec derived()
+    sous une clé tuple, puis utilisable comme colonne par rolling() et ewm().
+    """
+
+    def __init__(self, frame):
+        """
+        Args:
+            frame: OHLCV, pd.DataFrame ou dict {colonne: pd.Series}
+        """
+        self.frame = frame
+        self._cache = {}
+        self.computed = 0  # Primitives effectivement calculées
+        self.reused = 0  # Primitives servies depuis le cache
+
+    @classmethod
+    def of(cls, prices):
+        """
+        Contexte d'une série : réutilisé tel quel, ou créé pour une Series de clôtures
+
+        Args:
+            prices (IndicatorContext | pd.Series | OHLCV | pd.DataFrame): Série de prix
+
+        Returns:
+            IndicatorContext
+        """
+        if isinstance(prices, cls):
+            return prices
+        if isinstance(prices, pd.Series):
+            return cls({"close": prices})
+        return cls(prices)
+
+    def __len__(self):
+        return len(self.series("close"))
+
+    def _memo(self, key, compute):
+        """Retourne la primitive `key`, calculée au premier appel"""
+        if key in self._cache:
+            self.reused += 1
+            return self._cache[key]
+
+        value = compute()
+        self._cache[key] = value
+        self.computed += 1
+        return value
+
+    def series(self, column="close"):
+        """
+        Colonne de base ou série dérivée
+
+        Args:
+            column (str | tuple): Nom de colonne ou clé d'une série derived()
+
+        Returns:
+            pd.Series
+        """
+        if isinstance(column, tuple):
+            return self._cache[column]
+        return self._memo(("series", column), lambda: self.frame[column])
+
+    def derived(self, key, compute):
+        """
+        Série composée mémorisée (utilisable ensuite comme colonne)
+
+        Args:
+            key (tuple): Clé de la série (ex: ('macd_line', 12, 26))
+            compute (callable): Calcul de la série au premier appel
+
+        Returns:
+            pd.Series
+        """
+        return self._memo(key, compute)
+
+    def diff(self, column="close"):
+        """Variation d'une bougie à la suivante (pandas.Series.diff)"""
+        return self._memo(("diff", column), lambda: self.series(column).diff())
+
+    def rolling(self, kind, window, column="close", min_periods=None):
+        """
+        Statistique glissante
+
+        Fenêtres complètes (min_periods = window) : noyaux O(n) de kernels.py ;
+        la moyenne et l'écart-type sont calculés ensemble et mémorisés tous
+        les deux. Autres min_periods : pandas.
+
+        Args:
+            kind (str): 'mean', 'std' (ddof=1), 'min' ou 'max'
+            window (int): Taille de la fenêtre
+            column (str | tuple): Colonne ou série dérivée
+            min_periods (int): Observations minimales (None = window, défaut pandas)
+
+        Returns:
+            pd.Series
+        """
+        min_periods = window if min_periods is None else min_periods
+        key = ("rolling", kind, window, column, min_periods)
+        return self._memo(key, lambda: self._rolling(kind, window, column, min_periods))
+
+    def _rolling(self, kind, window, column, min_periods):
+        series = self.series(column)
+        if min_periods != window or kind not in ("min", "max", "mean", "std"):
+            return getattr(series.rolling(window=window, min_periods=min_periods), kind)()
+
+        values = series.to_numpy(dtype=np.float64)
+        if kind in ("min", "max"):
+            kernel = rolling_min if kind == "min" else rolling_max
+            return pd.Series(kernel(values, window), index=series.index)
+
+        # Moyenne et écart-type partagent les mêmes sommes : les deux sont mémorisés
+        mean, std = rolling_mean_std(values, window)
+        stats = {
+            "mean": pd.Series(mean, index=series.index),
+            "std": pd.Series(std, index=series.index),
+        }
+        for name, result in stats.items():
+            self._cache.setdefault(("rolling", name, window, column, min_periods), result)
+        return stats[kind]
+
+    def ewm(self, column="close", span=None, alpha=None, min_periods=0):
+        """
+        Moyenne exponentielle (pandas `ewm(adjust=False).mean()`)
+
+        Le lissage est calculé une fois par (colonne, span/alpha) ; les
+        variantes min_periods masquent seulement le début de cette série.
+
+        Args:
+            column (str | tuple): Colonne ou série dérivée
+            span (int): Période (span) - ou alpha
+            alpha (float): Facteur de lissage - ou span
+            min_periods (int): Observations minimales avant la première valeur
+
+        Returns:
+            pd.Series
+        """
+        base = self._memo(
+            ("ewm", column, span, alpha),
+            lambda: self.series(column).ewm(span=span, alpha=alpha, adjust=False).mean(),
+        )
+        if not min_periods:
+            return base
+
+        return self._memo(
+            ("ewm", column, span, alpha, min_periods),
+            lambda: base.mask(self.series(column).notna().cumsum() < min_periods),
+        )
@@ -0,0 +1,240 @@
+"""
+Registre des indicateurs du scanner
+Chaque indicateur déclare ses paramètres, ses colonnes d'entrée, ses
+timeframes et le nombre de bougies nécessaires pour atteindre la précision
+INDICATOR_PRECISION. Le plan de récupération (scanner.build_fetch_plan)
+et les tranches lues par chaque étape d'analyse sont déduits des indicateurs
+activés : un nouvel indicateur s'ajoute avec @register, sans toucher au scanner.
+"""
+
+import functools
+from scan_config import ScanConfig
+from indicators import warmup_length
+
+
+class IndicatorSpec:
+    """Besoins d'un indicateur activé"""
+
+    def __init__(self, name, stage, params, columns, timeframes, bars):
+        """
+        Args:
+            name (str): Nom de l'indicateur (ex: 'rsi')
+            stage (str): Étape d'analyse qui le calcule ('price', 'rsi', 'ma', 'multi')
+            params (dict): Paramètres (ex: {'period': 14})
+            columns (tuple): Colonnes OHLCV lues (ex: ('close',))
+            timeframes (list): Timeframes sur lesquels il est calculé
+            bars (int): Bougies nécessaires par timeframe (préchauffage compris)
+        """
+        self.name = name
+        self.stage = stage
+        self.params = params
+        self.columns = columns
+        self.timeframes = list(timeframes)
+        self.bars = bars
+
+    def __repr__(self):
+        return f"IndicatorSpec({self.name}, {self.params}, {self.timeframes}, bars={self.bars})"
+
+
+_PROVIDERS = []
+
+
+def register(provider):
+    """
+    Enregistre un indicateur (décorateur)
+
+    Le fournisseur reçoit la configuration du scan : il retourne un
+    IndicatorSpec si l'indicateur est activé, None sinon.
+
+    Args:
+        provider (callable): provider(settings: ScanConfig) -> IndicatorSpec | None
+
+    Returns:
+        callable: Le fournisseur, inchangé
+    """
+    _PROVIDERS.append(provider)
+    return provider
+
+
+# ============================================================================
+# PRÉCHAUFFAGE
+# ============================================================================
+
+
+def window_bars(period):
+    """Fenêtre glissante (SMA, Bollinger) : exacte dès `period` bougies"""
+    return period
+
+
+def ema_bars(period, precision):
+    """
+    EMA amorcée sur la première valeur : poids de l'amorce < precision
+
+    Args:
+        period (int): Période (span) de l'EMA
+        precision (float): Poids maximal de l'historique non récupéré
+
+    Returns:
+        int: Nombre de bougies
+    """
+    return max(period, warmup_length(2.0 / (period + 1.0), precision) + 1)
+
+
+def wilder_bars(period, precision):
+    """RSI de Wilder : amorce sur `period` variations, puis lissage 1/period"""
+    return period + 1 + warmup_length(1.0 / period, precision)
+
+
+# ============================================================================
+# INDICATEURS DU SCANNER
+# ============================================================================
+
+
+@register
+def _last_price(settings):
+    # Dernier prix et dernière bougie fermée (toujours nécessaires)
+    return IndicatorSpec("price", "price", {}, ("close",), [settings.TIMEFRAME], 1)
+
+
+@register
+def _rsi(settings):
+    if not settings.USE_RSI:
+        return None
+    period = settings.RSI_PERIOD
+    return IndicatorSpec(
+        "rsi", "rsi", {"period": period}, ("close",), [settings.TIMEFRAME],
+        wilder_bars(period, settings.INDICATOR_PRECISION),
+    )
+
+
+@register
+def _sma(settings):
+    if not (settings.USE_MA and settings.USE_SMA and settings.SMA_PERIODS):
+        return None
+    periods = settings.SMA_PERIODS
+    return IndicatorSpec(
+        "sma", "ma", {"periods": periods}, ("close",), settings.MA_TIMEFRAMES,
+        max(window_bars(p) for p in periods),
+    )
+
+
+@register
+def _ema(settings):
+    if not (settings.USE_MA and settings.USE_EMA and settings.EMA_PERIODS):
+        return None
+    periods = settings.EMA_PERIODS
+    return IndicatorSpec(
+        "ema", "ma", {"periods": periods}, ("close",), settings.MA_TIMEFRAMES,
+        max(ema_bars(p, settings.INDICATOR_PRECISION) for p in periods),
+    )
+
+
+@register
+def _macd(settings):
+    if not settings.USE_MACD:
+        return None
+    fast, slow, signal = settings.MACD_FAST_PERIOD, settings.MACD_SLOW_PERIOD, settings.MACD_SIGNAL_PERIOD
+    precision = settings.INDICATOR_PRECISION
+    # Ligne MACD convergée (EMA lente), puis ligne de signal ; +1 : histogramme précédent
+    bars = ema_bars(max(fast, slow), precision) + ema_bars(signal, precision)
+    return IndicatorSpec(
+        "macd", "multi", {"fast": fast, "slow": slow, "signal": signal}, ("close",),
+        [settings.TIMEFRAME], max(bars, slow + signal + 1),
+    )
+
+
+@register
+def _bollinger(settings):
+    if not settings.USE_BOLLINGER:
+        return None
+    period = settings.BOLLINGER_PERIOD
+    return IndicatorSpec(
+        "bollinger", "multi", {"period": period, "std_dev": settings.BOLLINGER_STD_DEV},
+        ("close",), [settings.TIMEFRAME], window_bars(period),
+    )
+
+
+@register
+def _stochastic(settings):
+    if not settings.USE_STOCHASTIC:
+        return None
+    k_period, d_period = settings.STOCHASTIC_K_PERIOD, settings.STOCHASTIC_D_PERIOD
+    # Deux %D successifs (détection des croisements)
+    return IndicatorSpec(
+        "stochastic", "multi", {"k": k_period, "d": d_period}, ("high", "low", "close"),
+        [settings.TIMEFRAME], window_bars(k_period) + d_period,
+    )
+
+
+# ============================================================================
+# BESOINS DE RÉCUPÉRATION
+# ============================================================================
+
+
+def enabled_indicators(settings=None):
+    """
+    Indicateurs activés par une configuration
+
+    Args:
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        list: IndicatorSpec des indicateurs activés
+    """
+    return list(_enabled(settings or ScanConfig.from_module(), tuple(_PROVIDERS)))
+
+
+# Clé de cache : la ScanConfig (hashable) et les indicateurs enregistrés,
+# un seul calcul par configuration au lieu d'un par paire et par étape
+@functools.lru_cache(maxsize=64)
+def _enabled(settings, providers):
+    specs = (provider(settings) for provider in providers)
+    return tuple(spec for spec in specs if spec is not None)
+
+
+def required_bars(stage, timeframe, settings=None):
+    """
+    Bougies lues par une étape d'analyse sur un timeframe
+
+    Args:
+        stage (str): Étape d'analyse ('price', 'rsi', 'ma', 'multi')
+        timeframe (str): Timeframe
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        int: Nombre de bougies (0 si aucun indicateur de l'étape ne l'utilise),
+             plafonné à MAX_FETCH_BARS
+    """
+    return _required_bars(stage, timeframe, settings or ScanConfig.from_module(), tuple(_PROVIDERS))
+
+
+@functools.lru_cache(maxsize=256)
+def _required_bars(stage, timeframe, settings, providers):
+    bars = max(
+        (
+            spec.bars
+            for spec in _enabled(settings, providers)
+            if spec.stage == stage and timeframe in spec.timeframes
+        ),
+        default=0,
+    )
+    return min(bars, settings.MAX_FETCH_BARS)
+
+
+def timeframe_requirements(settings=None):
+    """
+    Bougies nécessaires par timeframe pour l'ensemble des indicateurs activés
+
+    Args:
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        dict: {timeframe: bougies} (ex: {'4h': 174, '1w': 174, '1d': 174})
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    requirements = {}
+    for spec in _enabled(settings, tuple(_PROVIDERS)):
+        for tf in spec.timeframes:
+            requirements[tf] = max(requirements.get(tf, 0), min(spec.bars, settings.MAX_FETCH_BARS))
+    return requirements
@@ -3,20 +3,41 @@ Calcul d'indicateurs techniques
 RSI (V1) + SMA/EMA (V1.5)
 """
 
+import math
 import pandas as pd
 import numpy as np
+from kernels import (
+    rsi_kernel,
+    rsi_last,
+    ema_last,
+    macd_tail,
+    rolling_max,
+    rolling_min,
+)
+from indicator_context import IndicatorContext
 from logger import get_logger
 
 logger = get_logger()
 
+# Poids maximal de l'historique ignoré par les calculs "latest_*" (voir warmup_length)
+CONVERGENCE_TOLERANCE = 1e-10
+
+
+def _value_at(values, position):
+    """Valeur à une position d'une Series pandas ou d'un tableau NumPy"""
+    if isinstance(values, pd.Series):
+        return values.iloc[position]
+    return values[position]
+
 
 def calculate_rsi(prices, period=14):
     """
     Calcule le RSI (Relative Strength Index) sur une série de prix
     Implémentation standard avec moyennes mobiles exponentielles (méthode de Wilder)
+    Calcul délégué au noyau NumPy kernels.rsi_kernel (sans boucle pandas)
 
     Args:
-        prices (pd.Series): Série des prix de clôture
+        prices (pd.Series | IndicatorContext): Série des prix de clôture
         period (int): Période du RSI (par défaut 14)
 
     Returns:
@@ -30,53 +51,17 @@ def calculate_rsi(prices, period=14):
             )
             return None
 
-        # Réinitialiser l'index pour éviter les problèmes
-        prices = prices.reset_index(drop=True)
-
-        # Calcul des variations de prix
-        delta = prices.diff()
-
-        # Séparer les gains et les pertes
-        gains = delta.copy()
-        losses = delta.copy()
-
-        gains[gains < 0] = 0
-        losses[losses > 0] = 0
-        losses = abs(losses)
-
-        # Calcul initial : moyenne simple sur la période
-        avg_gain = pd.Series(index=gains.index, dtype=float)
-        avg_loss = pd.Series(index=losses.index, dtype=float)
-
-        # Première moyenne (moyenne simple)
-        avg_gain.iloc[period] = gains.iloc[1:period + 1].mean()
-        avg_loss.iloc[period] = losses.iloc[1:period + 1].mean()
-
-        # Application de la méthode de Wilder (EMA avec alpha = 1/period)
-        for i in range(period + 1, len(gains)):
-            avg_gain.iloc[i] = (
-                avg_gain.iloc[i - 1] * (period - 1) + gains.iloc[i]
-            ) / period
-            avg_loss.iloc[i] = (
-                avg_loss.iloc[i - 1] * (period - 1) + losses.iloc[i]
-            ) / period
-
-        # Calcul du RSI
-        rsi = pd.Series(index=prices.index, dtype=float)
-
-        for i in range(period, len(prices)):
-            if avg_loss.iloc[i] == 0:
-                # Si pas de pertes, RSI = 100
-                rsi.iloc[i] = 100.0
-            elif avg_gain.iloc[i] == 0:
-                # Si pas de gains, RSI = 0
-                rsi.iloc[i] = 0.0
-            else:
-                # Calcul normal
-                rs = avg_gain.iloc[i] / avg_loss.iloc[i]
-                rsi.iloc[i] = 100 - (100 / (1 + rs))
-
-        return rsi
+        # Noyau NumPy (lissage de Wilder sur tableaux float64)
+        context = IndicatorContext.of(prices)
+        close = context.series("close")
+        return context.derived(
+            ("rsi", period),
+            lambda: pd.Series(
+                rsi_kernel(np.asarray(close, dtype=np.float64), period),
+                index=close.index,
+                dtype=float,
+            ),
+        )
 
     except Exception as e:
         logger.error(f"Erreur lors du calcul du RSI: {str(e)}")
@@ -88,7 +73,7 @@ def get_latest_rsi(prices, period=14):
     Calcule le RSI et retourne la dernière valeur
 
     Args:
-        prices (pd.Series): Série des prix de clôture
+        prices (pd.Series | IndicatorContext): Série des prix de clôture
         period (int): Période du RSI
 
     Returns:
@@ -127,7 +112,7 @@ def calculate_sma(prices, period=20):
     Calcule la SMA (Simple Moving Average) sur une série de prix
 
     Args:
-        prices (pd.Series): Série des prix de clôture
+        prices (pd.Series | IndicatorContext): Série des prix de clôture
         period (int): Période de la SMA (par défaut 20)
 
     Returns:
@@ -141,10 +126,8 @@ def calculate_sma(prices, period=20):
             )
             return None
 
-        # Calcul de la moyenne mobile simple
-        sma = prices.rolling(window=period).mean()
-
-        return sma
+        # Calcul de la moyenne mobile simple (partagée avec la bande médiane de Bollinger)
+        return IndicatorContext.of(prices).rolling("mean", period)
 
     except Exception as e:
         logger.error(f"Erreur lors du calcul de la SMA{period}: {str(e)}")
@@ -156,7 +139,7 @@ def calculate_ema(prices, period=20):
     Calcule l'EMA (Exponential Moving Average) sur une série de prix
 
     Args:
-        prices (pd.Series): Série des prix de clôture
+        prices (pd.Series | IndicatorContext): Série des prix de clôture
         period (int): Période de l'EMA (par défaut 20)
 
     Returns:
@@ -172,9 +155,7 @@ def calculate_ema(prices, period=20):
 
         # Calcul de la moyenne mobile exponentielle
         # span = période, donne plus de poids aux valeurs récentes
-        ema = prices.ewm(span=period, adjust=False).mean()
-
-        return ema
+        return IndicatorContext.of(prices).ewm(span=period)
 
     except Exception as e:
         logger.error(f"Erreur lors du calcul de l'EMA{period}: {str(e)}")
@@ -305,7 +286,7 @@ def calculate_macd(prices, fast_period=12, slow_period=26, signal_period=9):
     Le MACD est un indicateur de momentum qui montre la relation entre deux moyennes mobiles.
 
     Args:
-        prices (pd.Series): Série des prix de clôture
+        prices (pd.Series | IndicatorContext): Série des prix de clôture
         fast_period (int): Période de l'EMA rapide (défaut 12)
         slow_period (int): Période de l'EMA lente (défaut 26)
         signal_period (int): Période de la ligne de signal (défaut 9)
@@ -325,15 +306,17 @@ def calculate_macd(prices, fast_period=12, slow_period=26, signal_period=9):
             )
             return None
 
-        # Calculer les EMA
-        fast_ema = prices.ewm(span=fast_period, adjust=False).mean()
-        slow_ema = prices.ewm(span=slow_period, adjust=False).mean()
+        context = IndicatorContext.of(prices)
 
-        # Ligne MACD = différence entre les deux EMA
-        macd_line = fast_ema - slow_ema
+        # Ligne MACD = différence entre les deux EMA (partagées avec calculate_ema)
+        line_key = ("macd_line", fast_period, slow_period)
+        macd_line = context.derived(
+            line_key,
+            lambda: context.ewm(span=fast_period) - context.ewm(span=slow_period),
+        )
 
         # Ligne de signal = EMA du MACD
-        signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
+        signal_line = context.ewm(line_key, span=signal_period)
 
         # Histogramme = différence entre MACD et signal
         histogram = macd_line - signal_line
@@ -354,7 +337,7 @@ def detect_macd_signal(macd_data):
     - Vente (bearish): MACD croise en-dessous de la ligne de signal (histogram < 0)
 
     Args:
-        macd_data (dict): Résultat de calculate_macd()
+        macd_data (dict): Résultat de calculate_macd() ou latest_macd()
 
     Returns:
         str: 'bullish', 'bearish', 'neutral'
@@ -369,8 +352,8 @@ def detect_macd_signal(macd_data):
             return None
 
         # Récupérer les 2 dernières valeurs pour détecter le croisement
-        hist_current = histogram.iloc[-1]
-        hist_previous = histogram.iloc[-2]
+        hist_current = _value_at(histogram, -1)
+        hist_previous = _value_at(histogram, -2)
 
         # Croisement haussier : histogram passe de négatif à positif
         if hist_previous < 0 and hist_current > 0:
@@ -401,7 +384,7 @@ def calculate_bollinger_bands(prices, period=20, std_dev=2):
     de surachat/survente.
 
     Args:
-        prices (pd.Series): Série des prix de clôture
+        prices (pd.Series | IndicatorContext): Série des prix de clôture
         period (int): Période de la moyenne mobile (défaut 20)
         std_dev (float): Nombre d'écarts-types (défaut 2)
 
@@ -421,11 +404,13 @@ def calculate_bollinger_bands(prices, period=20, std_dev=2):
             )
             return None
 
-        # Bande moyenne = SMA
-        middle_band = prices.rolling(window=period).mean()
+        context = IndicatorContext.of(prices)
+
+        # Bande moyenne = SMA (partagée avec calculate_sma)
+        middle_band = context.rolling("mean", period)
 
         # Écart-type
-        rolling_std = prices.rolling(window=period).std()
+        rolling_std = context.rolling("std", period)
 
         # Bandes supérieure et inférieure
         upper_band = middle_band + (rolling_std * std_dev)
@@ -456,8 +441,8 @@ def detect_bollinger_signal(prices, bb_data):
     - Neutre: Prix dans les bandes
 
     Args:
-        prices (pd.Series): Série des prix
-        bb_data (dict): Résultat de calculate_bollinger_bands()
+        prices (pd.Series | np.ndarray): Série des prix
+        bb_data (dict): Résultat de calculate_bollinger_bands() ou latest_bollinger_bands()
 
     Returns:
         str: 'oversold' (survente), 'overbought' (surachat), 'neutral'
@@ -467,10 +452,10 @@ def detect_bollinger_signal(prices, bb_data):
         if bb_data is None or prices is None:
             return None
 
-        last_price = prices.iloc[-1]
-        upper = bb_data["upper"].iloc[-1]
-        lower = bb_data["lower"].iloc[-1]
-        middle = bb_data["middle"].iloc[-1]
+        last_price = _value_at(prices, -1)
+        upper = _value_at(bb_data["upper"], -1)
+        lower = _value_at(bb_data["lower"], -1)
+        middle = _value_at(bb_data["middle"], -1)
 
         # Prix en dessous de la bande inférieure = survente
         if last_price <= lower:
@@ -495,7 +480,7 @@ def detect_bollinger_signal(prices, bb_data):
         return None
 
 
-def calculate_stochastic(high, low, close, k_period=14, d_period=3):
+def calculate_stochastic(high, low=None, close=None, k_period=14, d_period=3):
     """
     Calcule l'oscillateur Stochastique
 
@@ -503,7 +488,8 @@ def calculate_stochastic(high, low, close, k_period=14, d_period=3):
     high-low sur une période donnée. Valeurs entre 0 et 100.
 
     Args:
-        high (pd.Series): Série des prix les plus hauts
+        high (pd.Series | IndicatorContext): Série des prix les plus hauts,
+            ou contexte de la série (low et close sont alors ignorés)
         low (pd.Series): Série des prix les plus bas
         close (pd.Series): Série des prix de clôture
         k_period (int): Période pour %K (défaut 14)
@@ -517,23 +503,32 @@ def calculate_stochastic(high, low, close, k_period=14, d_period=3):
         None: En cas d'erreur
     """
     try:
-        if close is None or len(close) < k_period:
+        if isinstance(high, IndicatorContext):
+            context = high
+        elif close is not None:
+            context = IndicatorContext({"high": high, "low": low, "close": close})
+        else:
+            context = None
+
+        if context is None or len(context) < k_period:
             logger.warning(
                 f"Données insuffisantes pour calculer Stochastic (besoin de {k_period} valeurs)"
             )
             return None
 
-        # Plus bas sur k_period
-        lowest_low = low.rolling(window=k_period).min()
+        def percent_k():
+            # Plus bas et plus haut sur k_period
+            lowest_low = context.rolling("min", k_period, "low")
+            highest_high = context.rolling("max", k_period, "high")
 
-        # Plus haut sur k_period
-        highest_high = high.rolling(window=k_period).max()
+            # %K = ((Close - Lowest Low) / (Highest High - Lowest Low)) * 100
+            return ((context.series("close") - lowest_low) / (highest_high - lowest_low)) * 100
 
-        # %K = ((Close - Lowest Low) / (Highest High - Lowest Low)) * 100
-        stoch_k = ((close - lowest_low) / (highest_high - lowest_low)) * 100
+        k_key = ("stoch_k", k_period)
+        stoch_k = context.derived(k_key, percent_k)
 
         # %D = Moyenne mobile de %K sur d_period
-        stoch_d = stoch_k.rolling(window=d_period).mean()
+        stoch_d = context.rolling("mean", d_period, k_key)
 
         return {"k": stoch_k, "d": stoch_d}
 
@@ -553,7 +548,7 @@ def detect_stochastic_signal(stoch_data, oversold_level=20, overbought_level=80)
     - Croisement baissier: %K croise en-dessous de %D en zone de surachat
 
     Args:
-        stoch_data (dict): Résultat de calculate_stochastic()
+        stoch_data (dict): Résultat de calculate_stochastic() ou latest_stochastic()
         oversold_level (int): Seuil de survente (défaut 20)
         overbought_level (int): Seuil de surachat (défaut 80)
 
@@ -571,10 +566,10 @@ def detect_stochastic_signal(stoch_data, oversold_level=20, overbought_level=80)
         if k_line is None or len(k_line) < 2 or d_line is None:
             return None
 
-        k_current = k_line.iloc[-1]
-        k_previous = k_line.iloc[-2]
-        d_current = d_line.iloc[-1]
-        d_previous = d_line.iloc[-2]
+        k_current = _value_at(k_line, -1)
+        k_previous = _value_at(k_line, -2)
+        d_current = _value_at(d_line, -1)
+        d_previous = _value_at(d_line, -2)
 
         # Croisement haussier en zone de survente
         if (
@@ -607,11 +602,259 @@ def detect_stochastic_signal(stoch_data, oversold_level=20, overbought_level=80)
         return None
 
 
+# ============================================================================
+# DERNIÈRES VALEURS (chemin rapide du scanner)
+# ============================================================================
+#
+# Le scanner n'utilise que la ou les deux dernières valeurs de chaque
+# indicateur. Les fonctions latest_* ne calculent que cette fin, sur tableaux
+# NumPy (Series pandas ou np.ndarray acceptés) :
+# - fenêtres glissantes (SMA, Bollinger, Stochastic) : dernière fenêtre seule ;
+# - indicateurs récursifs (RSI, EMA, MACD) : les warmup_length() dernières
+#   valeurs, l'historique antérieur pesant moins de CONVERGENCE_TOLERANCE.
+# Quand la série tient dans la fenêtre de préchauffage (200 bougies avec la
+# tolérance par défaut), le résultat est identique au calcul complet.
+# tolerance=None : série déjà bornée par l'appelant (tranches du scanner,
+# indicator_registry), calculée en entier - même valeur que calculate_*.
+
+
+def warmup_length(alpha, tolerance=CONVERGENCE_TOLERANCE):
+    """
+    Nombre de valeurs nécessaires pour qu'un lissage exponentiel converge
+
+    Après n valeurs, le poids de tout l'historique antérieur (et de
+    l'amorçage) vaut (1 - alpha)^n : n est choisi pour qu'il passe sous
+    `tolerance`.
+
+    Args:
+        alpha (float): Facteur de lissage (2/(span+1) pour une EMA, 1/period pour Wilder)
+        tolerance (float): Poids résiduel maximal de l'historique ignoré
+
+    Returns:
+        int: Nombre de valeurs de préchauffage
+    """
+    return math.ceil(math.log(tolerance) / math.log(1.0 - alpha))
+
+
+def latest_price(prices):
+    """
+    Dernier prix non-NaN d'une série
+
+    Returns:
+        float: Dernier prix
+        None: Série vide ou sans prix valide
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    valid = values[~np.isnan(values)]
+    return float(valid[-1]) if len(valid) else None
+
+
+def latest_rsi(prices, period=14, tolerance=CONVERGENCE_TOLERANCE):
+    """
+    Dernier RSI (même contrat que get_latest_rsi, sur la fin de la série)
+
+    Args:
+        prices (pd.Series | np.ndarray): Prix de clôture
+        period (int): Période du RSI
+        tolerance (float): Poids résiduel toléré de l'historique ignoré
+            (None = série complète)
+
+    Returns:
+        float: Dernière valeur du RSI
+        None: Données insuffisantes ou invalides
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    if len(values) < period + 1:
+        return get_latest_rsi(pd.Series(values), period)
+
+    tail = values if tolerance is None else values[-(period + 1 + warmup_length(1.0 / period, tolerance)):]
+    rsi = rsi_last(tail, period)
+
+    if not np.isfinite(rsi):
+        # NaN dans la série : dernière valeur valide sur la série complète
+        return get_latest_rsi(pd.Series(values), period)
+    return rsi
+
+
+def latest_sma(prices, period=20):
+    """
+    Dernière SMA (moyenne de la dernière fenêtre)
+
+    Returns:
+        float: Dernière valeur (NaN si la fenêtre contient un NaN)
+        None: Données insuffisantes
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    if len(values) < period:
+        logger.warning(
+            f"Données insuffisantes pour calculer SMA{period} (besoin de {period} valeurs, reçu {len(values)})"
+        )
+        return None
+    return float(values[-period:].mean())
+
+
+def latest_ema(prices, period=20, tolerance=CONVERGENCE_TOLERANCE):
+    """
+    Dernière EMA (préchauffage borné par `tolerance`, None = série complète)
+
+    Returns:
+        float: Dernière valeur
+        None: Données insuffisantes
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    if len(values) < period:
+        logger.warning(
+            f"Données insuffisantes pour calculer EMA{period} (besoin de {period} valeurs, reçu {len(values)})"
+        )
+        return None
+
+    tail = values if tolerance is None else values[-warmup_length(2.0 / (period + 1.0), tolerance):]
+    if np.isnan(tail).any():
+        return float(calculate_ema(pd.Series(values), period).iloc[-1])
+    return ema_last(tail, period)
+
+
+def latest_macd(
+    prices, fast_period=12, slow_period=26, signal_period=9, tolerance=CONVERGENCE_TOLERANCE
+):
+    """
+    Deux dernières valeurs du MACD (préchauffage borné par `tolerance`, None = série complète)
+
+    Returns:
+        dict: {'macd', 'signal', 'histogram'} - tableaux des 2 dernières valeurs
+              (compatible detect_macd_signal)
+        None: Données insuffisantes
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    if len(values) < slow_period:
+        logger.warning(
+            f"Données insuffisantes pour calculer MACD (besoin de {slow_period} valeurs)"
+        )
+        return None
+
+    # Les EMA doivent converger, puis la ligne de signal calculée sur le MACD
+    if tolerance is None:
+        tail = values
+    else:
+        warmup = (
+            warmup_length(2.0 / (slow_period + 1.0), tolerance)
+            + warmup_length(2.0 / (signal_period + 1.0), tolerance)
+            + 1
+        )
+        tail = values[-warmup:]
+
+    if np.isnan(tail).any():
+        macd_data = calculate_macd(pd.Series(values), fast_period, slow_period, signal_period)
+        return {name: series.to_numpy()[-2:] for name, series in macd_data.items()}
+
+    macd_line, signal_line = macd_tail(tail, fast_period, slow_period, signal_period)
+    return {
+        "macd": macd_line,
+        "signal": signal_line,
+        "histogram": macd_line - signal_line,
+    }
+
+
+def latest_bollinger_bands(prices, period=20, std_dev=2):
+    """
+    Dernières Bandes de Bollinger (dernière fenêtre, écart-type ddof=1)
+
+    Returns:
+        dict: {'upper', 'middle', 'lower'} - tableaux de la dernière valeur
+              (compatible detect_bollinger_signal)
+        None: Données insuffisantes
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    if len(values) < period:
+        logger.warning(
+            f"Données insuffisantes pour calculer Bollinger (besoin de {period} valeurs)"
+        )
+        return None
+
+    window = values[-period:]
+    middle = window.mean(keepdims=True)
+    std = window.std(ddof=1, keepdims=True)
+    return {
+        "upper": middle + (std * std_dev),
+        "middle": middle,
+        "lower": middle - (std * std_dev),
+    }
+
+
+def latest_stochastic(high, low, close, k_period=14, d_period=3):
+    """
+    Deux dernières valeurs de %K et %D (dernières fenêtres uniquement)
+
+    Returns:
+        dict: {'k', 'd'} - tableaux des 2 dernières valeurs
+              (compatible detect_stochastic_signal)
+        None: Données insuffisantes
+    """
+    close = np.asarray(close, dtype=np.float64)
+    if len(close) < k_period + d_period:
+        stoch_data = calculate_stochastic(
+            pd.Series(high, dtype=float), pd.Series(low, dtype=float), pd.Series(close),
+            k_period, d_period,
+        )
+        if stoch_data is None:
+            return None
+        return {name: series.to_numpy()[-2:] for name, series in stoch_data.items()}
+
+    # %K sur les d_period + 1 dernières bougies (deux %D)
+    count = d_period + 1
+    span = k_period + count - 1
+    high = np.asarray(high, dtype=np.float64)[-span:]
+    low = np.asarray(low, dtype=np.float64)[-span:]
+    highest_high = rolling_max(high, k_period)[k_period - 1:]
+    lowest_low = rolling_min(low, k_period)[k_period - 1:]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stoch_k = ((close[-count:] - lowest_low) / (highest_high - lowest_low)) * 100
+
+    return {
+        "k": stoch_k[-2:],
+        "d": np.array([stoch_k[:-1].mean(), stoch_k[1:].mean()]),
+    }
+
+
 # ============================================================================
 # CONFLUENCE SCORE (V3)
 # ============================================================================
 
 
+# Pondérations par défaut (total = 100)
+DEFAULT_CONFLUENCE_WEIGHTS = {
+    "rsi": 20,
+    "trend": 25,
+    "macd": 20,
+    "bollinger": 20,
+    "stochastic": 15,
+}
+
+# RSI <= limite => points (au-delà de la dernière limite : dernier point)
+RSI_SCORE_LIMITS = (20, 30, 40, 50, 60)
+RSI_SCORE_POINTS = (20, 18, 15, 10, 5, 0)
+
+# Points par signal : (table, points d'un signal inconnu, maximum)
+SIGNAL_SCORE_POINTS = {
+    "macd": ({"bullish": 20, "neutral": 10, "bearish": 0}, 10, 20),
+    "bollinger": (
+        {"oversold": 20, "near_oversold": 15, "neutral": 10, "near_overbought": 5, "overbought": 0},
+        10,
+        20,
+    ),
+    "stochastic": (
+        {"oversold": 15, "bullish_cross": 12, "neutral": 7, "bearish_cross": 3, "overbought": 0},
+        7,
+        15,
+    ),
+}
+
+# Score >= seuil => grade (seuils décroissants)
+CONFLUENCE_GRADE_THRESHOLDS = (90, 80, 70, 60, 50)
+CONFLUENCE_GRADES = ("A+", "A", "B", "C", "D", "F")
+
+
 def calculate_confluence_score(
     rsi_value=None,
     trend_score=None,
@@ -652,17 +895,8 @@ def calculate_confluence_score(
     - Stochastic (0-15 pts): oversold=15, bullish_cross=12, neutral=7, bearish_cross=3, overbought=0
     """
     try:
-        # Pondérations par défaut (total = 100)
-        default_weights = {
-            "rsi": 20,
-            "trend": 25,
-            "macd": 20,
-            "bollinger": 20,
-            "stochastic": 15,
-        }
-
         if weights is None:
-            weights = default_weights
+            weights = DEFAULT_CONFLUENCE_WEIGHTS
 
         breakdown = {}
         total_score = 0
@@ -670,18 +904,11 @@ def calculate_confluence_score(
         # === RSI Score (0-20 pts) ===
         if rsi_value is not None:
             # RSI bas = score élevé (opportunité d'achat)
-            if rsi_value <= 20:
-                rsi_score = 20
-            elif rsi_value <= 30:
-                rsi_score = 18
-            elif rsi_value <= 40:
-                rsi_score = 15
-            elif rsi_value <= 50:
-                rsi_score = 10
-            elif rsi_value <= 60:
-                rsi_score = 5
-            else:
-                rsi_score = 0
+            rsi_score = RSI_SCORE_POINTS[-1]
+            for limit, points in zip(RSI_SCORE_LIMITS, RSI_SCORE_POINTS):
+                if rsi_value <= limit:
+                    rsi_score = points
+                    break
 
             # Appliquer pondération
             rsi_score = (rsi_score / 20) * weights["rsi"]
@@ -699,75 +926,25 @@ def calculate_confluence_score(
             breakdown["trend"] = round(trend_pts, 2)
             total_score += trend_pts
 
-        # === MACD Score (0-20 pts) ===
-        if macd_signal is not None:
-            if macd_signal == "bullish":
-                macd_score = 20
-            elif macd_signal == "neutral":
-                macd_score = 10
-            elif macd_signal == "bearish":
-                macd_score = 0
-            else:
-                macd_score = 10  # Par défaut
-
-            # Appliquer pondération
-            macd_score = (macd_score / 20) * weights["macd"]
-            breakdown["macd"] = round(macd_score, 2)
-            total_score += macd_score
-
-        # === Bollinger Score (0-20 pts) ===
-        if bb_position is not None:
-            if bb_position == "oversold":
-                bb_score = 20
-            elif bb_position == "near_oversold":
-                bb_score = 15
-            elif bb_position == "neutral":
-                bb_score = 10
-            elif bb_position == "near_overbought":
-                bb_score = 5
-            elif bb_position == "overbought":
-                bb_score = 0
-            else:
-                bb_score = 10  # Par défaut
-
-            # Appliquer pondération
-            bb_score = (bb_score / 20) * weights["bollinger"]
-            breakdown["bollinger"] = round(bb_score, 2)
-            total_score += bb_score
-
-        # === Stochastic Score (0-15 pts) ===
-        if stoch_signal is not None:
-            if stoch_signal == "oversold":
-                stoch_score = 15
-            elif stoch_signal == "bullish_cross":
-                stoch_score = 12
-            elif stoch_signal == "neutral":
-                stoch_score = 7
-            elif stoch_signal == "bearish_cross":
-                stoch_score = 3
-            elif stoch_signal == "overbought":
-                stoch_score = 0
-            else:
-                stoch_score = 7  # Par défaut
-
-            # Appliquer pondération
-            stoch_score = (stoch_score / 15) * weights["stochastic"]
-            breakdown["stochastic"] = round(stoch_score, 2)
-            total_score += stoch_score
+        # === Signaux MACD, Bollinger, Stochastic (table de points par signal) ===
+        for name, signal in (
+            ("macd", macd_signal),
+            ("bollinger", bb_position),
+            ("stochastic", stoch_signal),
+        ):
+            if signal is None:
+                continue
+            points, default, max_points = SIGNAL_SCORE_POINTS[name]
+            signal_score = (points.get(signal, default) / max_points) * weights[name]
+            breakdown[name] = round(signal_score, 2)
+            total_score += signal_score
 
         # Calculer le grade (A+ à F)
-        if total_score >= 90:
-            grade = "A+"
-        elif total_score >= 80:
-            grade = "A"
-        elif total_score >= 70:
-            grade = "B"
-        elif total_score >= 60:
-            grade = "C"
-        elif total_score >= 50:
-            grade = "D"
-        else:
-            grade = "F"
+        grade = CONFLUENCE_GRADES[-1]
+        for threshold, name in zip(CONFLUENCE_GRADE_THRESHOLDS, CONFLUENCE_GRADES):
+            if total_score >= threshold:
+                grade = name
+                break
 
         return {"score": round(total_score, 2), "breakdown": breakdown, "grade": grade}
 
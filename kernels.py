@@ -0,0 +1,366 @@
+"""
+Noyaux de calcul NumPy pour les indicateurs techniques
+Fonctions pures sur tableaux float64 : aucun objet pandas, aucun appel API
+
+Les récurrences (lissage de Wilder, EMA) passent par les boucles compilées de
+kernels_numba.py si config.KERNEL_BACKEND = "numba" et Numba est installé.
+KERNEL_BACKEND est un paramètre du processus, hors de la ScanConfig.
+"""
+
+import numpy as np
+import config
+from logger import get_logger
+
+logger = get_logger()
+_missing_numba_logged = False
+
+
+def jit_backend():
+    """
+    Noyaux compilés à utiliser pour les récurrences
+
+    Returns:
+        module: kernels_numba si config.KERNEL_BACKEND = "numba" et Numba installé
+        None: Backend NumPy (défaut, ou Numba absent)
+    """
+    global _missing_numba_logged
+    if config.KERNEL_BACKEND != "numba":
+        return None
+
+    import kernels_numba
+
+    if not kernels_numba.NUMBA_AVAILABLE:
+        if not _missing_numba_logged:
+            logger.warning("KERNEL_BACKEND='numba' mais Numba n'est pas installé : backend NumPy utilisé")
+            _missing_numba_logged = True
+        return None
+    return kernels_numba
+
+
+def wilder_smooth(values, period, start=1):
+    """
+    Lissage de Wilder (moyenne exponentielle avec alpha = 1/period)
+
+    Amorçage par une moyenne simple sur `period` valeurs à partir de `start`,
+    puis récurrence : avg[i] = (avg[i-1] * (period - 1) + values[i]) / period.
+    Les opérations sont effectuées dans le même ordre que l'implémentation
+    pandas historique : les résultats sont identiques bit à bit.
+
+    Args:
+        values (np.ndarray): Valeurs float64 à lisser (1-D)
+        period (int): Période de lissage
+        start (int): Indice de la première valeur utilisée (1 pour une diff)
+
+    Returns:
+        np.ndarray: Moyennes lissées (NaN avant l'indice d'amorçage)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+
+    seed_idx = start + period - 1
+    if len(values) <= seed_idx:
+        return out
+
+    # Amorçage : moyenne simple (NaN ignorés, comme pandas.Series.mean)
+    window = values[start:seed_idx + 1]
+    valid = ~np.isnan(window)
+    count = int(valid.sum())
+    avg = float(np.where(valid, window, 0.0).sum() / count) if count else np.nan
+
+    jit = jit_backend()
+    if jit is not None:
+        out[seed_idx:] = jit.wilder_series(np.ascontiguousarray(values[seed_idx:]), avg, period)
+        return out
+
+    # Récurrence de Wilder sur des flottants Python (pas d'indexation pandas)
+    p1 = period - 1
+    smoothed = [avg]
+    for value in values[seed_idx + 1:].tolist():
+        avg = (avg * p1 + value) / period
+        smoothed.append(avg)
+
+    out[seed_idx:] = smoothed
+    return out
+
+
+def rsi_kernel(close, period=14):
+    """
+    RSI de Wilder sur un tableau de prix de clôture
+
+    Args:
+        close (np.ndarray): Prix de clôture float64 (1-D)
+        period (int): Période du RSI
+
+    Returns:
+        np.ndarray: Valeurs RSI (0-100), NaN avant l'indice `period`
+    """
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+
+    # Variations de prix (même convention que pandas.Series.diff)
+    delta = np.empty(n)
+    delta[:1] = np.nan
+    delta[1:] = close[1:] - close[:-1]
+
+    # Gains et pertes (les NaN sont conservés)
+    gains = np.where(delta < 0, 0.0, delta)
+    losses = np.abs(np.where(delta > 0, 0.0, delta))
+
+    avg_gain = wilder_smooth(gains, period)
+    avg_loss = wilder_smooth(losses, period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        rsi = 100 - (100 / (1 + rs))
+
+    # Cas limites : pas de pertes => 100, pas de gains => 0
+    rsi = np.where(avg_loss == 0, 100.0, np.where(avg_gain == 0, 0.0, rsi))
+    rsi[:period] = np.nan
+
+    return rsi
+
+
+def rsi_last(close, period=14):
+    """
+    Dernière valeur du RSI de Wilder (mêmes opérations que rsi_kernel)
+
+    Une seule boucle lisse gains et pertes, sans construire les séries
+    intermédiaires. Les NaN ne sont pas ignorés : le résultat est alors NaN.
+
+    Args:
+        close (np.ndarray): Prix de clôture float64 (1-D, plus de `period` valeurs)
+        period (int): Période du RSI
+
+    Returns:
+        float: Dernier RSI (0-100)
+    """
+    delta = np.diff(np.asarray(close, dtype=np.float64))
+    gains = np.where(delta < 0, 0.0, delta)
+    losses = np.abs(np.where(delta > 0, 0.0, delta))
+
+    # Amorçage : même sommation NumPy que wilder_smooth
+    avg_gain = float(gains[:period].sum() / period)
+    avg_loss = float(losses[:period].sum() / period)
+
+    jit = jit_backend()
+    if jit is not None:
+        avg_gain = float(jit.wilder_series(gains[period - 1:], avg_gain, period)[-1])
+        avg_loss = float(jit.wilder_series(losses[period - 1:], avg_loss, period)[-1])
+    else:
+        p1 = period - 1
+        for gain, loss in zip(gains[period:].tolist(), losses[period:].tolist()):
+            avg_gain = (avg_gain * p1 + gain) / period
+            avg_loss = (avg_loss * p1 + loss) / period
+
+    if avg_loss == 0:
+        return 100.0
+    if avg_gain == 0:
+        return 0.0
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def ema_last(values, period):
+    """
+    Dernière valeur de l'EMA (pandas `ewm(span=period, adjust=False)`)
+
+    Amorçage sur la première valeur puis récurrence avec les mêmes opérations
+    flottantes que pandas : résultat identique bit à bit (valeurs sans NaN).
+
+    Args:
+        values (np.ndarray): Valeurs float64 sans NaN (1-D, non vide)
+        period (int): Période (span) de l'EMA
+
+    Returns:
+        float: Dernière valeur de l'EMA
+    """
+    alpha = 2.0 / (period + 1.0)
+    jit = jit_backend()
+    if jit is not None:
+        return float(jit.ema_series(np.ascontiguousarray(values, dtype=np.float64), alpha)[-1])
+
+    old_weight = 1.0 - alpha
+    norm = old_weight + alpha
+
+    values = np.asarray(values, dtype=np.float64).tolist()
+    weighted = values[0]
+    for value in values[1:]:
+        if weighted != value:
+            weighted = (old_weight * weighted + alpha * value) / norm
+    return weighted
+
+
+def macd_tail(values, fast_period=12, slow_period=26, signal_period=9):
+    """
+    Deux dernières valeurs du MACD et de sa ligne de signal, en une seule boucle
+
+    Mêmes récurrences que ema_last (EMA rapide, lente, puis EMA du MACD) :
+    résultats identiques à pandas pour des valeurs sans NaN.
+
+    Args:
+        values (np.ndarray): Prix de clôture float64 sans NaN (au moins 2 valeurs)
+        fast_period (int): Période de l'EMA rapide
+        slow_period (int): Période de l'EMA lente
+        signal_period (int): Période de la ligne de signal
+
+    Returns:
+        tuple: (macd, signal) - tableaux des 2 dernières valeurs
+    """
+    jit = jit_backend()
+    if jit is not None and len(values) >= 2:
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        macd = jit.ema_series(values, 2.0 / (fast_period + 1.0)) - jit.ema_series(values, 2.0 / (slow_period + 1.0))
+        signal = jit.ema_series(macd, 2.0 / (signal_period + 1.0))
+        return macd[-2:], signal[-2:]
+
+    coefficients = []
+    for period in (fast_period, slow_period, signal_period):
+        alpha = 2.0 / (period + 1.0)
+        coefficients.append((1.0 - alpha, alpha, (1.0 - alpha) + alpha))
+    (fast_old, fast_alpha, fast_norm), (slow_old, slow_alpha, slow_norm), (sig_old, sig_alpha, sig_norm) = coefficients
+
+    values = np.asarray(values, dtype=np.float64).tolist()
+    fast = slow = values[0]
+    macd = signal = fast - slow
+    previous = (macd, signal)
+
+    for value in values[1:]:
+        previous = (macd, signal)
+        if fast != value:
+            fast = (fast_old * fast + fast_alpha * value) / fast_norm
+        if slow != value:
+            slow = (slow_old * slow + slow_alpha * value) / slow_norm
+        macd = fast - slow
+        if signal != macd:
+            signal = (sig_old * signal + sig_alpha * macd) / sig_norm
+
+    return np.array([previous[0], macd]), np.array([previous[1], signal])
+
+
+# ============================================================================
+# FENÊTRES GLISSANTES (1-D ou lots 2-D, fenêtre sur le dernier axe)
+# ============================================================================
+#
+# Algorithme de van Herk / Gil-Werman : la série est découpée en blocs de la
+# taille de la fenêtre ; chaque fenêtre est la réunion de la fin d'un bloc
+# (cumul depuis la droite) et du début du bloc suivant (cumul depuis la
+# gauche). Trois passes vectorisées, O(n) quelle que soit la fenêtre. Un NaN
+# ne contamine que les fenêtres qui le contiennent (comme pandas avec
+# min_periods = fenêtre).
+
+
+def _blocks(values, window, fill):
+    """
+    Découpe le dernier axe en blocs de `window` valeurs (complété par `fill`)
+
+    Returns:
+        np.ndarray: Tableau (..., nombre de blocs, window)
+    """
+    pad = (-values.shape[-1]) % window
+    if pad:
+        padding = np.full(values.shape[:-1] + (pad,), fill)
+        values = np.concatenate([values, padding], axis=-1)
+    return values.reshape(values.shape[:-1] + (-1, window))
+
+
+def _block_scans(values, window, ufunc, fill):
+    """
+    Cumuls par bloc depuis la gauche (prefix) et depuis la droite (suffix)
+
+    Returns:
+        tuple: (prefix, suffix) - tableaux de la forme de `values` complétée
+    """
+    blocks = _blocks(values, window, fill)
+    prefix = ufunc.accumulate(blocks, axis=-1)
+    suffix = ufunc.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1]
+    shape = blocks.shape[:-2] + (-1,)
+    return prefix.reshape(shape), suffix.reshape(shape)
+
+
+def _rolling_extreme(values, window, ufunc, fill):
+    values = np.asarray(values, dtype=np.float64)
+    n = values.shape[-1]
+    out = np.full(values.shape, np.nan)
+    if window > n:
+        return out
+
+    prefix, suffix = _block_scans(values, window, ufunc, fill)
+    # Fenêtre [s, s + window - 1] = fin du bloc de s + début du bloc suivant
+    out[..., window - 1:] = ufunc(suffix[..., :n - window + 1], prefix[..., window - 1:n])
+    return out
+
+
+def rolling_max(values, window):
+    """
+    Maximum glissant (pandas `rolling(window).max()`)
+
+    Args:
+        values (np.ndarray): Valeurs float64 (1-D, ou (N, T) : une série par ligne)
+        window (int): Taille de la fenêtre
+
+    Returns:
+        np.ndarray: Même forme que `values`, NaN sur les window - 1 premières valeurs
+    """
+    return _rolling_extreme(values, window, np.maximum, -np.inf)
+
+
+def rolling_min(values, window):
+    """Minimum glissant (pandas `rolling(window).min()`), voir rolling_max"""
+    return _rolling_extreme(values, window, np.minimum, np.inf)
+
+
+def rolling_mean_std(values, window, ddof=1):
+    """
+    Moyenne et écart-type glissants (pandas `rolling(window).mean()` / `.std()`)
+
+    Les sommes sont cumulées par bloc (au plus `window` termes, pas de dérive
+    sur les longues séries) et chaque bloc est centré sur sa première valeur :
+    la variance est calculée sur des écarts locaux, sans la cancellation de
+    la formule E[x²] - E[x]² appliquée aux prix bruts. Écart relatif au
+    calcul exact de l'ordre de 1e-14 (pandas : 1e-11 sur 1000 bougies).
+
+    Args:
+        values (np.ndarray): Valeurs float64 (1-D, ou (N, T) : une série par ligne)
+        window (int): Taille de la fenêtre
+        ddof (int): Degrés de liberté retirés (1 : écart-type échantillon, comme pandas)
+
+    Returns:
+        tuple: (mean, std) - même forme que `values`, NaN sur les window - 1
+               premières valeurs
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = values.shape[-1]
+    mean = np.full(values.shape, np.nan)
+    std = np.full(values.shape, np.nan)
+    if window > n:
+        return mean, std
+
+    # Centrage sur la première valeur du bloc (0 si NaN) : fin de bloc centrée
+    # sur son propre bloc, début de bloc sur le bloc précédent (celui où
+    # commencent les fenêtres qui le couvrent)
+    blocks = _blocks(values, window, 0.0)
+    shift = blocks[..., :, :1]
+    shift = np.where(np.isnan(shift), 0.0, shift)
+    previous = np.concatenate([shift[..., :1, :], shift[..., :-1, :]], axis=-2)
+    tail = blocks - shift
+    head = blocks - previous
+
+    flat = values.shape[:-1] + (-1,)
+    tail1 = np.cumsum(tail[..., ::-1], axis=-1)[..., ::-1].reshape(flat)
+    tail2 = np.cumsum((tail * tail)[..., ::-1], axis=-1)[..., ::-1].reshape(flat)
+    head1 = np.cumsum(head, axis=-1).reshape(flat)
+    head2 = np.cumsum(head * head, axis=-1).reshape(flat)
+
+    # Fenêtre [s, s + window - 1] : fin du bloc de s + début du bloc suivant,
+    # ou bloc entier quand s est un début de bloc
+    count = n - window + 1
+    sum1 = tail1[..., :count] + head1[..., window - 1:n]
+    sum2 = tail2[..., :count] + head2[..., window - 1:n]
+    sum1[..., ::window] = tail1[..., :count:window]
+    sum2[..., ::window] = tail2[..., :count:window]
+
+    base = np.repeat(shift[..., 0], window, axis=-1)[..., :count]
+    mean[..., window - 1:] = base + sum1 / window
+    if window > ddof:
+        variance = (sum2 - sum1 * sum1 / window) / (window - ddof)
+        std[..., window - 1:] = np.sqrt(np.maximum(variance, 0.0))
+    return mean, std
@@ -0,0 +1,129 @@
+"""
+Récurrences des indicateurs compilées par Numba (backend optionnel)
+Lissage de Wilder et EMA sont séquentiels : la vectorisation NumPy ne
+s'applique qu'entre séries (lots 2-D), pas dans le temps. Ces boucles sont
+compilées à la volée quand Numba est installé et que
+config.KERNEL_BACKEND = "numba" (voir kernels.jit_backend).
+
+Les amorces (sommes NumPy) restent calculées par l'appelant : seules les
+récurrences sont compilées, avec les mêmes opérations flottantes que
+kernels.py et batch_indicators.py (résultats identiques). Sans Numba, les
+fonctions restent des fonctions Python, utilisées comme référence par le
+test de parité.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Sans Numba : fonction Python inchangée"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def wilder_series(values, seed, period):
+    """
+    Lissage de Wilder à partir d'une amorce
+
+    Args:
+        values (np.ndarray): Valeurs float64 (1-D) ; values[0] est la position
+                             de l'amorce (ignorée)
+        seed (float): Moyenne d'amorçage
+        period (int): Période de lissage
+
+    Returns:
+        np.ndarray: Moyennes lissées, out[0] = seed
+    """
+    out = np.empty(len(values))
+    p1 = period - 1
+    avg = seed
+    out[0] = avg
+    for i in range(1, len(values)):
+        avg = (avg * p1 + values[i]) / period
+        out[i] = avg
+    return out
+
+
+@njit(cache=True)
+def wilder_rows(values, seeds, period):
+    """
+    Lissage de Wilder de chaque ligne (voir wilder_series)
+
+    Args:
+        values (np.ndarray): Valeurs (N, T) ; colonne 0 = position de l'amorce
+        seeds (np.ndarray): Moyenne d'amorçage de chaque ligne (N,)
+        period (int): Période de lissage
+
+    Returns:
+        np.ndarray: Moyennes lissées (N, T)
+    """
+    rows, length = values.shape
+    out = np.empty((rows, length))
+    p1 = period - 1
+    for r in range(rows):
+        avg = seeds[r]
+        out[r, 0] = avg
+        for i in range(1, length):
+            avg = (avg * p1 + values[r, i]) / period
+            out[r, i] = avg
+    return out
+
+
+@njit(cache=True)
+def ema_series(values, alpha):
+    """
+    EMA amorcée sur la première valeur (pandas `ewm(alpha=alpha, adjust=False)`)
+
+    Args:
+        values (np.ndarray): Valeurs float64 sans NaN (1-D, non vide)
+        alpha (float): Facteur de lissage (2 / (période + 1))
+
+    Returns:
+        np.ndarray: EMA
+    """
+    old_weight = 1.0 - alpha
+    norm = old_weight + alpha
+    out = np.empty(len(values))
+    weighted = values[0]
+    out[0] = weighted
+    for i in range(1, len(values)):
+        value = values[i]
+        if weighted != value:
+            weighted = (old_weight * weighted + alpha * value) / norm
+        out[i] = weighted
+    return out
+
+
+@njit(cache=True)
+def ema_rows(values, alpha):
+    """
+    EMA de chaque ligne (voir ema_series)
+
+    Args:
+        values (np.ndarray): Valeurs (N, T) sans NaN
+        alpha (float): Facteur de lissage
+
+    Returns:
+        np.ndarray: EMA (N, T)
+    """
+    old_weight = 1.0 - alpha
+    norm = old_weight + alpha
+    rows, length = values.shape
+    out = np.empty((rows, length))
+    for r in range(rows):
+        weighted = values[r, 0]
+        out[r, 0] = weighted
+        for i in range(1, length):
+            value = values[r, i]
+            if weighted != value:
+                weighted = (old_weight * weighted + alpha * value) / norm
+            out[r, i] = weighted
+    return out
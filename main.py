@@ -1,14 +1,17 @@
 """
 Point d'entrée principal du scanner RSI Binance
-Usage: python main.py
+Usage: python main.py [--daemon] [--config fichier.json]
+       --daemon : scan continu après chaque clôture de bougie TIMEFRAME (daemon.py)
+       --config : paramètres de config.py remplacés par ceux du fichier JSON
 """
 
+import functools
 import sys
 from datetime import datetime
 from logger import setup_logger
 from scanner import scan_market
-from output import output_results
-import config
+from output import output_results, display_scan_event
+from scan_config import ScanConfig
 
 
 def main():
@@ -18,24 +21,36 @@ def main():
     # Initialiser le logger
     logger = setup_logger()
 
+    try:
+        settings = load_settings(sys.argv[1:])
+    except (OSError, ValueError) as e:
+        print(f"\n❌ Configuration invalide: {str(e)}")
+        logger.error(f"Configuration invalide: {str(e)}")
+        return 1
+
     print("\n" + "=" * 80)
     print("🔍 SCANNER RSI BINANCE")
     print("=" * 80)
     print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Exchange: {config.EXCHANGE_ID}")
-    print(f"Timeframe: {config.TIMEFRAME}")
-    print(f"RSI période: {config.RSI_PERIOD}")
-    print(f"Seuil RSI: < {config.RSI_THRESHOLD}")
-    print(f"Quote: {config.QUOTE_FILTER}")
+    print(f"Exchange: {settings.EXCHANGE_ID}")
+    print(f"Timeframe: {settings.TIMEFRAME}")
+    print(f"RSI période: {settings.RSI_PERIOD}")
+    print(f"Seuil RSI: < {settings.RSI_THRESHOLD}")
+    print(f"Quote: {settings.QUOTE_FILTER}")
     print("=" * 80)
     print("\n⚠️  MODE SCANNER UNIQUEMENT - AUCUN TRADING\n")
 
+    if "--daemon" in sys.argv[1:]:
+        return run_daemon(logger, settings)
+
     try:
-        # Lancer le scan
-        results = scan_market()
+        # Lancer le scan (opportunités affichées dès qu'elles sont trouvées)
+        results = scan_market(
+            on_event=functools.partial(display_scan_event, settings=settings), settings=settings
+        )
 
         # Afficher et exporter les résultats
-        output_results(results)
+        output_results(results, settings)
 
         logger.info("Scanner terminé avec succès")
         return 0
@@ -51,5 +66,42 @@ def main():
         return 1
 
 
+def load_settings(args):
+    """
+    Configuration du scan : config.py, remplacé par --config fichier.json
+
+    Raises:
+        ValueError: Fichier absent de la ligne de commande ou invalide
+    """
+    if "--config" not in args:
+        return ScanConfig.from_module()
+    position = args.index("--config") + 1
+    if position >= len(args):
+        raise ValueError("--config attend un fichier JSON")
+    return ScanConfig.from_file(args[position])
+
+
+def run_daemon(logger, settings=None):
+    """
+    Lance le scan continu (affichage et export à chaque cycle)
+    """
+    from daemon import ScanDaemon
+
+    try:
+        daemon = ScanDaemon(settings=settings)
+        daemon.run(on_cycle=functools.partial(output_results, settings=daemon.settings))
+        return 0
+
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Arrêt demandé par l'utilisateur (Ctrl+C)")
+        logger.warning("Arrêt du daemon par l'utilisateur")
+        return 0
+
+    except Exception as e:
+        print(f"\n\n❌ Erreur fatale: {str(e)}")
+        logger.error(f"Erreur fatale: {str(e)}", exc_info=True)
+        return 1
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -7,31 +7,34 @@ V2.5 : Support multi-indicateurs (MACD, Bollinger, Stochastic)
 import os
 import pandas as pd
 from datetime import datetime
-import config
+from scan_config import ScanConfig
 from logger import get_logger
 
 logger = get_logger()
 
 
-def display_results_console(results):
+def display_results_console(results, settings=None):
     """
     Affiche les résultats dans la console sous forme de tableau
     Inclut les colonnes MA et trend_score si disponibles (V1.5)
 
     Args:
         results (list): Liste des résultats du scan
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
     """
-    if not config.CONSOLE_OUTPUT:
+    if settings is None:
+        settings = ScanConfig.from_module()
+    if not settings.CONSOLE_OUTPUT:
         return
 
     print("\n" + "=" * 120)
 
     # Construire le titre selon les indicateurs actifs
     title_parts = []
-    if config.USE_RSI:
-        title_parts.append(f"RSI < {config.RSI_THRESHOLD}")
-    if config.USE_MA:
-        title_parts.append(f"TENDANCE ≥ {config.MIN_TREND_SCORE}/{len(config.MA_TIMEFRAMES)} TF")
+    if settings.USE_RSI:
+        title_parts.append(f"RSI < {settings.RSI_THRESHOLD}")
+    if settings.USE_MA:
+        title_parts.append(f"TENDANCE ≥ {settings.MIN_TREND_SCORE}/{len(settings.MA_TIMEFRAMES)} TF")
 
     if title_parts:
         print(f"RÉSULTATS DU SCAN - {' + '.join(title_parts)}")
@@ -63,7 +66,7 @@ def display_results_console(results):
     # Colonnes de base à afficher
     columns_to_display = ['symbol']
 
-    if 'rsi' in df.columns and config.USE_RSI:
+    if 'rsi' in df.columns and settings.USE_RSI:
         columns_to_display.append('rsi')
 
     if 'last_close_price' in df.columns:
@@ -75,12 +78,12 @@ def display_results_console(results):
     columns_to_display.append('timeframe')
 
     # Si MA activée, ajouter les colonnes de tendance
-    if config.USE_MA and 'trend_score' in df.columns:
+    if settings.USE_MA and 'trend_score' in df.columns:
         # Ajouter trend_score
         columns_to_display.append('trend_score')
 
         # Ajouter les flags de tendance pour chaque timeframe
-        for tf in config.MA_TIMEFRAMES:
+        for tf in settings.MA_TIMEFRAMES:
             col_name = f'trend_{tf}'
             if col_name in df.columns:
                 # Convertir bool en symbole ✓/✗
@@ -88,17 +91,17 @@ def display_results_console(results):
                 columns_to_display.append(col_name)
 
     # V2.5 : Ajouter les colonnes multi-indicateurs
-    if config.USE_MACD and 'macd_signal_type' in df.columns:
+    if settings.USE_MACD and 'macd_signal_type' in df.columns:
         columns_to_display.append('macd_signal_type')
 
-    if config.USE_BOLLINGER and 'bb_position' in df.columns:
+    if settings.USE_BOLLINGER and 'bb_position' in df.columns:
         columns_to_display.append('bb_position')
 
-    if config.USE_STOCHASTIC and 'stoch_signal' in df.columns:
+    if settings.USE_STOCHASTIC and 'stoch_signal' in df.columns:
         columns_to_display.append('stoch_signal')
 
     # V3 : Ajouter le score de confluence
-    if config.USE_CONFLUENCE_SCORE and 'confluence_score' in df.columns:
+    if settings.USE_CONFLUENCE_SCORE and 'confluence_score' in df.columns:
         # Formater le score avec le grade
         if 'confluence_grade' in df.columns:
             df['confluence_display'] = df.apply(
@@ -132,8 +135,8 @@ def display_results_console(results):
     }
 
     # Ajouter les renommages pour les tendances
-    if config.USE_MA:
-        for tf in config.MA_TIMEFRAMES:
+    if settings.USE_MA:
+        for tf in settings.MA_TIMEFRAMES:
             rename_map[f'trend_{tf}'] = tf.upper()
 
     display_df.rename(columns=rename_map, inplace=True)
@@ -145,15 +148,18 @@ def display_results_console(results):
     print("=" * 120 + "\n")
 
 
-def export_to_csv(results):
+def export_to_csv(results, settings=None):
     """
     Export les résultats dans un fichier CSV
     Inclut toutes les colonnes MA si disponibles (V1.5)
 
     Args:
         results (list): Liste des résultats du scan
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
     """
-    if not config.OUTPUT_CSV:
+    if settings is None:
+        settings = ScanConfig.from_module()
+    if not settings.OUTPUT_CSV:
         return
 
     if not results:
@@ -162,7 +168,7 @@ def export_to_csv(results):
 
     try:
         # Créer le dossier de sortie s'il n'existe pas
-        output_dir = os.path.dirname(config.CSV_PATH)
+        output_dir = os.path.dirname(settings.CSV_PATH)
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir, exist_ok=True)
 
@@ -172,9 +178,9 @@ def export_to_csv(results):
         # Ajouter des métadonnées
         df['scan_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        if config.USE_RSI:
-            df['rsi_period'] = config.RSI_PERIOD
-            df['rsi_threshold'] = config.RSI_THRESHOLD
+        if settings.USE_RSI:
+            df['rsi_period'] = settings.RSI_PERIOD
+            df['rsi_threshold'] = settings.RSI_THRESHOLD
 
         # Formater la colonne datetime si elle existe
         if 'last_close_time' in df.columns:
@@ -186,7 +192,7 @@ def export_to_csv(results):
         columns_order = ['symbol']
 
         # Ajouter RSI si activé
-        if 'rsi' in df.columns and config.USE_RSI:
+        if 'rsi' in df.columns and settings.USE_RSI:
             columns_order.append('rsi')
 
         if 'last_close_price' in df.columns:
@@ -198,22 +204,22 @@ def export_to_csv(results):
         columns_order.append('timeframe')
 
         # Ajouter les colonnes MA si disponibles (V1.5)
-        if config.USE_MA and 'trend_score' in df.columns:
+        if settings.USE_MA and 'trend_score' in df.columns:
             # Ajouter trend_score
             columns_order.append('trend_score')
 
             # Ajouter toutes les colonnes MA pour chaque timeframe
-            for tf in config.MA_TIMEFRAMES:
+            for tf in settings.MA_TIMEFRAMES:
                 # Ajouter SMA si activées
-                if config.USE_SMA:
-                    for period in config.SMA_PERIODS:
+                if settings.USE_SMA:
+                    for period in settings.SMA_PERIODS:
                         col_sma = f'sma{period}_{tf}'
                         if col_sma in df.columns:
                             columns_order.append(col_sma)
 
                 # Ajouter EMA si activées
-                if config.USE_EMA:
-                    for period in config.EMA_PERIODS:
+                if settings.USE_EMA:
+                    for period in settings.EMA_PERIODS:
                         col_ema = f'ema{period}_{tf}'
                         if col_ema in df.columns:
                             columns_order.append(col_ema)
@@ -224,23 +230,23 @@ def export_to_csv(results):
                     columns_order.append(col_trend)
 
         # V2.5 : Ajouter les colonnes multi-indicateurs
-        if config.USE_MACD:
+        if settings.USE_MACD:
             for col in ['macd', 'macd_signal', 'macd_histogram', 'macd_signal_type']:
                 if col in df.columns:
                     columns_order.append(col)
 
-        if config.USE_BOLLINGER:
+        if settings.USE_BOLLINGER:
             for col in ['bb_upper', 'bb_middle', 'bb_lower', 'bb_position']:
                 if col in df.columns:
                     columns_order.append(col)
 
-        if config.USE_STOCHASTIC:
+        if settings.USE_STOCHASTIC:
             for col in ['stoch_k', 'stoch_d', 'stoch_signal']:
                 if col in df.columns:
                     columns_order.append(col)
 
         # V3 : Ajouter les colonnes de confluence
-        if config.USE_CONFLUENCE_SCORE:
+        if settings.USE_CONFLUENCE_SCORE:
             for col in ['confluence_score', 'confluence_grade']:
                 if col in df.columns:
                     columns_order.append(col)
@@ -271,21 +277,50 @@ def export_to_csv(results):
         df = df[columns_order]
 
         # Export CSV
-        df.to_csv(config.CSV_PATH, index=False, encoding='utf-8')
+        df.to_csv(settings.CSV_PATH, index=False, encoding='utf-8')
 
-        logger.info(f"✓ Résultats exportés vers: {config.CSV_PATH}")
-        print(f"\n📁 Fichier CSV créé: {config.CSV_PATH}\n")
+        logger.info(f"✓ Résultats exportés vers: {settings.CSV_PATH}")
+        print(f"\n📁 Fichier CSV créé: {settings.CSV_PATH}\n")
 
     except Exception as e:
         logger.error(f"Erreur lors de l'export CSV: {str(e)}")
 
 
-def output_results(results):
+def display_scan_event(event, settings=None):
+    """
+    Affiche une opportunité dès qu'elle est trouvée, pendant le scan
+
+    Args:
+        event (ScanEvent): Événement de scanner.iter_scan (seuls les
+            événements 'result' sont affichés)
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    if not settings.CONSOLE_OUTPUT or event.kind != "result":
+        return
+
+    result = event.result
+    parts = [f"[{event.done}/{event.total}]", f"{result['symbol']:<16}"]
+    if 'rsi' in result:
+        parts.append(f"RSI {result['rsi']:6.2f}")
+    if 'trend_score' in result:
+        parts.append(f"Trend {result['trend_score']}/{len(settings.MA_TIMEFRAMES)}")
+    if 'confluence_score' in result:
+        parts.append(f"Score {result['confluence_score']:5.1f} ({result['confluence_grade']})")
+
+    print("  🎯 " + " | ".join(parts), flush=True)
+
+
+def output_results(results, settings=None):
     """
     Fonction principale d'output : affichage console + export CSV
 
     Args:
         results (list): Liste des résultats du scan
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
     """
-    display_results_console(results)
-    export_to_csv(results)
+    if settings is None:
+        settings = ScanConfig.from_module()
+    display_results_console(results, settings)
+    export_to_csv(results, settings)
@@ -0,0 +1,202 @@
+"""
+Moteur de scan en deux étages : téléchargement et calcul séparés
+Les threads de l'étage réseau ne font que récupérer des bougies (PairFrames,
+tableaux NumPy compacts) et déposent les paires prêtes dans une file bornée.
+L'étage calcul vide cette file par lots et calcule les indicateurs de tout le
+lot en une passe vectorisée (batch_scanner.screen_pairs / finish_pairs) : le
+calcul ne bloque plus les requêtes, les requêtes n'attendent plus le calcul.
+
+Ordre des étapes identique aux autres moteurs : RSI et multi-indicateurs sur
+le timeframe principal, puis, pour les seules paires encore en course, retour
+à l'étage réseau pour les autres timeframes et calcul des MA. Les
+téléchargements de ces paires passent avant les nouvelles paires.
+
+Les deux étages se règlent séparément (PIPELINE_FETCH_WORKERS,
+PIPELINE_COMPUTE_WORKERS, PIPELINE_QUEUE_DEPTH, PIPELINE_BATCH_SIZE). Une
+file pleine ralentit l'étage réseau ; un consommateur lent (iter_scan)
+ralentit les deux.
+"""
+
+import queue
+import threading
+from logger import get_logger
+from data import PairFrames
+from batch_scanner import screen_pairs, finish_pairs
+from scanner import analyze_single_pair, build_pipeline
+
+logger = get_logger()
+
+# Attente max (secondes) entre deux vérifications de l'arrêt du scan
+_POLL_INTERVAL = 0.1
+
+
+def _put(target, item, stop):
+    """
+    Dépose un élément dans une file bornée, en attendant une place
+
+    Returns:
+        bool: False si l'arrêt du scan a été demandé entre-temps
+    """
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def iter_pipelined_scan(exchange, symbols, plan, kept=None, pipeline=None):
+    """
+    Scanne les paires avec un étage réseau et un étage calcul séparés
+
+    Args:
+        exchange: Instance ccxt dont les marchés sont déjà chargés
+        symbols (list): Symboles à analyser
+        plan (dict): Plan de récupération {timeframe: limit}
+        kept (dict): Complété avec les bougies des paires candidates
+                     {symbol: PairFrames} (optionnel)
+        pipeline (Pipeline): Étapes, rejet anticipé et configuration du scan
+                             (optionnel, build_pipeline)
+
+    Yields:
+        tuple: (symbol, status, result) dans l'ordre de complétion - mêmes
+               résultats que analyze_single_pair. Fermer le générateur arrête
+               les deux étages.
+    """
+    if pipeline is None:
+        pipeline = build_pipeline(plan)
+    if not symbols:
+        return
+
+    settings = pipeline.settings
+    total = len(symbols)
+    index = {symbol: idx for idx, symbol in enumerate(symbols, 1)}
+    frames = {symbol: PairFrames(exchange, symbol, plan, settings=settings) for symbol in symbols}
+    others = [tf for tf in plan if tf != settings.TIMEFRAME]
+    screened = {}
+
+    new_pairs = iter(symbols)
+    new_pairs_lock = threading.Lock()
+    # Travail prioritaire de l'étage réseau : ("others" | "single", symbol)
+    requeued = queue.Queue()
+    # Paires téléchargées en attente de calcul : ("screen" | "finish", symbol)
+    ready = queue.Queue(maxsize=settings.PIPELINE_QUEUE_DEPTH)
+    outcomes = queue.Queue(maxsize=settings.PIPELINE_QUEUE_DEPTH)
+    stop = threading.Event()
+
+    def next_fetch():
+        """Prochaine tâche réseau : paires en course d'abord, puis nouvelles paires"""
+        try:
+            return requeued.get_nowait()
+        except queue.Empty:
+            pass
+        with new_pairs_lock:
+            symbol = next(new_pairs, None)
+        if symbol is not None:
+            return "primary", symbol
+        try:
+            return requeued.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            return None
+
+    def fetch_worker():
+        """Étage réseau : récupère les bougies, ne calcule rien"""
+        while not stop.is_set():
+            task = next_fetch()
+            if task is None:
+                continue
+            kind, symbol = task
+
+            try:
+                if kind == "single":
+                    # Historique incomplet : analyse individuelle (rare)
+                    status, result = analyze_single_pair(
+                        exchange, symbol, index[symbol], total,
+                        plan=plan, frames=frames[symbol], kept=kept, pipeline=pipeline,
+                    )
+                    _put(outcomes, (symbol, status, result), stop)
+                    continue
+
+                for tf in ([settings.TIMEFRAME] if kind == "primary" else others):
+                    frames[symbol].get(tf)
+                _put(ready, ("screen" if kind == "primary" else "finish", symbol), stop)
+
+            except Exception as e:
+                logger.error(f"  ✗ Erreur inattendue pour {symbol}: {str(e)}")
+                _put(outcomes, (symbol, "error", None), stop)
+
+    def compute(batch):
+        """Calcule un lot de paires prêtes, retourne leurs résultats terminés"""
+        results, fallback = [], []
+        finish = [symbol for kind, symbol in batch if kind == "finish"]
+        screen = [symbol for kind, symbol in batch if kind == "screen"]
+
+        if screen:
+            try:
+                filtered, survivors, missing, states = screen_pairs(frames, screen, pipeline)
+            except Exception as e:
+                logger.error(f"  ✗ Erreur inattendue (lot de {len(screen)} paires): {str(e)}")
+                results.extend((symbol, "error", None) for symbol in screen)
+            else:
+                screened.update(states)
+                results.extend(filtered)
+                fallback.extend(missing)
+                if others:
+                    for symbol in survivors:
+                        requeued.put(("others", symbol))
+                else:
+                    finish.extend(survivors)
+
+        if finish:
+            try:
+                finished, missing = finish_pairs(frames, finish, screened, pipeline, kept)
+            except Exception as e:
+                logger.error(f"  ✗ Erreur inattendue (lot de {len(finish)} paires): {str(e)}")
+                results.extend((symbol, "error", None) for symbol in finish)
+            else:
+                results.extend(finished)
+                fallback.extend(missing)
+
+        for symbol in fallback:
+            requeued.put(("single", symbol))
+        return results
+
+    def compute_worker():
+        """Étage calcul : vide la file par lots, indicateurs vectorisés"""
+        while not stop.is_set():
+            try:
+                batch = [ready.get(timeout=_POLL_INTERVAL)]
+            except queue.Empty:
+                continue
+            while len(batch) < settings.PIPELINE_BATCH_SIZE:
+                try:
+                    batch.append(ready.get_nowait())
+                except queue.Empty:
+                    break
+
+            for outcome in compute(batch):
+                if not _put(outcomes, outcome, stop):
+                    return
+
+    workers = [
+        threading.Thread(target=fetch_worker, name=f"scan-fetch-{i}", daemon=True)
+        for i in range(settings.PIPELINE_FETCH_WORKERS)
+    ] + [
+        threading.Thread(target=compute_worker, name=f"scan-compute-{i}", daemon=True)
+        for i in range(settings.PIPELINE_COMPUTE_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+
+    try:
+        for _ in range(total):
+            symbol, status, result = outcomes.get()
+            # Bougies libérées dès la paire terminée (sauf paires conservées : kept)
+            frames.pop(symbol, None)
+            screened.pop(symbol, None)
+            yield symbol, status, result
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
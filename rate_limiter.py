@@ -0,0 +1,182 @@
+"""
+Limiteur de débit partagé (token bucket pondéré)
+Un seul budget de poids pour tout le processus : data.py, exchange.py et la GUI
+puisent dans le même seau, quel que soit le thread ou la boucle asyncio.
+Ses paramètres (USE_WEIGHT_RATE_LIMITER, RATE_LIMIT_*) sont donc lus dans
+config.py, hors de la ScanConfig (scan_config.PROCESS_SETTINGS).
+"""
+
+import asyncio
+import threading
+import time
+import config
+from logger import get_logger
+
+logger = get_logger()
+
+# Poids des endpoints Binance (API spot, REQUEST_WEIGHT)
+ENDPOINT_WEIGHTS = {
+    "load_markets": 20,  # GET /api/v3/exchangeInfo
+    "fetch_tickers": 80,  # GET /api/v3/ticker/24hr (toutes les paires)
+    "fetch_time": 1,  # GET /api/v3/time
+}
+
+
+def ohlcv_weight(limit):
+    """
+    Poids d'une requête GET /api/v3/klines selon le nombre de bougies
+
+    Args:
+        limit (int): Nombre de bougies demandées (None = défaut Binance, 500)
+
+    Returns:
+        int: Poids de la requête
+    """
+    if limit is None:
+        limit = 500
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+class TokenBucket:
+    """
+    Seau à jetons thread-safe
+
+    Chaque requête réserve son poids ; le seau se remplit en continu au rythme
+    du budget de l'exchange. Une réservation qui rend le solde négatif retourne
+    le délai à attendre : les appelants suivants attendent d'autant plus, ce qui
+    lisse le débit au lieu de produire des rafales.
+    """
+
+    def __init__(self, capacity, refill_per_second):
+        """
+        Args:
+            capacity (float): Poids maximal disponible en rafale
+            refill_per_second (float): Poids rendu disponible par seconde
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """Ajoute les jetons accumulés depuis la dernière mise à jour"""
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+        self._updated = now
+
+    def reserve(self, weight):
+        """
+        Réserve `weight` jetons
+
+        Args:
+            weight (float): Poids de la requête
+
+        Returns:
+            float: Délai (secondes) à attendre avant d'émettre la requête
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= weight
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    def acquire(self, weight=1):
+        """Réserve `weight` jetons et attend (bloquant) qu'ils soient disponibles"""
+        wait = self.reserve(weight)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, weight=1):
+        """Réserve `weight` jetons et attend (asyncio) qu'ils soient disponibles"""
+        wait = self.reserve(weight)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, seconds):
+        """
+        Vide le seau pour `seconds` secondes (après un rate limit de l'exchange)
+
+        Toutes les requêtes suivantes, de tous les threads, attendent ensemble
+        au lieu de réessayer chacune de leur côté.
+
+        Args:
+            seconds (float): Durée de la pause imposée
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.refill_per_second
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    Retourne le limiteur partagé du processus (créé au premier appel)
+
+    Returns:
+        TokenBucket: Seau dimensionné sur RATE_LIMIT_WEIGHT_PER_MINUTE
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            per_second = config.RATE_LIMIT_WEIGHT_PER_MINUTE * config.RATE_LIMIT_SAFETY_RATIO / 60
+            _limiter = TokenBucket(config.RATE_LIMIT_BURST_WEIGHT, per_second)
+            logger.debug(
+                f"Limiteur de poids: {per_second * 60:.0f}/min, rafale {config.RATE_LIMIT_BURST_WEIGHT}"
+            )
+        return _limiter
+
+
+def reset_rate_limiter():
+    """Recrée le limiteur au prochain appel (après modification de la configuration)"""
+    global _limiter
+    with _limiter_lock:
+        _limiter = None
+
+
+def enabled():
+    """Indique si le budget de poids partagé est actif (USE_WEIGHT_RATE_LIMITER)"""
+    return config.USE_WEIGHT_RATE_LIMITER
+
+
+def acquire(weight):
+    """
+    Attend (bloquant) que `weight` soit disponible dans le budget partagé
+
+    Args:
+        weight (int): Poids de la requête (voir ENDPOINT_WEIGHTS, ohlcv_weight)
+    """
+    if config.USE_WEIGHT_RATE_LIMITER:
+        get_rate_limiter().acquire(weight)
+
+
+async def acquire_async(weight):
+    """
+    Attend (asyncio) que `weight` soit disponible dans le budget partagé
+
+    Args:
+        weight (int): Poids de la requête (voir ENDPOINT_WEIGHTS, ohlcv_weight)
+    """
+    if config.USE_WEIGHT_RATE_LIMITER:
+        await get_rate_limiter().acquire_async(weight)
+
+
+def penalize(seconds):
+    """
+    Suspend le budget partagé après un rate limit signalé par l'exchange
+
+    Args:
+        seconds (float): Durée de la pause imposée à tous les appelants
+    """
+    if config.USE_WEIGHT_RATE_LIMITER:
+        get_rate_limiter().penalize(seconds)
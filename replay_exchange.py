@@ -0,0 +1,445 @@
+"""
+Exchange hors-ligne (rejeu) pour les tests et benchmarks
+Implémente le sous-ensemble de l'interface ccxt utilisé par le scanner :
+load_markets / markets, fetch_ohlcv, fetch_tickers (versions synchrone et asyncio).
+
+Deux sources de données :
+- "synthetic" : générateur déterministe (N paires, marche aléatoire par série)
+- "archive"   : archive enregistrée depuis Binance (python replay_exchange.py record)
+
+Latence et erreurs de rate limit peuvent être injectées (REPLAY_*).
+
+Usage:
+    python replay_exchange.py record [nombre_de_paires]
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+import numpy as np
+import ccxt
+from scan_config import ScanConfig
+from data import WEEK_OFFSET_MS
+from logger import get_logger
+
+logger = get_logger()
+
+# Bougies max par requête OHLCV (limite de l'API Binance)
+MAX_OHLCV_LIMIT = 1000
+
+# Bases réelles en tête de l'univers synthétique (les tests visent BTC/ETH/BNB)
+SYNTHETIC_BASES = ["BTC", "ETH", "BNB", "SOL", "XRP", "ADA", "DOGE", "AVAX", "LINK", "DOT"]
+
+
+def _timeframe_ms(timeframe):
+    """Durée d'une bougie en millisecondes"""
+    return ccxt.Exchange.parse_timeframe(timeframe) * 1000
+
+
+def _current_open(timeframe, now_ms):
+    """Date d'ouverture de la bougie en cours (semaines alignées sur le lundi)"""
+    timeframe_ms = _timeframe_ms(timeframe)
+    offset = WEEK_OFFSET_MS if timeframe == "1w" else 0
+    return (now_ms - offset) // timeframe_ms * timeframe_ms + offset
+
+
+def _market(base, quote):
+    """Structure de marché ccxt minimale (spot)"""
+    return {
+        "id": f"{base}{quote}",
+        "symbol": f"{base}/{quote}",
+        "base": base,
+        "quote": quote,
+        "baseId": base,
+        "quoteId": quote,
+        "active": True,
+        "type": "spot",
+        "spot": True,
+        "precision": {"amount": 1e-8, "price": 1e-8},
+        "limits": {},
+        "info": {},
+    }
+
+
+def _archive_series_path(archive_dir, symbol, timeframe):
+    """Chemin d'une série OHLCV dans une archive"""
+    safe_symbol = symbol.replace("/", "_").replace(":", "_")
+    return os.path.join(archive_dir, "ohlcv", safe_symbol, f"{timeframe}.npy")
+
+
+class SyntheticSource:
+    """
+    Générateur déterministe de marchés, tickers et bougies
+
+    Chaque série (symbole, timeframe) est une marche aléatoire géométrique dont
+    la graine dépend du symbole et du timeframe : deux exécutions produisent
+    exactement les mêmes bougies. Toutes les séries d'un symbole se terminent
+    au même prix, celui de son ticker.
+    """
+
+    name = "synthetic"
+
+    def __init__(self, pairs, bars, now_ms, quote, seed=0):
+        """
+        Args:
+            pairs (int): Nombre de paires générées
+            bars (int): Profondeur d'historique de chaque série
+            now_ms (int): Horodatage courant simulé (millisecondes)
+            quote (str): Devise de cotation (ex: 'USDC')
+            seed (int): Graine globale du générateur
+        """
+        self.pairs = pairs
+        self.bars = bars
+        self.now_ms = now_ms
+        self.quote = quote
+        self.seed = seed
+        self._markets = None
+
+    def _rng(self, *keys):
+        """Générateur aléatoire propre à une clé (symbole, timeframe...)"""
+        key = "|".join(str(k) for k in (self.seed,) + keys)
+        return np.random.default_rng(zlib.crc32(key.encode()))
+
+    def _profile(self, symbol):
+        """Prix courant, dérive et volatilité (par bougie 4h) d'un symbole"""
+        rng = self._rng(symbol)
+        price = 10 ** rng.uniform(-3, 4)
+        drift = rng.normal(0, 0.002)
+        volatility = rng.uniform(0.005, 0.04)
+        return price, drift, volatility
+
+    def markets(self):
+        """Marchés synthétiques : bases réelles puis SYN0001, SYN0002..."""
+        if self._markets is None:
+            bases = SYNTHETIC_BASES[:self.pairs]
+            bases += [f"SYN{i:04d}" for i in range(1, self.pairs - len(bases) + 1)]
+            self._markets = {f"{base}/{self.quote}": _market(base, self.quote) for base in bases}
+        return self._markets
+
+    def tickers(self):
+        """Tickers 24h synthétiques (volume, spread et variation variés)"""
+        tickers = {}
+        for symbol in self.markets():
+            price, _, volatility = self._profile(symbol)
+            rng = self._rng(symbol, "ticker")
+            spread = price * 10 ** rng.uniform(-4.5, -1.5)
+            tickers[symbol] = {
+                "symbol": symbol,
+                "timestamp": self.now_ms - int(rng.exponential(10 * 60 * 1000)),
+                "last": price,
+                "bid": price - spread / 2,
+                "ask": price + spread / 2,
+                "percentage": float(rng.normal(0, volatility * 100 * 2.5)),
+                "quoteVolume": float(10 ** rng.uniform(3, 8)),
+            }
+        return tickers
+
+    def series(self, symbol, timeframe):
+        """
+        Série complète (bars, 6) se terminant par la bougie en cours
+
+        Returns:
+            np.ndarray: [time_ms, open, high, low, close, volume]
+            None: Si le symbole n'existe pas
+        """
+        if symbol not in self.markets():
+            return None
+
+        price, drift, volatility = self._profile(symbol)
+        rng = self._rng(symbol, timeframe)
+        scale = np.sqrt(_timeframe_ms(timeframe) / (4 * 3600 * 1000))
+
+        returns = rng.normal(drift * scale ** 2, volatility * scale, self.bars)
+        # Marche construite depuis la fin : la dernière clôture vaut `price`
+        log_close = np.log(price) - (np.cumsum(returns[::-1])[::-1] - returns)
+        close = np.exp(log_close)
+        open_ = np.exp(log_close - returns)
+        wick = np.abs(rng.normal(0, volatility * scale / 2, (2, self.bars)))
+        high = np.maximum(open_, close) * (1 + wick[0])
+        low = np.minimum(open_, close) * (1 - wick[1])
+        volume = rng.lognormal(8, 1, self.bars)
+
+        end = _current_open(timeframe, self.now_ms)
+        times = end - _timeframe_ms(timeframe) * np.arange(self.bars)[::-1]
+
+        return np.column_stack([times, open_, high, low, close, volume])
+
+
+class ArchiveSource:
+    """
+    Données enregistrées depuis un exchange réel (voir record_archive)
+
+    Le temps simulé est figé à la date d'enregistrement de l'archive.
+    """
+
+    name = "archive"
+
+    def __init__(self, archive_dir):
+        """
+        Args:
+            archive_dir (str): Dossier de l'archive
+        """
+        self.archive_dir = archive_dir
+        with open(os.path.join(archive_dir, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(os.path.join(archive_dir, "markets.json"), "r", encoding="utf-8") as f:
+            self._markets = json.load(f)
+        self.now_ms = meta["recorded_at"]
+
+    def markets(self):
+        """Marchés enregistrés"""
+        return self._markets
+
+    def tickers(self):
+        """Tickers enregistrés ({} si absents de l'archive)"""
+        path = os.path.join(self.archive_dir, "tickers.json")
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def series(self, symbol, timeframe):
+        """Série enregistrée (None si absente de l'archive)"""
+        path = _archive_series_path(self.archive_dir, symbol, timeframe)
+        if not os.path.exists(path):
+            return None
+        return np.load(path)
+
+
+class ReplayExchange:
+    """
+    Remplaçant hors-ligne d'une instance ccxt synchrone
+
+    Attributs et méthodes utilisés par le scanner et la GUI : id, markets,
+    currencies, load_markets, set_markets, fetch_ohlcv, fetch_tickers,
+    fetch_time, milliseconds, parse_timeframe. Le compteur `calls` recense les requêtes.
+    """
+
+    def __init__(self, source, latency_ms=0, rate_limit_error_rate=0.0, seed=0):
+        """
+        Args:
+            source: SyntheticSource ou ArchiveSource
+            latency_ms (float): Latence simulée de chaque requête
+            rate_limit_error_rate (float): Probabilité d'une erreur 429 par requête de données
+            seed (int): Graine du tirage des erreurs injectées
+        """
+        self.id = f"replay_{source.name}"
+        self.source = source
+        self.latency = latency_ms / 1000
+        self.rate_limit_error_rate = rate_limit_error_rate
+        self.markets = None
+        self.currencies = {}
+        self.calls = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    parse_timeframe = staticmethod(ccxt.Exchange.parse_timeframe)
+
+    def milliseconds(self):
+        """Horodatage courant simulé"""
+        return self.source.now_ms
+
+    def set_markets(self, markets, currencies=None):
+        """Installe des marchés déjà chargés (même contrat que ccxt)"""
+        self.markets = markets
+        self.currencies = currencies or {}
+        return self.markets
+
+    def _request(self, endpoint, inject_errors=True):
+        """
+        Comptabilise une requête et tire une éventuelle erreur injectée
+
+        Returns:
+            float: Latence à simuler (secondes)
+        """
+        with self._lock:
+            self.calls[endpoint] += 1
+            failed = inject_errors and self._rng.random() < self.rate_limit_error_rate
+        if failed:
+            raise ccxt.RateLimitExceeded(f"{self.id} {endpoint}: 429 simulé")
+        return self.latency
+
+    def _ohlcv_rows(self, symbol, timeframe, since, limit):
+        """Découpe la série selon since/limit, comme l'API Binance"""
+        rows = self.source.series(symbol, timeframe)
+        if rows is None:
+            raise ccxt.BadSymbol(f"{self.id} ne connaît pas {symbol} ({timeframe})")
+
+        limit = min(limit or 500, MAX_OHLCV_LIMIT)
+        if since is not None:
+            rows = rows[rows[:, 0] >= since][:limit]
+        else:
+            rows = rows[-limit:]
+
+        # Format ccxt : listes Python, horodatage entier
+        return [[int(row[0])] + row[1:] for row in rows.tolist()]
+
+    def load_markets(self, reload=False, params={}):
+        """Charge les marchés de la source (une seule fois sauf reload)"""
+        if self.markets and not reload:
+            return self.markets
+        time.sleep(self._request("load_markets", inject_errors=False))
+        return self.set_markets(self.source.markets())
+
+    def fetch_ohlcv(self, symbol, timeframe="1m", since=None, limit=None, params={}):
+        """Bougies [time, open, high, low, close, volume] de la source"""
+        time.sleep(self._request("fetch_ohlcv"))
+        return self._ohlcv_rows(symbol, timeframe, since, limit)
+
+    def fetch_time(self, params={}):
+        """Horloge de l'exchange (horodatage simulé, millisecondes)"""
+        time.sleep(self._request("fetch_time", inject_errors=False))
+        return self.source.now_ms
+
+    def fetch_tickers(self, symbols=None, params={}):
+        """Tickers 24h de la source (tous, ou `symbols` seulement)"""
+        time.sleep(self._request("fetch_tickers"))
+        tickers = self.source.tickers()
+        if symbols is not None:
+            tickers = {s: t for s, t in tickers.items() if s in symbols}
+        return tickers
+
+
+class AsyncReplayExchange(ReplayExchange):
+    """Variante asyncio de ReplayExchange (interface ccxt.async_support)"""
+
+    async def load_markets(self, reload=False, params={}):
+        if self.markets and not reload:
+            return self.markets
+        await asyncio.sleep(self._request("load_markets", inject_errors=False))
+        return self.set_markets(self.source.markets())
+
+    async def fetch_ohlcv(self, symbol, timeframe="1m", since=None, limit=None, params={}):
+        await asyncio.sleep(self._request("fetch_ohlcv"))
+        return self._ohlcv_rows(symbol, timeframe, since, limit)
+
+    async def fetch_tickers(self, symbols=None, params={}):
+        await asyncio.sleep(self._request("fetch_tickers"))
+        tickers = self.source.tickers()
+        if symbols is not None:
+            tickers = {s: t for s, t in tickers.items() if s in symbols}
+        return tickers
+
+    async def close(self):
+        """Rien à fermer (pas de session HTTP)"""
+        return None
+
+
+def create_replay_exchange(async_mode=False, shared_with=None, settings=None):
+    """
+    Crée l'exchange hors-ligne décrit par la configuration (EXCHANGE_MODE, REPLAY_*)
+
+    Args:
+        async_mode (bool): True pour la variante asyncio
+        shared_with (ReplayExchange): Instance dont la source et le compteur de
+                                      requêtes sont partagés (moteur asyncio)
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        ReplayExchange | AsyncReplayExchange: Instance prête à l'emploi
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    exchange_class = AsyncReplayExchange if async_mode else ReplayExchange
+
+    if isinstance(shared_with, ReplayExchange):
+        exchange = exchange_class(
+            shared_with.source,
+            latency_ms=settings.REPLAY_LATENCY_MS,
+            rate_limit_error_rate=settings.REPLAY_RATE_LIMIT_ERROR_RATE,
+            seed=settings.REPLAY_SEED,
+        )
+        exchange.calls = shared_with.calls
+        return exchange
+
+    if settings.EXCHANGE_MODE == "archive":
+        source = ArchiveSource(settings.REPLAY_ARCHIVE_DIR)
+    else:
+        now_ms = settings.REPLAY_NOW_MS or int(time.time() * 1000)
+        source = SyntheticSource(
+            settings.REPLAY_SYNTHETIC_PAIRS,
+            settings.REPLAY_SYNTHETIC_BARS,
+            now_ms,
+            settings.QUOTE_FILTER,
+            seed=settings.REPLAY_SEED,
+        )
+
+    return exchange_class(
+        source,
+        latency_ms=settings.REPLAY_LATENCY_MS,
+        rate_limit_error_rate=settings.REPLAY_RATE_LIMIT_ERROR_RATE,
+        seed=settings.REPLAY_SEED,
+    )
+
+
+def record_archive(exchange, symbols, plan, archive_dir, bars=1000):
+    """
+    Enregistre marchés, tickers et bougies d'un exchange réel dans une archive
+
+    Args:
+        exchange: Instance ccxt (marchés déjà chargés)
+        symbols (list): Symboles à enregistrer
+        plan (dict): Timeframes à enregistrer {timeframe: limit}
+        archive_dir (str): Dossier de destination
+        bars (int): Profondeur minimale de chaque série
+    """
+    import rate_limiter
+
+    os.makedirs(archive_dir, exist_ok=True)
+    recorded_at = exchange.milliseconds()
+
+    markets = {symbol: exchange.markets[symbol] for symbol in symbols}
+    with open(os.path.join(archive_dir, "markets.json"), "w", encoding="utf-8") as f:
+        json.dump(markets, f)
+
+    rate_limiter.acquire(rate_limiter.ENDPOINT_WEIGHTS["fetch_tickers"])
+    tickers = exchange.fetch_tickers()
+    with open(os.path.join(archive_dir, "tickers.json"), "w", encoding="utf-8") as f:
+        json.dump({s: t for s, t in tickers.items() if s in markets}, f)
+
+    for idx, symbol in enumerate(symbols, 1):
+        for timeframe, limit in plan.items():
+            limit = max(limit, bars)
+            rate_limiter.acquire(rate_limiter.ohlcv_weight(limit))
+            rows = exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
+            path = _archive_series_path(archive_dir, symbol, timeframe)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            np.save(path, np.asarray(rows, dtype=np.float64).reshape(-1, 6))
+        logger.info(f"[{idx}/{len(symbols)}] {symbol} enregistré")
+
+    with open(os.path.join(archive_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"exchange_id": exchange.id, "recorded_at": recorded_at,
+                   "timeframes": list(plan)}, f)
+
+    logger.info(f"Archive enregistrée dans {archive_dir} ({len(symbols)} paires)")
+
+
+def main():
+    """Enregistre une archive depuis l'exchange réel (python replay_exchange.py record [N])"""
+    if len(sys.argv) < 2 or sys.argv[1] != "record":
+        print(__doc__)
+        return 1
+
+    from logger import setup_logger
+    from exchange import init_exchange, load_markets, filter_pairs
+    from scanner import build_fetch_plan
+
+    setup_logger()
+    settings = ScanConfig.from_module().replace(EXCHANGE_MODE="live")
+    pairs = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    exchange = init_exchange(settings)
+    load_markets(exchange, settings)
+    symbols = filter_pairs(exchange, settings)[:pairs]
+    record_archive(exchange, symbols, build_fetch_plan(settings), settings.REPLAY_ARCHIVE_DIR)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
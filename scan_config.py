@@ -0,0 +1,191 @@
+"""
+Configuration figée d'un scan (ScanConfig)
+Un scan fige sa configuration au démarrage (ScanConfig.from_module() par
+défaut, ou celle passée à scanner.iter_scan / scan_market) et la transmet
+explicitement (paramètre `settings`) aux fonctions du scan : scanner,
+moteurs, indicator_registry, data, exchange, scoring et output ne lisent
+qu'elle. Modifier config.py pendant le scan (onglet Configuration de la GUI)
+n'a donc pas d'effet sur un scan en cours, et plusieurs scans configurés
+différemment peuvent tourner en parallèle dans le même processus.
+
+Une ScanConfig est immuable et hashable : utilisable comme clé de cache
+(hash en mémoire, fingerprint stable d'un processus à l'autre).
+
+Les paramètres du processus (PROCESS_SETTINGS) n'en font pas partie : ils
+règlent des ressources partagées par tous les scans et ne changent pas
+leurs résultats. Leurs modules les lisent directement dans config.py.
+"""
+
+import hashlib
+import json
+from types import MappingProxyType
+import config as config_module
+
+# Paramètres du processus, exclus des ScanConfig (et de leur hash) :
+#   LOG_*                                 journal commun (logger.py)
+#   USE_WEIGHT_RATE_LIMITER, RATE_LIMIT_* budget de poids partagé (rate_limiter.py)
+#   CANDLE_STORE_DIR, CANDLE_STORE_MAX_BARS
+#                                         cache disque des bougies clôturées (candle_store.py)
+#   KERNEL_BACKEND                        noyaux NumPy / Numba, mêmes valeurs (kernels.py)
+PROCESS_SETTINGS = (
+    "LOG_LEVEL",
+    "LOG_FILE",
+    "LOG_TO_CONSOLE",
+    "LOG_TO_FILE",
+    "USE_WEIGHT_RATE_LIMITER",
+    "RATE_LIMIT_WEIGHT_PER_MINUTE",
+    "RATE_LIMIT_SAFETY_RATIO",
+    "RATE_LIMIT_BURST_WEIGHT",
+    "CANDLE_STORE_DIR",
+    "CANDLE_STORE_MAX_BARS",
+    "KERNEL_BACKEND",
+)
+
+_SCALARS = (type(None), bool, int, float, str)
+
+
+def _freeze(value):
+    """
+    Forme immuable d'une valeur de configuration
+
+    Returns:
+        tuple: (valeur lue par le scan, clé hashable)
+        None: Si la valeur n'est pas une donnée de configuration
+    """
+    if isinstance(value, _SCALARS):
+        return value, value
+    if isinstance(value, (list, tuple)):
+        items = [_freeze(item) for item in value]
+        if any(item is None for item in items):
+            return None
+        return tuple(item[0] for item in items), ("list",) + tuple(item[1] for item in items)
+    if isinstance(value, dict):
+        items = {key: _freeze(item) for key, item in value.items()}
+        if any(item is None for item in items.values()) or not all(isinstance(k, str) for k in items):
+            return None
+        return (
+            MappingProxyType({key: item[0] for key, item in items.items()}),
+            ("dict",) + tuple(sorted((key, item[1]) for key, item in items.items())),
+        )
+    return None
+
+
+def _thaw(value):
+    """Valeur modifiable équivalente (listes et dicts), pour JSON ou config.py"""
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+class ScanConfig:
+    """
+    Paramètres d'un scan, figés (mêmes noms que config.py)
+
+    Les listes sont lues en tuples, les dictionnaires en vues en lecture
+    seule (MappingProxyType).
+    """
+
+    def __init__(self, values):
+        """
+        Args:
+            values (dict): {NOM: valeur} - seuls les noms en majuscules dont la
+                           valeur est une donnée (nombre, texte, liste, dict) sont
+                           gardés, hors PROCESS_SETTINGS
+        """
+        frozen = {}
+        for name, value in values.items():
+            if not name.isupper() or name.startswith("_") or name in PROCESS_SETTINGS:
+                continue
+            item = _freeze(value)
+            if item is not None:
+                frozen[name] = item
+
+        # Valeurs en attributs d'instance : lecture directe, sans __getattr__
+        self.__dict__.update({name: item[0] for name, item in frozen.items()})
+        self.__dict__["_names"] = tuple(sorted(frozen))
+        self.__dict__["_key"] = tuple((name, frozen[name][1]) for name in self._names)
+        self.__dict__["_hash"] = hash(self._key)
+
+    @classmethod
+    def from_module(cls, module=None):
+        """
+        Fige les valeurs actuelles du module config.py
+
+        Args:
+            module: Module de configuration (None = config)
+
+        Returns:
+            ScanConfig
+        """
+        return cls(vars(module or config_module))
+
+    @classmethod
+    def from_file(cls, path, base=None):
+        """
+        Configuration décrite par un fichier JSON {NOM: valeur}
+
+        Les paramètres absents du fichier gardent la valeur de `base`.
+
+        Args:
+            path (str): Chemin du fichier JSON
+            base (ScanConfig): Valeurs par défaut (None = config.py actuel)
+
+        Returns:
+            ScanConfig
+
+        Raises:
+            ValueError: Fichier invalide ou paramètre inconnu
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+        if not isinstance(overrides, dict):
+            raise ValueError(f"Configuration invalide dans {path}: objet JSON attendu")
+        return (base or cls.from_module()).replace(**overrides)
+
+    def replace(self, **changes):
+        """
+        Copie avec des paramètres modifiés (ex: GUI, balayage de seuils)
+
+        Raises:
+            ValueError: Paramètre inconnu ou paramètre du processus
+        """
+        process = [name for name in changes if name in PROCESS_SETTINGS]
+        if process:
+            raise ValueError(
+                f"Paramètre(s) du processus, hors configuration d'un scan: {', '.join(sorted(process))}"
+            )
+        unknown = [name for name in changes if name not in self._names]
+        if unknown:
+            raise ValueError(f"Paramètre(s) de configuration inconnu(s): {', '.join(sorted(unknown))}")
+        values = self.as_dict()
+        values.update(changes)
+        return ScanConfig(values)
+
+    def as_dict(self):
+        """Paramètres en dictionnaire modifiable (listes et dicts)"""
+        return {name: _thaw(self.__dict__[name]) for name in self._names}
+
+    @property
+    def fingerprint(self):
+        """Empreinte stable des paramètres (clé de cache sur disque, 16 caractères hexadécimaux)"""
+        return hashlib.sha256(repr(self._key).encode()).hexdigest()[:16]
+
+    def __getattr__(self, name):
+        raise AttributeError(f"Paramètre de configuration inconnu: {name}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ScanConfig est immuable (utiliser replace)")
+
+    def __delattr__(self, name):
+        raise AttributeError("ScanConfig est immuable")
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return isinstance(other, ScanConfig) and self._key == other._key
+
+    def __repr__(self):
+        return f"ScanConfig({self.fingerprint})"
@@ -5,37 +5,145 @@ V2 : Concurrency avec ThreadPoolExecutor
 V2.5 : Multi-indicateurs (MACD, Bollinger Bands, Stochastic)
 """
 
-import config
+from scan_config import ScanConfig
 from logger import get_logger
+import candle_store
 from exchange import get_filtered_pairs
-from data import fetch_ohlcv, get_last_closed_candle
+from data import PairFrames, get_last_closed_candle, timeframe_ratio
+from indicator_registry import required_bars, timeframe_requirements
 from indicators import (
-    get_latest_rsi,
+    calculate_rsi,
     calculate_sma,
     calculate_ema,
-    detect_trend,
     calculate_macd,
-    detect_macd_signal,
     calculate_bollinger_bands,
-    detect_bollinger_signal,
     calculate_stochastic,
+    latest_rsi,
+    latest_price,
+    latest_sma,
+    latest_ema,
+    detect_trend,
+    latest_macd,
+    detect_macd_signal,
+    latest_bollinger_bands,
+    detect_bollinger_signal,
+    latest_stochastic,
     detect_stochastic_signal,
     calculate_confluence_score,
     check_signal_filters,
+    SIGNAL_SCORE_POINTS,
 )
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from indicator_context import IndicatorContext
+from scoring import SIGNAL_COLUMNS, score_result
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import bisect
+import itertools
 import time
 
 logger = get_logger()
 
 
-def analyze_pair_ma(exchange, symbol):
+def _ma_periods(settings):
+    """
+    Retourne toutes les périodes de moyennes mobiles activées (SMA + EMA)
+
+    Args:
+        settings (ScanConfig): Configuration du scan
+
+    Returns:
+        list: Périodes configurées
+    """
+    all_periods = []
+    if settings.USE_SMA:
+        all_periods.extend(settings.SMA_PERIODS)
+    if settings.USE_EMA:
+        all_periods.extend(settings.EMA_PERIODS)
+    return all_periods
+
+
+def _multi_max_period(settings):
+    """
+    Période maximale requise par les multi-indicateurs activés
+
+    Args:
+        settings (ScanConfig): Configuration du scan
+
+    Returns:
+        int: Période maximale (0 si aucun indicateur activé)
+    """
+    return max(
+        (
+            settings.MACD_SLOW_PERIOD + settings.MACD_SIGNAL_PERIOD
+            if settings.USE_MACD
+            else 0
+        ),
+        settings.BOLLINGER_PERIOD if settings.USE_BOLLINGER else 0,
+        settings.STOCHASTIC_K_PERIOD if settings.USE_STOCHASTIC else 0,
+    )
+
+
+def _analysis_settings(frames, settings):
+    """Configuration d'une analyse : `settings`, sinon celle des bougies, sinon config.py"""
+    if settings is not None:
+        return settings
+    return frames.settings if frames is not None else ScanConfig.from_module()
+
+
+def build_fetch_plan(settings=None):
+    """
+    Construit le plan de récupération OHLCV d'une paire
+
+    Rassemble les besoins (timeframe, nombre de bougies) des indicateurs
+    activés (indicator_registry) et ne garde que le maximum par timeframe :
+    chaque timeframe n'est ainsi téléchargé qu'une seule fois par paire, puis
+    découpé pour le RSI, les MA et les multi-indicateurs.
+
+    Args:
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        dict: {timeframe: limit} (ex: {'4h': 174, '1w': 174, '1d': 174})
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    plan = {}
+
+    def require(timeframe, limit):
+        plan[timeframe] = max(plan.get(timeframe, 0), limit)
+
+    # Timeframes supérieurs reconstruits depuis TIMEFRAME si l'historique
+    # nécessaire tient en une requête, ou dans le cache des bougies : téléchargé
+    # par pages au premier scan, une seule requête `since` aux suivants
+    source_limit = settings.RESAMPLE_MAX_SOURCE_BARS
+    if settings.USE_CANDLE_STORE:
+        source_limit = max(source_limit, candle_store.capacity())
+
+    for tf, bars in timeframe_requirements(settings).items():
+        ratio = (
+            timeframe_ratio(settings.TIMEFRAME, tf)
+            if settings.RESAMPLE_HIGHER_TIMEFRAMES and tf != settings.TIMEFRAME
+            else None
+        )
+        # +1 : la première période, incomplète, est écartée au ré-échantillonnage
+        source_bars = (bars + 1) * ratio if ratio else None
+        if source_bars and source_bars <= source_limit:
+            require(settings.TIMEFRAME, source_bars)
+        else:
+            require(tf, bars)
+
+    return plan
+
+
+def analyze_pair_ma(exchange, symbol, frames=None, settings=None):
     """
     Analyse les moyennes mobiles d'une paire sur plusieurs timeframes
 
     Args:
         exchange: Instance CCXT de l'exchange
         symbol (str): Symbole de la paire (ex: "BTC/USDC")
+        frames (PairFrames): Bougies partagées de la paire (optionnel)
+        settings (ScanConfig): Configuration du scan (None = celle de frames,
+            sinon config.py actuel)
 
     Returns:
         dict: Résultats de l'analyse MA
@@ -51,52 +159,50 @@ def analyze_pair_ma(exchange, symbol):
         }
         None si erreur
     """
-    if not config.USE_MA:
+    settings = _analysis_settings(frames, settings)
+    if not settings.USE_MA:
         return None
 
+    if frames is None:
+        frames = PairFrames(exchange, symbol, build_fetch_plan(settings), settings=settings)
+
     results = {}
     trend_score = 0
 
     try:
-        for tf in config.MA_TIMEFRAMES:
+        for tf in settings.MA_TIMEFRAMES:
             # Récupérer OHLCV pour ce timeframe
             # Calculer la limite nécessaire (max des périodes SMA et EMA)
-            all_periods = []
-            if config.USE_SMA:
-                all_periods.extend(config.SMA_PERIODS)
-            if config.USE_EMA:
-                all_periods.extend(config.EMA_PERIODS)
+            all_periods = _ma_periods(settings)
 
             if not all_periods:
                 logger.warning(f"    ⚠ Aucune période MA configurée pour {symbol}")
                 continue
 
             max_period = max(all_periods)
-            limit = max(config.MIN_MA_BARS, max_period + 10)  # +10 pour marge
 
-            df = fetch_ohlcv(exchange, symbol, timeframe=tf, limit=limit)
+            df = frames.get(tf, limit=required_bars("ma", tf, settings))
 
             if df is None or len(df) < max_period:
                 logger.debug(f"    ⚠ Données insuffisantes pour MA sur {tf}")
                 continue
 
-            # Calculer les moyennes mobiles configurées
+            # Calculer les moyennes mobiles configurées (dernière valeur seule)
+            close = df.column("close")
             sma_results = {}
             ema_results = {}
 
-            if config.USE_SMA:
-                for period in config.SMA_PERIODS:
-                    sma = calculate_sma(df["close"], period)
-                    if sma is not None:
-                        sma_value = float(sma.iloc[-1])
+            if settings.USE_SMA:
+                for period in settings.SMA_PERIODS:
+                    sma_value = latest_sma(close, period)
+                    if sma_value is not None:
                         results[f"sma{period}_{tf}"] = round(sma_value, 8)
                         sma_results[period] = sma_value
 
-            if config.USE_EMA:
-                for period in config.EMA_PERIODS:
-                    ema = calculate_ema(df["close"], period)
-                    if ema is not None:
-                        ema_value = float(ema.iloc[-1])
+            if settings.USE_EMA:
+                for period in settings.EMA_PERIODS:
+                    ema_value = latest_ema(close, period, tolerance=None)
+                    if ema_value is not None:
                         results[f"ema{period}_{tf}"] = round(ema_value, 8)
                         ema_results[period] = ema_value
 
@@ -110,7 +216,7 @@ def analyze_pair_ma(exchange, symbol):
                 ema20 = ema_results.get(20) if has_ema_20_50 else None
                 ema50 = ema_results.get(50) if has_ema_20_50 else None
 
-                is_bullish = detect_trend(df["close"], sma20, sma50, ema20, ema50)
+                is_bullish = detect_trend(latest_price(close), sma20, sma50, ema20, ema50)
 
                 results[f"trend_{tf}"] = is_bullish
 
@@ -130,13 +236,16 @@ def analyze_pair_ma(exchange, symbol):
         return None
 
 
-def analyze_pair_multi_indicators(exchange, symbol):
+def analyze_pair_multi_indicators(exchange, symbol, frames=None, settings=None):
     """
     Analyse les multi-indicateurs d'une paire (MACD, Bollinger, Stochastic)
 
     Args:
         exchange: Instance CCXT de l'exchange
         symbol (str): Symbole de la paire (ex: "BTC/USDC")
+        frames (PairFrames): Bougies partagées de la paire (optionnel)
+        settings (ScanConfig): Configuration du scan (None = celle de frames,
+            sinon config.py actuel)
 
     Returns:
         dict: Résultats des indicateurs
@@ -156,46 +265,43 @@ def analyze_pair_multi_indicators(exchange, symbol):
         None si aucun indicateur activé ou erreur
     """
     results = {}
+    settings = _analysis_settings(frames, settings)
 
     try:
         # Vérifier si au moins un indicateur est activé
-        if not (config.USE_MACD or config.USE_BOLLINGER or config.USE_STOCHASTIC):
+        if not (settings.USE_MACD or settings.USE_BOLLINGER or settings.USE_STOCHASTIC):
             return None
 
         # Déterminer la période maximale nécessaire
-        max_period = max(
-            (
-                config.MACD_SLOW_PERIOD + config.MACD_SIGNAL_PERIOD
-                if config.USE_MACD
-                else 0
-            ),
-            config.BOLLINGER_PERIOD if config.USE_BOLLINGER else 0,
-            config.STOCHASTIC_K_PERIOD if config.USE_STOCHASTIC else 0,
-        )
+        max_period = _multi_max_period(settings)
 
-        limit = max(200, max_period + 50)  # Marge suffisante
+        if frames is None:
+            frames = PairFrames(exchange, symbol, build_fetch_plan(settings), settings=settings)
 
         # Récupérer les données OHLCV
-        df = fetch_ohlcv(exchange, symbol, timeframe=config.TIMEFRAME, limit=limit)
+        df = frames.get(settings.TIMEFRAME, limit=required_bars("multi", settings.TIMEFRAME, settings))
 
         if df is None or len(df) < max_period:
             logger.debug("    ⚠ Données insuffisantes pour multi-indicateurs")
             return None
 
+        close = df.column("close")
+
         # === MACD ===
-        if config.USE_MACD:
-            macd_data = calculate_macd(
-                df["close"],
-                fast_period=config.MACD_FAST_PERIOD,
-                slow_period=config.MACD_SLOW_PERIOD,
-                signal_period=config.MACD_SIGNAL_PERIOD,
+        if settings.USE_MACD:
+            macd_data = latest_macd(
+                close,
+                fast_period=settings.MACD_FAST_PERIOD,
+                slow_period=settings.MACD_SLOW_PERIOD,
+                signal_period=settings.MACD_SIGNAL_PERIOD,
+                tolerance=None,
             )
 
             if macd_data:
-                results["macd"] = round(float(macd_data["macd"].iloc[-1]), 8)
-                results["macd_signal"] = round(float(macd_data["signal"].iloc[-1]), 8)
+                results["macd"] = round(float(macd_data["macd"][-1]), 8)
+                results["macd_signal"] = round(float(macd_data["signal"][-1]), 8)
                 results["macd_histogram"] = round(
-                    float(macd_data["histogram"].iloc[-1]), 8
+                    float(macd_data["histogram"][-1]), 8
                 )
                 results["macd_signal_type"] = detect_macd_signal(macd_data)
 
@@ -204,40 +310,40 @@ def analyze_pair_multi_indicators(exchange, symbol):
                 )
 
         # === BOLLINGER BANDS ===
-        if config.USE_BOLLINGER:
-            bb_data = calculate_bollinger_bands(
-                df["close"],
-                period=config.BOLLINGER_PERIOD,
-                std_dev=config.BOLLINGER_STD_DEV,
+        if settings.USE_BOLLINGER:
+            bb_data = latest_bollinger_bands(
+                close,
+                period=settings.BOLLINGER_PERIOD,
+                std_dev=settings.BOLLINGER_STD_DEV,
             )
 
             if bb_data:
-                results["bb_upper"] = round(float(bb_data["upper"].iloc[-1]), 8)
-                results["bb_middle"] = round(float(bb_data["middle"].iloc[-1]), 8)
-                results["bb_lower"] = round(float(bb_data["lower"].iloc[-1]), 8)
-                results["bb_position"] = detect_bollinger_signal(df["close"], bb_data)
+                results["bb_upper"] = round(float(bb_data["upper"][-1]), 8)
+                results["bb_middle"] = round(float(bb_data["middle"][-1]), 8)
+                results["bb_lower"] = round(float(bb_data["lower"][-1]), 8)
+                results["bb_position"] = detect_bollinger_signal(close, bb_data)
 
                 logger.debug(
                     f"    BB: {results['bb_middle']:.2f} | Position: {results['bb_position']}"
                 )
 
         # === STOCHASTIC ===
-        if config.USE_STOCHASTIC:
-            stoch_data = calculate_stochastic(
-                df["high"],
-                df["low"],
-                df["close"],
-                k_period=config.STOCHASTIC_K_PERIOD,
-                d_period=config.STOCHASTIC_D_PERIOD,
+        if settings.USE_STOCHASTIC:
+            stoch_data = latest_stochastic(
+                df.column("high"),
+                df.column("low"),
+                close,
+                k_period=settings.STOCHASTIC_K_PERIOD,
+                d_period=settings.STOCHASTIC_D_PERIOD,
             )
 
             if stoch_data:
-                results["stoch_k"] = round(float(stoch_data["k"].iloc[-1]), 2)
-                results["stoch_d"] = round(float(stoch_data["d"].iloc[-1]), 2)
+                results["stoch_k"] = round(float(stoch_data["k"][-1]), 2)
+                results["stoch_d"] = round(float(stoch_data["d"][-1]), 2)
                 results["stoch_signal"] = detect_stochastic_signal(
                     stoch_data,
-                    oversold_level=config.STOCHASTIC_OVERSOLD,
-                    overbought_level=config.STOCHASTIC_OVERBOUGHT,
+                    oversold_level=settings.STOCHASTIC_OVERSOLD,
+                    overbought_level=settings.STOCHASTIC_OVERBOUGHT,
                 )
 
                 logger.debug(
@@ -251,16 +357,585 @@ def analyze_pair_multi_indicators(exchange, symbol):
         return None
 
 
-def analyze_single_pair(exchange, symbol, idx, total):
+def _stage_context(frames, stage, timeframe):
+    """
+    Contexte de calcul des bougies lues par une étape d'analyse
+
+    Args:
+        frames (PairFrames): Bougies de la paire
+        stage (str): Étape d'analyse ('rsi', 'ma', 'multi')
+        timeframe (str): Timeframe des bougies
+
+    Returns:
+        IndicatorContext: Colonnes indexées par date d'ouverture
+        None: Si les bougies sont indisponibles
+    """
+    df = frames.get(timeframe, limit=required_bars(stage, timeframe, frames.settings))
+    if df is None or len(df) == 0:
+        return None
+    return IndicatorContext(df.to_dataframe().set_index("time"))
+
+
+def pair_series(frames, settings=None):
+    """
+    Séries complètes des indicateurs d'une paire, pour les graphiques
+
+    Mêmes fonctions (indicators.py) et mêmes tranches de bougies que le scan
+    (indicator_registry.required_bars) : la dernière valeur de chaque série
+    est celle du tableau de résultats. Les bougies sont celles du scan
+    (scan_market(frames=...)), sans nouveau téléchargement.
+
+    Args:
+        frames (PairFrames): Bougies de la paire
+        settings (ScanConfig): Configuration (None = celle du scan des bougies)
+
+    Returns:
+        dict: {
+            'ohlcv': pd.DataFrame - Bougies de TIMEFRAME (index = date),
+            'rsi': pd.Series,
+            'sma' / 'ema': {période: pd.Series} (si TIMEFRAME in MA_TIMEFRAMES),
+            'macd' / 'bollinger' / 'stochastic': dict de pd.Series
+        } - séries alignées sur l'index des bougies, indicateurs non
+        disponibles absents
+        None: Si les bougies sont indisponibles
+    """
+    settings = _analysis_settings(frames, settings)
+    tf = settings.TIMEFRAME
+    df = frames.get(tf)
+    if df is None or len(df) == 0:
+        return None
+
+    ohlcv = df.to_dataframe().set_index("time")
+    series = {"ohlcv": ohlcv}
+
+    def align(values):
+        return values.reindex(ohlcv.index)
+
+    if settings.USE_RSI:
+        context = _stage_context(frames, "rsi", tf)
+        rsi = calculate_rsi(context, settings.RSI_PERIOD) if context is not None else None
+        if rsi is not None:
+            series["rsi"] = align(rsi)
+
+    if settings.USE_MA and tf in settings.MA_TIMEFRAMES:
+        context = _stage_context(frames, "ma", tf)
+        for key, enabled, periods, calculate in (
+            ("sma", settings.USE_SMA, settings.SMA_PERIODS, calculate_sma),
+            ("ema", settings.USE_EMA, settings.EMA_PERIODS, calculate_ema),
+        ):
+            if not enabled or context is None:
+                continue
+            averages = {period: calculate(context, period) for period in periods}
+            series[key] = {
+                period: align(values) for period, values in averages.items() if values is not None
+            }
+
+    if settings.USE_MACD or settings.USE_BOLLINGER or settings.USE_STOCHASTIC:
+        context = _stage_context(frames, "multi", tf)
+        multi = {}
+        if context is not None and settings.USE_MACD:
+            multi["macd"] = calculate_macd(
+                context,
+                fast_period=settings.MACD_FAST_PERIOD,
+                slow_period=settings.MACD_SLOW_PERIOD,
+                signal_period=settings.MACD_SIGNAL_PERIOD,
+            )
+        if context is not None and settings.USE_BOLLINGER:
+            multi["bollinger"] = calculate_bollinger_bands(
+                context, period=settings.BOLLINGER_PERIOD, std_dev=settings.BOLLINGER_STD_DEV
+            )
+        if context is not None and settings.USE_STOCHASTIC:
+            multi["stochastic"] = calculate_stochastic(
+                context,
+                k_period=settings.STOCHASTIC_K_PERIOD,
+                d_period=settings.STOCHASTIC_D_PERIOD,
+            )
+        for key, lines in multi.items():
+            if lines is not None:
+                series[key] = {name: align(values) for name, values in lines.items()}
+
+    return series
+
+
+def passes_trend_filter(ma_data, settings):
+    """
+    Vérifie le trend_score minimum (filtre combiné RSI + MA)
+
+    Args:
+        ma_data (dict): Résultat de analyze_pair_ma (ou None)
+        settings (ScanConfig): Configuration du scan
+
+    Returns:
+        bool: False si la paire doit être filtrée
+    """
+    if settings.USE_MA and ma_data:
+        trend_score = ma_data.get("trend_score", 0)
+
+        if trend_score < settings.MIN_TREND_SCORE:
+            logger.debug(
+                f"    ⚠ Trend score insuffisant: {trend_score}/{len(settings.MA_TIMEFRAMES)}"
+            )
+            return False
+
+    return True
+
+
+def finalize_pair(symbol, rsi, last_candle, ma_data, multi_ind_data, settings):
+    """
+    Construit le résultat candidat d'une paire
+
+    Étape commune au scan paire par paire (analyze_single_pair) et au moteur
+    vectorisé (batch_scanner). Les filtres de signaux et le score de
+    confluence sont appliqués ensuite (scoring.score_result pendant le scan,
+    scoring.score_results pour re-noter toutes les paires à la fois).
+
+    Args:
+        symbol (str): Symbole de la paire
+        rsi (float): RSI de la dernière bougie (ou None)
+        last_candle (dict): Dernière bougie fermée (ou None)
+        ma_data (dict): Résultat de analyze_pair_ma (ou None)
+        multi_ind_data (dict): Résultat de analyze_pair_multi_indicators (ou None)
+        settings (ScanConfig): Configuration du scan
+
+    Returns:
+        tuple: ('success', result)
+    """
+    # ===== D. CONSTRUIRE LE RÉSULTAT =====
+    result = {"symbol": symbol, "timeframe": settings.TIMEFRAME}
+
+    # Ajouter RSI si calculé
+    if rsi is not None:
+        result["rsi"] = round(rsi, 2)
+
+    # Ajouter prix et date si disponibles
+    if last_candle:
+        result["last_close_price"] = last_candle["close"]
+        result["last_close_time"] = last_candle["time"]
+
+    # Ajouter les données MA si disponibles
+    if ma_data:
+        result.update(ma_data)
+
+    # Ajouter les multi-indicateurs si disponibles
+    if multi_ind_data:
+        result.update(multi_ind_data)
+
+    return ("success", result)
+
+
+def _log_opportunity(result, settings):
+    """Log détaillé d'une paire retenue après filtres et score de confluence"""
+    log_parts = [result["symbol"]]
+    if "rsi" in result:
+        log_parts.append(f"RSI={result['rsi']:.2f}")
+    if settings.USE_MA and "trend_score" in result:
+        log_parts.append(f"Trend={result['trend_score']}/{len(settings.MA_TIMEFRAMES)}")
+    if "macd_signal_type" in result:
+        log_parts.append(f"MACD={result['macd_signal_type']}")
+    if "bb_position" in result:
+        log_parts.append(f"BB={result['bb_position']}")
+    if "stoch_signal" in result:
+        log_parts.append(f"Stoch={result['stoch_signal']}")
+    if "confluence_score" in result:
+        log_parts.append(
+            f"Score={result['confluence_score']:.1f} ({result['confluence_grade']})"
+        )
+
+    logger.info(f"  🎯 {' | '.join(log_parts)}")
+
+
+def sort_results(results, settings=None):
+    """
+    Trie les résultats d'un scan (en place)
+
+    Si RSI activé, par RSI ascendant ; sinon si MA activée, par trend_score
+    descendant ; sinon par symbole.
+
+    Args:
+        results (list): Résultats retenus
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        list: Les mêmes résultats, triés
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    if settings.USE_RSI and results and "rsi" in results[0]:
+        results.sort(key=lambda x: x.get("rsi", 999))
+    elif settings.USE_MA and results and "trend_score" in results[0]:
+        results.sort(key=lambda x: x.get("trend_score", 0), reverse=True)
+    else:
+        results.sort(key=lambda x: x.get("symbol", ""))
+    return results
+
+
+class AnalysisStage:
+    """
+    Étape de l'analyse d'une paire
+
+    Chaque étape déclare son coût (timeframes OHLCV à télécharger, nombre
+    d'indicateurs à calculer) et complète l'état de la paire ; elle retourne
+    un status ('filtered', 'error') pour rejeter la paire, None pour continuer.
+    """
+
+    def __init__(self, name, timeframes, cpu, run, reads=None):
+        """
+        Args:
+            name (str): Nom de l'étape ('rsi', 'ma', 'multi')
+            timeframes (list): Timeframes du plan lus par l'étape
+            cpu (int): Indicateurs calculés (coût de calcul relatif)
+            run (callable): run(state) -> status ou None
+            reads (dict): Bougies lues par timeframe, timeframes reconstruits
+                compris {timeframe: bars} (optionnel, voir PairFrames.direct_fetches)
+        """
+        self.name = name
+        self.timeframes = list(dict.fromkeys(timeframes))
+        self.cpu = cpu
+        self.run = run
+        self.reads = reads or {}
+
+    def requests(self, fetched=()):
+        """
+        Requêtes OHLCV de l'étape
+
+        Args:
+            fetched (iterable): Timeframes déjà récupérés par les étapes précédentes
+
+        Returns:
+            int: Nombre de timeframes restant à télécharger
+        """
+        return sum(1 for tf in self.timeframes if tf not in fetched)
+
+    def __repr__(self):
+        return f"AnalysisStage({self.name}, {self.timeframes}, cpu={self.cpu})"
+
+
+class Pipeline(list):
+    """Étapes ordonnées de l'analyse d'une paire (voir build_pipeline)"""
+
+    def __init__(self, stages=(), early_rejection=False, settings=None):
+        """
+        Args:
+            stages (iterable): AnalysisStage dans l'ordre d'exécution
+            early_rejection (bool): Filtres de signaux et borne du score de
+                confluence vérifiés après chaque étape (rejects_early)
+            settings (ScanConfig): Configuration du scan, lue par les étapes
+                et les moteurs (None = config.py actuel)
+        """
+        super().__init__(stages)
+        self.early_rejection = early_rejection
+        self.settings = settings if settings is not None else ScanConfig.from_module()
+
+    def describe(self):
+        """Résumé pour les logs (ex: 'rsi (1 req.) → multi (0 req.) → ma (2 req.)')"""
+        fetched = set()
+        parts = []
+        for stage in self:
+            parts.append(f"{stage.name} ({stage.requests(fetched)} req.)")
+            fetched.update(stage.timeframes)
+        return " → ".join(parts)
+
+
+def _rsi_stage(state):
+    """Étape RSI : dernière bougie du timeframe principal + filtre RSI"""
+    frames, settings = state["frames"], state["settings"]
+
+    if not settings.USE_RSI:
+        # Si RSI non activé, récupérer quand même les données de base pour le prix
+        df = frames.get(settings.TIMEFRAME, limit=1)
+        if df is not None and len(df) > 0:
+            state["last_candle"] = get_last_closed_candle(df)
+        return None
+
+    df = frames.get(settings.TIMEFRAME, limit=required_bars("rsi", settings.TIMEFRAME, settings))
+    if df is None or len(df) == 0:
+        logger.debug(f"  ⚠ Données insuffisantes pour {state['symbol']}")
+        return "error"
+
+    # Tranche déjà bornée par le registre : calculée en entier, comme pair_series
+    rsi = latest_rsi(df.column("close"), period=settings.RSI_PERIOD, tolerance=None)
+    if rsi is None:
+        logger.debug(f"  ⚠ Impossible de calculer RSI pour {state['symbol']}")
+        return "error"
+
+    logger.debug(f"  ✓ {state['symbol']}: RSI = {rsi:.2f}")
+    state["rsi"] = rsi
+
+    # Filtrer si RSI >= seuil
+    if rsi >= settings.RSI_THRESHOLD:
+        return "filtered"
+
+    state["last_candle"] = get_last_closed_candle(df)
+    return None
+
+
+def _ma_stage(state):
+    """Étape MA : moyennes mobiles multi-timeframe + filtre de tendance"""
+    logger.debug("    Analyse MA multi-timeframe...")
+    state["ma"] = analyze_pair_ma(
+        state["exchange"], state["symbol"], frames=state["frames"], settings=state["settings"]
+    )
+    return None if passes_trend_filter(state["ma"], state["settings"]) else "filtered"
+
+
+def _multi_stage(state):
+    """Étape multi-indicateurs : MACD, Bollinger, Stochastic du timeframe principal"""
+    logger.debug("    Analyse multi-indicateurs...")
+    state["multi"] = analyze_pair_multi_indicators(
+        state["exchange"], state["symbol"], frames=state["frames"], settings=state["settings"]
+    )
+    return None
+
+
+def build_pipeline(plan=None, early_rejection=None, settings=None):
+    """
+    Étapes de l'analyse d'une paire, de la moins coûteuse à la plus coûteuse
+
+    Ordre glouton : à chaque pas, l'étape qui demande le moins de nouvelles
+    requêtes OHLCV (timeframes déjà récupérés gratuits), puis le moins de
+    calcul. Configuration par défaut : RSI (1 requête) -> multi-indicateurs
+    (mêmes bougies) -> MA (timeframes supérieurs).
+
+    Args:
+        plan (dict): Plan de récupération {timeframe: limit} (None = build_fetch_plan)
+        early_rejection (bool): Filtres de signaux et borne du score de
+            confluence vérifiés après chaque étape (None = EARLY_REJECTION)
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
+
+    Returns:
+        Pipeline: AnalysisStage dans l'ordre d'exécution (avec sa configuration)
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    if plan is None:
+        plan = build_fetch_plan(settings)
+    if early_rejection is None:
+        early_rejection = settings.EARLY_REJECTION
+
+    # Timeframes reconstruits localement : lus depuis TIMEFRAME
+    source = PairFrames(None, None, plan, settings=settings).fetch_timeframe
+
+    stages = [AnalysisStage("rsi", [settings.TIMEFRAME], 1 if settings.USE_RSI else 0, _rsi_stage)]
+    if settings.USE_MA:
+        stages.append(
+            AnalysisStage(
+                "ma",
+                [source(tf) for tf in settings.MA_TIMEFRAMES],
+                len(settings.MA_TIMEFRAMES) * len(_ma_periods(settings)),
+                _ma_stage,
+                reads={tf: required_bars("ma", tf, settings) for tf in settings.MA_TIMEFRAMES},
+            )
+        )
+    multi = [settings.USE_MACD, settings.USE_BOLLINGER, settings.USE_STOCHASTIC]
+    if any(multi):
+        stages.append(AnalysisStage("multi", [settings.TIMEFRAME], sum(multi), _multi_stage))
+
+    ordered = Pipeline(early_rejection=early_rejection, settings=settings)
+    fetched = set()
+    while stages:
+        stage = min(stages, key=lambda s: (s.requests(fetched), s.cpu))
+        stages.remove(stage)
+        ordered.append(stage)
+        fetched.update(stage.timeframes)
+    return ordered
+
+
+def _best_signal(name):
+    """Signal le mieux noté d'un indicateur (table SIGNAL_SCORE_POINTS)"""
+    points = SIGNAL_SCORE_POINTS[name][0]
+    return max(points, key=points.get)
+
+
+def confluence_upper_bound(state):
+    """
+    Meilleur score de confluence encore atteignable par une paire
+
+    Les composantes déjà calculées gardent leur note ; celles des étapes
+    restantes prennent la note maximale (tendance complète, meilleur signal).
+    Même calcul que le score final (calculate_confluence_score), donc
+    jamais inférieur à celui-ci.
+
+    Args:
+        state (dict): État de la paire ('rsi', 'ma', 'multi' présents une
+                      fois l'étape exécutée)
+
+    Returns:
+        float: Borne supérieure du score arrondi
+    """
+    settings = state["settings"]
+    rsi = state.get("rsi")
+    max_trend = len(settings.MA_TIMEFRAMES) if settings.USE_MA else 0
+
+    if "ma" in state:
+        trend_score = state["ma"].get("trend_score") if state["ma"] else None
+    else:
+        trend_score = max_trend
+
+    signals = {}
+    enabled = {
+        "macd": settings.USE_MACD,
+        "bollinger": settings.USE_BOLLINGER,
+        "stochastic": settings.USE_STOCHASTIC,
+    }
+    for name, key in SIGNAL_COLUMNS.items():
+        if "multi" in state:
+            signals[name] = state["multi"].get(key) if state["multi"] else None
+        else:
+            signals[name] = _best_signal(name) if enabled[name] else None
+
+    bound = calculate_confluence_score(
+        rsi_value=round(rsi, 2) if rsi is not None else None,
+        trend_score=trend_score,
+        max_trend_score=max_trend,
+        macd_signal=signals["macd"],
+        bb_position=signals["bollinger"],
+        stoch_signal=signals["stochastic"],
+        weights=settings.CONFLUENCE_WEIGHTS,
+    )
+    return bound["score"] if bound else 100.0
+
+
+def rejects_early(state):
+    """
+    Rejet anticipé d'une paire (mêmes règles que scoring.score_results)
+
+    Args:
+        state (dict): État de la paire après une étape
+
+    Returns:
+        bool: True si les filtres de signaux ou le score minimum ne peuvent
+              plus être satisfaits
+    """
+    settings = state["settings"]
+    multi = state.get("multi")
+    if multi and not check_signal_filters(
+        multi.get("macd_signal_type"),
+        multi.get("bb_position"),
+        multi.get("stoch_signal"),
+        settings.FILTER_MACD_SIGNAL,
+        settings.FILTER_BB_POSITION,
+        settings.FILTER_STOCH_SIGNAL,
+    ):
+        return True
+
+    if settings.USE_CONFLUENCE_SCORE:
+        bound = confluence_upper_bound(state)
+        if bound < settings.MIN_CONFLUENCE_SCORE:
+            logger.debug(f"    ⚠ Score de confluence atteignable {bound} < {settings.MIN_CONFLUENCE_SCORE}")
+            return True
+
+    return False
+
+
+def rescore_is_complete(scan_settings, settings=None):
+    """
+    Indique si les candidats d'un scan suffisent pour le re-noter
+
+    Avec EARLY_REJECTION, le scan écarte les paires qui ne peuvent plus passer
+    ses filtres de signaux ou atteindre son score minimum : elles manquent aux
+    candidats. Une re-notation plus permissive (filtres ou pondérations
+    modifiés, score minimum plus bas) demande alors un nouveau scan.
+
+    Args:
+        scan_settings (ScanConfig): Configuration du scan
+        settings (ScanConfig): Configuration de la re-notation (None = config.py actuel)
+
+    Returns:
+        bool: True si toutes les paires que la re-notation retiendrait sont
+              parmi les candidats
+    """
+    if not scan_settings.EARLY_REJECTION:
+        return True
+    if settings is None:
+        settings = ScanConfig.from_module()
+
+    filters = ("FILTER_MACD_SIGNAL", "FILTER_BB_POSITION", "FILTER_STOCH_SIGNAL")
+    if any(getattr(settings, name) != getattr(scan_settings, name) for name in filters):
+        return False
+    if not scan_settings.USE_CONFLUENCE_SCORE:
+        return True
+    return (
+        settings.USE_CONFLUENCE_SCORE
+        and settings.CONFLUENCE_WEIGHTS == scan_settings.CONFLUENCE_WEIGHTS
+        and settings.MIN_CONFLUENCE_SCORE >= scan_settings.MIN_CONFLUENCE_SCORE
+    )
+
+
+def run_stage(stage, state, pipeline):
+    """
+    Exécute une étape puis les prédicats de rejet anticipé
+
+    Args:
+        stage (AnalysisStage): Étape à exécuter
+        state (dict): État de la paire (complété)
+        pipeline (Pipeline): Pipeline en cours (early_rejection)
+
+    Returns:
+        str: 'filtered' / 'error' si la paire est rejetée, None sinon
+    """
+    status = stage.run(state)
+    if status is None and pipeline.early_rejection and rejects_early(state):
+        status = "filtered"
+    return status
+
+
+def new_analysis(exchange, symbol, frames):
+    """État initial de l'analyse d'une paire (partagé par les étapes, configuration de frames)"""
+    return {
+        "exchange": exchange,
+        "symbol": symbol,
+        "frames": frames,
+        "settings": frames.settings,
+        "rsi": None,
+        "last_candle": None,
+    }
+
+
+def finish_analysis(state, kept=None):
+    """
+    Résultat candidat d'une paire dont toutes les étapes ont réussi
+
+    Args:
+        state (dict): État de la paire
+        kept (dict): Complété avec les bougies de la paire {symbol: PairFrames} (optionnel)
+
+    Returns:
+        tuple: ('success', result)
+    """
+    if kept is not None:
+        kept[state["symbol"]] = state["frames"]
+    return finalize_pair(
+        state["symbol"], state["rsi"], state["last_candle"], state.get("ma"), state.get("multi"),
+        state["settings"],
+    )
+
+
+def analyze_single_pair(
+    exchange, symbol, idx, total, plan=None, frames=None, kept=None, pipeline=None, settings=None
+):
     """
     Analyse une seule paire (isolée pour parallélisation)
     Thread-safe, gère ses propres erreurs
 
+    Chaque (symbole, timeframe) n'est téléchargé qu'une fois : le RSI, les MA
+    et les multi-indicateurs se partagent les mêmes bougies (PairFrames). Les
+    étapes s'exécutent de la moins coûteuse à la plus coûteuse et la paire
+    est rejetée dès qu'une étape l'écarte (build_pipeline) : les timeframes
+    supérieurs ne sont téléchargés que pour les paires encore en course.
+
     Args:
         exchange: Instance CCXT
         symbol (str): Symbole à analyser
         idx (int): Index de la paire (pour logs)
         total (int): Nombre total de paires
+        plan (dict): Plan de récupération {timeframe: limit} (optionnel)
+        frames (dict | PairFrames): Bougies déjà récupérées {timeframe: OHLCV}
+                       (optionnel, utilisé par le moteur batch)
+        kept (dict): Complété avec les bougies de la paire si elle est candidate
+                     {symbol: PairFrames} (optionnel, voir pair_series)
+        pipeline (Pipeline): Étapes ordonnées (optionnel, build_pipeline)
+        settings (ScanConfig): Configuration du scan (None = celle de pipeline,
+            sinon config.py actuel)
 
     Returns:
         tuple: (status, result)
@@ -270,216 +945,285 @@ def analyze_single_pair(exchange, symbol, idx, total):
     try:
         logger.debug(f"[{idx}/{total}] Traitement de {symbol}...")
 
-        # ===== A. CALCUL RSI (si activé) =====
-        rsi = None
-        df_rsi = None
-        last_candle = None
+        if settings is None:
+            settings = pipeline.settings if pipeline is not None else ScanConfig.from_module()
+        if plan is None:
+            plan = build_fetch_plan(settings)
+        if pipeline is None:
+            pipeline = build_pipeline(plan, settings=settings)
+        if not isinstance(frames, PairFrames):
+            frames = PairFrames(exchange, symbol, plan, frames, settings)
+
+        state = new_analysis(exchange, symbol, frames)
+        for stage in pipeline:
+            status = run_stage(stage, state, pipeline)
+            if status is not None:
+                return (status, None)
 
-        if config.USE_RSI:
-            # Récupérer les données OHLCV pour le RSI
-            df_rsi = fetch_ohlcv(exchange, symbol, timeframe=config.TIMEFRAME)
+        return finish_analysis(state, kept)
 
-            if df_rsi is None or len(df_rsi) == 0:
-                logger.debug(f"  ⚠ Données insuffisantes pour {symbol}")
-                return ("error", None)
+    except Exception as e:
+        logger.error(f"  ✗ Erreur inattendue pour {symbol}: {str(e)}")
+        return ("error", None)
 
-            # Calculer le RSI
-            rsi = get_latest_rsi(df_rsi["close"], period=config.RSI_PERIOD)
 
-            if rsi is None:
-                logger.debug(f"  ⚠ Impossible de calculer RSI pour {symbol}")
-                return ("error", None)
+class ScanEvent:
+    """
+    Événement d'un scan en cours (iter_scan)
 
-            logger.debug(f"  ✓ {symbol}: RSI = {rsi:.2f}")
+    kind :
+        'progress' - avancement (done / total), au début, régulièrement et à la fin
+        'result'   - opportunité retenue (filtres de signaux et score appliqués)
+        'filtered' - paire écartée par un filtre
+        'error'    - paire non analysable
+    """
 
-            # Filtrer si RSI < seuil
-            if rsi >= config.RSI_THRESHOLD:
-                return ("filtered", None)
+    def __init__(self, kind, done, total, symbol=None, result=None, top=None):
+        """
+        Args:
+            kind (str): Type d'événement
+            done (int): Paires traitées
+            total (int): Paires à traiter
+            symbol (str): Symbole de la paire (événements par paire)
+            result (dict): Résultat retenu (événements 'result')
+            top (list): Meilleures opportunités jusqu'ici, triées (si top_n)
+        """
+        self.kind = kind
+        self.done = done
+        self.total = total
+        self.symbol = symbol
+        self.result = result
+        self.top = top
+
+    def __repr__(self):
+        return f"ScanEvent({self.kind}, {self.symbol}, {self.done}/{self.total})"
+
+
+def result_rank(settings=None):
+    """
+    Clé de classement des opportunités (même ordre que sort_results)
 
-            last_candle = get_last_closed_candle(df_rsi)
-        else:
-            # Si RSI non activé, récupérer quand même les données de base pour le prix
-            df_rsi = fetch_ohlcv(exchange, symbol, timeframe=config.TIMEFRAME, limit=1)
-            if df_rsi is not None and len(df_rsi) > 0:
-                last_candle = get_last_closed_candle(df_rsi)
-
-        # ===== B. CALCUL MOYENNES MOBILES (V1.5) =====
-        ma_data = None
-        if config.USE_MA:
-            logger.debug("    Analyse MA multi-timeframe...")
-            ma_data = analyze_pair_ma(exchange, symbol)
-
-        # ===== C. FILTRE COMBINÉ =====
-        # Si MA activée, vérifier le trend_score
-        if config.USE_MA and ma_data:
-            trend_score = ma_data.get("trend_score", 0)
-
-            if trend_score < config.MIN_TREND_SCORE:
-                logger.debug(
-                    f"    ⚠ Trend score insuffisant: {trend_score}/{len(config.MA_TIMEFRAMES)}"
-                )
-                return ("filtered", None)
+    Args:
+        settings (ScanConfig): Configuration du scan (None = config.py actuel)
 
-        # ===== D. CONSTRUIRE LE RÉSULTAT =====
-        result = {"symbol": symbol, "timeframe": config.TIMEFRAME}
+    Returns:
+        callable: key(result) - RSI croissant, sinon trend_score décroissant,
+                  sinon symbole
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    if settings.USE_RSI:
+        return lambda result: result.get("rsi", 999)
+    if settings.USE_MA:
+        return lambda result: -result.get("trend_score", 0)
+    return lambda result: result.get("symbol", "")
+
+
+class TopResults:
+    """Meilleures opportunités d'un scan en cours (classement result_rank)"""
+
+    def __init__(self, size, key=None, settings=None):
+        """
+        Args:
+            size (int): Nombre d'opportunités conservées
+            key (callable): Clé de classement (None = result_rank(settings))
+            settings (ScanConfig): Configuration du scan (None = config.py actuel)
+        """
+        self.size = size
+        self.key = key or result_rank(settings)
+        self._items = []
+
+    def add(self, result):
+        """
+        Insère une opportunité (à égalité, la première arrivée reste devant)
+
+        Returns:
+            bool: True si elle entre dans le classement
+        """
+        bisect.insort_right(self._items, result, key=self.key)
+        if len(self._items) > self.size:
+            dropped = self._items.pop()
+            return dropped is not result
+        return True
+
+    def items(self):
+        """Opportunités conservées, triées (copie)"""
+        return list(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+
+def _iter_threaded(exchange, symbols, plan, kept, pipeline):
+    """
+    Analyse les paires dans un ThreadPoolExecutor, résultats au fil de l'eau
 
-        # Ajouter RSI si calculé
-        if rsi is not None:
-            result["rsi"] = round(rsi, 2)
-
-        # Ajouter prix et date si disponibles
-        if last_candle:
-            result["last_close_price"] = last_candle["close"]
-            result["last_close_time"] = last_candle["time"]
-
-        # Ajouter les données MA si disponibles
-        if ma_data:
-            result.update(ma_data)
-
-        # ===== D. CALCUL MULTI-INDICATEURS (V2.5) =====
-        multi_ind_data = None
-        if config.USE_MACD or config.USE_BOLLINGER or config.USE_STOCHASTIC:
-            logger.debug("    Analyse multi-indicateurs...")
-            multi_ind_data = analyze_pair_multi_indicators(exchange, symbol)
-
-            if multi_ind_data:
-                result.update(multi_ind_data)
-
-        # ===== E. FILTRES AVANCÉS SUR SIGNAUX (V3) =====
-        if multi_ind_data:
-            # Vérifier les filtres de signaux
-            filters_passed = check_signal_filters(
-                macd_signal=multi_ind_data.get("macd_signal_type"),
-                bb_position=multi_ind_data.get("bb_position"),
-                stoch_signal=multi_ind_data.get("stoch_signal"),
-                filter_macd=config.FILTER_MACD_SIGNAL,
-                filter_bb=config.FILTER_BB_POSITION,
-                filter_stoch=config.FILTER_STOCH_SIGNAL,
-            )
+    Au plus 2 × MAX_WORKERS paires sont soumises à la fois : les suivantes
+    ne le sont qu'à mesure que le consommateur lit les résultats
+    (contre-pression). Fermer le générateur n'attend que les paires en cours.
 
-            if not filters_passed:
-                logger.debug(
-                    "    ⚠ Signaux ne correspondent pas aux filtres configurés"
+    Yields:
+        tuple: (symbol, status, result) dans l'ordre de complétion
+    """
+    settings = pipeline.settings
+    pending_symbols = iter(enumerate(symbols, 1))
+    window = 2 * settings.MAX_WORKERS
+
+    with ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor:
+        pending = {}
+
+        def submit():
+            for idx, symbol in itertools.islice(pending_symbols, window - len(pending)):
+                future = executor.submit(
+                    analyze_single_pair,
+                    exchange,
+                    symbol,
+                    idx,
+                    len(symbols),
+                    plan,
+                    kept=kept,
+                    pipeline=pipeline,
                 )
-                return ("filtered", None)
-
-        # ===== F. SCORE DE CONFLUENCE (V3) =====
-        confluence_data = None
-        if config.USE_CONFLUENCE_SCORE:
-            logger.debug("    Calcul du score de confluence...")
-
-            confluence_data = calculate_confluence_score(
-                rsi_value=rsi,
-                trend_score=ma_data.get("trend_score") if ma_data else None,
-                max_trend_score=len(config.MA_TIMEFRAMES) if config.USE_MA else 0,
-                macd_signal=(
-                    multi_ind_data.get("macd_signal_type") if multi_ind_data else None
-                ),
-                bb_position=(
-                    multi_ind_data.get("bb_position") if multi_ind_data else None
-                ),
-                stoch_signal=(
-                    multi_ind_data.get("stoch_signal") if multi_ind_data else None
-                ),
-                weights=config.CONFLUENCE_WEIGHTS,
-            )
+                pending[future] = symbol
 
-            if confluence_data:
-                result["confluence_score"] = confluence_data["score"]
-                result["confluence_grade"] = confluence_data["grade"]
-                result["confluence_breakdown"] = confluence_data["breakdown"]
+        submit()
+        while pending:
+            completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in completed:
+                symbol = pending.pop(future)
+                try:
+                    status, result = future.result()
+                except Exception as e:
+                    logger.error(f"  ✗ Exception future pour {symbol}: {str(e)}")
+                    status, result = "error", None
+                yield symbol, status, result
+            submit()
 
-                # Filtre par score minimum
-                if confluence_data["score"] < config.MIN_CONFLUENCE_SCORE:
-                    logger.debug(
-                        f"    ⚠ Score de confluence insuffisant: {confluence_data['score']:.1f}/{config.MIN_CONFLUENCE_SCORE}"
-                    )
-                    return ("filtered", None)
 
-        # Log détaillé
-        log_parts = [symbol]
-        if rsi is not None:
-            log_parts.append(f"RSI={rsi:.2f}")
-        if config.USE_MA and ma_data:
-            trend_score = ma_data.get("trend_score", 0)
-            log_parts.append(f"Trend={trend_score}/{len(config.MA_TIMEFRAMES)}")
-        if multi_ind_data:
-            if "macd_signal_type" in multi_ind_data:
-                log_parts.append(f"MACD={multi_ind_data['macd_signal_type']}")
-            if "bb_position" in multi_ind_data:
-                log_parts.append(f"BB={multi_ind_data['bb_position']}")
-            if "stoch_signal" in multi_ind_data:
-                log_parts.append(f"Stoch={multi_ind_data['stoch_signal']}")
-        if confluence_data:
-            log_parts.append(
-                f"Score={confluence_data['score']:.1f} ({confluence_data['grade']})"
-            )
+def _iter_outcomes(exchange, symbols, plan, kept, pipeline):
+    """
+    Résultat brut de chaque paire avec le moteur configuré (SCAN_ENGINE de pipeline.settings)
 
-        logger.info(f"  🎯 {' | '.join(log_parts)}")
+    Yields:
+        tuple: (symbol, status, result) - mêmes status/result que analyze_single_pair
+    """
+    settings = pipeline.settings
+    if settings.SCAN_ENGINE == "asyncio":
+        # === MODE ASYNCIO (ccxt.async_support) ===
+        from async_scanner import iter_async_scan
 
-        return ("success", result)
+        logger.info(
+            f"⚡ Mode asyncio activé ({settings.ASYNC_MAX_CONCURRENCY} requêtes simultanées max)"
+        )
+        yield from iter_async_scan(exchange, symbols, plan, kept=kept, pipeline=pipeline)
 
-    except Exception as e:
-        logger.error(f"  ✗ Erreur inattendue pour {symbol}: {str(e)}")
-        return ("error", None)
+    elif settings.SCAN_ENGINE == "batch":
+        # === MODE VECTORISÉ (matrice symboles × temps) ===
+        # Passes sur toutes les paires à la fois : résultats rendus à la fin
+        from batch_scanner import run_batch_scan
+
+        logger.info("🧮 Mode batch activé (indicateurs vectorisés sur toutes les paires)")
+        yield from run_batch_scan(exchange, symbols, plan, kept=kept, pipeline=pipeline)
+
+    elif settings.SCAN_ENGINE == "pipelined":
+        # === MODE DEUX ÉTAGES (réseau / calcul vectorisé par lots) ===
+        from pipelined_scanner import iter_pipelined_scan
+
+        logger.info(
+            f"🔀 Mode pipelined activé ({settings.PIPELINE_FETCH_WORKERS} threads réseau, "
+            f"{settings.PIPELINE_COMPUTE_WORKERS} threads de calcul, file de {settings.PIPELINE_QUEUE_DEPTH})"
+        )
+        yield from iter_pipelined_scan(exchange, symbols, plan, kept=kept, pipeline=pipeline)
+
+    elif settings.ENABLE_CONCURRENCY:
+        # === MODE PARALLÈLE (ThreadPoolExecutor) ===
+        logger.info(f"🚀 Mode parallèle activé ({settings.MAX_WORKERS} workers)")
+        yield from _iter_threaded(exchange, symbols, plan, kept, pipeline)
+
+    else:
+        # === MODE SÉQUENTIEL (boucle classique) ===
+        logger.info("🐢 Mode séquentiel (ENABLE_CONCURRENCY=False)")
+        for idx, symbol in enumerate(symbols, 1):
+            status, result = analyze_single_pair(
+                exchange, symbol, idx, len(symbols), plan, kept=kept, pipeline=pipeline
+            )
+            yield symbol, status, result
 
 
-def scan_market():
+def iter_scan(exchange=None, candidates=None, frames=None, top_n=None, settings=None):
     """
-    Scanne le marché et retourne les paires avec RSI < seuil
-    Et optionnellement avec tendance haussière multi-timeframe (V1.5)
-    Utilise ThreadPoolExecutor pour parallélisation (V2)
+    Scanne le marché en rendant un événement par paire dès qu'elle est analysée
 
-    Returns:
-        list: Liste de dictionnaires contenant les résultats
-        [
-            {
-                'symbol': 'BTC/USDT',
-                'rsi': 28.5,
-                'last_close_price': 45000.0,
-                'last_close_time': datetime(...),
-                'timeframe': '4h',
-                'sma20_1w': 44000.0,  # V1.5
-                'sma50_1w': 43000.0,  # V1.5
-                ...
-                'trend_score': 2  # V1.5
-            },
-            ...
-        ]
+    Chaque paire candidate est notée aussitôt (scoring.score_result, même
+    règle que pour toutes les paires à la fois) : une opportunité est rendue
+    dès que sa paire est terminée, sans attendre la fin du scan. Le scan
+    avance au rythme du consommateur (contre-pression) ; fermer le générateur
+    arrête le scan.
+
+    Args:
+        exchange: Instance ccxt à réutiliser (optionnel, créée si None)
+        candidates (list): Complétée avec les résultats candidats, avant
+            filtres de signaux et score de confluence (optionnel) ; avec
+            EARLY_REJECTION, sans les paires rejetées pendant le scan
+        frames (dict): Complété avec les bougies des paires candidates
+            {symbol: PairFrames} (optionnel, voir pair_series)
+        top_n (int): Taille du classement courant joint aux événements
+            'result' (ScanEvent.top, optionnel)
+        settings (ScanConfig): Configuration du scan (None = config.py figé
+            à l'appel) ; transmise aux étapes, aux moteurs et au scoring
+
+    Yields:
+        ScanEvent: 'progress' (0/total au début), puis 'result' / 'filtered' /
+                   'error' par paire, 'progress' environ tous les 1 % et à la fin.
+                   Aucun événement si l'exchange ou l'univers est indisponible.
     """
-    start_time = time.time()
+    if settings is None:
+        settings = ScanConfig.from_module()
+    return _scan_events(exchange, candidates, frames, top_n, settings)
+
 
+def _scan_events(exchange, candidates, frames, top_n, settings):
+    """Événements du scan (iter_scan)"""
     logger.info("=" * 60)
     logger.info("DÉBUT DU SCAN")
     logger.info("=" * 60)
     logger.info("Paramètres du scan:")
-    logger.info(f"  - Exchange: {config.EXCHANGE_ID}")
-    logger.info(f"  - Quote: {config.QUOTE_FILTER}")
-    logger.info(f"  - Max paires: {config.MAX_PAIRS if config.MAX_PAIRS else 'Toutes'}")
+    logger.info(f"  - Exchange: {settings.EXCHANGE_ID}")
+    logger.info(f"  - Quote: {settings.QUOTE_FILTER}")
+    logger.info(f"  - Max paires: {settings.MAX_PAIRS if settings.MAX_PAIRS else 'Toutes'}")
+    if settings.USE_TICKER_PREFILTER:
+        volume = settings.PREFILTER_MIN_QUOTE_VOLUME
+        logger.info(
+            "  - Préfiltre tickers: volume 24h "
+            + (f"≥ {volume:,.0f} {settings.QUOTE_FILTER}" if volume is not None else "désactivé")
+        )
+    logger.info(f"  - Moteur: {settings.SCAN_ENGINE}")
     logger.info(
-        f"  - Concurrency: {'✓ Activée' if config.ENABLE_CONCURRENCY else '✗ Désactivée'}"
+        f"  - Concurrency: {'✓ Activée' if settings.ENABLE_CONCURRENCY else '✗ Désactivée'}"
     )
-    if config.ENABLE_CONCURRENCY:
-        logger.info(f"    Workers: {config.MAX_WORKERS}")
+    if settings.SCAN_ENGINE == "asyncio":
+        logger.info(f"    Requêtes simultanées: {settings.ASYNC_MAX_CONCURRENCY}")
+    elif settings.ENABLE_CONCURRENCY:
+        logger.info(f"    Workers: {settings.MAX_WORKERS}")
     logger.info("  - Indicateurs activés:")
 
-    if config.USE_RSI:
+    if settings.USE_RSI:
         logger.info(
-            f"    • RSI: seuil < {config.RSI_THRESHOLD} (période {config.RSI_PERIOD}, TF {config.TIMEFRAME})"
+            f"    • RSI: seuil < {settings.RSI_THRESHOLD} (période {settings.RSI_PERIOD}, TF {settings.TIMEFRAME})"
         )
 
-    if config.USE_MA:
+    if settings.USE_MA:
         ma_types = []
-        if config.USE_SMA:
-            ma_types.append(f"SMA{config.SMA_PERIODS}")
-        if config.USE_EMA:
-            ma_types.append(f"EMA{config.EMA_PERIODS}")
+        if settings.USE_SMA:
+            ma_types.append(f"SMA{settings.SMA_PERIODS}")
+        if settings.USE_EMA:
+            ma_types.append(f"EMA{settings.EMA_PERIODS}")
 
         logger.info(f"    • Moyennes Mobiles: {' + '.join(ma_types)}")
-        logger.info(f"      - Timeframes: {', '.join(config.MA_TIMEFRAMES)}")
-        logger.info(f"      - Min trend score: {config.MIN_TREND_SCORE}")
+        logger.info(f"      - Timeframes: {', '.join(settings.MA_TIMEFRAMES)}")
+        logger.info(f"      - Min trend score: {settings.MIN_TREND_SCORE}")
 
-    if not config.USE_RSI and not config.USE_MA:
+    if not settings.USE_RSI and not settings.USE_MA:
         logger.warning(
             "  ⚠ AUCUN INDICATEUR ACTIVÉ - Le scan listera toutes les paires"
         )
@@ -488,100 +1232,157 @@ def scan_market():
 
     # 1. Initialiser l'exchange et obtenir les paires filtrées
     try:
-        exchange, symbols = get_filtered_pairs()
+        exchange, symbols = get_filtered_pairs(exchange, settings)
     except Exception as e:
         logger.error(f"Erreur lors de l'initialisation de l'exchange: {str(e)}")
-        return []
+        return
 
     if not symbols:
         logger.warning("Aucune paire trouvée correspondant au scope")
-        return []
+        return
+
+    # Plan de récupération commun à toutes les paires
+    plan = build_fetch_plan(settings)
+    logger.info(
+        "Plan OHLCV par paire: "
+        + ", ".join(f"{tf}×{limit}" for tf, limit in plan.items())
+        + f" ({len(plan)} requête(s))"
+    )
+    resampled = [tf for tf in timeframe_requirements(settings) if tf not in plan]
+    if resampled:
+        logger.info(f"Timeframes reconstruits depuis {settings.TIMEFRAME}: {', '.join(resampled)}")
+
+    # Étapes par paire, de la moins coûteuse à la plus coûteuse (rejet anticipé :
+    # EARLY_REJECTION, voir rescore_is_complete pour la re-notation)
+    pipeline = build_pipeline(plan, settings=settings)
+    logger.info(
+        f"Étapes par paire: {pipeline.describe()}"
+        + (" (rejet anticipé)" if pipeline.early_rejection else "")
+    )
 
     logger.info(f"Scan de {len(symbols)} paires...")
     logger.info("-" * 60)
 
-    # 2. Scanner les paires (séquentiel ou parallèle)
+    # 2. Analyser les paires (résultats dans l'ordre de complétion)
+    total = len(symbols)
+    step = max(1, total // 100)
+    done = 0
+    top = TopResults(top_n, settings=settings) if top_n else None
+    yield ScanEvent("progress", done, total)
+
+    for symbol, status, result in _iter_outcomes(exchange, symbols, plan, frames, pipeline):
+        done += 1
+
+        if status == "success":
+            if candidates is not None:
+                candidates.append(result)
+            # Filtres de signaux et score de confluence (résultat isolé : calcul direct)
+            retained = score_result(result, settings=settings)
+            if retained is not None:
+                result = retained
+                if top is not None:
+                    top.add(result)
+                yield ScanEvent(
+                    "result", done, total, symbol, result, top.items() if top is not None else None
+                )
+            else:
+                logger.debug(f"  {symbol} écartée par les filtres de signaux / score de confluence")
+                yield ScanEvent("filtered", done, total, symbol)
+        else:
+            yield ScanEvent(status, done, total, symbol)
+
+        if done % step == 0 or done == total:
+            yield ScanEvent("progress", done, total)
+
+
+def scan_market(exchange=None, candidates=None, frames=None, on_event=None, stop=None, settings=None):
+    """
+    Scanne le marché et retourne les paires avec RSI < seuil
+    Et optionnellement avec tendance haussière multi-timeframe (V1.5)
+    Consommateur de iter_scan : collecte les opportunités, les trie et
+    affiche le bilan
+
+    Args:
+        exchange: Instance ccxt à réutiliser (optionnel, créée si None)
+        candidates (list): Liste complétée avec les résultats candidats, avant
+            filtres de signaux et score de confluence (optionnel, pour re-noter
+            sans nouveau scan : scoring.score_results, voir rescore_is_complete)
+        frames (dict): Complété avec les bougies des paires candidates
+            {symbol: PairFrames} (optionnel, pour tracer les séries sans
+            nouveau téléchargement : pair_series)
+        on_event (callable): Appelé avec chaque ScanEvent, pendant le scan
+            (optionnel, affichage au fil de l'eau : CLI, GUI)
+        stop (threading.Event): Arrêt demandé (optionnel) : le scan s'arrête
+            après l'événement en cours, les résultats déjà obtenus sont retournés
+        settings (ScanConfig): Configuration du scan (None = config.py figé
+            à l'appel) ; modifier config.py pendant le scan est sans effet
+
+    Returns:
+        list: Liste de dictionnaires contenant les résultats
+        [
+            {
+                'symbol': 'BTC/USDT',
+                'rsi': 28.5,
+                'last_close_price': 45000.0,
+                'last_close_time': datetime(...),
+                'timeframe': '4h',
+                'sma20_1w': 44000.0,  # V1.5
+                'sma50_1w': 43000.0,  # V1.5
+                ...
+                'trend_score': 2  # V1.5
+            },
+            ...
+        ]
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    start_time = time.time()
+
     results = []
-    success_count = 0
-    filtered_count = 0
-    error_count = 0
+    counts = {"result": 0, "filtered": 0, "error": 0}
+    total = None
 
     try:
-        if config.ENABLE_CONCURRENCY:
-            # === MODE PARALLÈLE (ThreadPoolExecutor) ===
-            logger.info(f"🚀 Mode parallèle activé ({config.MAX_WORKERS} workers)")
-
-            with ThreadPoolExecutor(max_workers=config.MAX_WORKERS) as executor:
-                # Soumettre toutes les tâches
-                future_to_symbol = {
-                    executor.submit(
-                        analyze_single_pair, exchange, symbol, idx, len(symbols)
-                    ): symbol
-                    for idx, symbol in enumerate(symbols, 1)
-                }
-
-                # Traiter les résultats au fur et à mesure
-                for future in as_completed(future_to_symbol):
-                    symbol = future_to_symbol[future]
-                    try:
-                        status, result = future.result()
-
-                        if status == "success":
-                            results.append(result)
-                            success_count += 1
-                        elif status == "filtered":
-                            filtered_count += 1
-                        else:  # error
-                            error_count += 1
-
-                    except Exception as e:
-                        logger.error(f"  ✗ Exception future pour {symbol}: {str(e)}")
-                        error_count += 1
-        else:
-            # === MODE SÉQUENTIEL (boucle classique) ===
-            logger.info("🐢 Mode séquentiel (ENABLE_CONCURRENCY=False)")
+        for event in iter_scan(exchange, candidates=candidates, frames=frames, settings=settings):
+            if on_event is not None:
+                on_event(event)
 
-            for idx, symbol in enumerate(symbols, 1):
-                try:
-                    status, result = analyze_single_pair(
-                        exchange, symbol, idx, len(symbols)
-                    )
-
-                    if status == "success":
-                        results.append(result)
-                        success_count += 1
-                    elif status == "filtered":
-                        filtered_count += 1
-                    else:  # error
-                        error_count += 1
-
-                except KeyboardInterrupt:
-                    logger.warning("Interruption utilisateur (Ctrl+C)")
-                    logger.info(f"Scan arrêté après {idx}/{len(symbols)} paires")
-                    break
+            if event.kind == "progress":
+                total = event.total
+            else:
+                counts[event.kind] += 1
+                if event.kind == "result":
+                    results.append(event.result)
+
+            if stop is not None and stop.is_set():
+                logger.warning(f"Scan arrêté après {sum(counts.values())}/{total} paires")
+                break
 
     except KeyboardInterrupt:
         logger.warning("Interruption utilisateur (Ctrl+C)")
+        if total:
+            logger.info(f"Scan arrêté après {sum(counts.values())}/{total} paires")
 
-    # 3. Trier les résultats
-    # Si RSI activé, trier par RSI ascendant
-    # Sinon si MA activée, trier par trend_score descendant
-    # Sinon par symbole
-    if config.USE_RSI and results and "rsi" in results[0]:
-        results.sort(key=lambda x: x.get("rsi", 999))
-    elif config.USE_MA and results and "trend_score" in results[0]:
-        results.sort(key=lambda x: x.get("trend_score", 0), reverse=True)
-    else:
-        results.sort(key=lambda x: x.get("symbol", ""))
+    if total is None:
+        return []
+
+    success_count = counts["result"]
+    filtered_count = counts["filtered"]
+    error_count = counts["error"]
+
+    # Trier les résultats
+    sort_results(results, settings)
+    for result in results:
+        _log_opportunity(result, settings)
 
-    # 4. Logs de fin
+    # Logs de fin
     elapsed_time = time.time() - start_time
 
     logger.info("-" * 60)
     logger.info("FIN DU SCAN")
     logger.info(f"Durée totale: {elapsed_time:.2f}s")
     logger.info(
-        f"Paires traitées: {success_count + filtered_count + error_count}/{len(symbols)}"
+        f"Paires traitées: {success_count + filtered_count + error_count}/{total}"
     )
     logger.info(f"  - Succès: {success_count}")
     logger.info(f"  - Filtrées: {filtered_count}")
@@ -589,18 +1390,18 @@ def scan_market():
 
     # Message selon les filtres actifs
     filter_parts = []
-    if config.USE_RSI:
-        filter_parts.append(f"RSI < {config.RSI_THRESHOLD}")
-    if config.USE_MA:
-        filter_parts.append(f"Trend ≥ {config.MIN_TREND_SCORE}")
+    if settings.USE_RSI:
+        filter_parts.append(f"RSI < {settings.RSI_THRESHOLD}")
+    if settings.USE_MA:
+        filter_parts.append(f"Trend ≥ {settings.MIN_TREND_SCORE}")
 
     if filter_parts:
         logger.info(f"Opportunités ({' + '.join(filter_parts)}): {len(results)}")
     else:
         logger.info(f"Paires listées: {len(results)}")
 
-    if len(symbols) > 0:
-        rate = len(symbols) / elapsed_time
+    if total > 0:
+        rate = total / elapsed_time
         logger.info(f"Vitesse: {rate:.2f} paires/seconde")
 
     logger.info("=" * 60)
@@ -0,0 +1,294 @@
+"""
+Score de confluence et filtres de signaux en colonnes (toutes les paires à la fois)
+Les signaux sont encodés en petits entiers, les points lus dans des tables
+(indicators.SIGNAL_SCORE_POINTS), le RSI classé par searchsorted : scores,
+grades et masques de filtres sont calculés en une passe NumPy. Mêmes valeurs
+que indicators.calculate_confluence_score / check_signal_filters.
+
+Les résultats candidats d'un scan (scanner.scan_market(candidates=...))
+peuvent ainsi être re-notés avec d'autres pondérations ou un autre score
+minimum sans nouveau scan. Un résultat isolé (scan en flux) est noté par
+score_result, sans passer par les colonnes.
+"""
+
+import math
+import numpy as np
+from scan_config import ScanConfig
+from indicators import (
+    calculate_confluence_score,
+    check_signal_filters,
+    DEFAULT_CONFLUENCE_WEIGHTS,
+    RSI_SCORE_LIMITS,
+    RSI_SCORE_POINTS,
+    SIGNAL_SCORE_POINTS,
+    CONFLUENCE_GRADE_THRESHOLDS,
+    CONFLUENCE_GRADES,
+)
+
+# Colonne du résultat de scan portant le signal de chaque indicateur
+SIGNAL_COLUMNS = {
+    "macd": "macd_signal_type",
+    "bollinger": "bb_position",
+    "stochastic": "stoch_signal",
+}
+
+CONFLUENCE_KEYS = ("confluence_score", "confluence_grade", "confluence_breakdown")
+
+# Grades par seuil croissant (searchsorted)
+_GRADE_THRESHOLDS = np.array(CONFLUENCE_GRADE_THRESHOLDS[::-1], dtype=np.float64)
+_GRADES = np.array(CONFLUENCE_GRADES[::-1], dtype=object)
+
+
+def encode_signals(values, labels):
+    """
+    Encode des libellés de signaux en codes entiers
+
+    Args:
+        values (list): Libellés (str ou None), un par paire
+        labels (iterable): Libellés connus (codes 0..n-1)
+
+    Returns:
+        tuple: (codes np.ndarray int16, vocabulaire list) - code -1 = signal
+               absent ; les libellés inconnus sont ajoutés au vocabulaire
+    """
+    vocabulary = list(labels)
+    index = {label: code for code, label in enumerate(vocabulary)}
+    codes = np.empty(len(values), dtype=np.int16)
+
+    for i, value in enumerate(values):
+        if value is None:
+            codes[i] = -1
+            continue
+        if value not in index:
+            index[value] = len(vocabulary)
+            vocabulary.append(value)
+        codes[i] = index[value]
+
+    return codes, vocabulary
+
+
+def encode_results(rows):
+    """
+    Colonnes de notation d'une liste de résultats de scan
+
+    Args:
+        rows (list): Résultats (dicts de scanner.finalize_pair)
+
+    Returns:
+        dict: {'rsi': float (NaN si absent), 'trend_score': float (NaN si absent),
+               'macd' / 'bollinger' / 'stochastic': (codes, vocabulaire)}
+    """
+    columns = {
+        "rsi": np.array([row.get("rsi", np.nan) for row in rows], dtype=np.float64),
+        "trend_score": np.array(
+            [np.nan if row.get("trend_score") is None else row["trend_score"] for row in rows],
+            dtype=np.float64,
+        ),
+    }
+    for name, key in SIGNAL_COLUMNS.items():
+        points = SIGNAL_SCORE_POINTS[name][0]
+        columns[name] = encode_signals([row.get(key) for row in rows], points)
+    return columns
+
+
+def score_columns(columns, weights=None, max_trend_score=0):
+    """
+    Score de confluence de toutes les paires
+
+    Args:
+        columns (dict): Colonnes de encode_results
+        weights (dict): Pondérations (None = indicators.DEFAULT_CONFLUENCE_WEIGHTS)
+        max_trend_score (int): Score de tendance maximum (0 = tendance ignorée)
+
+    Returns:
+        dict: {'score': np.ndarray (non arrondi), 'grade': np.ndarray,
+               'breakdown': {indicateur: np.ndarray, NaN si non noté}}
+    """
+    if weights is None:
+        weights = DEFAULT_CONFLUENCE_WEIGHTS
+
+    rsi = columns["rsi"]
+    breakdown = {}
+
+    # RSI : classe de searchsorted (RSI <= limite) -> points
+    rsi_points = np.array(RSI_SCORE_POINTS, dtype=np.float64)
+    bucket = np.searchsorted(np.array(RSI_SCORE_LIMITS, dtype=np.float64), rsi, side="left")
+    breakdown["rsi"] = np.where(
+        np.isnan(rsi), np.nan, (rsi_points[np.minimum(bucket, len(rsi_points) - 1)] / 20) * weights["rsi"]
+    )
+
+    if max_trend_score > 0:
+        trend_pts = (columns["trend_score"] / max_trend_score) * 25
+        breakdown["trend"] = (trend_pts / 25) * weights["trend"]
+    else:
+        breakdown["trend"] = np.full(len(rsi), np.nan)
+
+    for name in SIGNAL_COLUMNS:
+        codes, vocabulary = columns[name]
+        points, default, max_points = SIGNAL_SCORE_POINTS[name]
+        # Dernière case : signal absent (code -1)
+        table = np.array([points.get(label, default) for label in vocabulary] + [np.nan], dtype=np.float64)
+        breakdown[name] = (table[codes] / max_points) * weights[name]
+
+    # Même ordre d'addition que le calcul paire par paire
+    total = np.zeros(len(rsi))
+    for values in breakdown.values():
+        total = total + np.where(np.isnan(values), 0.0, values)
+
+    grade = _GRADES[np.searchsorted(_GRADE_THRESHOLDS, total, side="right")]
+    return {"score": total, "grade": grade, "breakdown": breakdown}
+
+
+def signal_mask(columns, filter_macd=None, filter_bb=None, filter_stoch=None):
+    """
+    Filtres de signaux de toutes les paires (règle de check_signal_filters)
+
+    Un signal absent passe toujours le filtre correspondant.
+
+    Args:
+        columns (dict): Colonnes de encode_results
+        filter_macd (list): Signaux MACD acceptés (None = pas de filtre)
+        filter_bb (list): Positions Bollinger acceptées
+        filter_stoch (list): Signaux Stochastic acceptés
+
+    Returns:
+        np.ndarray: Masque booléen des paires retenues
+    """
+    mask = np.ones(len(columns["rsi"]), dtype=bool)
+    for name, accepted in (("macd", filter_macd), ("bollinger", filter_bb), ("stochastic", filter_stoch)):
+        if not accepted:
+            continue
+        codes, vocabulary = columns[name]
+        # Dernière case : signal absent (code -1) toujours accepté
+        allowed = np.array([label in accepted for label in vocabulary] + [True])
+        mask &= allowed[codes]
+    return mask
+
+
+def _round_values(values):
+    """round(valeur, 2) de chaque élément (calculé une fois par valeur distincte)"""
+    unique, inverse = np.unique(values, return_inverse=True)
+    rounded = np.array([round(value, 2) for value in unique.tolist()], dtype=np.float64)
+    return rounded[inverse].tolist()
+
+
+def score_results(rows, weights=None, min_score=None, settings=None):
+    """
+    Applique les filtres de signaux et le score de confluence à des résultats
+
+    Les résultats d'entrée ne sont pas modifiés : les paires retenues sont
+    des copies complétées de 'confluence_score', 'confluence_grade' et
+    'confluence_breakdown' (clés retirées si USE_CONFLUENCE_SCORE est désactivé).
+
+    Args:
+        rows (list): Résultats candidats (scanner.finalize_pair)
+        weights (dict): Pondérations (None = CONFLUENCE_WEIGHTS)
+        min_score (float): Score minimum (None = MIN_CONFLUENCE_SCORE)
+        settings (ScanConfig): Configuration (filtres, pondérations, score
+            minimum ; None = config.py actuel)
+
+    Returns:
+        list: Résultats retenus, dans l'ordre d'entrée
+    """
+    if not rows:
+        return []
+    if settings is None:
+        settings = ScanConfig.from_module()
+
+    columns = encode_results(rows)
+    mask = signal_mask(
+        columns,
+        filter_macd=settings.FILTER_MACD_SIGNAL,
+        filter_bb=settings.FILTER_BB_POSITION,
+        filter_stoch=settings.FILTER_STOCH_SIGNAL,
+    )
+
+    if not settings.USE_CONFLUENCE_SCORE:
+        return [
+            {key: value for key, value in row.items() if key not in CONFLUENCE_KEYS}
+            for row, keep in zip(rows, mask)
+            if keep
+        ]
+
+    scored = score_columns(
+        columns,
+        weights=settings.CONFLUENCE_WEIGHTS if weights is None else weights,
+        max_trend_score=len(settings.MA_TIMEFRAMES) if settings.USE_MA else 0,
+    )
+    min_score = settings.MIN_CONFLUENCE_SCORE if min_score is None else min_score
+
+    # Arrondi Python (round) : mêmes valeurs affichées que le calcul paire par paire.
+    # Les notes par indicateur ne prennent que quelques valeurs : arrondies une fois chacune
+    scores = [round(score, 2) for score in scored["score"].tolist()]
+    breakdown = {name: _round_values(values) for name, values in scored["breakdown"].items()}
+    grades = scored["grade"]
+
+    results = []
+    for i in np.flatnonzero(mask).tolist():
+        if scores[i] < min_score:
+            continue
+
+        row = dict(rows[i])
+        row["confluence_score"] = scores[i]
+        row["confluence_grade"] = grades[i]
+        row["confluence_breakdown"] = {
+            name: values[i] for name, values in breakdown.items() if not math.isnan(values[i])
+        }
+        results.append(row)
+
+    return results
+
+
+def score_result(row, weights=None, min_score=None, settings=None):
+    """
+    Filtres de signaux et score de confluence d'un seul résultat
+
+    Mêmes règles et mêmes valeurs que score_results([row]), calculées
+    directement (indicators.calculate_confluence_score) : pour le scan en
+    flux, qui note chaque paire dès qu'elle est terminée.
+
+    Args:
+        row (dict): Résultat candidat (scanner.finalize_pair)
+        weights (dict): Pondérations (None = CONFLUENCE_WEIGHTS)
+        min_score (float): Score minimum (None = MIN_CONFLUENCE_SCORE)
+        settings (ScanConfig): Configuration (filtres, pondérations, score
+            minimum ; None = config.py actuel)
+
+    Returns:
+        dict: Copie complétée du résultat s'il est retenu
+        None: Si le résultat est écarté
+    """
+    if settings is None:
+        settings = ScanConfig.from_module()
+    signals = {name: row.get(key) for name, key in SIGNAL_COLUMNS.items()}
+    if not check_signal_filters(
+        signals["macd"],
+        signals["bollinger"],
+        signals["stochastic"],
+        settings.FILTER_MACD_SIGNAL,
+        settings.FILTER_BB_POSITION,
+        settings.FILTER_STOCH_SIGNAL,
+    ):
+        return None
+
+    if not settings.USE_CONFLUENCE_SCORE:
+        return {key: value for key, value in row.items() if key not in CONFLUENCE_KEYS}
+
+    confluence = calculate_confluence_score(
+        rsi_value=row.get("rsi"),
+        trend_score=row.get("trend_score"),
+        max_trend_score=len(settings.MA_TIMEFRAMES) if settings.USE_MA else 0,
+        macd_signal=signals["macd"],
+        bb_position=signals["bollinger"],
+        stoch_signal=signals["stochastic"],
+        weights=settings.CONFLUENCE_WEIGHTS if weights is None else weights,
+    )
+    min_score = settings.MIN_CONFLUENCE_SCORE if min_score is None else min_score
+    if confluence is None or confluence["score"] < min_score:
+        return None
+
+    result = dict(row)
+    result["confluence_score"] = confluence["score"]
+    result["confluence_grade"] = confluence["grade"]
+    result["confluence_breakdown"] = confluence["breakdown"]
+    return result
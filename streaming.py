@@ -0,0 +1,428 @@
+"""
+Indicateurs incrémentaux (mise à jour en O(1) par bougie clôturée)
+Chaque indicateur conserve un état minimal, intègre une bougie à la fois et
+se sérialise en dictionnaire JSON pour être restauré d'une exécution à
+l'autre. Mêmes formules que indicators.py :
+
+- RSI et EMA/MACD : mêmes opérations que les calculs complets, valeurs identiques
+- SMA, Bollinger et %D : sommes glissantes (écart de l'ordre de 1e-15 en relatif)
+"""
+
+import json
+import math
+import os
+from collections import deque
+import numpy as np
+import pandas as pd
+
+
+def _time_ms(value):
+    """Horodatage d'une bougie en millisecondes (int, pd.Timestamp ou datetime)"""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return int(pd.Timestamp(value).value // 1_000_000)
+
+
+class StreamingIndicator:
+    """
+    Base des indicateurs incrémentaux
+
+    Les bougies déjà intégrées (horodatage <= dernière bougie vue) sont
+    ignorées : rejouer un historique qui chevauche l'état restauré est sans effet.
+    """
+
+    _PARAMS = ()
+
+    def __init__(self):
+        self.count = 0
+        self.last_time = None
+
+    def update(self, candle):
+        """
+        Intègre une bougie clôturée
+
+        Args:
+            candle (dict): Bougie {'time', 'open', 'high', 'low', 'close', 'volume'}
+                           ('time' optionnel)
+
+        Returns:
+            Valeur courante de l'indicateur (None pendant le préchauffage)
+        """
+        if candle.get("time") is not None:
+            time_ms = _time_ms(candle["time"])
+            if self.last_time is not None and time_ms <= self.last_time:
+                return self.value
+            self.last_time = time_ms
+
+        self.count += 1
+        self._push(candle)
+        return self.value
+
+    def update_many(self, ohlcv):
+        """
+        Intègre un historique de bougies (préchauffage)
+
+        Args:
+            ohlcv (OHLCV): Bougies clôturées, de la plus ancienne à la plus récente
+
+        Returns:
+            Valeur courante de l'indicateur
+        """
+        from data import OHLCV_COLUMNS
+
+        for time_ms, row in zip(ohlcv.times.tolist(), ohlcv.values.T.tolist()):
+            candle = dict(zip(OHLCV_COLUMNS, row))
+            candle["time"] = time_ms
+            self.update(candle)
+        return self.value
+
+    @property
+    def value(self):
+        raise NotImplementedError
+
+    def _push(self, candle):
+        raise NotImplementedError
+
+    def to_dict(self):
+        """
+        État sérialisable en JSON
+
+        Returns:
+            dict: {'type': nom de classe, 'state': {attribut: valeur}}
+        """
+        state = {}
+        for name, value in vars(self).items():
+            if isinstance(value, StreamingIndicator):
+                value = value.to_dict()
+            elif isinstance(value, deque):
+                value = list(value)
+            state[name] = value
+        return {"type": type(self).__name__, "state": state}
+
+    @staticmethod
+    def from_dict(data):
+        """
+        Restaure un indicateur depuis to_dict()
+
+        Args:
+            data (dict): État sérialisé
+
+        Returns:
+            StreamingIndicator: Indicateur dans l'état sauvegardé
+        """
+        cls = _TYPES[data["type"]]
+        state = data["state"]
+        indicator = cls(**{name: state[name] for name in cls._PARAMS})
+
+        for name, value in state.items():
+            current = getattr(indicator, name, None)
+            if isinstance(current, StreamingIndicator):
+                value = StreamingIndicator.from_dict(value)
+            elif isinstance(current, deque):
+                value = deque(value, maxlen=current.maxlen)
+            setattr(indicator, name, value)
+        return indicator
+
+
+class StreamingSMA(StreamingIndicator):
+    """Moyenne mobile simple glissante (somme recalculée toutes les `period` bougies)"""
+
+    _PARAMS = ("period",)
+
+    def __init__(self, period):
+        super().__init__()
+        self.period = period
+        self.window = deque(maxlen=period)
+        self.total = 0.0
+
+    def _push(self, candle):
+        self._push_value(candle["close"])
+
+    def _push_value(self, value):
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(value)
+        self.total += value
+
+        # Resynchronisation périodique : pas de dérive de la somme glissante
+        if self.count % self.period == 0:
+            self.total = math.fsum(self.window)
+
+    @property
+    def value(self):
+        if len(self.window) < self.period:
+            return None
+        return self.total / self.period
+
+
+class StreamingEMA(StreamingIndicator):
+    """
+    Moyenne mobile exponentielle (pandas `ewm(span=period, adjust=False)`)
+
+    Amorcée sur la première valeur ; disponible après `period` bougies comme
+    indicators.calculate_ema.
+    """
+
+    _PARAMS = ("period",)
+
+    def __init__(self, period):
+        super().__init__()
+        self.period = period
+        self.weighted = None
+
+    def _push(self, candle):
+        self._push_value(candle["close"])
+
+    def _push_value(self, value):
+        if self.weighted is None:
+            self.weighted = value
+            return
+
+        # Mêmes opérations flottantes que pandas (valeurs identiques)
+        alpha = 2.0 / (self.period + 1.0)
+        old_weight = 1.0 - alpha
+        if self.weighted != value:
+            self.weighted = (old_weight * self.weighted + alpha * value) / (old_weight + alpha)
+
+    @property
+    def value(self):
+        if self.count < self.period:
+            return None
+        return self.weighted
+
+
+class StreamingRSI(StreamingIndicator):
+    """RSI de Wilder (amorçage par moyenne simple, puis lissage 1/period)"""
+
+    _PARAMS = ("period",)
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.period = period
+        self.previous_close = None
+        self.seed_gains = []
+        self.seed_losses = []
+        self.avg_gain = None
+        self.avg_loss = None
+
+    def _push(self, candle):
+        close = candle["close"]
+        previous, self.previous_close = self.previous_close, close
+        if previous is None:
+            return
+
+        delta = close - previous
+        gain = 0.0 if delta < 0 else delta
+        loss = abs(0.0 if delta > 0 else delta)
+
+        if self.avg_gain is None:
+            self.seed_gains.append(gain)
+            self.seed_losses.append(loss)
+            if len(self.seed_gains) == self.period:
+                # Même sommation que kernels.wilder_smooth
+                self.avg_gain = float(np.sum(self.seed_gains) / self.period)
+                self.avg_loss = float(np.sum(self.seed_losses) / self.period)
+                self.seed_gains, self.seed_losses = [], []
+            return
+
+        p1 = self.period - 1
+        self.avg_gain = (self.avg_gain * p1 + gain) / self.period
+        self.avg_loss = (self.avg_loss * p1 + loss) / self.period
+
+    @property
+    def value(self):
+        if self.avg_gain is None:
+            return None
+        if self.avg_loss == 0:
+            return 100.0
+        if self.avg_gain == 0:
+            return 0.0
+        return 100 - (100 / (1 + self.avg_gain / self.avg_loss))
+
+
+class StreamingMACD(StreamingIndicator):
+    """MACD : EMA rapide - EMA lente, ligne de signal et histogramme"""
+
+    _PARAMS = ("fast_period", "slow_period", "signal_period")
+
+    def __init__(self, fast_period=12, slow_period=26, signal_period=9):
+        super().__init__()
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self.fast = StreamingEMA(fast_period)
+        self.slow = StreamingEMA(slow_period)
+        self.signal = StreamingEMA(signal_period)
+        self.previous_histogram = None
+
+    def _push(self, candle):
+        if self.signal.weighted is not None:
+            self.previous_histogram = self._histogram()
+
+        self.fast.update({"close": candle["close"]})
+        self.slow.update({"close": candle["close"]})
+        self.signal.update({"close": self.fast.weighted - self.slow.weighted})
+
+    def _histogram(self):
+        return (self.fast.weighted - self.slow.weighted) - self.signal.weighted
+
+    @property
+    def value(self):
+        """dict: {'macd', 'signal', 'histogram', 'previous_histogram'} ou None"""
+        if self.count < self.slow_period:
+            return None
+        return {
+            "macd": self.fast.weighted - self.slow.weighted,
+            "signal": self.signal.weighted,
+            "histogram": self._histogram(),
+            "previous_histogram": self.previous_histogram,
+        }
+
+
+class StreamingBollinger(StreamingIndicator):
+    """Bandes de Bollinger : moyenne et variance glissantes (Welford, ddof=1)"""
+
+    _PARAMS = ("period", "std_dev")
+
+    def __init__(self, period=20, std_dev=2):
+        super().__init__()
+        self.period = period
+        self.std_dev = std_dev
+        self.window = deque(maxlen=period)
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _push(self, candle):
+        value = candle["close"]
+
+        if len(self.window) < self.period:
+            # Phase de remplissage : Welford classique
+            self.window.append(value)
+            delta = value - self.mean
+            self.mean += delta / len(self.window)
+            self.m2 += delta * (value - self.mean)
+            return
+
+        # Fenêtre pleine : remplacement de la plus ancienne valeur
+        old = self.window[0]
+        self.window.append(value)
+        old_mean = self.mean
+        self.mean += (value - old) / self.period
+        self.m2 += (value - old) * (value - self.mean + old - old_mean)
+
+    @property
+    def value(self):
+        """dict: {'upper', 'middle', 'lower'} ou None"""
+        if len(self.window) < self.period:
+            return None
+        std = math.sqrt(max(self.m2, 0.0) / (self.period - 1))
+        return {
+            "upper": self.mean + std * self.std_dev,
+            "middle": self.mean,
+            "lower": self.mean - std * self.std_dev,
+        }
+
+
+class StreamingStochastic(StreamingIndicator):
+    """
+    Stochastique %K / %D
+
+    Plus haut et plus bas glissants par files monotones (O(1) amorti),
+    %D = moyenne des `d_period` derniers %K.
+    """
+
+    _PARAMS = ("k_period", "d_period")
+
+    def __init__(self, k_period=14, d_period=3):
+        super().__init__()
+        self.k_period = k_period
+        self.d_period = d_period
+        self.highs = deque()  # [index, high] décroissants
+        self.lows = deque()  # [index, low] croissants
+        self.k_values = deque(maxlen=d_period)
+        self.previous = None
+
+    def _push(self, candle):
+        index = self.count
+        while self.highs and self.highs[-1][1] <= candle["high"]:
+            self.highs.pop()
+        self.highs.append([index, candle["high"]])
+        while self.lows and self.lows[-1][1] >= candle["low"]:
+            self.lows.pop()
+        self.lows.append([index, candle["low"]])
+
+        oldest = index - self.k_period
+        while self.highs[0][0] <= oldest:
+            self.highs.popleft()
+        while self.lows[0][0] <= oldest:
+            self.lows.popleft()
+
+        if self.count < self.k_period:
+            return
+
+        current = self.value
+        if current is not None:
+            self.previous = [current["k"], current["d"]]
+
+        highest_high, lowest_low = self.highs[0][1], self.lows[0][1]
+        range_ = highest_high - lowest_low
+        k = (candle["close"] - lowest_low) / range_ * 100 if range_ else math.nan
+        self.k_values.append(k)
+
+    @property
+    def value(self):
+        """dict: {'k', 'd', 'k_previous', 'd_previous'} ou None"""
+        if len(self.k_values) < self.d_period:
+            return None
+        previous = self.previous or [None, None]
+        return {
+            "k": self.k_values[-1],
+            "d": sum(self.k_values) / self.d_period,
+            "k_previous": previous[0],
+            "d_previous": previous[1],
+        }
+
+
+_TYPES = {
+    cls.__name__: cls
+    for cls in (
+        StreamingSMA,
+        StreamingEMA,
+        StreamingRSI,
+        StreamingMACD,
+        StreamingBollinger,
+        StreamingStochastic,
+    )
+}
+
+
+def save_states(path, states):
+    """
+    Sauvegarde des indicateurs incrémentaux (écriture atomique)
+
+    Args:
+        path (str): Fichier JSON de destination
+        states (dict): {clé: StreamingIndicator} (ex: 'BTC/USDC|4h|rsi14')
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({key: state.to_dict() for key, state in states.items()}, f)
+    os.replace(tmp_path, path)
+
+
+def load_states(path):
+    """
+    Restaure des indicateurs incrémentaux sauvegardés par save_states
+
+    Args:
+        path (str): Fichier JSON
+
+    Returns:
+        dict: {clé: StreamingIndicator} (vide si le fichier n'existe pas)
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {key: StreamingIndicator.from_dict(state) for key, state in data.items()}
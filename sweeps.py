@@ -0,0 +1,179 @@
+"""
+Balayages de paramètres des indicateurs (toutes les valeurs en une fois)
+Chaque fonction calcule un indicateur pour plusieurs jeux de paramètres à
+partir d'une seule série de clôtures : sortie (paramètres, T), une ligne par
+valeur dans l'ordre demandé.
+
+Le travail commun passe par un IndicatorContext : variations, gains et pertes
+du RSI calculés une fois pour toutes les périodes, EMA d'une période
+partagées entre EMA et MACD, moyenne et écart-type d'une période partagés
+entre SMA et toutes les largeurs de Bollinger. Passer le même contexte à
+plusieurs balayages d'une série réutilise aussi ces primitives.
+
+Mêmes valeurs que indicators.py (RSI et EMA/MACD identiques, SMA et
+Bollinger par les noyaux glissants de kernels.py).
+"""
+
+import numpy as np
+import pandas as pd
+from indicator_context import IndicatorContext
+from kernels import wilder_smooth
+
+
+def sweep_context(close):
+    """
+    Contexte de calcul d'une série de clôtures
+
+    Args:
+        close (np.ndarray | pd.Series | IndicatorContext): Clôtures (1-D)
+
+    Returns:
+        IndicatorContext
+    """
+    if isinstance(close, (IndicatorContext, pd.Series)):
+        return IndicatorContext.of(close)
+    return IndicatorContext.of(pd.Series(np.asarray(close, dtype=np.float64)))
+
+
+def _periods(values):
+    """Périodes en liste d'entiers (accepte un entier, une liste ou un range)"""
+    periods = np.atleast_1d(np.asarray(values, dtype=np.int64))
+    if periods.ndim != 1 or not len(periods) or (periods < 1).any():
+        raise ValueError(f"Périodes invalides: {values}")
+    return periods.tolist()
+
+
+def rsi_sweep(close, periods):
+    """
+    RSI de Wilder pour plusieurs périodes
+
+    Variations, gains et pertes sont calculés une fois ; seul le lissage de
+    Wilder dépend de la période (mêmes opérations que kernels.rsi_kernel,
+    valeurs identiques).
+
+    Args:
+        close (np.ndarray | pd.Series | IndicatorContext): Clôtures (1-D)
+        periods (iterable): Périodes du RSI (ex: range(7, 29))
+
+    Returns:
+        np.ndarray: RSI (P, T), NaN avant l'indice `period` de chaque ligne
+    """
+    context = sweep_context(close)
+    periods = _periods(periods)
+
+    delta = context.diff("close").to_numpy(dtype=np.float64)
+    gains = np.where(delta < 0, 0.0, delta)
+    losses = np.abs(np.where(delta > 0, 0.0, delta))
+
+    avg_gain = np.stack([wilder_smooth(gains, period) for period in periods])
+    avg_loss = np.stack([wilder_smooth(losses, period) for period in periods])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    # Cas limites : pas de pertes => 100, pas de gains => 0
+    rsi = np.where(avg_loss == 0, 100.0, np.where(avg_gain == 0, 0.0, rsi))
+    rsi[np.arange(len(delta)) < np.array(periods)[:, None]] = np.nan
+    return rsi
+
+
+def ema_sweep(close, periods):
+    """
+    EMA pour plusieurs périodes (mêmes valeurs que indicators.calculate_ema)
+
+    Args:
+        close (np.ndarray | pd.Series | IndicatorContext): Clôtures (1-D)
+        periods (iterable): Périodes (span) des EMA
+
+    Returns:
+        np.ndarray: EMA (P, T)
+    """
+    context = sweep_context(close)
+    return np.stack([context.ewm(span=period).to_numpy() for period in _periods(periods)])
+
+
+def sma_sweep(close, periods):
+    """
+    SMA pour plusieurs périodes (mêmes valeurs que indicators.calculate_sma)
+
+    Args:
+        close (np.ndarray | pd.Series | IndicatorContext): Clôtures (1-D)
+        periods (iterable): Périodes des SMA
+
+    Returns:
+        np.ndarray: SMA (P, T), NaN avant la première fenêtre complète
+    """
+    context = sweep_context(close)
+    return np.stack([context.rolling("mean", period).to_numpy() for period in _periods(periods)])
+
+
+def macd_sweep(close, fast_periods=(12,), slow_periods=(26,), signal_periods=(9,)):
+    """
+    MACD pour toutes les combinaisons (rapide, lente, signal) avec rapide < lente
+
+    Chaque EMA de clôtures et chaque ligne MACD ne sont calculées qu'une fois,
+    quelle que soit la combinaison qui les utilise (mêmes clés de contexte que
+    indicators.calculate_macd).
+
+    Args:
+        close (np.ndarray | pd.Series | IndicatorContext): Clôtures (1-D)
+        fast_periods (iterable): Périodes de l'EMA rapide
+        slow_periods (iterable): Périodes de l'EMA lente
+        signal_periods (iterable): Périodes de la ligne de signal
+
+    Returns:
+        tuple: (params, {'macd', 'signal', 'histogram'}) - params liste de
+               (rapide, lente, signal), matrices (len(params), T) dans le même ordre
+    """
+    context = sweep_context(close)
+    params = [
+        (fast, slow, signal)
+        for fast in _periods(fast_periods)
+        for slow in _periods(slow_periods)
+        if fast < slow
+        for signal in _periods(signal_periods)
+    ]
+    if not params:
+        raise ValueError("Aucune combinaison MACD avec période rapide < période lente")
+
+    macd_rows, signal_rows = [], []
+    for fast, slow, signal in params:
+        line_key = ("macd_line", fast, slow)
+        macd_line = context.derived(
+            line_key,
+            lambda: context.ewm(span=fast) - context.ewm(span=slow),
+        )
+        macd_rows.append(macd_line.to_numpy())
+        signal_rows.append(context.ewm(line_key, span=signal).to_numpy())
+
+    macd = np.stack(macd_rows)
+    signal = np.stack(signal_rows)
+    return params, {"macd": macd, "signal": signal, "histogram": macd - signal}
+
+
+def bollinger_sweep(close, periods=(20,), std_devs=(2,)):
+    """
+    Bandes de Bollinger pour plusieurs périodes et largeurs
+
+    Moyenne et écart-type (ddof=1) sont calculés une fois par période ; chaque
+    largeur ne coûte qu'une multiplication.
+
+    Args:
+        close (np.ndarray | pd.Series | IndicatorContext): Clôtures (1-D)
+        periods (iterable): Périodes de la bande moyenne
+        std_devs (iterable): Nombres d'écarts-types
+
+    Returns:
+        dict: {'middle': (P, T), 'upper': (P, S, T), 'lower': (P, S, T)}
+    """
+    context = sweep_context(close)
+    periods = _periods(periods)
+    middle = np.stack([context.rolling("mean", period).to_numpy() for period in periods])
+    std = np.stack([context.rolling("std", period).to_numpy() for period in periods])
+    widths = std[:, None, :] * np.asarray(std_devs, dtype=np.float64)[None, :, None]
+
+    return {
+        "middle": middle,
+        "upper": middle[:, None, :] + widths,
+        "lower": middle[:, None, :] - widths,
+    }
@@ -3,9 +3,50 @@ Script de test pour valider les modules individuellement
 Usage: python test_modules.py
 """
 
+import contextlib
 import sys
 
 
+def synthetic_settings(**overrides):
+    """
+    Configuration d'un scan hors-ligne pour les tests
+
+    Univers synthétique, sans cache disque (bougies, marchés), seuils larges
+    pour obtenir des résultats ; overrides remplace d'autres paramètres.
+    """
+    from scan_config import ScanConfig
+
+    values = {
+        "EXCHANGE_MODE": "synthetic",
+        "USE_CANDLE_STORE": False,
+        "USE_MARKETS_CACHE": False,
+        "RSI_THRESHOLD": 60,
+        "MIN_TREND_SCORE": 0,
+    }
+    values.update(overrides)
+    return ScanConfig.from_module().replace(**values)
+
+
+@contextlib.contextmanager
+def patched_config(**values):
+    """
+    Modifie config.py le temps d'un bloc with (valeurs restaurées à la sortie)
+
+    Réservé aux paramètres du processus (PROCESS_SETTINGS), hors ScanConfig,
+    et aux tests qui modifient config.py volontairement.
+    """
+    import config
+
+    saved = {name: getattr(config, name) for name in values}
+    try:
+        for name, value in values.items():
+            setattr(config, name, value)
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(config, name, value)
+
+
 def test_config():
     """Test du module config"""
     print("\n" + "="*60)
@@ -208,6 +249,1374 @@ def test_indicators():
         return False
 
 
+def test_rsi_kernel():
+    """Test du noyau RSI NumPy (cas limites de Wilder)"""
+    print("\n" + "="*60)
+    print("TEST: kernels.py (RSI Wilder)")
+    print("="*60)
+    try:
+        import numpy as np
+        from kernels import rsi_kernel
+
+        # Prix strictement croissants : aucune perte => RSI = 100
+        rising = rsi_kernel(np.arange(30, dtype=float), period=14)
+        # Prix strictement décroissants : aucun gain => RSI = 0
+        falling = rsi_kernel(np.arange(30, 0, -1, dtype=float), period=14)
+
+        if not (np.isnan(rising[:14]).all() and (rising[14:] == 100.0).all()):
+            print("✗ RSI incorrect sur prix croissants")
+            return False
+        if not (falling[14:] == 0.0).all():
+            print("✗ RSI incorrect sur prix décroissants")
+            return False
+        print("✓ Cas limites 0/100 et amorçage à l'indice `period` corrects")
+
+        # Valeur de référence (amorçage SMA puis lissage de Wilder)
+        prices = np.array([44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42,
+                           45.84, 46.08, 45.89, 46.03, 45.61, 46.28, 46.28, 46.00])
+        rsi = rsi_kernel(prices, period=14)
+        print(f"  RSI[14]={rsi[14]:.2f}  RSI[15]={rsi[15]:.2f}")
+        if abs(rsi[14] - 70.46) > 0.01 or abs(rsi[15] - 66.25) > 0.01:
+            print("✗ Valeurs de référence non retrouvées")
+            return False
+
+        print("✓ Valeurs de référence retrouvées")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_kernel_backends():
+    """Test de parité des backends de récurrences (NumPy / Numba)"""
+    print("\n" + "="*60)
+    print("TEST: kernels_numba.py (parité des backends)")
+    print("="*60)
+    import numpy as np
+    import pandas as pd
+    import config
+    import kernels_numba
+    import batch_indicators
+    from indicators import calculate_rsi, latest_rsi, latest_ema, latest_macd
+
+    rng = np.random.default_rng(11)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 400)))
+    gapped = close.copy()
+    gapped[[5, 120]] = np.nan  # NaN : amorce et propagation du lissage de Wilder
+    matrix = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (25, 200)), axis=1))
+
+    def compute():
+        macd = latest_macd(close)
+        return [
+            calculate_rsi(pd.Series(close)).to_numpy(),
+            calculate_rsi(pd.Series(gapped)).to_numpy(),
+            np.array([latest_rsi(close), latest_ema(close, 50), *macd["macd"], *macd["signal"]]),
+            batch_indicators.rsi_last(matrix, 14),
+            batch_indicators.ema_series(matrix, 26),
+            batch_indicators.macd_last(matrix)["histogram"],
+        ]
+
+    saved = (config.KERNEL_BACKEND, kernels_numba.NUMBA_AVAILABLE)
+    try:
+        config.KERNEL_BACKEND = "numpy"
+        reference = compute()
+
+        # Sans Numba, les récurrences de kernels_numba s'exécutent en Python :
+        # la parité des deux chemins est vérifiée dans tous les cas
+        config.KERNEL_BACKEND = "numba"
+        kernels_numba.NUMBA_AVAILABLE = True
+        accelerated = compute()
+
+        for expected, got in zip(reference, accelerated):
+            if not np.array_equal(expected, got, equal_nan=True):
+                print("✗ Résultats différents entre backends NumPy et Numba")
+                return False
+        compiled = "compilé" if saved[1] else "Numba non installé, récurrences Python"
+        print(f"✓ RSI, EMA, MACD (1-D et lots 2-D) identiques entre backends ({compiled})")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+    finally:
+        config.KERNEL_BACKEND, kernels_numba.NUMBA_AVAILABLE = saved
+
+
+def test_rolling_kernels():
+    """Test des noyaux glissants O(n) (mêmes valeurs que pandas, 1-D et 2-D)"""
+    print("\n" + "="*60)
+    print("TEST: kernels.py (fenêtres glissantes)")
+    print("="*60)
+    try:
+        import numpy as np
+        import pandas as pd
+        from kernels import rolling_max, rolling_min, rolling_mean_std
+
+        rng = np.random.default_rng(3)
+        batch = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (5, 503)), axis=1))
+        batch[2, 40] = np.nan  # Un NaN ne contamine que ses fenêtres
+
+        for window in (1, 14, 20, 503, 600):
+            frame = pd.DataFrame(batch.T).rolling(window)
+            mean, std = rolling_mean_std(batch, window)
+            pairs = [
+                (rolling_min(batch, window), frame.min()),
+                (rolling_max(batch, window), frame.max()),
+                (mean, frame.mean()),
+                (std, frame.std()),
+            ]
+            for values, expected in pairs:
+                expected = expected.to_numpy().T
+                if not np.allclose(values, expected, rtol=1e-9, atol=0, equal_nan=True):
+                    print(f"✗ Écart avec pandas (fenêtre {window})")
+                    return False
+
+            # Lot 2-D : chaque ligne comme une série 1-D
+            if not np.array_equal(rolling_max(batch[0], window), rolling_max(batch, window)[0], equal_nan=True):
+                print(f"✗ Ligne 2-D différente de la série 1-D (fenêtre {window})")
+                return False
+        print("✓ Min, max, moyenne et écart-type identiques à pandas (< 1e-9), 1-D et 2-D")
+
+        # Prix élevés et faible volatilité : pas de cancellation
+        flat = 50000 + rng.normal(0, 1e-3, 1000)
+        reference = np.lib.stride_tricks.sliding_window_view(flat, 20).std(axis=1, ddof=1)
+        if not np.allclose(rolling_mean_std(flat, 20)[1][19:], reference, rtol=1e-6, atol=0):
+            print("✗ Écart-type imprécis sur une série peu volatile")
+            return False
+        print("✓ Écart-type précis sur prix élevés peu volatils")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_resample():
+    """Test de la reconstruction locale des timeframes supérieurs"""
+    print("\n" + "="*60)
+    print("TEST: data.py (ré-échantillonnage 4h -> 1d / 1w)")
+    print("="*60)
+    try:
+        import numpy as np
+        from data import OHLCV, resample_ohlcv, timeframe_ratio
+
+        if timeframe_ratio("4h", "1d") != 6 or timeframe_ratio("4h", "1w") != 42:
+            print("✗ Ratios de timeframes incorrects")
+            return False
+        if timeframe_ratio("3d", "1w") is not None or timeframe_ratio("4h", "1M") is not None:
+            print("✗ Timeframes non alignés acceptés")
+            return False
+        print("✓ Ratios et alignements de timeframes")
+
+        # 4 jours de bougies 4h, commençant le dimanche 2025-10-05 à 20h UTC
+        h4 = 4 * 3600 * 1000
+        start = 1759694400000
+        ts = start + h4 * np.arange(24)
+        close = np.arange(24, dtype=float) + 100
+        rows = np.column_stack([ts, close - 0.5, close + 1, close - 1, close, np.ones(24)])
+        candles = OHLCV.from_rows(rows)
+
+        daily = resample_ohlcv(candles, "4h", "1d")
+        weekly = resample_ohlcv(candles, "4h", "1w")
+
+        # Le dimanche (1 bougie sur 6) est incomplet : écarté
+        if len(daily) != 4 or str(daily['time'].iloc[0]) != "2025-10-06 00:00:00":
+            print(f"✗ Bornes journalières incorrectes: {list(daily['time'])}")
+            return False
+        first = daily.to_dataframe().iloc[0]
+        if (first['open'], first['high'], first['low'], first['close'], first['volume']) != (100.5, 107.0, 100.0, 106.0, 6.0):
+            print(f"✗ Agrégation OHLCV incorrecte: {first.to_dict()}")
+            return False
+        print("✓ Bougies 1d alignées sur minuit UTC (OHLCV agrégés)")
+
+        if len(weekly) != 1 or weekly['time'].iloc[0].day_name() != "Monday":
+            print(f"✗ Bornes hebdomadaires incorrectes: {list(weekly['time'])}")
+            return False
+        print("✓ Bougie 1w alignée sur le lundi (semaine en cours)")
+
+        # Paire récente : 60 bougies 4h (10 jours), 1d reconstruit trop court
+        from data import PairFrames
+
+        class ShortHistory:
+            """Exchange minimal : 60 bougies 4h, 40 bougies 1d"""
+            def __init__(self):
+                self.requests = []
+
+            def fetch_ohlcv(self, symbol, timeframe, limit=None, since=None):
+                self.requests.append((timeframe, limit))
+                step = h4 if timeframe == "4h" else 6 * h4
+                count = 60 if timeframe == "4h" else 40
+                times = 1759708800000 + step * np.arange(count)  # lundi 2025-10-06
+                return np.column_stack([times, np.ones((count, 5))])[-limit:]
+
+        settings = synthetic_settings(RESAMPLE_HIGHER_TIMEFRAMES=True)
+        with patched_config(USE_WEIGHT_RATE_LIMITER=False):
+            exchange = ShortHistory()
+            enough = PairFrames(exchange, "NEW/USDC", {"4h": 200}, settings=settings).get("1d", limit=5)
+            if len(enough) != 5 or [tf for tf, _ in exchange.requests] != ["4h"]:
+                print(f"✗ 1d suffisant non reconstruit: {exchange.requests}")
+                return False
+
+            exchange = ShortHistory()
+            frames = PairFrames(exchange, "NEW/USDC", {"4h": 200}, settings=settings)
+            short = frames.get("1d", limit=20)
+            if len(short) != 20 or exchange.requests != [("4h", 200), ("1d", 20)] \
+                    or frames.fetch_timeframe("1d") != "1d":
+                print(f"✗ 1d trop court non téléchargé: {exchange.requests}")
+                return False
+
+            frames = PairFrames(ShortHistory(), "NEW/USDC", {"4h": 200}, settings=settings)
+            frames.get("4h")
+            if frames.direct_fetches({"1d": 20, "1w": 1}) != ["1d"] or not frames.has("1w"):
+                print("✗ direct_fetches incorrect")
+                return False
+        print("✓ Historique source trop court : 1d téléchargé directement")
+
+        # Scan complet : 1d reconstruit depuis l'historique 4h du cache des bougies
+        import tempfile
+        from replay_exchange import create_replay_exchange
+        from scanner import build_fetch_plan, scan_market
+
+        requests = {}
+        for resample in (False, True):
+            settings = synthetic_settings(
+                REPLAY_SYNTHETIC_PAIRS=10, REPLAY_SYNTHETIC_BARS=2500, REPLAY_NOW_MS=1_760_000_000_000,
+                USE_TICKER_PREFILTER=False, USE_CANDLE_STORE=True, RESAMPLE_HIGHER_TIMEFRAMES=resample,
+            )
+            with tempfile.TemporaryDirectory() as store_dir, \
+                    patched_config(USE_WEIGHT_RATE_LIMITER=False, CANDLE_STORE_DIR=store_dir):
+                scans = []
+                for _ in range(2):  # premier scan, puis rescan depuis le cache
+                    exchange = create_replay_exchange(settings=settings)
+                    scans.append((scan_market(exchange, settings=settings), exchange.calls["fetch_ohlcv"]))
+            (first, cold), (second, warm) = scans
+            if second != first or not any("sma20_1d" in result for result in second):
+                print(f"✗ Rescan différent du premier scan, ou 1d absent (reconstruction: {resample})")
+                return False
+            requests[resample] = (cold, warm, build_fetch_plan(settings))
+
+        (_, direct, _), (cold, resampled, plan) = requests[False], requests[True]
+        if "1d" in plan or resampled >= direct:
+            print(f"✗ Rescan avec reconstruction: {resampled} requêtes OHLCV (sans: {direct}), plan {plan}")
+            return False
+        print(
+            f"✓ 1d reconstruit depuis le cache ({plan[settings.TIMEFRAME]} bougies 4h, {cold} requêtes au "
+            f"1er scan) : {resampled} requêtes OHLCV au rescan contre {direct} sans reconstruction"
+        )
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_latest_indicators():
+    """Test du chemin rapide latest_* (mêmes valeurs que les séries complètes)"""
+    print("\n" + "="*60)
+    print("TEST: indicators.latest_* (dernières valeurs)")
+    print("="*60)
+    try:
+        import numpy as np
+        import pandas as pd
+        from indicators import (
+            get_latest_rsi, calculate_sma, calculate_ema, calculate_macd, calculate_bollinger_bands,
+            calculate_stochastic, detect_macd_signal, detect_bollinger_signal, detect_stochastic_signal,
+            latest_rsi, latest_sma, latest_ema, latest_macd, latest_bollinger_bands, latest_stochastic,
+        )
+
+        rng = np.random.default_rng(11)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 200)))
+        high, low = close * 1.01, close * 0.99
+        prices = pd.Series(close)
+
+        # Série plus courte que le préchauffage : valeurs identiques au bit près
+        if latest_rsi(close) != get_latest_rsi(prices) or latest_ema(close, 50) != calculate_ema(prices, 50).iloc[-1]:
+            print("✗ RSI / EMA différents du calcul complet")
+            return False
+        macd, full_macd = latest_macd(close), calculate_macd(prices)
+        if not np.array_equal(macd["histogram"], full_macd["histogram"].to_numpy()[-2:]):
+            print("✗ MACD différent du calcul complet")
+            return False
+        print("✓ RSI, EMA et MACD identiques au calcul complet")
+
+        if not np.isclose(latest_sma(close, 50), calculate_sma(prices, 50).iloc[-1], rtol=1e-12):
+            print("✗ SMA différente du calcul complet")
+            return False
+
+        bands, full_bands = latest_bollinger_bands(close), calculate_bollinger_bands(prices)
+        stoch = latest_stochastic(high, low, close)
+        full_stoch = calculate_stochastic(pd.Series(high), pd.Series(low), prices)
+        signals = (
+            detect_macd_signal(macd) == detect_macd_signal(full_macd)
+            and detect_bollinger_signal(close, bands) == detect_bollinger_signal(prices, full_bands)
+            and detect_stochastic_signal(stoch) == detect_stochastic_signal(full_stoch)
+        )
+        if not signals:
+            print("✗ Signaux différents du calcul complet")
+            return False
+        print("✓ SMA, Bollinger, Stochastic et signaux cohérents")
+
+        # Série longue : préchauffage borné, écart sous la tolérance
+        long_close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 2000)))
+        if abs(latest_rsi(long_close) - get_latest_rsi(pd.Series(long_close))) > 1e-6:
+            print("✗ RSI sur préchauffage borné hors tolérance")
+            return False
+        print("✓ Préchauffage borné sur 2000 bougies dans la tolérance")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_indicator_context():
+    """Test du contexte partagé (primitives calculées une seule fois par série)"""
+    print("\n" + "="*60)
+    print("TEST: indicator_context.py")
+    print("="*60)
+    try:
+        import numpy as np
+        import pandas as pd
+        from indicator_context import IndicatorContext
+        from indicators import (
+            calculate_rsi, calculate_sma, calculate_ema, calculate_macd,
+            calculate_bollinger_bands, calculate_stochastic,
+        )
+
+        rng = np.random.default_rng(5)
+        close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, 200))))
+        frame = pd.DataFrame({"high": close * 1.01, "low": close * 0.99, "close": close})
+        context = IndicatorContext(frame)
+
+        # Mêmes séries que le calcul sur une Series seule
+        pairs = [
+            (calculate_rsi(context), calculate_rsi(close)),
+            (calculate_sma(context, 20), calculate_sma(close, 20)),
+            (calculate_ema(context, 26), calculate_ema(close, 26)),
+            (calculate_macd(context)["histogram"], calculate_macd(close)["histogram"]),
+            (calculate_bollinger_bands(context)["upper"], calculate_bollinger_bands(close)["upper"]),
+            (calculate_stochastic(context)["d"], calculate_stochastic(frame.high, frame.low, close)["d"]),
+        ]
+        if not all(shared.equals(alone) for shared, alone in pairs):
+            print("✗ Valeurs différentes du calcul sans contexte")
+            return False
+        print("✓ Valeurs identiques au calcul sans contexte")
+
+        # SMA20 = bande médiane, EMA26 = EMA lente du MACD : rien n'est recalculé
+        if calculate_bollinger_bands(context)["middle"] is not calculate_sma(context, 20):
+            print("✗ Bande médiane recalculée")
+            return False
+        computed = context.computed
+        calculate_ema(context, 12)
+        calculate_macd(context)
+        calculate_stochastic(context)
+        if context.computed != computed:
+            print(f"✗ {context.computed - computed} primitive(s) recalculée(s)")
+            return False
+        print(f"✓ {context.computed} primitives calculées, {context.reused} réutilisées")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_indicator_registry():
+    """Test du registre d'indicateurs (plan de récupération déduit des besoins)"""
+    print("\n" + "="*60)
+    print("TEST: indicator_registry.py")
+    print("="*60)
+    import indicator_registry
+    from indicator_registry import IndicatorSpec, register, required_bars, wilder_bars
+    from scan_config import ScanConfig
+    from scanner import build_fetch_plan
+
+    providers = list(indicator_registry._PROVIDERS)
+    try:
+        settings = ScanConfig.from_module().replace(RESAMPLE_HIGHER_TIMEFRAMES=False)
+        plan = build_fetch_plan(settings)
+        print(f"✓ Plan par défaut: {plan}")
+
+        # RSI : l'amorce pèse moins de INDICATOR_PRECISION
+        bars = required_bars("rsi", settings.TIMEFRAME, settings)
+        if bars != wilder_bars(settings.RSI_PERIOD, settings.INDICATOR_PRECISION):
+            print(f"✗ Bougies RSI inattendues: {bars}")
+            return False
+        finer = settings.replace(INDICATOR_PRECISION=settings.INDICATOR_PRECISION / 10)
+        if required_bars("rsi", settings.TIMEFRAME, finer) <= bars:
+            print("✗ Une précision plus fine devrait demander plus de bougies")
+            return False
+
+        # SMA seules sur les MA, multi-indicateurs sans MACD : fenêtres exactes
+        sma_only = settings.replace(USE_EMA=False, USE_MACD=False)
+        ma_bars = required_bars("ma", settings.MA_TIMEFRAMES[0], sma_only)
+        multi_bars = required_bars("multi", settings.TIMEFRAME, sma_only)
+        expected_multi = max(settings.BOLLINGER_PERIOD, settings.STOCHASTIC_K_PERIOD + settings.STOCHASTIC_D_PERIOD)
+        if ma_bars != max(settings.SMA_PERIODS) or multi_bars != expected_multi:
+            print(f"✗ Bougies MA/multi inattendues: {ma_bars}/{multi_bars}")
+            return False
+        print(f"✓ SMA seules: {ma_bars} bougies, Bollinger + Stochastic: {multi_bars}")
+
+        # Nouvel indicateur : ajouté au plan sans modifier le scanner
+        register(lambda settings: IndicatorSpec("custom", "custom", {}, ("close",), ["1M"], 5000))
+        if build_fetch_plan(settings.replace(MAX_FETCH_BARS=500)).get("1M") != 500:
+            print("✗ Indicateur enregistré absent du plan (ou plafond ignoré)")
+            return False
+        print("✓ Indicateur enregistré ajouté au plan, plafonné à MAX_FETCH_BARS")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+    finally:
+        indicator_registry._PROVIDERS[:] = providers
+
+
+def test_sweeps():
+    """Test des balayages de paramètres (mêmes valeurs qu'un calcul par variante)"""
+    print("\n" + "="*60)
+    print("TEST: sweeps.py")
+    print("="*60)
+    import numpy as np
+    import pandas as pd
+    from indicators import calculate_rsi, calculate_ema, calculate_macd, calculate_bollinger_bands
+    from sweeps import sweep_context, rsi_sweep, ema_sweep, macd_sweep, bollinger_sweep
+
+    try:
+        rng = np.random.default_rng(3)
+        close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.02, 300))))
+        same = lambda a, b: np.array_equal(a, b.to_numpy(), equal_nan=True)
+
+        periods = list(range(7, 29))
+        rsi = rsi_sweep(close.to_numpy(), periods)
+        if rsi.shape != (len(periods), len(close)) or not all(
+            same(row, calculate_rsi(close, p)) for row, p in zip(rsi, periods)
+        ):
+            print("✗ RSI balayé différent de calculate_rsi")
+            return False
+        print(f"✓ RSI {periods[0]}-{periods[-1]}: matrice {rsi.shape} identique")
+
+        # EMA et MACD d'un même contexte : les EMA 12/26 ne sont calculées qu'une fois
+        context = sweep_context(close.to_numpy())
+        ema = ema_sweep(context, (12, 26, 50))
+        params, macd = macd_sweep(context, (8, 12), (26,), (5, 9))
+        if not all(same(row, calculate_ema(close, p)) for row, p in zip(ema, (12, 26, 50))):
+            print("✗ EMA balayée différente de calculate_ema")
+            return False
+        for i, p in enumerate(params):
+            expected = calculate_macd(close, *p)
+            if not (same(macd["macd"][i], expected["macd"]) and same(macd["histogram"][i], expected["histogram"])):
+                print(f"✗ MACD {p} différent de calculate_macd")
+                return False
+        # Série, EMA 12/26/50, EMA 8, 2 lignes MACD, 4 lignes de signal (EMA 12/26 réutilisées)
+        if context.computed != 11:
+            print(f"✗ Primitives recalculées: {context.computed} calculées, {context.reused} réutilisées")
+            return False
+        print(f"✓ EMA + {len(params)} MACD: {context.computed} primitives, {context.reused} réutilisées")
+
+        bands = bollinger_sweep(close, (10, 20), (1.5, 2))
+        for i, period in enumerate((10, 20)):
+            for j, width in enumerate((1.5, 2)):
+                expected = calculate_bollinger_bands(close, period, width)
+                if not (same(bands["upper"][i, j], expected["upper"]) and same(bands["lower"][i, j], expected["lower"])):
+                    print(f"✗ Bollinger ({period}, {width}) différent de calculate_bollinger_bands")
+                    return False
+        print(f"✓ Bollinger 2 périodes x 2 largeurs: {bands['upper'].shape}")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_scoring():
+    """Test du score de confluence en colonnes (parité avec le calcul par paire)"""
+    print("\n" + "="*60)
+    print("TEST: scoring.py")
+    print("="*60)
+    import itertools
+    from indicators import calculate_confluence_score, check_signal_filters, SIGNAL_SCORE_POINTS
+    from scan_config import ScanConfig
+    from scoring import encode_results, signal_mask, score_result, score_results
+
+    try:
+        settings = ScanConfig.from_module()
+        # Toutes les combinaisons de signaux (absent, connus, inconnu) x grille RSI / tendance
+        labels = [[None, "inconnu", *SIGNAL_SCORE_POINTS[name][0]] for name in ("macd", "bollinger", "stochastic")]
+        rows = []
+        for rsi, trend, macd, bb, stoch in itertools.product(
+            [None, 5.0, 20.0, 20.01, 30.0, 39.99, 50.0, 60.0, 60.01, 85.0], [None, 0, 1, 3], *labels
+        ):
+            row = {"symbol": "TEST/USDC", "rsi": rsi, "trend_score": trend,
+                   "macd_signal_type": macd, "bb_position": bb, "stoch_signal": stoch}
+            rows.append({key: value for key, value in row.items() if value is not None})
+
+        weights = {"rsi": 10, "trend": 35, "macd": 15, "bollinger": 25, "stochastic": 15}
+        scored = score_results(rows, weights=weights, min_score=0, settings=settings)
+        for row, result in zip(rows, scored):
+            expected = calculate_confluence_score(
+                rsi_value=row.get("rsi"),
+                trend_score=row.get("trend_score"),
+                max_trend_score=len(settings.MA_TIMEFRAMES),
+                macd_signal=row.get("macd_signal_type"),
+                bb_position=row.get("bb_position"),
+                stoch_signal=row.get("stoch_signal"),
+                weights=weights,
+            )
+            got = (result["confluence_score"], result["confluence_grade"], result["confluence_breakdown"])
+            if len(scored) != len(rows) or got != (expected["score"], expected["grade"], expected["breakdown"]):
+                print(f"✗ Score différent pour {row}: {got} != {expected}")
+                return False
+        print(f"✓ {len(rows)} combinaisons identiques au calcul par paire")
+
+        # Résultat isolé (scan en flux) : mêmes valeurs que la notation en colonnes
+        filtered = settings.replace(
+            FILTER_MACD_SIGNAL=["bullish"], FILTER_BB_POSITION=["oversold", "near_oversold"],
+            FILTER_STOCH_SIGNAL=None, MIN_CONFLUENCE_SCORE=40,
+        )
+        singles = [score_result(row, weights=weights, settings=filtered) for row in rows]
+        if [single for single in singles if single is not None] != score_results(rows, weights=weights, settings=filtered):
+            print("✗ score_result différent de score_results")
+            return False
+        print(f"✓ Notation d'un résultat isolé identique: {sum(s is not None for s in singles)}/{len(rows)} retenus")
+
+        # Filtres de signaux : même règle que check_signal_filters
+        filters = (["bullish"], ["oversold", "inconnu"], ["bullish_cross"])
+        mask = signal_mask(encode_results(rows), *filters)
+        expected = [
+            check_signal_filters(r.get("macd_signal_type"), r.get("bb_position"), r.get("stoch_signal"), *filters)
+            for r in rows
+        ]
+        if mask.tolist() != expected:
+            print("✗ Masque de filtres différent de check_signal_filters")
+            return False
+        print(f"✓ Filtres de signaux: {int(mask.sum())}/{len(rows)} paires retenues")
+
+        # Re-notation sans nouveau scan : score minimum et filtres de la configuration
+        rescored = score_results(rows, settings=settings.replace(MIN_CONFLUENCE_SCORE=70, FILTER_MACD_SIGNAL=["bullish"]))
+        if any(r["confluence_score"] < 70 or r.get("macd_signal_type", "bullish") != "bullish" for r in rescored):
+            print("✗ Score minimum ou filtre ignoré à la re-notation")
+            return False
+        if any("confluence_score" in row for row in rows):
+            print("✗ Les candidats ne doivent pas être modifiés")
+            return False
+        print(f"✓ Re-notation (score ≥ 70, MACD bullish): {len(rescored)} paires")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_streaming():
+    """Test des indicateurs incrémentaux (mêmes valeurs que le calcul complet)"""
+    print("\n" + "="*60)
+    print("TEST: streaming.py (mise à jour bougie par bougie)")
+    print("="*60)
+    try:
+        import json
+        import numpy as np
+        import pandas as pd
+        from data import OHLCV
+        from indicators import get_latest_rsi, calculate_ema, calculate_macd, calculate_bollinger_bands, calculate_stochastic
+        from streaming import (
+            StreamingIndicator, StreamingRSI, StreamingEMA, StreamingMACD,
+            StreamingBollinger, StreamingStochastic,
+        )
+
+        rng = np.random.default_rng(7)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 300)))
+        high, low = close * 1.01, close * 0.99
+        times = np.arange(300, dtype=np.int64) * 14_400_000
+        candles = OHLCV(times, np.vstack([close, high, low, close, np.ones(300)]))
+
+        indicators = [StreamingRSI(14), StreamingEMA(20), StreamingMACD(), StreamingBollinger(), StreamingStochastic()]
+        for indicator in indicators:
+            indicator.update_many(OHLCV(times[:200], candles.values[:, :200]))
+
+        # Sauvegarde / restauration, puis rejeu d'un historique qui chevauche l'état
+        indicators = [StreamingIndicator.from_dict(json.loads(json.dumps(i.to_dict()))) for i in indicators]
+        for indicator in indicators:
+            indicator.update_many(OHLCV(times[150:], candles.values[:, 150:]))
+        rsi, ema, macd, bollinger, stoch = (i.value for i in indicators)
+
+        prices = pd.Series(close)
+        if rsi != get_latest_rsi(prices, 14) or ema != calculate_ema(prices, 20).iloc[-1]:
+            print("✗ RSI / EMA incrémentaux différents du calcul complet")
+            return False
+        if macd["histogram"] != calculate_macd(prices)["histogram"].iloc[-1]:
+            print("✗ MACD incrémental différent du calcul complet")
+            return False
+        print(f"✓ RSI={rsi:.2f}, EMA20 et MACD identiques après restauration")
+
+        bands = calculate_bollinger_bands(prices)
+        full_stoch = calculate_stochastic(pd.Series(high), pd.Series(low), prices)
+        if not (np.isclose(bollinger["upper"], bands["upper"].iloc[-1], rtol=1e-12)
+                and np.isclose(stoch["d"], full_stoch["d"].iloc[-1], rtol=1e-12)
+                and stoch["k"] == full_stoch["k"].iloc[-1]):
+            print("✗ Bollinger / Stochastic incrémentaux différents du calcul complet")
+            return False
+        print(f"✓ Bollinger et Stochastic (K={stoch['k']:.2f}) cohérents")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_rate_limiter():
+    """Test du limiteur de poids partagé (token bucket)"""
+    print("\n" + "="*60)
+    print("TEST: rate_limiter.py")
+    print("="*60)
+    try:
+        from rate_limiter import TokenBucket, ohlcv_weight
+
+        if [ohlcv_weight(n) for n in (50, 200, 1000, 1500)] != [1, 2, 5, 10]:
+            print("✗ Poids klines incorrects")
+            return False
+        print("✓ Poids klines selon la limite (1/2/5/10)")
+
+        # Seau de 10 jetons, rechargé à 100 jetons/s
+        bucket = TokenBucket(10, 100)
+        waits = [bucket.reserve(5) for _ in range(3)]
+        if waits[0] != 0 or waits[1] != 0 or not 0.04 <= waits[2] <= 0.05:
+            print(f"✗ Délais de réservation incorrects: {waits}")
+            return False
+        print(f"✓ Rafale servie puis lissage (attente {waits[2] * 1000:.0f} ms)")
+
+        # Une pénalité (erreur 429) fait attendre tous les appelants suivants
+        bucket.penalize(1.0)
+        wait = bucket.reserve(1)
+        if wait < 1.0:
+            print(f"✗ Pénalité non appliquée (attente {wait:.2f}s)")
+            return False
+        print(f"✓ Pénalité partagée appliquée (attente {wait:.2f}s)")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_ticker_prefilter():
+    """Test du préfiltre tickers 24h (sans réseau)"""
+    print("\n" + "="*60)
+    print("TEST: exchange.py (préfiltre tickers)")
+    print("="*60)
+    try:
+        from exchange import prefilter_by_tickers
+        from scan_config import ScanConfig
+
+        settings = ScanConfig.from_module()
+        now = 1760000000000
+
+        class TickerExchange:
+            """Exchange minimal renvoyant des tickers fixes"""
+            def fetch_tickers(self):
+                return {
+                    "LIQ/USDC": {"quoteVolume": 5e6, "bid": 9.99, "ask": 10.01, "percentage": -3.0, "timestamp": now},
+                    "THIN/USDC": {"quoteVolume": 2e3, "bid": 1.0, "ask": 1.001, "percentage": 1.0, "timestamp": now},
+                    "WIDE/USDC": {"quoteVolume": 5e6, "bid": 1.0, "ask": 1.1, "percentage": 1.0, "timestamp": now},
+                    "OLD/USDC": {"quoteVolume": 5e6, "bid": 1.0, "ask": 1.001, "percentage": 1.0, "timestamp": now - 86400000},
+                    "NOVOL/USDC": {"bid": 1.0, "ask": 1.001, "percentage": 1.0, "timestamp": now},
+                }
+
+            def milliseconds(self):
+                return now
+
+        symbols = ["LIQ/USDC", "THIN/USDC", "WIDE/USDC", "OLD/USDC", "GONE/USDC", "NOVOL/USDC"]
+        kept = prefilter_by_tickers(TickerExchange(), symbols, settings)
+        if kept != ["LIQ/USDC"]:
+            print(f"✗ Paires retenues incorrectes: {kept}")
+            return False
+        print("✓ Volume, spread, ancienneté et ticker absent filtrés")
+
+        kept = prefilter_by_tickers(TickerExchange(), symbols, settings.replace(PREFILTER_MAX_CHANGE_PCT=-5.0))
+        if kept:
+            print(f"✗ Filtre de variation 24h ignoré: {kept}")
+            return False
+        print("✓ Filtre de variation 24h appliqué")
+
+        kept = prefilter_by_tickers(TickerExchange(), symbols, settings.replace(PREFILTER_MIN_QUOTE_VOLUME=None))
+        if kept != ["LIQ/USDC", "THIN/USDC", "NOVOL/USDC"]:
+            print(f"✗ Critère de volume désactivé (None) mal appliqué: {kept}")
+            return False
+        print("✓ Critère de volume désactivé (None) : volume faible ou absent accepté")
+
+        # Scan complet, préfiltre actif sans critère de volume
+        from replay_exchange import create_replay_exchange
+        from scanner import scan_market
+
+        # (les tickers synthétiques ont tous un volume : même univers qu'un seuil nul)
+        zero_volume = synthetic_settings(
+            REPLAY_SYNTHETIC_PAIRS=20, USE_TICKER_PREFILTER=True, PREFILTER_MIN_QUOTE_VOLUME=0
+        )
+        no_volume = zero_volume.replace(PREFILTER_MIN_QUOTE_VOLUME=None)
+        with patched_config(USE_WEIGHT_RATE_LIMITER=False):
+            exchange = create_replay_exchange(settings=no_volume)
+            results = scan_market(exchange, settings=no_volume)
+            reference = scan_market(create_replay_exchange(settings=zero_volume), settings=zero_volume)
+        if exchange.calls["fetch_tickers"] != 1 or not reference or results != reference:
+            print(f"✗ Scan avec préfiltre sans critère de volume: {len(results)} / {len(reference)} résultat(s)")
+            return False
+        print(f"✓ Scan avec préfiltre sans critère de volume: {len(results)} résultat(s)")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_markets_cache():
+    """Test du cache des marchés et des paires filtrées (sans réseau)"""
+    print("\n" + "="*60)
+    print("TEST: exchange.py (cache des marchés)")
+    print("="*60)
+    try:
+        import tempfile
+        import ccxt
+        from exchange import _exchange_options, get_filtered_pairs
+        from scan_config import ScanConfig
+
+        calls = []
+
+        def new_exchange():
+            """Instance ccxt dont exchangeInfo est simulé (compte les appels)"""
+            exchange = ccxt.binance(_exchange_options(settings))
+            exchange.fetch_currencies = lambda params={}: {}
+            exchange.fetch_markets = lambda params={}: calls.append(1) or [
+                {"id": f"{base}USDC", "symbol": f"{base}/USDC", "base": base, "quote": "USDC",
+                 "active": True, "type": "spot", "spot": True, "precision": {}, "limits": {}, "info": {}}
+                for base in ("BTC", "ETH", "USDT")
+            ]
+            return exchange
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            settings = ScanConfig.from_module().replace(USE_MARKETS_CACHE=True, MARKETS_CACHE_DIR=cache_dir)
+            _, cold = get_filtered_pairs(new_exchange(), settings)
+            exchange, warm = get_filtered_pairs(new_exchange(), settings)
+            _, reused = get_filtered_pairs(exchange, settings)
+
+        if len(calls) != 1:
+            print(f"✗ exchangeInfo téléchargé {len(calls)} fois (attendu: 1)")
+            return False
+        if not (cold == warm == reused == ["BTC/USDC", "ETH/USDC"]):
+            print(f"✗ Paires filtrées incohérentes: {cold} / {warm} / {reused}")
+            return False
+        print("✓ Marchés rechargés depuis le cache disque puis depuis l'instance")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_candle_store():
+    """Test du cache local des bougies : fusion, bougies clôturées, rescan incrémental"""
+    print("\n" + "="*60)
+    print("TEST: candle_store.py (cache des bougies)")
+    print("="*60)
+    try:
+        import tempfile
+        import numpy as np
+        import candle_store
+        from replay_exchange import create_replay_exchange
+        from scanner import scan_market
+
+        h4 = 4 * 3600 * 1000
+
+        def candles(start, count, close=1.0):
+            """Bougies 4h consécutives à partir de la bougie n° start"""
+            times = (start + np.arange(count)) * h4
+            return np.column_stack([times] + [np.full(count, close)] * 5)
+
+        # Fusion : triée, sans doublon, la bougie récente l'emporte
+        merged = candle_store.merge_candles(candles(0, 10), candles(8, 4, close=2.0))
+        if not (np.array_equal(merged[:, 0], candles(0, 12)[:, 0])
+                and (merged[:8, 4] == 1.0).all() and (merged[8:, 4] == 2.0).all()):
+            print("✗ Fusion des bougies stockées et récentes incorrecte")
+            return False
+        if candle_store.merge_candles(None, candles(0, 3)).shape != (3, 6):
+            print("✗ Fusion sans cache incorrecte")
+            return False
+        print("✓ Fusion : triée, sans doublon, bougies récentes prioritaires")
+
+        # Bougies clôturées : la bougie en cours est écartée
+        now_ms = 10 * h4 + 1
+        if len(candle_store.closed_candles(candles(0, 11), h4, now_ms)) != 10:
+            print("✗ La bougie en cours est conservée dans le cache")
+            return False
+        print("✓ Seules les bougies clôturées sont conservées")
+
+        # Récupération incrémentale : since = 1re bougie manquante
+        stored = candles(0, 10)
+        cases = [
+            ("cache vide", None, 100, None),
+            ("2 bougies manquantes", stored, 5, (10 * h4, 2)),
+            ("trop de bougies manquantes", stored[:2], 5, None),
+            ("historique stocké trop court", stored, 20, None),
+        ]
+        for name, rows, limit, expected in cases:
+            since = candle_store.incremental_since(rows, h4, 11 * h4 + 1, limit)
+            if since != expected:
+                print(f"✗ Récupération incrémentale ({name}): {since} (attendu: {expected})")
+                return False
+        print("✓ Récupération incrémentale, ou téléchargement complet si le cache ne suffit pas")
+
+        # Deux scans : le second ne demande que la bougie en cours de chaque série
+        settings = synthetic_settings(REPLAY_SYNTHETIC_PAIRS=10, USE_TICKER_PREFILTER=False, USE_CANDLE_STORE=True)
+        with tempfile.TemporaryDirectory() as store_dir, \
+                patched_config(USE_WEIGHT_RATE_LIMITER=False, CANDLE_STORE_DIR=store_dir):
+            scans = []
+            for _ in range(2):
+                exchange = create_replay_exchange(settings=settings)
+                requests = []
+                fetch = exchange.fetch_ohlcv
+
+                def recorded_fetch(symbol, timeframe="1m", since=None, limit=None, params={},
+                                   fetch=fetch, requests=requests):
+                    requests.append((timeframe, since is not None, limit))
+                    return fetch(symbol, timeframe, since, limit)
+
+                exchange.fetch_ohlcv = recorded_fetch
+                scans.append((scan_market(exchange, settings=settings), requests))
+
+        (first, cold), (second, warm) = scans
+        if not first or second != first:
+            print(f"✗ Rescan depuis le cache différent du premier scan ({len(first)} / {len(second)} résultats)")
+            return False
+        if any(since for _, since, _ in cold) or any(request[1:] != (True, 1) for request in warm):
+            print(f"✗ Requêtes inattendues: {cold[:2]}... puis {warm[:2]}...")
+            return False
+        print(
+            f"✓ Rescan identique : {len(cold)} téléchargements complets, "
+            f"puis {len(warm)} requêtes 'since' d'une bougie"
+        )
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_replay_exchange():
+    """Test de l'exchange hors-ligne (synthétique puis rejeu d'archive)"""
+    print("\n" + "="*60)
+    print("TEST: replay_exchange.py (scan sans réseau)")
+    print("="*60)
+    try:
+        import tempfile
+        from replay_exchange import create_replay_exchange, record_archive
+        from scanner import scan_market, build_fetch_plan
+
+        settings = synthetic_settings(REPLAY_SYNTHETIC_PAIRS=20)
+        with tempfile.TemporaryDirectory() as archive_dir, patched_config(USE_WEIGHT_RATE_LIMITER=False):
+            synthetic = create_replay_exchange(settings=settings)
+            first = scan_market(synthetic, settings=settings)
+            second = scan_market(create_replay_exchange(settings=settings), settings=settings)
+
+            symbols = list(synthetic.markets)
+            record_archive(synthetic, symbols, build_fetch_plan(settings), archive_dir)
+            archive = settings.replace(EXCHANGE_MODE="archive", REPLAY_ARCHIVE_DIR=archive_dir)
+            replayed = scan_market(create_replay_exchange(settings=archive), settings=archive)
+
+        if not first:
+            print("✗ Aucun résultat sur l'univers synthétique")
+            return False
+        print(f"✓ {len(first)} résultat(s) sur 20 paires synthétiques, {sum(synthetic.calls.values())} requêtes")
+
+        if first != second:
+            print("✗ Données synthétiques non déterministes")
+            return False
+        print("✓ Deux scans synthétiques identiques")
+
+        if replayed != first:
+            print("✗ Rejeu de l'archive différent du scan enregistré")
+            return False
+        print("✓ Rejeu de l'archive identique au scan enregistré")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_batch_engine():
+    """Test du moteur vectorisé (mêmes résultats que le scan paire par paire)"""
+    print("\n" + "="*60)
+    print("TEST: batch_scanner.py (matrice symboles × temps)")
+    print("="*60)
+    try:
+        from replay_exchange import create_replay_exchange
+        from scanner import scan_market
+
+        settings = synthetic_settings(REPLAY_SYNTHETIC_PAIRS=50)
+        with patched_config(USE_WEIGHT_RATE_LIMITER=False):
+            exchange = create_replay_exchange(settings=settings)
+            per_pair, batch = (
+                sorted(scan_market(exchange, settings=settings.replace(SCAN_ENGINE=engine)),
+                       key=lambda r: r["symbol"])
+                for engine in ("threads", "batch")
+            )
+
+        if not per_pair:
+            print("✗ Aucun résultat sur l'univers synthétique")
+            return False
+
+        if [list(r.items()) for r in batch] != [list(r.items()) for r in per_pair]:
+            print("✗ Résultats du moteur batch différents du scan paire par paire")
+            return False
+        print(f"✓ {len(batch)} résultat(s) identiques au scan paire par paire (50 paires)")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_pipelined_engine():
+    """Test du moteur à deux étages (mêmes résultats et requêtes que le scan paire par paire)"""
+    print("\n" + "="*60)
+    print("TEST: pipelined_scanner.py (étages réseau / calcul)")
+    print("="*60)
+    try:
+        from replay_exchange import create_replay_exchange
+        from scanner import scan_market
+
+        # Petites files et petits lots : contre-pression entre les étages
+        base = synthetic_settings(
+            REPLAY_SYNTHETIC_PAIRS=50, PIPELINE_FETCH_WORKERS=4, PIPELINE_QUEUE_DEPTH=4, PIPELINE_BATCH_SIZE=3
+        )
+        runs = {}
+        with patched_config(USE_WEIGHT_RATE_LIMITER=False):
+            for engine in ("threads", "pipelined"):
+                settings = base.replace(SCAN_ENGINE=engine)
+                exchange = create_replay_exchange(settings=settings)
+                frames = {}
+                results = sorted(scan_market(exchange, frames=frames, settings=settings), key=lambda r: r["symbol"])
+                runs[engine] = (results, exchange.calls["fetch_ohlcv"], sorted(frames))
+
+        (per_pair, per_pair_fetches, per_pair_kept), (staged, staged_fetches, staged_kept) = (
+            runs["threads"], runs["pipelined"]
+        )
+        if not per_pair:
+            print("✗ Aucun résultat sur l'univers synthétique")
+            return False
+        if [list(r.items()) for r in staged] != [list(r.items()) for r in per_pair]:
+            print("✗ Résultats du moteur pipelined différents du scan paire par paire")
+            return False
+        if staged_fetches != per_pair_fetches or staged_kept != per_pair_kept:
+            print(f"✗ Requêtes ou bougies conservées différentes ({staged_fetches} / {per_pair_fetches})")
+            return False
+        print(f"✓ {len(staged)} résultat(s) identiques, {staged_fetches} requêtes OHLCV (50 paires)")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_daemon():
+    """Test du mode daemon (calendrier des clôtures, mise à jour incrémentale)"""
+    print("\n" + "="*60)
+    print("TEST: daemon.py (scan continu)")
+    print("="*60)
+    try:
+        import json
+        from replay_exchange import SyntheticSource, ReplayExchange, _current_open
+        from daemon import ScanDaemon, next_close_ms
+        from scanner import scan_market
+
+        h4 = 4 * 3600 * 1000
+        monday = 1_700_438_400_000  # 2023-11-20 00:00 UTC (lundi)
+        if next_close_ms("4h", monday + 1) != monday + h4 or next_close_ms("1w", monday - 1) != monday:
+            print("✗ Clôtures mal alignées")
+            return False
+        print("✓ Clôtures alignées (4h sur minuit UTC, 1w sur le lundi)")
+
+        class ClockSource:
+            """Séries figées, tronquées à l'horodatage courant (le temps avance)"""
+            name = "clock"
+
+            def __init__(self):
+                self.base = SyntheticSource(30, 400, monday + 40 * h4, settings.QUOTE_FILTER)
+                self.now_ms = monday + 1000
+
+            def markets(self):
+                return self.base.markets()
+
+            def tickers(self):
+                return self.base.tickers()
+
+            def series(self, symbol, timeframe):
+                rows = self.base.series(symbol, timeframe)
+                return None if rows is None else rows[rows[:, 0] <= _current_open(timeframe, self.now_ms)]
+
+        settings = synthetic_settings(USE_TICKER_PREFILTER=False, SCAN_ENGINE="threads")
+        source = ClockSource()
+        exchange = ReplayExchange(source)
+        requests = []
+        fetch = exchange.fetch_ohlcv
+
+        def recorded_fetch(symbol, timeframe="1m", since=None, limit=None, params={}):
+            requests.append((timeframe, since is not None, limit))
+            return fetch(symbol, timeframe, since, limit)
+
+        exchange.fetch_ohlcv = recorded_fetch
+        with patched_config(USE_WEIGHT_RATE_LIMITER=False):
+            daemon = ScanDaemon(exchange, settings=settings)
+
+            for cycle in range(7):  # 7 × 4h : traverse une clôture journalière
+                requests.clear()
+                results = daemon.run_cycle()
+                reference = scan_market(ReplayExchange(source), settings=settings)
+                if json.dumps(results, default=str) != json.dumps(reference, default=str):
+                    print(f"✗ Cycle {cycle + 1}: résultats différents d'un scan complet")
+                    return False
+                if cycle == 0:
+                    first = len(requests)
+                source.now_ms += h4
+
+        # Dernier cycle : une requête de 2 bougies (since) par série 4h
+        timeframe = settings.TIMEFRAME
+        requests_4h = [request for request in requests if request[0] == timeframe]
+        if exchange.calls["fetch_time"] != 7 or requests_4h != [(timeframe, True, 2)] * len(daemon.frames):
+            print(f"✗ Requêtes {timeframe} du dernier cycle: {requests_4h[:3]}... ({len(daemon.frames)} paires)")
+            return False
+        print(
+            f"✓ 7 cycles identiques à un scan complet ({first} requêtes au 1er cycle, "
+            f"{len(requests)} au dernier dont {len(requests_4h)} de 2 bougies)"
+        )
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_scan_config():
+    """Test de la configuration figée (immuabilité, hash, scans concurrents)"""
+    print("\n" + "="*60)
+    print("TEST: scan_config.py (configuration figée d'un scan)")
+    print("="*60)
+    try:
+        import json
+        import os
+        import tempfile
+        import threading
+        import config
+        from replay_exchange import create_replay_exchange
+        from scan_config import ScanConfig, PROCESS_SETTINGS
+        from scanner import scan_market, iter_scan
+
+        snapshot = ScanConfig.from_module()
+        try:
+            snapshot.RSI_THRESHOLD = 10
+            print("✗ ScanConfig modifiable")
+            return False
+        except AttributeError:
+            pass
+        if snapshot != ScanConfig.from_module() or hash(snapshot) != hash(ScanConfig.from_module()):
+            print("✗ Deux instantanés identiques différent (égalité ou hash)")
+            return False
+        changed = snapshot.replace(RSI_THRESHOLD=snapshot.RSI_THRESHOLD + 1)
+        if changed == snapshot or changed.fingerprint == snapshot.fingerprint or len({snapshot, changed}) != 2:
+            print("✗ replace() sans effet sur l'égalité / l'empreinte")
+            return False
+        if not isinstance(snapshot.SMA_PERIODS, tuple) or snapshot.SMA_PERIODS != tuple(config.SMA_PERIODS):
+            print("✗ Listes non figées en tuples")
+            return False
+        try:
+            snapshot.replace(RSI_TRESHOLD=30)
+            print("✗ Paramètre inconnu accepté")
+            return False
+        except ValueError:
+            pass
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"RSI_THRESHOLD": 25}, f)
+        try:
+            loaded = ScanConfig.from_file(f.name)
+        finally:
+            os.unlink(f.name)
+        if loaded != snapshot.replace(RSI_THRESHOLD=25):
+            print("✗ from_file différent de replace")
+            return False
+        if any(name in snapshot.as_dict() for name in PROCESS_SETTINGS):
+            print("✗ Paramètre du processus inclus dans l'instantané")
+            return False
+        try:
+            snapshot.replace(LOG_LEVEL="DEBUG")
+            print("✗ Paramètre du processus accepté par replace()")
+            return False
+        except ValueError:
+            pass
+        print(f"✓ Immuable, hashable, replace / from_file ({snapshot!r})")
+
+        base = synthetic_settings(REPLAY_SYNTHETIC_PAIRS=60)
+        thresholds = (40, 60)
+        with patched_config(USE_WEIGHT_RATE_LIMITER=False, RSI_THRESHOLD=config.RSI_THRESHOLD):
+            for engine in ("threads", "asyncio", "batch", "pipelined"):
+                configs = [base.replace(RSI_THRESHOLD=t, SCAN_ENGINE=engine) for t in thresholds]
+                expected = [
+                    json.dumps(scan_market(create_replay_exchange(settings=c), settings=c), default=str)
+                    for c in configs
+                ]
+
+                # Config.py modifié pendant le scan : sans effet sur le scan en cours
+                config.RSI_THRESHOLD = 90
+                stream = iter_scan(create_replay_exchange(settings=configs[0]), settings=configs[0])
+                next(stream)
+                config.RSI_THRESHOLD = 5
+                during = sorted(event.result["symbol"] for event in stream if event.kind == "result")
+                if during != sorted(r["symbol"] for r in json.loads(expected[0])):
+                    print(f"✗ [{engine}] Modification de config.py visible pendant le scan")
+                    return False
+
+                # Deux scans concurrents, configurations différentes
+                concurrent = [None, None]
+
+                def scan(position):
+                    concurrent[position] = json.dumps(
+                        scan_market(create_replay_exchange(settings=configs[position]), settings=configs[position]),
+                        default=str,
+                    )
+
+                threads = [threading.Thread(target=scan, args=(i,)) for i in range(2)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                if concurrent != expected or expected[0] == expected[1]:
+                    print(f"✗ [{engine}] Scans concurrents différents des scans séquentiels")
+                    return False
+                print(
+                    f"✓ [{engine}] 2 scans concurrents (RSI < {thresholds[0]} / < {thresholds[1]}): "
+                    f"{len(json.loads(expected[0]))} / {len(json.loads(expected[1]))} résultats, "
+                    "identiques aux scans séquentiels"
+                )
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_pipeline():
+    """Test du pipeline par étapes (ordre par coût, borne du score, rejet anticipé)"""
+    print("\n" + "="*60)
+    print("TEST: scanner.build_pipeline (rejet anticipé)")
+    print("="*60)
+    try:
+        import itertools
+        from indicators import calculate_confluence_score, SIGNAL_SCORE_POINTS
+        from replay_exchange import create_replay_exchange
+        from scan_config import ScanConfig
+        from scanner import build_pipeline, confluence_upper_bound, rescore_is_complete, scan_market
+
+        settings = ScanConfig.from_module()
+        pipeline = build_pipeline(settings=settings)
+        order = [stage.name for stage in pipeline]
+        if order != ["rsi", "multi", "ma"]:
+            print(f"✗ Ordre des étapes inattendu: {order}")
+            return False
+        print(f"✓ Étapes: {pipeline.describe()}")
+
+        # La borne n'est jamais inférieure au score final, à chaque étape
+        max_trend = len(settings.MA_TIMEFRAMES)
+        labels = [list(SIGNAL_SCORE_POINTS[name][0]) + [None] for name in ("macd", "bollinger", "stochastic")]
+        for rsi, trend, macd, bb, stoch in itertools.product(
+            [12.3, 20.004, 29.996, 45.0, 59.0], range(max_trend + 1), *labels
+        ):
+            multi = {"macd_signal_type": macd, "bb_position": bb, "stoch_signal": stoch}
+            final = calculate_confluence_score(
+                rsi_value=round(rsi, 2), trend_score=trend, max_trend_score=max_trend,
+                macd_signal=macd, bb_position=bb, stoch_signal=stoch,
+                weights=settings.CONFLUENCE_WEIGHTS,
+            )["score"]
+            for state in ({"settings": settings, "rsi": rsi}, {"settings": settings, "rsi": rsi, "multi": multi},
+                          {"settings": settings, "rsi": rsi, "multi": multi, "ma": {"trend_score": trend}}):
+                if confluence_upper_bound(state) < final:
+                    print(f"✗ Borne {confluence_upper_bound(state)} < score {final} pour {state}")
+                    return False
+        print("✓ Borne supérieure du score respectée à chaque étape")
+
+        base = synthetic_settings(REPLAY_SYNTHETIC_PAIRS=60, MIN_CONFLUENCE_SCORE=70, SCAN_ENGINE="threads")
+        runs = {}
+        with patched_config(USE_WEIGHT_RATE_LIMITER=False):
+            for early in (False, True):
+                settings = base.replace(EARLY_REJECTION=early)
+                exchange = create_replay_exchange(settings=settings)
+                # Candidats demandés (GUI, re-notation) : rejet anticipé conservé
+                results = sorted(scan_market(exchange, candidates=[], settings=settings), key=lambda r: r["symbol"])
+                runs[early] = (results, exchange.calls["fetch_ohlcv"])
+
+        scanned = base.replace(EARLY_REJECTION=True)
+        complete = {
+            "même configuration": rescore_is_complete(scanned, scanned),
+            "score minimum plus haut": rescore_is_complete(scanned, scanned.replace(MIN_CONFLUENCE_SCORE=80)),
+            "scan sans rejet anticipé": rescore_is_complete(
+                scanned.replace(EARLY_REJECTION=False), scanned.replace(MIN_CONFLUENCE_SCORE=0)
+            ),
+        }
+        partial = {
+            "score minimum plus bas": rescore_is_complete(scanned, scanned.replace(MIN_CONFLUENCE_SCORE=50)),
+            "pondérations modifiées": rescore_is_complete(
+                scanned, scanned.replace(CONFLUENCE_WEIGHTS={**scanned.CONFLUENCE_WEIGHTS, "rsi": 0})
+            ),
+            "score désactivé": rescore_is_complete(scanned, scanned.replace(USE_CONFLUENCE_SCORE=False)),
+        }
+
+        wrong = [name for name, ok in complete.items() if not ok] + [name for name, ok in partial.items() if ok]
+        if wrong:
+            print(f"✗ rescore_is_complete incorrect: {', '.join(wrong)}")
+            return False
+        print("✓ Re-notation plus permissive que le scan détectée (rescore_is_complete)")
+
+        (full, full_fetches), (early, early_fetches) = runs[False], runs[True]
+        if [list(r.items()) for r in early] != [list(r.items()) for r in full]:
+            print("✗ Résultats différents avec le rejet anticipé")
+            return False
+        if early_fetches >= full_fetches:
+            print(f"✗ Pas de requête évitée ({early_fetches} >= {full_fetches})")
+            return False
+        print(f"✓ {len(early)} résultat(s) identiques, {early_fetches}/{full_fetches} requêtes OHLCV")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
+def test_iter_scan():
+    """Test du scan en flux (événements, classement courant, arrêt anticipé)"""
+    print("\n" + "="*60)
+    print("TEST: scanner.iter_scan (scan en flux)")
+    print("="*60)
+    try:
+        from replay_exchange import create_replay_exchange
+        from scanner import iter_scan, scan_market, sort_results
+
+        base = synthetic_settings(REPLAY_SYNTHETIC_PAIRS=60)
+        with patched_config(USE_WEIGHT_RATE_LIMITER=False):
+            for engine in ("threads", "asyncio"):
+                settings = base.replace(SCAN_ENGINE=engine)
+                reference = scan_market(create_replay_exchange(settings=settings), settings=settings)
+
+                events = list(iter_scan(create_replay_exchange(settings=settings), top_n=5, settings=settings))
+                kinds = {event.kind for event in events}
+                if not kinds <= {"progress", "result", "filtered", "error"}:
+                    print(f"✗ [{engine}] Types d'événements inattendus: {kinds}")
+                    return False
+                if events[0].kind != "progress" or events[-1].kind != "progress" \
+                        or events[-1].done != events[-1].total:
+                    print(f"✗ [{engine}] Progression de début / fin absente")
+                    return False
+
+                streamed = [event.result for event in events if event.kind == "result"]
+                if sort_results(streamed, settings) != reference:
+                    print(f"✗ [{engine}] Résultats différents de scan_market")
+                    return False
+                last_top = [event.top for event in events if event.kind == "result"][-1:]
+                if last_top and last_top[0] != reference[:5]:
+                    print(f"✗ [{engine}] Classement courant différent de sort_results()[:5]")
+                    return False
+                print(f"✓ [{engine}] {len(streamed)} opportunité(s) en flux, identiques à scan_market")
+
+            # Fermer le générateur arrête le scan : moins de requêtes
+            settings = base.replace(SCAN_ENGINE="threads")
+            full = create_replay_exchange(settings=settings)
+            list(iter_scan(full, settings=settings))
+            partial = create_replay_exchange(settings=settings)
+            stream = iter_scan(partial, settings=settings)
+            for event in stream:
+                if event.kind != "progress" and event.done >= 5:
+                    break
+            stream.close()
+
+        if partial.calls["fetch_ohlcv"] >= full.calls["fetch_ohlcv"]:
+            print(f"✗ Arrêt sans effet ({partial.calls['fetch_ohlcv']} >= {full.calls['fetch_ohlcv']})")
+            return False
+        print(f"✓ Arrêt après 5 paires: {partial.calls['fetch_ohlcv']}/{full.calls['fetch_ohlcv']} requêtes OHLCV")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_pair_series():
+    """Test des séries des graphiques (mêmes valeurs que le tableau de résultats)"""
+    print("\n" + "="*60)
+    print("TEST: scanner.pair_series (graphiques de l'onglet Détails)")
+    print("="*60)
+    try:
+        from replay_exchange import create_replay_exchange
+        from scanner import scan_market, pair_series
+
+        base = synthetic_settings(REPLAY_SYNTHETIC_PAIRS=30)
+        with patched_config(USE_WEIGHT_RATE_LIMITER=False):
+            exchange = create_replay_exchange(settings=base)
+            checked = 0
+            for engine in ("threads", "asyncio", "batch", "pipelined"):
+                settings = base.replace(SCAN_ENGINE=engine)
+                frames = {}
+                results = scan_market(exchange, frames=frames, settings=settings)
+                if not results or any(r["symbol"] not in frames for r in results):
+                    print(f"✗ Bougies du scan non conservées (moteur {engine})")
+                    return False
+
+                # Onglet Configuration modifié après le scan : graphiques sur la configuration du scan
+                with patched_config(RSI_PERIOD=settings.RSI_PERIOD + 7, BOLLINGER_PERIOD=settings.BOLLINGER_PERIOD + 5):
+                    for result in results:
+                        pair_frames = frames[result["symbol"]]
+                        fetches = pair_frames.fetch_count
+                        series = pair_series(pair_frames, pair_frames.settings)
+                        if pair_frames.fetch_count != fetches:
+                            print("✗ Téléchargement supplémentaire pour les graphiques")
+                            return False
+
+                        last = lambda values, digits: round(float(values.iloc[-1]), digits)
+                        expected = {
+                            "rsi": (series["rsi"], 2),
+                            "macd": (series["macd"]["macd"], 8),
+                            "macd_signal": (series["macd"]["signal"], 8),
+                            "macd_histogram": (series["macd"]["histogram"], 8),
+                            "bb_lower": (series["bollinger"]["lower"], 8),
+                            "bb_middle": (series["bollinger"]["middle"], 8),
+                            "bb_upper": (series["bollinger"]["upper"], 8),
+                            "stoch_k": (series["stochastic"]["k"], 2),
+                            "stoch_d": (series["stochastic"]["d"], 2),
+                        }
+                        for key, periods in (("sma", settings.SMA_PERIODS), ("ema", settings.EMA_PERIODS)):
+                            for period in periods:
+                                expected[f"{key}{period}_{settings.TIMEFRAME}"] = (series[key][period], 8)
+                        for key, (values, digits) in expected.items():
+                            if len(values) != len(series["ohlcv"]) or last(values, digits) != result[key]:
+                                print(f"✗ {key} différent du tableau pour {result['symbol']} ({engine})")
+                                return False
+                        checked += 1
+
+        print(f"✓ {checked} paire(s) sur 4 moteurs: dernières valeurs identiques au tableau, sans téléchargement")
+        return True
+
+    except Exception as e:
+        print(f"✗ Erreur: {e}")
+        return False
+
+
 def test_full_scan_single_pair():
     """Test complet sur une seule paire"""
     print("\n" + "="*60)
@@ -265,6 +1674,28 @@ def main():
         ("Exchange", test_exchange),
         ("Data", test_data),
         ("Indicators", test_indicators),
+        ("Noyau RSI", test_rsi_kernel),
+        ("Noyaux glissants", test_rolling_kernels),
+        ("Backends de récurrences", test_kernel_backends),
+        ("Dernières valeurs", test_latest_indicators),
+        ("Contexte partagé", test_indicator_context),
+        ("Registre d'indicateurs", test_indicator_registry),
+        ("Balayages de paramètres", test_sweeps),
+        ("Score de confluence", test_scoring),
+        ("Indicateurs incrémentaux", test_streaming),
+        ("Rate limiter", test_rate_limiter),
+        ("Ré-échantillonnage", test_resample),
+        ("Préfiltre tickers", test_ticker_prefilter),
+        ("Cache des marchés", test_markets_cache),
+        ("Cache des bougies", test_candle_store),
+        ("Exchange hors-ligne", test_replay_exchange),
+        ("Moteur batch", test_batch_engine),
+        ("Moteur pipelined", test_pipelined_engine),
+        ("Pipeline par étapes", test_pipeline),
+        ("Scan en flux", test_iter_scan),
+        ("Mode daemon", test_daemon),
+        ("Configuration figée", test_scan_config),
+        ("Séries des graphiques", test_pair_series),
         ("Scan complet", test_full_scan_single_pair),
     ]
 